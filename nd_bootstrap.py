@@ -12,23 +12,48 @@ Bootstrap a Nexus Dashboard cluster.
   - Easier to integrate with CI/CD pipelines and secret management systems
   - Easier to use with shell scripts and automation tools
 - Loads and validates a YAML configuration file
+- Renders configurations from a template and an inventory of per-cluster variables (--inventory, --cluster)
 - Validates NTP servers are reachable and compatible from Nexus Dashboard's perspective prior to POST
+  - Successful validations are cached, so re-runs with the same DNS/NTP servers skip the round trip (--revalidate to force it)
 - Retrieves node credentials from environment variables and dynamically updates the node configurations prior to POST
   - More secure and flexible than hardcoding credentials in the configuration file
 - Retrieves node serial numbers from Nexus Dashboard and dynamically updates the node configurations prior to POST
   - No need to manually specify serial numbers in the configuration file
+  - With --wait-for-nodes, waits (with backoff) for nodes that are still booting to register
+- Supports a --verify-health flag to check every node and externalServices address concurrently after the install completes
 - Supports a --dry-run flag to perform all validation steps but skip the final POST to bootstrap the cluster
+- Supports a --reconcile flag to skip validation and the POST when the cluster already has the desired configuration
 - Posts the configuration to Nexus Dashboard after the terminal-based bringup is complete
 - Modular design with classes for environment, login, configuration, NTP validation, and bootstrapping
 - Uses requests library for HTTP interactions
 - Uses PyYAML for YAML parsing
 - Includes detailed error handling and informative messages
+  - The nd_bootstrap package raises typed exceptions and returns result objects, so one process can bootstrap many clusters
+- Supports a --profile flag to print a per-phase timing table (wall time, CPU time, requests, bytes), and --profile-output to write cProfile statistics
+- Supports a --trace flag to write trace spans for every stage, status poll, login and HTTP request to rotating OTLP-JSON files
+- Coalesces concurrent re-authentications for the same Nexus Dashboard into one login (e.g. across --spool or --queue-run jobs)
+- Reuses one connection pool for the initial login and every re-login, resumes TLS sessions on reconnect, and opens the connection while the configuration loads
+- Supports a --hedge flag to resend a slow status, cluster or syscfg GET on another connection, within a budget of extra requests
+- Supports a --deadline flag (and --stage-budget per stage) that bounds every request, retry and wait, so a run finishes by a known time
+- Supports a --dashboard flag to show a live terminal table (stage, progress, overallStatus, ETA, last error, re-authentications)
+  - With --state-dir, several runs publish their state to one directory, shown together by: python -m nd_bootstrap.dashboard STATE_DIR
+- Sends notifications when a stage starts or fails, validation completes, poll progress changes, or the bootstrap completes
+  - --notify-webhook, --notify-file and --notify-socket deliver them from background workers, so a slow receiver never delays polling
+- Supports a --preflight-only flag to audit every cluster of an inventory concurrently (login, firmware, node serial numbers, DNS/NTP)
+  without posting anything, and print a per-cluster matrix (--preflight-report writes it as JSON)
+- Supports a --spool flag to watch a directory and bootstrap each configuration file that arrives, with several bootstraps running concurrently
+- Supports a shared job queue (--queue-submit, --queue-run) so several runner processes or hosts bootstrap a fleet, with leases, heartbeats and checkpoint resume
+- Records (--record) and replays (--replay) HTTP sessions with Nexus Dashboard as cassette files, with secrets redacted
+  - Replays run offline, with waits compressed (--replay-speed), so regression tests against real firmware behavior run in well under a second
 
 ## Environment Variables
 
 - ND_IP4: The IPv4 address of the Nexus Dashboard
 - ND_IP6: The IPv6 address of the Nexus Dashboard
-- ND_IP_PROTOCOL: The IP protocol to use, either "IP4" or "IP6". Default is "IP4".
+- ND_IP_PROTOCOL: The IP protocol to use, either "IP4", "IP6", or "DUAL". Default is "IP4".
+  - DUAL requires both ND_IP4 and ND_IP6. Connections to both are raced and the first to connect is used.
+    If that address becomes unreachable (e.g. while ND restarts services during install), the script
+    switches to the other address family.
 - ND_USERNAME: The username to authenticate with Nexus Dashboard
 - ND_PASSWORD: The password to authenticate with Nexus Dashboard
 - ND_DOMAIN: The domain to authenticate with Nexus Dashboard. Default is "local".
@@ -51,17 +76,28 @@ export ND_IP4=192.168.1.1
 export ND_IP6=2001:db8::1
 export ND_USERNAME=admin
 export ND_PASSWORD=MyPassword
-./nd_bootstrap.py path/to/bootstrap.yaml [--dry-run]
+./nd_bootstrap.py path/to/bootstrap.yaml [--dry-run] [--reconcile] [--revalidate]
+# or, render from a template and an inventory
+./nd_bootstrap.py nd_bootstrap_template.yaml --inventory nd_bootstrap_inventory.csv [--cluster NAME]
 ```
 
 """
 import argparse
-
-from nd_bootstrap.bootstrap import NdBootstrap
+from contextlib import AbstractContextManager, ExitStack, nullcontext, redirect_stdout
+from sys import exit as sys_exit
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Bootstrap ND cluster from YAML configuration")
-    parser.add_argument("config_file", help="Path to the YAML configuration file")
+    parser.add_argument("config_file", nargs="?", default="", help="Path to the YAML configuration file (or template file, if --inventory is set). Not used with --spool")
+    parser.add_argument(
+        "--inventory",
+        help="Path to a CSV or YAML inventory of per-cluster variables. config_file is then treated as a template. "
+        "Without --cluster, all clusters are rendered and validated, and nothing is sent",
+    )
+    parser.add_argument(
+        "--cluster",
+        help="With --inventory, bootstrap the rendered cluster whose clusterConfig.name matches this value",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -72,6 +108,185 @@ if __name__ == "__main__":
         action="store_true",
         help="Poll the bootstrap and services bringup status until both are complete. Ignored if --dry-run is set",
     )
+    parser.add_argument(
+        "--reconcile",
+        action="store_true",
+        help="Compare the configuration with the current Nexus Dashboard state first. "
+        "Skip validation and the POST if the cluster is already bootstrapped (or bootstrapping) with this configuration",
+    )
+    parser.add_argument(
+        "--revalidate",
+        action="store_true",
+        help="Ignore cached pre-flight (DNS/NTP) validation results and validate again. "
+        "Successful results are cached for an hour, per Nexus Dashboard, firmware version and DNS/NTP servers",
+    )
+    parser.add_argument(
+        "--wait-for-nodes",
+        action="store_true",
+        help="Wait until every node in the configuration has registered with Nexus Dashboard (with a serial number) before continuing, instead of failing if a node is missing",
+    )
+    parser.add_argument(
+        "--discovery-timeout",
+        type=int,
+        default=1800,
+        help="Seconds to wait for nodes to register with Nexus Dashboard. Ignored if --wait-for-nodes is not set",
+    )
+    parser.add_argument(
+        "--verify-health",
+        action="store_true",
+        help="After the install completes, check concurrently that every node (management and data addresses, API and services) and every externalServices address is healthy, "
+        "and print a per-node matrix. Ignored if --poll-status is not set",
+    )
+    parser.add_argument(
+        "--record",
+        metavar="CASSETTE",
+        help="Record every HTTP request and response (secrets redacted) to this cassette file. Compressed with gzip if the name ends with .gz",
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="CASSETTE",
+        help="Replay HTTP responses from this cassette file instead of contacting Nexus Dashboard",
+    )
+    parser.add_argument(
+        "--replay-speed",
+        type=float,
+        default=0,
+        help="With --replay, run waits (polling intervals, backoff) this many times faster than real time. 0 (default) skips waits entirely",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print a per-phase timing table (wall time, CPU time, requests, bytes) for login, configuration loading, serial numbers, validation, POST and each poller",
+    )
+    parser.add_argument(
+        "--profile-output",
+        metavar="PSTATS_FILE",
+        help="With --profile, also run cProfile and write its statistics to this file (read it with: python -m pstats PSTATS_FILE)",
+    )
+    parser.add_argument(
+        "--trace",
+        metavar="TRACE_FILE",
+        help="Write trace spans (each workflow stage, status poll, login and HTTP request) to this file as OTLP-JSON, one export request per line. "
+        "Rotated at 10 MiB, keeping 5 old files",
+    )
+    parser.add_argument(
+        "--dashboard",
+        action="store_true",
+        help="Show a live table of the cluster's stage, progress, overallStatus, ETA, last error and re-authentications. Messages go to --dashboard-log",
+    )
+    parser.add_argument(
+        "--dashboard-log",
+        metavar="LOG_FILE",
+        default="nd_bootstrap.log",
+        help="With --dashboard, write messages to this file instead of the terminal. Default is nd_bootstrap.log",
+    )
+    parser.add_argument(
+        "--state-dir",
+        metavar="STATE_DIR",
+        help="Publish this run's progress to STATE_DIR, where python -m nd_bootstrap.dashboard STATE_DIR shows every run in one table",
+    )
+    parser.add_argument(
+        "--notify-webhook",
+        action="append",
+        default=[],
+        metavar="URL",
+        help="POST progress events (stage changes, validation, poll progress, completion, failure) as JSON to this URL. May be repeated",
+    )
+    parser.add_argument(
+        "--notify-file",
+        action="append",
+        default=[],
+        metavar="EVENT_FILE",
+        help="Append progress events to this file, one JSON object per line. May be repeated",
+    )
+    parser.add_argument(
+        "--notify-socket",
+        action="append",
+        default=[],
+        metavar="SOCKET_PATH",
+        help="Write progress events, one JSON object per line, to this Unix socket. May be repeated",
+    )
+    parser.add_argument(
+        "--spool",
+        metavar="SPOOL_DIR",
+        help="Watch SPOOL_DIR and bootstrap each YAML configuration file that arrives (moved to SPOOL_DIR/done or SPOOL_DIR/failed when finished), until interrupted",
+    )
+    parser.add_argument(
+        "--spool-workers",
+        type=int,
+        default=4,
+        help="With --spool, the maximum number of concurrent bootstraps. Default is 4",
+    )
+    parser.add_argument(
+        "--queue-submit",
+        metavar="QUEUE_DB",
+        help="Add a job for config_file (or, with --inventory, for every rendered cluster, or --cluster) to the job queue QUEUE_DB, then exit",
+    )
+    parser.add_argument(
+        "--queue-run",
+        metavar="QUEUE_DB",
+        help="Run bootstrap jobs from the job queue QUEUE_DB until interrupted. Start any number of runners, on any number of hosts sharing QUEUE_DB",
+    )
+    parser.add_argument(
+        "--queue-workers",
+        type=int,
+        default=4,
+        help="With --queue-run, the number of concurrent bootstraps in this runner. Default is 4",
+    )
+    parser.add_argument(
+        "--queue-exit-when-idle",
+        action="store_true",
+        help="With --queue-run, exit once no job is pending or running",
+    )
+    parser.add_argument(
+        "--preflight-only",
+        action="store_true",
+        help="Audit config_file (or, with --inventory, every rendered cluster, or --cluster) without posting anything: login, firmware version, "
+        "node serial numbers and DNS/NTP validation, with every target audited concurrently. Prints a matrix, and exits 1 if any check failed",
+    )
+    parser.add_argument(
+        "--preflight-report",
+        metavar="REPORT_FILE",
+        help="With --preflight-only, also write the matrix, with the detail of every check, to this file as JSON",
+    )
+    parser.add_argument(
+        "--preflight-workers",
+        type=int,
+        default=256,
+        help="With --preflight-only, the maximum number of targets audited concurrently. Default is 256",
+    )
+    parser.add_argument(
+        "--target-from",
+        choices=["environment", "config"],
+        help="With --spool, --queue-run or --preflight-only, take each Nexus Dashboard address from ND_IP4/ND_IP6 (environment) "
+        "or from the managementNetwork of the node with 'self: true' (config). Default is config with --preflight-only, otherwise environment",
+    )
+    parser.add_argument(
+        "--hedge",
+        action="store_true",
+        help="If a status, cluster or syscfg GET has no response by the p95 of recent latencies, send it again on another connection and use the first response",
+    )
+    parser.add_argument(
+        "--hedge-budget",
+        type=float,
+        default=0.1,
+        help="With --hedge, the fraction of those GETs that may be sent twice. Default is 0.1",
+    )
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        default=0,
+        metavar="SECONDS",
+        help="Fail (exit 1) if the bootstrap has not finished SECONDS after it started. Bounds every request, retry and polling wait. "
+        "With --spool or --queue-run, applies to each job. Default is 0 (no deadline)",
+    )
+    parser.add_argument(
+        "--stage-budget",
+        action="append",
+        default=[],
+        metavar="STAGE=SECONDS",
+        help="Fail (exit 1) if STAGE (e.g. login, validation, post, poll_bootstrap, poll_install) takes longer than SECONDS. May be repeated",
+    )
     parser.add_argument(
         "--retries",
         type=int,
@@ -85,11 +300,266 @@ if __name__ == "__main__":
         help="Interval (in seconds) between polling attempts when polling both bootstrap and services status. Ignored if --poll-status is not set or --dry-run is set",
     )
     args = parser.parse_args()
+    if not args.config_file and not args.spool and not args.queue_run:
+        parser.error("config_file is required unless --spool or --queue-run is set")
+    stage_budgets: dict[str, float] = {}
+    for stage_budget in args.stage_budget:
+        stage, _, seconds = stage_budget.partition("=")
+        try:
+            stage_budgets[stage] = float(seconds)
+        except ValueError:
+            parser.error(f"--stage-budget {stage_budget}: not STAGE=SECONDS")
+        if not stage or stage_budgets[stage] <= 0:
+            parser.error(f"--stage-budget {stage_budget}: not STAGE=SECONDS, with SECONDS greater than 0")
+
+    # Imported after argument parsing so that --help and argument errors return immediately.
+    # pylint: disable=import-outside-toplevel
+    # The package raises NdBootstrapError (or a subclass) on failure. This script is the only
+    # place where failures are mapped to exit codes.
+    from nd_bootstrap.exceptions import NdBootstrapError
+
+    profiler = None
+    if args.profile:
+        # Only with --profile: the profiler imports requests, which the --inventory linting path does not need.
+        from nd_bootstrap.profiler import NdProfiler
+
+        profiler = NdProfiler()
+        profiler.enabled = True
+        profiler.profile_file = args.profile_output or ""
+
+    def phase(name: str) -> AbstractContextManager:
+        """
+        Record the enclosed block as a profiler phase called name, if --profile is set.
+        """
+        return profiler.phase(name) if profiler is not None else nullcontext()
+
+    try:
+        with phase("nd_bootstrap"):
+            from nd_bootstrap.config_generator import NdConfigGenerator
+
+            nd_bootstrap_config = None
+            if args.queue_submit:
+                from nd_bootstrap.config import NdBootstrapConfig
+                from nd_bootstrap.job_queue import NdJobQueue
+
+                queue = NdJobQueue()
+                queue.database = args.queue_submit
+                if args.inventory:
+                    generator = NdConfigGenerator()
+                    generator.template_file = args.config_file
+                    generator.inventory_file = args.inventory
+                    submitted = [rendered for rendered in generator.generate() if not args.cluster or rendered.nd_cluster_name == args.cluster]
+                else:
+                    submitted = [NdBootstrapConfig()]
+                    submitted[0].config_file = args.config_file
+                    submitted[0].commit()
+                for job_config in submitted:
+                    print(f"Submitted cluster '{job_config.nd_cluster_name}' as job {queue.submit(job_config)} to {args.queue_submit}.")
+                sys_exit(0)
+            if args.inventory and not args.preflight_only:
+                generator = NdConfigGenerator()
+                generator.template_file = args.config_file
+                generator.inventory_file = args.inventory
+                with phase("render_inventory"):
+                    for rendered in generator.generate():
+                        if not args.cluster:
+                            print(f"Rendered cluster '{rendered.nd_cluster_name}' with {len(rendered.config['nodes'])} node(s).")
+                            continue
+                        if rendered.nd_cluster_name == args.cluster:
+                            nd_bootstrap_config = rendered
+                            break
+                if not args.cluster:
+                    sys_exit(0)
+                if nd_bootstrap_config is None:
+                    print(f"Cluster '{args.cluster}' not found in inventory {args.inventory}, exiting.")
+                    sys_exit(1)
+
+            from nd_bootstrap.bootstrap import NdBootstrap
+            from nd_bootstrap.events import NdEventBus, NdFileSink, NdUnixSocketSink, NdWebhookSink
+
+            events = NdEventBus()
+            for url in args.notify_webhook:
+                webhook_sink = NdWebhookSink()
+                webhook_sink.url = url
+                events.add_sink(webhook_sink)
+            for path in args.notify_file:
+                file_sink = NdFileSink()
+                file_sink.path = path
+                events.add_sink(file_sink)
+            for path in args.notify_socket:
+                socket_sink = NdUnixSocketSink()
+                socket_sink.path = path
+                events.add_sink(socket_sink)
+
+            def configure(nd_bootstrap: NdBootstrap) -> None:
+                """
+                Apply the command-line options to nd_bootstrap.
+                """
+                nd_bootstrap.dry_run = args.dry_run
+                nd_bootstrap.poll = args.poll_status
+                nd_bootstrap.reconcile = args.reconcile
+                nd_bootstrap.revalidate = args.revalidate
+                nd_bootstrap.wait_for_nodes = args.wait_for_nodes
+                nd_bootstrap.verify_health = args.verify_health
+                nd_bootstrap.discovery_timeout = args.discovery_timeout
+                nd_bootstrap.retries = args.retries
+                nd_bootstrap.interval = args.interval
+                if args.deadline or stage_budgets:
+                    from nd_bootstrap.deadline import NdDeadline
+
+                    # Attached last, so that it bounds the requests of the cassette, profiling and tracing adapters too.
+                    deadline = NdDeadline()
+                    deadline.seconds = args.deadline
+                    deadline.budgets = stage_budgets
+                    deadline.attach(nd_bootstrap.context)
+
+            if args.preflight_only:
+                from nd_bootstrap.config import NdBootstrapConfig
+                from nd_bootstrap.preflight import NdPreflightAudit
+
+                audit = NdPreflightAudit()
+                audit.address_source = args.target_from or "config"
+                audit.max_workers = args.preflight_workers
+                audit.configure = configure
+                if args.inventory:
+                    generator = NdConfigGenerator()
+                    generator.template_file = args.config_file
+                    generator.inventory_file = args.inventory
+                    with phase("render_inventory"):
+                        audit.configs = [rendered for rendered in generator.generate() if not args.cluster or rendered.nd_cluster_name == args.cluster]
+                else:
+                    audit_config = NdBootstrapConfig()
+                    audit_config.config_file = args.config_file
+                    audit_config.commit()
+                    audit.configs = [audit_config]
+                if not audit.configs:
+                    print(f"Cluster '{args.cluster}' not found in inventory {args.inventory}, exiting.")
+                    sys_exit(1)
+                with phase("preflight_audit"):
+                    preflight = audit.commit()
+                if args.preflight_report:
+                    audit.write_report(args.preflight_report)
+                    print(f"Wrote the pre-flight matrix to {args.preflight_report}.")
+                sys_exit(0 if preflight.passed else 1)
+            if args.spool:
+                from nd_bootstrap.spool import NdSpoolRunner
+
+                runner = NdSpoolRunner()
+                runner.spool_dir = args.spool
+                runner.max_workers = args.spool_workers
+                runner.address_source = args.target_from or "environment"
+                runner.configure = configure
+                runner.events = events
+                print(f"Watching {args.spool} for bootstrap configuration files (Ctrl-C to stop).")
+                try:
+                    runner.commit()
+                except KeyboardInterrupt:
+                    print("Interrupted, bootstraps in progress were finished.")
+                finally:
+                    events.close()
+                sys_exit(0)
+            if args.queue_run:
+                from nd_bootstrap.job_queue import NdJobQueue, NdJobRunner
+
+                job_runner = NdJobRunner()
+                job_runner.queue = NdJobQueue()
+                job_runner.queue.database = args.queue_run
+                job_runner.workers = args.queue_workers
+                job_runner.exit_when_idle = args.queue_exit_when_idle
+                job_runner.address_source = args.target_from or "environment"
+                job_runner.configure = configure
+                job_runner.events = events
+                print(f"Runner {job_runner.runner_id}: running jobs from {args.queue_run} with {args.queue_workers} worker(s) (Ctrl-C to stop).")
+                try:
+                    job_runner.commit()
+                except KeyboardInterrupt:
+                    # Jobs in progress keep their lease until it expires, then another runner resumes them.
+                    print("Interrupted, jobs in progress will be resumed by another runner after their lease expires.")
+                finally:
+                    events.close()
+                sys_exit(0)
+
+            from nd_bootstrap.context import NdContext
+
+            instance = NdBootstrap()
+            instance.context = NdContext.from_environment()
+            recorder = None
+            if args.record:
+                from nd_bootstrap.cassette import NdCassetteRecorder
+
+                recorder = NdCassetteRecorder()
+                recorder.cassette_file = args.record
+                instance.context.adapter = recorder
+            if args.replay:
+                from nd_bootstrap.cassette import NdCassettePlayer
+                from nd_bootstrap.clock import NdScaledClock
+
+                player = NdCassettePlayer()
+                player.cassette_file = args.replay
+                instance.context.adapter = player
+                instance.context.clock = NdScaledClock()
+                instance.context.clock.speed = args.replay_speed
+            hedger = None
+            if args.hedge:
+                from nd_bootstrap.hedging import NdHedger
+
+                # Before the profiler, tracer and deadline, so that a hedged exchange counts as one request.
+                hedger = NdHedger()
+                hedger.budget = args.hedge_budget
+                hedger.attach(instance.context)
+            if profiler is not None:
+                # After the cassette adapter is set, so that replayed requests are counted too.
+                profiler.attach(instance.context)
+            if args.trace:
+                from nd_bootstrap.tracing import NdTracer
+
+                tracer = NdTracer()
+                tracer.trace_file = args.trace
+                tracer.enabled = True
+                tracer.attach(instance.context)
+            instance.context.events = events
+            registry = None
+            dashboard = None
+            if args.dashboard or args.state_dir:
+                from nd_bootstrap.cluster_state import NdClusterStateRegistry
+
+                registry = NdClusterStateRegistry()
+                registry.register(instance.context.cluster_state)
+                if args.state_dir:
+                    registry.state_dir = args.state_dir
+                    registry.start_publishing()
+            if args.dashboard and registry is not None:
+                from nd_bootstrap.dashboard import NdDashboard
 
-    instance = NdBootstrap()
-    instance.config_file = args.config_file
-    instance.dry_run = args.dry_run
-    instance.poll = args.poll_status
-    instance.retries = args.retries
-    instance.interval = args.interval
-    instance.commit()
+                dashboard = NdDashboard(registry.snapshot)
+            if nd_bootstrap_config is not None:
+                instance.nd_bootstrap_config = nd_bootstrap_config
+            else:
+                instance.config_file = args.config_file
+            configure(instance)
+            try:
+                with ExitStack() as stack:
+                    if dashboard is not None:
+                        # The dashboard draws on the terminal; messages would scroll it away.
+                        stack.enter_context(redirect_stdout(stack.enter_context(open(args.dashboard_log, "a", encoding="utf-8"))))
+                        dashboard.start()
+                        stack.callback(dashboard.stop)
+                    instance.commit()
+            finally:
+                if recorder is not None:
+                    recorder.save()
+                if hedger is not None:
+                    print(hedger.summary())
+                if args.profile and instance.context.transport is not None:
+                    transport = instance.context.transport
+                    print(f"TLS handshakes with Nexus Dashboard: {transport.handshakes} ({transport.resumed} resumed a previous session).")
+                if registry is not None:
+                    registry.stop_publishing()
+                # Waits (at most 5 seconds) for queued notifications, including the failure, if any.
+                events.close()
+    except NdBootstrapError as error:
+        print(f"{str(error).rstrip('.')}, exiting.")
+        sys_exit(1)
+    finally:
+        if profiler is not None:
+            profiler.print_report()
@@ -2,28 +2,283 @@
 Nexus Dashboard Bootstrap Package
 
 A Python package for bootstrapping Cisco Nexus Dashboard clusters using REST APIs.
+
+Messages are prefixed with "<class_name>.<method_name>: ", with method_name set from inspect.stack()[0][3].
+Methods that run for every request, poll, or target of NdPreflightAudit and NdFleetMonitor set it to a
+string literal instead: inspect.stack() costs about a millisecond per call, holding the GIL.
 """
 
-from nd_bootstrap.bootstrap import NdBootstrap
-from nd_bootstrap.config import NdBootstrapConfig
-from nd_bootstrap.environment import NdEnvironment
-from nd_bootstrap.login import NdLogin
-from nd_bootstrap.ntp import NdNtpServersValidate
-from nd_bootstrap.poll_bootstrap_status import NdPollBootstrapStatus
-from nd_bootstrap.poll_install_status import NdPollInstallStatus
-from nd_bootstrap.remote_services import NdVerifyRemoteServices
-from nd_bootstrap.version import NdVersion
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from nd_bootstrap.auth_manager import NdAuthManager, NdAuthState
+    from nd_bootstrap.bootstrap import NdBootstrap
+    from nd_bootstrap.cassette import NdCassettePlayer, NdCassetteRecorder
+    from nd_bootstrap.clock import NdClock, NdScaledClock, NdVirtualClock
+    from nd_bootstrap.cluster_state import NdClusterState, NdClusterStateRegistry
+    from nd_bootstrap.config import NdBootstrapConfig
+    from nd_bootstrap.config_generator import NdConfigGenerator
+    from nd_bootstrap.context import NdContext
+    from nd_bootstrap.dashboard import NdDashboard
+    from nd_bootstrap.deadline import NdDeadline, NdDeadlineAdapter, NdDeadlineClock
+    from nd_bootstrap.dual_stack import NdDualStack
+    from nd_bootstrap.environment import NdEnvironment
+    from nd_bootstrap.events import NdEvent, NdEventBus, NdEventChannel, NdEventReceiver, NdEventSink, NdFileSink, NdUnixSocketSink, NdWebhookSink
+    from nd_bootstrap.exceptions import (
+        NdApiError,
+        NdAuthenticationError,
+        NdBootstrapError,
+        NdBootstrapFailedError,
+        NdConfigError,
+        NdConnectionError,
+        NdDeadlineExceededError,
+        NdHealthCheckError,
+        NdNodeDiscoveryError,
+        NdParameterError,
+        NdReconcileConflictError,
+        NdValidationError,
+    )
+    from nd_bootstrap.fleet_monitor import NdFleetMonitor, NdSimulatedFleet
+    from nd_bootstrap.hedging import NdHedger, NdHedgingAdapter
+    from nd_bootstrap.inventory import NdClusterInventory
+    from nd_bootstrap.job_queue import NdJob, NdJobQueue, NdJobRunner
+    from nd_bootstrap.login import NdLogin
+    from nd_bootstrap.node_health import NdNodeHealth
+    from nd_bootstrap.ntp import NdNtpServersValidate
+    from nd_bootstrap.poll_bootstrap_status import NdPollBootstrapStatus
+    from nd_bootstrap.poll_install_status import NdPollInstallStatus
+    from nd_bootstrap.poll_node_discovery import NdPollNodeDiscovery
+    from nd_bootstrap.preflight import NdPreflightAudit
+    from nd_bootstrap.profiler import NdPhaseTiming, NdProfiler, NdProfilingAdapter
+    from nd_bootstrap.reconcile import NdReconcile
+    from nd_bootstrap.remote_services import NdVerifyRemoteServices
+    from nd_bootstrap.results import (
+        NdBootstrapResult,
+        NdDiscoveryResult,
+        NdHealthCheck,
+        NdHealthResult,
+        NdPollResult,
+        NdPreflightCheck,
+        NdPreflightResult,
+        NdPreflightTarget,
+        NdReconcileResult,
+        NdValidationResult,
+        NdVersionResult,
+    )
+    from nd_bootstrap.simulation import NdPolicyReport, NdPollingSimulation, NdSimulatedNd, NdTimeline
+    from nd_bootstrap.soak import NdFault, NdFaultInjectingNd, NdFaultPlan, NdSoakReport, NdSoakSample, NdSoakTest
+    from nd_bootstrap.spool import NdInotify, NdSpoolRunner, NdSpoolWatcher
+    from nd_bootstrap.tracing import NdSpan, NdTracer, NdTracingAdapter
+    from nd_bootstrap.transport import NdResumingSSLContext, NdTransportAdapter
+    from nd_bootstrap.validation_cache import NdValidationCache
+    from nd_bootstrap.version import NdVersion
+
+# Submodules are imported on first attribute access (PEP 562), so that importing the
+# package (e.g. for `nd_bootstrap.py --help` or config linting) does not pay for
+# requests/urllib3 and every submodule up front.
+_lazy_imports: dict[str, str] = {
+    "NdApiError": "nd_bootstrap.exceptions",
+    "NdAuthManager": "nd_bootstrap.auth_manager",
+    "NdAuthState": "nd_bootstrap.auth_manager",
+    "NdAuthenticationError": "nd_bootstrap.exceptions",
+    "NdBootstrap": "nd_bootstrap.bootstrap",
+    "NdBootstrapConfig": "nd_bootstrap.config",
+    "NdBootstrapError": "nd_bootstrap.exceptions",
+    "NdBootstrapFailedError": "nd_bootstrap.exceptions",
+    "NdBootstrapResult": "nd_bootstrap.results",
+    "NdCassettePlayer": "nd_bootstrap.cassette",
+    "NdCassetteRecorder": "nd_bootstrap.cassette",
+    "NdClock": "nd_bootstrap.clock",
+    "NdClusterInventory": "nd_bootstrap.inventory",
+    "NdClusterState": "nd_bootstrap.cluster_state",
+    "NdClusterStateRegistry": "nd_bootstrap.cluster_state",
+    "NdConfigError": "nd_bootstrap.exceptions",
+    "NdConfigGenerator": "nd_bootstrap.config_generator",
+    "NdConnectionError": "nd_bootstrap.exceptions",
+    "NdContext": "nd_bootstrap.context",
+    "NdDashboard": "nd_bootstrap.dashboard",
+    "NdDeadline": "nd_bootstrap.deadline",
+    "NdDeadlineAdapter": "nd_bootstrap.deadline",
+    "NdDeadlineClock": "nd_bootstrap.deadline",
+    "NdDeadlineExceededError": "nd_bootstrap.exceptions",
+    "NdDiscoveryResult": "nd_bootstrap.results",
+    "NdDualStack": "nd_bootstrap.dual_stack",
+    "NdEnvironment": "nd_bootstrap.environment",
+    "NdEvent": "nd_bootstrap.events",
+    "NdEventBus": "nd_bootstrap.events",
+    "NdEventChannel": "nd_bootstrap.events",
+    "NdEventReceiver": "nd_bootstrap.events",
+    "NdEventSink": "nd_bootstrap.events",
+    "NdFault": "nd_bootstrap.soak",
+    "NdFaultInjectingNd": "nd_bootstrap.soak",
+    "NdFaultPlan": "nd_bootstrap.soak",
+    "NdFileSink": "nd_bootstrap.events",
+    "NdFleetMonitor": "nd_bootstrap.fleet_monitor",
+    "NdHealthCheck": "nd_bootstrap.results",
+    "NdHealthCheckError": "nd_bootstrap.exceptions",
+    "NdHealthResult": "nd_bootstrap.results",
+    "NdHedger": "nd_bootstrap.hedging",
+    "NdHedgingAdapter": "nd_bootstrap.hedging",
+    "NdInotify": "nd_bootstrap.spool",
+    "NdJob": "nd_bootstrap.job_queue",
+    "NdJobQueue": "nd_bootstrap.job_queue",
+    "NdJobRunner": "nd_bootstrap.job_queue",
+    "NdLogin": "nd_bootstrap.login",
+    "NdNodeDiscoveryError": "nd_bootstrap.exceptions",
+    "NdNodeHealth": "nd_bootstrap.node_health",
+    "NdNtpServersValidate": "nd_bootstrap.ntp",
+    "NdParameterError": "nd_bootstrap.exceptions",
+    "NdPhaseTiming": "nd_bootstrap.profiler",
+    "NdPolicyReport": "nd_bootstrap.simulation",
+    "NdPollBootstrapStatus": "nd_bootstrap.poll_bootstrap_status",
+    "NdPollInstallStatus": "nd_bootstrap.poll_install_status",
+    "NdPollNodeDiscovery": "nd_bootstrap.poll_node_discovery",
+    "NdPollResult": "nd_bootstrap.results",
+    "NdPollingSimulation": "nd_bootstrap.simulation",
+    "NdPreflightAudit": "nd_bootstrap.preflight",
+    "NdPreflightCheck": "nd_bootstrap.results",
+    "NdPreflightResult": "nd_bootstrap.results",
+    "NdPreflightTarget": "nd_bootstrap.results",
+    "NdProfiler": "nd_bootstrap.profiler",
+    "NdProfilingAdapter": "nd_bootstrap.profiler",
+    "NdReconcile": "nd_bootstrap.reconcile",
+    "NdReconcileConflictError": "nd_bootstrap.exceptions",
+    "NdReconcileResult": "nd_bootstrap.results",
+    "NdResumingSSLContext": "nd_bootstrap.transport",
+    "NdScaledClock": "nd_bootstrap.clock",
+    "NdSimulatedFleet": "nd_bootstrap.fleet_monitor",
+    "NdSimulatedNd": "nd_bootstrap.simulation",
+    "NdSoakReport": "nd_bootstrap.soak",
+    "NdSoakSample": "nd_bootstrap.soak",
+    "NdSoakTest": "nd_bootstrap.soak",
+    "NdSpan": "nd_bootstrap.tracing",
+    "NdSpoolRunner": "nd_bootstrap.spool",
+    "NdSpoolWatcher": "nd_bootstrap.spool",
+    "NdTimeline": "nd_bootstrap.simulation",
+    "NdTracer": "nd_bootstrap.tracing",
+    "NdTracingAdapter": "nd_bootstrap.tracing",
+    "NdTransportAdapter": "nd_bootstrap.transport",
+    "NdUnixSocketSink": "nd_bootstrap.events",
+    "NdValidationCache": "nd_bootstrap.validation_cache",
+    "NdValidationError": "nd_bootstrap.exceptions",
+    "NdValidationResult": "nd_bootstrap.results",
+    "NdVerifyRemoteServices": "nd_bootstrap.remote_services",
+    "NdVersion": "nd_bootstrap.version",
+    "NdVersionResult": "nd_bootstrap.results",
+    "NdVirtualClock": "nd_bootstrap.clock",
+    "NdWebhookSink": "nd_bootstrap.events",
+}
 
 __all__ = [
+    "NdApiError",
+    "NdAuthManager",
+    "NdAuthState",
+    "NdAuthenticationError",
     "NdBootstrap",
     "NdBootstrapConfig",
+    "NdBootstrapError",
+    "NdBootstrapFailedError",
+    "NdBootstrapResult",
+    "NdCassettePlayer",
+    "NdCassetteRecorder",
+    "NdClock",
+    "NdClusterInventory",
+    "NdClusterState",
+    "NdClusterStateRegistry",
+    "NdConfigError",
+    "NdConfigGenerator",
+    "NdConnectionError",
+    "NdContext",
+    "NdDashboard",
+    "NdDeadline",
+    "NdDeadlineAdapter",
+    "NdDeadlineClock",
+    "NdDeadlineExceededError",
+    "NdDiscoveryResult",
+    "NdDualStack",
     "NdEnvironment",
+    "NdEvent",
+    "NdEventBus",
+    "NdEventChannel",
+    "NdEventReceiver",
+    "NdEventSink",
+    "NdFault",
+    "NdFaultInjectingNd",
+    "NdFaultPlan",
+    "NdFileSink",
+    "NdFleetMonitor",
+    "NdHealthCheck",
+    "NdHealthCheckError",
+    "NdHealthResult",
+    "NdHedger",
+    "NdHedgingAdapter",
+    "NdInotify",
+    "NdJob",
+    "NdJobQueue",
+    "NdJobRunner",
     "NdLogin",
+    "NdNodeDiscoveryError",
+    "NdNodeHealth",
     "NdNtpServersValidate",
+    "NdParameterError",
+    "NdPhaseTiming",
+    "NdPolicyReport",
     "NdPollBootstrapStatus",
     "NdPollInstallStatus",
+    "NdPollNodeDiscovery",
+    "NdPollResult",
+    "NdPollingSimulation",
+    "NdPreflightAudit",
+    "NdPreflightCheck",
+    "NdPreflightResult",
+    "NdPreflightTarget",
+    "NdProfiler",
+    "NdProfilingAdapter",
+    "NdReconcile",
+    "NdReconcileConflictError",
+    "NdReconcileResult",
+    "NdResumingSSLContext",
+    "NdScaledClock",
+    "NdSimulatedFleet",
+    "NdSimulatedNd",
+    "NdSoakReport",
+    "NdSoakSample",
+    "NdSoakTest",
+    "NdSpan",
+    "NdSpoolRunner",
+    "NdSpoolWatcher",
+    "NdTimeline",
+    "NdTracer",
+    "NdTracingAdapter",
+    "NdTransportAdapter",
+    "NdUnixSocketSink",
+    "NdValidationCache",
+    "NdValidationError",
+    "NdValidationResult",
     "NdVerifyRemoteServices",
     "NdVersion",
+    "NdVersionResult",
+    "NdVirtualClock",
+    "NdWebhookSink",
 ]
 
-__version__ = "1.0.0"
+__version__ = "0.1.0"
+
+
+def __getattr__(name: str) -> object:
+    """
+    Import the submodule that defines name on first access.
+    """
+    if name in _lazy_imports:
+        value = getattr(import_module(_lazy_imports[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """
+    Include the lazily imported names in dir(nd_bootstrap).
+    """
+    return sorted(list(globals()) + __all__)
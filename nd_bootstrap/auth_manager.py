@@ -0,0 +1,177 @@
+"""
+Nexus Dashboard Bootstrap Authentication Manager
+
+Single-flight re-authentication: concurrent demands to re-authenticate with the same Nexus Dashboard and
+credentials are served by one /login, whose session cookies are then shared with every registered context.
+"""
+
+import inspect
+import threading
+import weakref
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # NdContext holds an NdAuthManager, so import it for type checking only.
+    from nd_bootstrap.context import NdContext
+
+# (nd_ip4, nd_ip6, nd_domain, nd_username) of a context
+CredentialKey = tuple[str, str, str, str]
+
+
+@dataclass
+class NdAuthState:
+    """
+    Re-authentication state of one credential (Nexus Dashboard address, domain and username).
+
+    - generation: Number of successful re-authentications.
+    - attempts: Number of re-authentications finished (successful or not).
+    - in_flight: True while a re-authentication is in progress.
+    - succeeded: Whether the last re-authentication succeeded.
+    - coalesced: Number of demands served by another caller's re-authentication.
+    - condition: Waited on by callers while a re-authentication is in progress.
+    - contexts: The contexts whose sessions are updated after a re-authentication.
+    """
+
+    generation: int = 0
+    attempts: int = 0
+    in_flight: bool = False
+    succeeded: bool = False
+    coalesced: int = 0
+    condition: threading.Condition = field(default_factory=threading.Condition)
+    contexts: "weakref.WeakSet[NdContext]" = field(default_factory=weakref.WeakSet)
+
+
+class NdAuthManager:
+    """
+    # Summary
+
+    Coalesce re-authentication demands per credential (Nexus Dashboard address, domain and username).
+
+    When several pollers or workers sharing a target get a 401 (or lose their connection) at about
+    the same time, the first caller of reauthenticate() sends the /login, and the others wait for its
+    result instead of sending their own.  On success, the session cookies of the new login are copied
+    into the session of every context registered for the credential (NdLogin registers each context it
+    logs in), so they all continue with the new token.  A re-authentication storm becomes one request.
+
+    A caller passes the generation() it saw before its request failed; if another caller has
+    re-authenticated since, reauthenticate() returns at once, so late arrivals do not log in again.
+    NdLogin.reauthenticate() is the usual entry point.
+
+    Share one NdAuthManager between the contexts that should coalesce (context.auth), e.g. the jobs
+    of NdSpoolRunner and NdJobRunner.
+
+    ## Usage
+
+    ```python
+    seen = context.auth.generation(context)
+    response = context.session.get(url, timeout=30)
+    if response.status_code == 401:
+        nd_login = NdLogin()
+        nd_login.context = context
+        nd_login.reauthenticate(seen)  # calls context.auth.reauthenticate(context, seen, login)
+    ```
+    """
+
+    def __init__(self) -> None:
+        self.class_name: str = self.__class__.__name__
+        self._lock = threading.Lock()
+        self._states: dict[CredentialKey, NdAuthState] = {}
+
+    @staticmethod
+    def key(context: "NdContext") -> CredentialKey:
+        """
+        Return the credential key of context.
+        """
+        return (context.nd_ip4, context.nd_ip6, context.nd_domain, context.nd_username)
+
+    def state(self, context: "NdContext") -> NdAuthState:
+        """
+        Return the NdAuthState of the credential of context, creating it on first use.
+        """
+        key = self.key(context)
+        with self._lock:
+            if key not in self._states:
+                self._states[key] = NdAuthState()
+            return self._states[key]
+
+    def generation(self, context: "NdContext") -> int:
+        """
+        Return the number of successful re-authentications for the credential of context.  Cheap enough to call before every request.
+        """
+        state = self._states.get(self.key(context))
+        return state.generation if state is not None else 0
+
+    def register(self, context: "NdContext") -> None:
+        """
+        Share future re-authentications for the credential of context with the session of context.
+        """
+        state = self.state(context)
+        with state.condition:
+            state.contexts.add(context)
+
+    def reauthenticate(self, context: "NdContext", seen: int | None, login: Callable[[], bool]) -> bool:
+        """
+        Re-authenticate context with Nexus Dashboard by calling login() (which sets context.session and returns
+        True on success), unless another caller did so since generation seen, or is doing so now, in which case
+        wait for, and return, its result.  On success, share the new session cookies (see share()).
+
+        Returns:
+            bool: True if context.session holds a valid login.
+
+        Raises if:
+            - this caller called login() and it raised (e.g. requests.ConnectionError, NdDeadlineExceededError)
+        """
+        method_name: str = inspect.stack()[0][3]
+        msg: str = ""
+
+        state = self.state(context)
+        with state.condition:
+            state.contexts.add(context)
+            if state.in_flight:
+                attempts = state.attempts
+                state.condition.wait_for(lambda: state.attempts != attempts)
+                state.coalesced += 1
+                msg = f"{self.class_name}.{method_name}: "
+                msg += f"Reused the re-authentication of another worker for {context.nd_username}@{context.nd_ip4 or context.nd_ip6}."
+                print(msg)
+                return state.succeeded
+            if seen is not None and state.generation != seen:
+                state.coalesced += 1
+                return True
+            state.in_flight = True
+
+        succeeded = False
+        try:
+            succeeded = login()
+            if succeeded:
+                self.share(context, state)
+        finally:
+            with state.condition:
+                state.in_flight = False
+                state.succeeded = succeeded
+                state.attempts += 1
+                if succeeded:
+                    state.generation += 1
+                state.condition.notify_all()
+        return succeeded
+
+    @staticmethod
+    def share(context: "NdContext", state: NdAuthState) -> None:
+        """
+        Copy the cookies of context.session into the sessions of the other contexts of state.
+        """
+        if context.session is None:
+            return
+        with state.condition:
+            others = [other for other in state.contexts if other is not context]
+        for other in others:
+            if other.session is not None and other.session is not context.session:
+                other.session.cookies.update(context.session.cookies)
+
+    def coalesced(self, context: "NdContext") -> int:
+        """
+        Return the number of re-authentication demands for the credential of context served by another caller.
+        """
+        return self.state(context).coalesced
@@ -6,21 +6,31 @@ Main class that orchestrates the complete bootstrap workflow.
 
 import inspect
 import json
-from sys import exit as sys_exit
 
 import requests
 
 from nd_bootstrap.config import NdBootstrapConfig
-from nd_bootstrap.environment import NdEnvironment
+from nd_bootstrap.context import NdContext
+from nd_bootstrap.exceptions import NdApiError, NdAuthenticationError, NdConnectionError, NdNodeDiscoveryError, NdParameterError, NdReconcileConflictError
+from nd_bootstrap.inventory import NdClusterInventory
 from nd_bootstrap.login import NdLogin
+from nd_bootstrap.node_health import NdNodeHealth
 from nd_bootstrap.ntp import NdNtpServersValidate
 from nd_bootstrap.poll_bootstrap_status import NdPollBootstrapStatus
 from nd_bootstrap.poll_install_status import NdPollInstallStatus
+from nd_bootstrap.poll_node_discovery import NdPollNodeDiscovery
+from nd_bootstrap.reconcile import NdReconcile
 from nd_bootstrap.remote_services import NdVerifyRemoteServices
+from nd_bootstrap.results import NdBootstrapResult, NdDiscoveryResult, NdReconcileResult, NdValidationResult
+from nd_bootstrap.validation_cache import NdValidationCache
 from nd_bootstrap.version import NdVersion
 
+# Firmware versions with a known pre-flight validation (see NdBootstrap.select_validator).
+REMOTE_SERVICES_VERSIONS: tuple[str, ...] = ("4.2.1.4", "4.2.1.10")
+NTP_VERSION_PREFIXES: tuple[str, ...] = ("4.3.",)
 
-class NdBootstrap:
+
+class NdBootstrap:  # pylint: disable=too-many-public-methods
     """
     Bootstrap a Nexus Dashboard cluster.
     """
@@ -29,36 +39,85 @@ class NdBootstrap:
         self.class_name: str = self.__class__.__name__
         self._auth_cookie: dict[str, str] = {}
         self._auth_token: str = ""
+        self._cluster_data: dict = {}
         self._cluster_name: str = ""
         self._config: dict = {}
         self._config_file: str = ""
+        self._discovery_result: NdDiscoveryResult | None = None
+        self._discovery_timeout: int = 1800
         self._dry_run: bool = False
         self._headers: dict[str, str] = {"Content-Type": "application/json"}
         self._interval: int = 10
         self._retries: int = 100
         self._poll: bool = True  # Whether to poll the bootstrap status after posting the configuration
+        self._reconcile: bool = False  # Whether to compare the configuration with ND's state before validating and posting
+        self._revalidate: bool = False  # Whether to ignore cached pre-flight validation results
+        self._verify_health: bool = False  # Whether to check every node and externalServices address after the install completes
+        self._wait_for_nodes: bool = False  # Whether to wait for every configured node to register with ND before enrichment
+        self.validation_cache = NdValidationCache()
         self.nd_bootstrap_config = NdBootstrapConfig()
-        self.nd_environment = NdEnvironment()
-        self._nd_login = NdLogin()
-        self._nd_login.commit()
-        self.session = self._nd_login.session
+        self.inventory = NdClusterInventory()
+        self._context: NdContext | None = None
+
+    def login(self) -> None:
+        """
+        Login to Nexus Dashboard and set context.session, unless the context already has a session.
+
+        ## Raises if:
+
+        - Authentication fails
+        """
+        method_name: str = "login"
+        msg: str = ""
+
+        if self.context.session is not None:
+            return
+        nd_login = NdLogin()
+        nd_login.context = self.context
+        nd_login.commit()
+        if not nd_login.status:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Unable to login to Nexus Dashboard at {self.context.nd_ip}."
+            raise NdAuthenticationError(msg)
 
     def update_node_serial_numbers(self) -> None:
         """
-        Update self._config.nodes[<index>].serialNumber for each node in the configuration dictionary by retrieving cluster
-        information from Nexus Dashboard and matching self._config.nodes[<index>].managementNetwork.ipSubnet with the
-        corresponding response.nodes.<index>.managementNetwork.ipSubnet and updating self._config.nodes[<index>].serialNumber
-        with response.nodes[<index>].serialNumber.
+        Enrich every node in the configuration in a single pass, using the nodes reported by Nexus Dashboard.
+
+        The /v2/bootstrap/cluster response is indexed once by NdClusterInventory (management IP, data IP,
+        hostname, serial number).  Then, for each node in the configuration:
+
+        - nodeController credentials are filled in (see update_node_credentials())
+        - nodeController.ipAddress is set from managementNetwork.ipSubnet, if not already set
+        - serialNumber is set from the matching node reported by Nexus Dashboard
+
+        If wait_for_nodes is True, NdPollNodeDiscovery first polls until every configured node has
+        registered with a serial number (or discovery_timeout expires).
 
         ## Endpoint
 
         Path: /v2/bootstrap/cluster
         Verb: GET
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = "update_node_serial_numbers"
         msg: str = ""
 
-        url = f"https://{self.nd_environment.nd_ip}/v2/bootstrap/cluster"
+        if self.wait_for_nodes:
+            nd_node_discovery = NdPollNodeDiscovery()
+            nd_node_discovery.context = self.context
+            nd_node_discovery.config = self._config
+            nd_node_discovery.inventory = self.inventory
+            nd_node_discovery.timeout = self.discovery_timeout
+            with self.context.phase("node_discovery"):
+                self._discovery_result = nd_node_discovery.commit()
+            # Retained so that reconcile mode can compare against it without a second GET.
+            self._cluster_data = nd_node_discovery.cluster_data
+            for node in self._config.get("nodes", []):
+                self.update_node_credentials(node)
+                self.inventory.enrich(node)
+            return
+
+        url = f"https://{self.context.nd_host}/v2/bootstrap/cluster"
         try:
             response = self.session.get(
                 url,
@@ -70,16 +129,16 @@ class NdBootstrap:
         except requests.RequestException as e:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Error retrieving serial numbers: {str(e)}"
-            print(msg)
-            sys_exit(1)
+            raise NdConnectionError(msg) from e
 
         if response.status_code not in (200, 201):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Failed to retrieve serial numbers. Status code: {response.status_code} : {response.text}"
-            print(msg)
-            sys_exit(1)
+            raise NdApiError(msg, status_code=response.status_code)
 
         data = response.json()
+        # Retained so that reconcile mode can compare against it without a second GET.
+        self._cluster_data = data
         nodes_info = data.get("nodes", [])
         msg = f"{self.class_name}.{method_name}: "
         msg += f"Retrieved {len(nodes_info)} nodes from Nexus Dashboard for serial number update."
@@ -88,91 +147,53 @@ class NdBootstrap:
         if not nodes_info:
             msg = f"{self.class_name}.{method_name}: "
             msg += "No nodes found in the response."
-            print(msg)
-            sys_exit(1)
+            raise NdNodeDiscoveryError(msg)
 
+        self.inventory.nodes = nodes_info
         for node in self._config.get("nodes", []):
-            mgmt_ip_subnet = node.get("managementNetwork", {}).get("ipSubnet", "")
-            if not mgmt_ip_subnet:
-                msg = f"{self.class_name}.{method_name}: "
-                msg += "Node managementNetwork.ipSubnet is missing or empty."
-                print(msg)
-                sys_exit(1)
-
-            matched_node = next(
-                (n for n in nodes_info if n.get("managementNetwork", {}).get("ipSubnet", "") == mgmt_ip_subnet),
-                None,
-            )
-            if not matched_node:
-                msg = f"{self.class_name}.{method_name}: "
-                msg += f"No matching node found for managementNetwork.ipSubnet {mgmt_ip_subnet}."
-                print(msg)
-                sys_exit(1)
-
-            serial_number = matched_node.get("serialNumber", "")
-            if not serial_number:
-                msg = f"{self.class_name}.{method_name}: "
-                msg += f"Matched node for managementNetwork.ipSubnet {mgmt_ip_subnet} has no serialNumber."
-                print(msg)
-                sys_exit(1)
-            node["serialNumber"] = serial_number
-            msg = f"{self.class_name}.{method_name}: "
-            msg += f"Updated node with managementNetwork.ipSubnet {mgmt_ip_subnet} to serialNumber {serial_number}."
-            print(msg)
+            self.update_node_credentials(node)
+            self.inventory.enrich(node)
 
-    def update_node_credentials(self) -> None:
+    def update_node_credentials(self, node: dict) -> None:
         """
-        Update the nodeController credentials (if any) in the configuration dictionary.
-
-        Args:
-            config: The configuration dictionary to update.
-            nd_username: The username to set for each nodeController.
-            nd_password: The password to set for each nodeController.
-        """
-        for node in self._config.get("nodes", []):
-            if "nodeController" not in node:
-                continue
-            if "loginUser" in node["nodeController"]:
-                if node["nodeController"]["loginUser"] == "ND_USERNAME":
-                    node["nodeController"]["loginUser"] = self.nd_environment.nd_username
-            if "loginPassword" in node["nodeController"]:
-                if node["nodeController"]["loginPassword"] == "ND_PASSWORD":
-                    node["nodeController"]["loginPassword"] = self.nd_environment.nd_password
-
-    def update_node_controller_ip(self) -> None:
-        """
-        For each node with a nodeController, set nodeController.ipAddress from
-        managementNetwork.ipSubnet (stripping the prefix length) if not already set.
+        Replace the ND_USERNAME and ND_PASSWORD placeholders in node's nodeController (if any)
+        with the credentials from the context.
         """
-        for node in self._config.get("nodes", []):
-            if "nodeController" not in node:
-                continue
-            if node["nodeController"].get("ipAddress"):
-                continue
-            mgmt_ip_subnet = node.get("managementNetwork", {}).get("ipSubnet", "")
-            if mgmt_ip_subnet:
-                node["nodeController"]["ipAddress"] = mgmt_ip_subnet.split("/")[0]
+        node_controller = node.get("nodeController")
+        if not isinstance(node_controller, dict):
+            return
+        if node_controller.get("loginUser") == "ND_USERNAME":
+            node_controller["loginUser"] = self.context.nd_username
+        if node_controller.get("loginPassword") == "ND_PASSWORD":
+            node_controller["loginPassword"] = self.context.nd_password
 
-    def send_bootstrap_configuration(self) -> None:
+    def send_bootstrap_configuration(self) -> int:
         """
         # Summary
 
         Send the bootstrap configuration to the specified URL.
 
+        If self.dry_run is True, print the configuration that would be sent instead.
+
         ## Endpoint
 
         - Path: /v2/bootstrap/cluster
         - Verb: POST
 
-        ## Exits if:
+        ## Returns
+
+        - The HTTP status code of the POST (405 if the configuration was already sent).
+        - 0 if nothing was sent (dry run).
 
-        - self.dry_run is True (after printing the configuration that would be sent)
+        ## Raises if:
 
+        - The request failed (NdConnectionError)
+        - Nexus Dashboard rejected the configuration, i.e. any status code but 200, 201 and 405 (NdApiError)
         """
         method_name: str = inspect.stack()[0][3]
         msg: str = ""
 
-        url = f"https://{self.nd_environment.nd_ip}/v2/bootstrap/cluster"
+        url = f"https://{self.context.nd_host}/v2/bootstrap/cluster"
 
         if self.dry_run:
             msg = f"{self.class_name}.{method_name}: "
@@ -180,7 +201,7 @@ class NdBootstrap:
             msg += f"Would POST the following configuration to {url} if --dry_run were not set:\n"
             msg += f"{json.dumps(self._config, indent=4)}"
             print(msg)
-            sys_exit(0)
+            return 0
 
         msg = f"{self.class_name}.{method_name}: "
         msg += f"Sending bootstrap configuration to Nexus Dashboard at {url}."
@@ -196,21 +217,64 @@ class NdBootstrap:
             msg = f"{self.class_name}.{method_name}: "
             msg += "Error sending POST request for cluster bootstrap: "
             msg += f"Error detail: {str(e)}"
-            print(msg)
-            return
+            raise NdConnectionError(msg) from e
         if response.status_code == 405:
             msg = f"{self.class_name}.{method_name}: "
             msg += "Bootstrap configuration already sent. Returning."
             print(msg)
-            return
+            return response.status_code
         if response.status_code in (200, 201):
             msg = f"{self.class_name}.{method_name}: "
             msg += "Cluster bootstrap initiated successfully."
             print(msg)
-            return
+            return response.status_code
         msg = f"{self.class_name}.{method_name}: "
         msg += f"Failed to bootstrap cluster. Status code: {response.status_code} : {response.text}"
-        print(msg)
+        raise NdApiError(msg, status_code=response.status_code)
+
+    def reconcile_cluster(self) -> NdReconcileResult:
+        """
+        # Summary
+
+        Compare the enriched configuration with Nexus Dashboard's current state and return the action to take.
+
+        Reuses the /v2/bootstrap/cluster response retrieved by update_node_serial_numbers().
+
+        ## Returns
+
+        NdReconcileResult, whose action is one of:
+
+        - "bootstrap": validate and POST the configuration.
+        - "poll": skip validation and the POST, go straight to the status checks.
+
+        ## Raises if:
+
+        - ND is already bootstrapped with a configuration that differs from the desired configuration (NdReconcileConflictError).
+        """
+        method_name: str = inspect.stack()[0][3]
+        msg: str = ""
+
+        nd_reconcile = NdReconcile()
+        nd_reconcile.context = self.context
+        nd_reconcile.config = self._config
+        if self._cluster_data:
+            nd_reconcile.cluster_data = self._cluster_data
+        result = nd_reconcile.commit()
+
+        if result.action == "conflict":
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Cluster '{self.nd_bootstrap_config.nd_cluster_name}' is already bootstrapped "
+            msg += "with a configuration that differs from the desired configuration."
+            raise NdReconcileConflictError(msg, differences=result.differences)
+        if result.action == "poll":
+            msg = f"{self.class_name}.{method_name}: "
+            if result.differences:
+                msg += f"Bootstrap state is {result.state}. The differences above cannot be applied to a running bootstrap. "
+            else:
+                msg += f"Bootstrap state is {result.state} and the configuration is unchanged. "
+            msg += "Skipping pre-flight validation and POST."
+            print(msg)
+        return result
 
     def select_validator(self, firmware_version: str) -> "NdVerifyRemoteServices | NdNtpServersValidate":
         """
@@ -225,16 +289,15 @@ class NdBootstrap:
           which NdNtpServersValidate handles case-insensitively.
         - Any other / unrecognized version defaults to NTP verification, with a warning.
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = "select_validator"
         msg: str = ""
 
-        remote_services_versions = ["4.2.1.4", "4.2.1.10"]
-        if firmware_version in remote_services_versions:
+        if firmware_version in REMOTE_SERVICES_VERSIONS:
             validator: NdVerifyRemoteServices | NdNtpServersValidate = NdVerifyRemoteServices()
             msg = f"{self.class_name}.{method_name}: "
             msg += f"ND {firmware_version}: using remote-services (DNS + NTP) pre-flight validation."
             print(msg)
-        elif firmware_version.startswith("4.3."):
+        elif firmware_version.startswith(NTP_VERSION_PREFIXES):
             validator = NdNtpServersValidate()
             msg = f"{self.class_name}.{method_name}: "
             msg += f"ND {firmware_version}: using NTP pre-flight validation."
@@ -246,66 +309,142 @@ class NdBootstrap:
             print(msg)
         return validator
 
-    def commit(self) -> None:
+    @staticmethod
+    def supports_firmware(firmware_version: str) -> bool:
         """
-        Commit the changes by loading the YAML config, updating node credentials, and
-        posting the bootstrap configuration.
+        Return True if select_validator() recognizes firmware_version, rather than defaulting to NTP validation.
         """
-        method_name: str = inspect.stack()[0][3]
-        msg: str = ""
-
-        if not self.session:
-            msg = f"{self.class_name}.{method_name}: "
-            msg += "instance.session must be set before calling instance.commit, exiting."
-            print(msg)
-            sys_exit(1)
-
-        if not self.config_file:
-            msg = f"{self.class_name}.{method_name}: "
-            msg += "instance.config_file must be set before calling instance.commit, exiting."
-            print(msg)
-            sys_exit(1)
-
-        self.nd_bootstrap_config.config_file = self.config_file
-        self.nd_bootstrap_config.commit()
-        self._config = self.nd_bootstrap_config.config
-
-        self.update_node_credentials()
-        self.update_node_controller_ip()
-
-        msg = f"{self.class_name}.{method_name}: "
-        msg += f"Bootstrapping cluster '{self.nd_bootstrap_config.nd_cluster_name}' "
-        msg += f"on Nexus Dashboard at {self.nd_environment.nd_ip}."
-        print(msg)
-        self.update_node_serial_numbers()
+        return firmware_version in REMOTE_SERVICES_VERSIONS or firmware_version.startswith(NTP_VERSION_PREFIXES)
 
-        # Detect ND firmware version
-        nd_version = NdVersion()
-        nd_version.session = self.session
-        nd_version.commit()
-
-        # Choose pre-flight validation based on the detected firmware version
-        validate = self.select_validator(nd_version.firmware_version)
-
-        validate.session = self.session
+    def validate_configuration(self, firmware_version: str) -> NdValidationResult:
+        """
+        Run the pre-flight validation appropriate for firmware_version, consulting the validation cache first.
+        """
+        validate = self.select_validator(firmware_version)
+        validate.context = self.context
         validate.config = self._config
-        validate.commit()
+        validate.firmware_version = firmware_version
+        self.validation_cache.revalidate = self.revalidate
+        validate.cache = self.validation_cache
+        return validate.commit()
 
-        # POST the Bootstrap JSON
-        self.send_bootstrap_configuration()
+    def load_config(self) -> None:
+        """
+        Load and validate the configuration (the "load_config" stage), then announce the cluster
+        to cluster_state and the event sinks ("bootstrap.started").
+        """
+        with self.context.phase("load_config"):
+            if self.config_file:
+                self.nd_bootstrap_config.config_file = self.config_file
+            self.nd_bootstrap_config.commit()
+            self._config = self.nd_bootstrap_config.config
+        self.context.cluster_state.update(cluster_name=self.nd_bootstrap_config.nd_cluster_name)
+        self.context.emit("bootstrap.started", dry_run=self.dry_run, reconcile=self.reconcile, poll=self.poll)
+
+    def poll_status(self, result: NdBootstrapResult) -> None:
+        """
+        Poll the bootstrap status, then the install status, until each completes, and store the results in result.
 
-        if self.poll:
+        If verify_health is True and the install completed, check the health of every node and
+        externalServices address (see NdNodeHealth), which raises NdHealthCheckError if any check fails.
+        """
+        with self.context.phase("poll_bootstrap"):
             nd_bootstrap_status = NdPollBootstrapStatus()
-            nd_bootstrap_status.session = self.session
+            nd_bootstrap_status.context = self.context
             nd_bootstrap_status.retries = self.retries
             nd_bootstrap_status.interval = self.interval
-            nd_bootstrap_status.commit()
+            result.bootstrap_poll = nd_bootstrap_status.commit()
 
+        with self.context.phase("poll_install"):
             nd_install_status = NdPollInstallStatus()
-            nd_install_status.session = self.session
+            nd_install_status.context = self.context
             nd_install_status.retries = self.retries
             nd_install_status.interval = self.interval
-            nd_install_status.commit()
+            result.install_poll = nd_install_status.commit()
+
+        if self.verify_health and result.install_poll.completed:
+            with self.context.phase("verify_health"):
+                nd_node_health = NdNodeHealth()
+                nd_node_health.context = self.context
+                nd_node_health.config = self._config
+                result.health = nd_node_health.commit()
+
+    def commit(self) -> NdBootstrapResult:
+        """
+        Commit the changes by loading the YAML config, updating node credentials, and
+        posting the bootstrap configuration.
+
+        The configuration is loaded and validated before logging in to Nexus Dashboard.
+
+        Instead of setting config_file, nd_bootstrap_config may be replaced with an
+        NdBootstrapConfig instance whose config is already set (e.g. from NdConfigGenerator).
+
+        Returns:
+            NdBootstrapResult
+
+        Raises:
+            NdBootstrapError (or a subclass, see nd_bootstrap.exceptions) on failure.
+        """
+        method_name: str = inspect.stack()[0][3]
+        msg: str = ""
+
+        if not self.config_file and not self.nd_bootstrap_config.config:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "instance.config_file (or instance.nd_bootstrap_config.config) must be set before calling instance.commit."
+            raise NdParameterError(msg)
+
+        with self.context.phase("bootstrap", {"nd.dry_run": self.dry_run, "nd.reconcile": self.reconcile}) as span:
+            # The TCP and TLS handshakes with Nexus Dashboard run in the background while the configuration loads.
+            self.context.prewarm()
+            self.load_config()
+            span.set_attribute("nd.cluster.name", self.nd_bootstrap_config.nd_cluster_name)
+
+            # Everything above is local, so a broken configuration fails before any network round trip.
+            with self.context.phase("login"):
+                self.login()
+            self.context.cluster_state.update(nd_ip=self.context.nd_ip)
+
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Bootstrapping cluster '{self.nd_bootstrap_config.nd_cluster_name}' "
+            msg += f"on Nexus Dashboard at {self.context.nd_ip}."
+            print(msg)
+            with self.context.phase("serial_numbers"):
+                self.update_node_serial_numbers()
+
+            result = NdBootstrapResult(cluster_name=self.nd_bootstrap_config.nd_cluster_name, nd_ip=self.context.nd_ip)
+            result.discovery = self._discovery_result
+            if self.reconcile:
+                with self.context.phase("reconcile"):
+                    result.reconcile = self.reconcile_cluster()
+                result.action = result.reconcile.action
+            span.set_attribute("nd.action", result.action)
+
+            if result.action == "bootstrap":
+                # Detect ND firmware version
+                with self.context.phase("version"):
+                    nd_version = NdVersion()
+                    nd_version.context = self.context
+                    result.firmware_version = nd_version.commit().firmware_version
+                span.set_attribute("nd.firmware.version", result.firmware_version)
+
+                with self.context.phase("validation"):
+                    result.validation = self.validate_configuration(result.firmware_version)
+
+                # POST the Bootstrap JSON
+                with self.context.phase("post"):
+                    result.post_status_code = self.send_bootstrap_configuration()
+            elif self.dry_run:
+                msg = f"{self.class_name}.{method_name}: "
+                msg += "DRY RUN: Nothing to POST, Nexus Dashboard already has the desired configuration."
+                print(msg)
+
+            if self.dry_run:
+                result.action = "dry_run"
+            elif self.poll:
+                self.poll_status(result)
+            self.context.cluster_state.update(stage="completed")
+            self.context.emit("bootstrap.completed", action=result.action, firmware_version=result.firmware_version)
+            return result
 
     @property
     def config_file(self) -> str:
@@ -320,8 +459,7 @@ class NdBootstrap:
     @config_file.setter
     def config_file(self, value: str) -> None:
         if not value or not isinstance(value, str):
-            print("Invalid config_file: empty or not a string, exiting.")
-            sys_exit(1)
+            raise NdParameterError("Invalid config_file: empty or not a string.")
         self._config_file = value
 
     @property
@@ -334,6 +472,22 @@ class NdBootstrap:
         """
         return self._config
 
+    @property
+    def discovery_timeout(self) -> int:
+        """
+        With wait_for_nodes, the number of seconds to wait for every configured node to register with Nexus Dashboard.
+
+        - getter: return the discovery timeout in seconds.
+        - setter: set and validate the discovery timeout in seconds.
+        """
+        return self._discovery_timeout
+
+    @discovery_timeout.setter
+    def discovery_timeout(self, value: int) -> None:
+        if not isinstance(value, int) or value < 0:
+            raise NdParameterError("Invalid discovery_timeout: not a non-negative int.")
+        self._discovery_timeout = value
+
     @property
     def dry_run(self) -> bool:
         """
@@ -347,8 +501,7 @@ class NdBootstrap:
     @dry_run.setter
     def dry_run(self, value: bool) -> None:
         if not isinstance(value, bool):
-            print("Invalid dry_run: not a boolean, exiting.")
-            sys_exit(1)
+            raise NdParameterError("Invalid dry_run: not a boolean.")
         self._dry_run = value
 
     @property
@@ -364,8 +517,7 @@ class NdBootstrap:
     @interval.setter
     def interval(self, value: int) -> None:
         if not isinstance(value, int):
-            print("Invalid interval: not an int, exiting.")
-            sys_exit(1)
+            raise NdParameterError("Invalid interval: not an int.")
         self._interval = value
 
     @property
@@ -381,10 +533,78 @@ class NdBootstrap:
     @poll.setter
     def poll(self, value: bool) -> None:
         if not isinstance(value, bool):
-            print("Invalid poll: not a boolean, exiting.")
-            sys_exit(1)
+            raise NdParameterError("Invalid poll: not a boolean.")
         self._poll = value
 
+    @property
+    def reconcile(self) -> bool:
+        """
+        If true, compare the configuration with Nexus Dashboard's current state before validating and posting.
+
+        - getter: return the reconcile flag.
+        - setter: set the reconcile flag.
+        """
+        return self._reconcile
+
+    @reconcile.setter
+    def reconcile(self, value: bool) -> None:
+        if not isinstance(value, bool):
+            raise NdParameterError("Invalid reconcile: not a boolean.")
+        self._reconcile = value
+
+    @property
+    def revalidate(self) -> bool:
+        """
+        If true, ignore cached pre-flight validation results and always contact Nexus Dashboard.
+
+        - getter: return the revalidate flag.
+        - setter: set the revalidate flag.
+        """
+        return self._revalidate
+
+    @revalidate.setter
+    def revalidate(self, value: bool) -> None:
+        if not isinstance(value, bool):
+            raise NdParameterError("Invalid revalidate: not a boolean.")
+        self._revalidate = value
+
+    @property
+    def context(self) -> NdContext:
+        """
+        getter: return the NdContext for the target Nexus Dashboard. Built from the environment if not set.
+        setter: set the NdContext for the target Nexus Dashboard.
+        """
+        if self._context is None:
+            self._context = NdContext.from_environment()
+        return self._context
+
+    @context.setter
+    def context(self, value: NdContext) -> None:
+        if not isinstance(value, NdContext):
+            raise NdParameterError("Invalid context: not an NdContext instance.")
+        self._context = value
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        context.session, the authenticated requests.Session, created by login() during commit().
+
+        - getter: return the session. Raises NdParameterError if commit() has not logged in yet.
+        - setter: set an already-authenticated session. login() is then skipped.
+        """
+        method_name: str = "session"
+        msg: str = ""
+        session = self.context.session
+        if session is None:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "Not logged in to Nexus Dashboard yet."
+            raise NdParameterError(msg)
+        return session
+
+    @session.setter
+    def session(self, value: requests.Session) -> None:
+        self.context.session = value
+
     @property
     def retries(self) -> int:
         """
@@ -398,6 +618,37 @@ class NdBootstrap:
     @retries.setter
     def retries(self, value: int) -> None:
         if not isinstance(value, int):
-            print("Invalid retries: not an int, exiting.")
-            sys_exit(1)
+            raise NdParameterError("Invalid retries: not an int.")
         self._retries = value
+
+    @property
+    def verify_health(self) -> bool:
+        """
+        If true, check the health of every node and externalServices address after the install completes.
+
+        - getter: return the verify_health flag.
+        - setter: set the verify_health flag.
+        """
+        return self._verify_health
+
+    @verify_health.setter
+    def verify_health(self, value: bool) -> None:
+        if not isinstance(value, bool):
+            raise NdParameterError("Invalid verify_health: not a boolean.")
+        self._verify_health = value
+
+    @property
+    def wait_for_nodes(self) -> bool:
+        """
+        If true, wait (with backoff) until every configured node has registered with Nexus Dashboard before enrichment.
+
+        - getter: return the wait_for_nodes flag.
+        - setter: set the wait_for_nodes flag.
+        """
+        return self._wait_for_nodes
+
+    @wait_for_nodes.setter
+    def wait_for_nodes(self, value: bool) -> None:
+        if not isinstance(value, bool):
+            raise NdParameterError("Invalid wait_for_nodes: not a boolean.")
+        self._wait_for_nodes = value
@@ -0,0 +1,313 @@
+"""
+Nexus Dashboard HTTP Cassettes
+
+Record the HTTP exchanges of a real Nexus Dashboard session to a cassette file, and replay them offline.
+"""
+
+import gzip
+import inspect
+import json
+import threading
+import time
+from collections import deque
+from collections.abc import Mapping
+from io import BytesIO
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.response import HTTPResponse
+
+from nd_bootstrap.exceptions import NdConfigError, NdParameterError
+
+# Keys whose values are replaced with REDACTED in recorded request and response bodies.
+REDACTED_KEYS: frozenset[str] = frozenset(
+    {
+        "authToken",
+        "jwttoken",
+        "loginPassword",
+        "password",
+        "passphrase",
+        "token",
+        "userPasswd",
+    }
+)
+REDACTED: str = "REDACTED"
+CASSETTE_VERSION: int = 1
+
+
+def redact(value: object) -> object:
+    """
+    Return a copy of value with the values of REDACTED_KEYS replaced, at any depth.
+    """
+    if isinstance(value, dict):
+        return {key: REDACTED if key in REDACTED_KEYS else redact(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [redact(item) for item in value]
+    return value
+
+
+def redact_body(body: str) -> str:
+    """
+    Return a JSON body with secrets redacted.  Non-JSON bodies are returned unchanged.
+    """
+    try:
+        return json.dumps(redact(json.loads(body)), separators=(",", ":"))
+    except ValueError:
+        return body
+
+
+def load_cassette(cassette_file: str) -> dict:
+    """
+    Load a cassette file (gzip-compressed if the name ends with .gz).
+
+    Raises NdConfigError if the file cannot be read or is not a cassette.
+    """
+    try:
+        if cassette_file.endswith(".gz"):
+            with gzip.open(cassette_file, "rt", encoding="utf-8") as compressed_file:
+                cassette = json.load(compressed_file)
+        else:
+            with open(cassette_file, "r", encoding="utf-8") as plain_file:
+                cassette = json.load(plain_file)
+    except (OSError, ValueError) as e:
+        raise NdConfigError(f"load_cassette: Error reading cassette file '{cassette_file}': {str(e)}") from e
+    if not isinstance(cassette, dict) or not isinstance(cassette.get("interactions"), list):
+        raise NdConfigError(f"load_cassette: '{cassette_file}' is not a cassette file.")
+    return cassette
+
+
+class NdCassetteRecorder(HTTPAdapter):
+    """
+    # Summary
+
+    requests transport adapter that performs every request for real and records the exchange.
+
+    Each interaction records the time since the first request, the method, the path (without
+    scheme and host, so a cassette can be replayed against any address), the request body, the
+    response status, Content-Type and body, or the connection error raised.  Secrets (passwords,
+    tokens) are redacted and cookies and authorization headers are not recorded.
+
+    ## Properties
+
+    - cassette_file: (getter/setter) Path of the cassette file written by save(). Compressed with gzip if it ends with .gz.
+    - interactions: (getter) The interactions recorded so far.
+
+    ## Usage
+
+    ```python
+    recorder = NdCassetteRecorder()
+    recorder.cassette_file = "nd-4.2.1.10-bootstrap.json.gz"
+    context.adapter = recorder  # mounted on the session created by NdLogin
+    try:
+        nd_bootstrap.commit()
+    finally:
+        recorder.save()
+    ```
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.class_name: str = self.__class__.__name__
+        self._cassette_file: str = ""
+        self._interactions: list[dict] = []
+        self._lock = threading.Lock()
+        self._start: float | None = None
+
+    def send(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: float | tuple[float, float] | tuple[float, None] | None = None,
+        verify: bool | str = True,
+        cert: bytes | str | tuple[bytes | str, bytes | str] | None = None,
+        proxies: Mapping[str, str] | None = None,
+    ) -> requests.Response:
+        """
+        Send the request and record the exchange.
+        """
+        with self._lock:
+            if self._start is None:
+                self._start = time.monotonic()
+            elapsed = time.monotonic() - self._start
+        interaction: dict = {
+            "t": round(elapsed, 3),
+            "method": request.method,
+            "path": request.path_url,
+        }
+        if request.body:
+            body = request.body.decode("utf-8", errors="replace") if isinstance(request.body, bytes) else str(request.body)
+            interaction["request"] = redact_body(body)
+        try:
+            response = super().send(request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+        except requests.RequestException as e:
+            interaction["error"] = type(e).__name__
+            interaction["message"] = str(e)
+            self.append(interaction)
+            raise
+        interaction["status"] = response.status_code
+        interaction["content_type"] = response.headers.get("Content-Type", "")
+        interaction["body"] = redact_body(response.text)
+        self.append(interaction)
+        return response
+
+    def append(self, interaction: dict) -> None:
+        """
+        Append an interaction to the recording.
+        """
+        with self._lock:
+            self._interactions.append(interaction)
+
+    def save(self) -> None:
+        """
+        Write the recorded interactions to cassette_file.
+
+        Raises if:
+            - instance.cassette_file is not set
+        """
+        method_name: str = inspect.stack()[0][3]
+        msg: str = ""
+
+        if not self._cassette_file:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "instance.cassette_file must be set before calling instance.save."
+            raise NdParameterError(msg)
+        with self._lock:
+            interactions = list(self._interactions)
+        data = json.dumps({"version": CASSETTE_VERSION, "interactions": interactions}, separators=(",", ":"))
+        if self._cassette_file.endswith(".gz"):
+            with gzip.open(self._cassette_file, "wt", encoding="utf-8") as compressed_file:
+                compressed_file.write(data)
+        else:
+            with open(self._cassette_file, "w", encoding="utf-8") as plain_file:
+                plain_file.write(data)
+        msg = f"{self.class_name}.{method_name}: "
+        msg += f"Recorded {len(interactions)} interactions to {self._cassette_file}."
+        print(msg)
+
+    @property
+    def cassette_file(self) -> str:
+        """
+        getter: return the cassette file path.
+        setter: set the cassette file path.
+        """
+        return self._cassette_file
+
+    @cassette_file.setter
+    def cassette_file(self, value: str) -> None:
+        if not value or not isinstance(value, str):
+            raise NdParameterError("Invalid cassette_file: empty or not a string.")
+        self._cassette_file = value
+
+    @property
+    def interactions(self) -> list[dict]:
+        """
+        getter: return the interactions recorded so far.
+        """
+        return self._interactions
+
+
+class NdCassettePlayer(HTTPAdapter):
+    """
+    # Summary
+
+    requests transport adapter that answers requests from a cassette instead of the network.
+
+    Interactions are replayed in recorded order, per (method, path).  Once only the last
+    interaction for a (method, path) remains, it is repeated, so that e.g. a status endpoint keeps
+    reporting its final state however often it is polled.  Requests that were never recorded are
+    answered with 404, which the package treats as "not available yet".  Recorded connection errors
+    are raised as requests.ConnectionError.
+
+    Replay does not wait between requests.  To compress the waits between polls as well, set
+    context.clock to an NdScaledClock (see nd_bootstrap.clock); with speed 0, a 25-minute bootstrap
+    replays in milliseconds.
+
+    ## Properties
+
+    - cassette_file: (getter/setter) Path of the cassette file. Setting it loads the cassette.
+    - remaining: (getter) The number of interactions not yet replayed.
+
+    ## Usage
+
+    ```python
+    player = NdCassettePlayer()
+    player.cassette_file = "nd-4.2.1.10-bootstrap.json.gz"
+    context.adapter = player
+    context.clock = NdScaledClock()
+    context.clock.speed = 0
+    result = nd_bootstrap.commit()
+    ```
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.class_name: str = self.__class__.__name__
+        self._cassette_file: str = ""
+        self._lock = threading.Lock()
+        self._queues: dict[tuple[str, str], deque[dict]] = {}
+
+    def next_interaction(self, method: str, path: str) -> dict | None:
+        """
+        Return the next recorded interaction for (method, path), or None if there is none.
+        """
+        with self._lock:
+            queue = self._queues.get((method, path))
+            if not queue:
+                return None
+            if len(queue) > 1:
+                return queue.popleft()
+            return queue[0]
+
+    def send(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: float | tuple[float, float] | tuple[float, None] | None = None,
+        verify: bool | str = True,
+        cert: bytes | str | tuple[bytes | str, bytes | str] | None = None,
+        proxies: Mapping[str, str] | None = None,
+    ) -> requests.Response:
+        """
+        Answer the request from the cassette.
+        """
+        interaction = self.next_interaction(str(request.method), str(request.path_url))
+        if interaction is None:
+            interaction = {"status": 404, "content_type": "text/plain", "body": f"{request.method} {request.path_url} is not in the cassette"}
+        if "error" in interaction:
+            raise requests.ConnectionError(f"{interaction['error']} (replayed): {interaction.get('message', '')}", request=request)
+        body = interaction.get("body", "").encode("utf-8")
+        raw = HTTPResponse(
+            body=BytesIO(body),
+            headers={"Content-Type": interaction.get("content_type", ""), "Content-Length": str(len(body))},
+            status=interaction["status"],
+            preload_content=False,
+        )
+        return self.build_response(request, raw)
+
+    @property
+    def cassette_file(self) -> str:
+        """
+        getter: return the cassette file path.
+        setter: set the cassette file path and load the cassette.
+        """
+        return self._cassette_file
+
+    @cassette_file.setter
+    def cassette_file(self, value: str) -> None:
+        if not value or not isinstance(value, str):
+            raise NdParameterError("Invalid cassette_file: empty or not a string.")
+        cassette = load_cassette(value)
+        queues: dict[tuple[str, str], deque[dict]] = {}
+        for interaction in cassette["interactions"]:
+            queues.setdefault((interaction["method"], interaction["path"]), deque()).append(interaction)
+        with self._lock:
+            self._cassette_file = value
+            self._queues = queues
+
+    @property
+    def remaining(self) -> int:
+        """
+        getter: return the number of interactions not yet replayed (the repeated last interaction of each path is not counted).
+        """
+        with self._lock:
+            return sum(len(queue) - 1 for queue in self._queues.values())
@@ -0,0 +1,167 @@
+"""
+Nexus Dashboard Bootstrap Clocks
+
+Time sources used for every wait in the package, so that waits can be compressed (e.g. when replaying a cassette).
+"""
+
+import threading
+import time
+
+from nd_bootstrap.exceptions import NdParameterError
+
+
+class NdClock:
+    """
+    # Summary
+
+    Wall-clock time source.  Every wait in the package (polling intervals, backoff, login retries)
+    goes through `context.clock`, so that a different clock can be substituted per context.
+
+    ## Methods
+
+    - monotonic(): Seconds from an arbitrary, monotonically increasing origin.
+    - sleep(seconds): Wait for seconds.
+    - time(): Seconds since the epoch.
+    """
+
+    def monotonic(self) -> float:
+        """
+        Return seconds from an arbitrary, monotonically increasing origin.
+        """
+        return time.monotonic()
+
+    def sleep(self, seconds: float) -> None:
+        """
+        Wait for seconds.
+        """
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def time(self) -> float:
+        """
+        Return seconds since the epoch.
+        """
+        return time.time()
+
+
+class NdScaledClock(NdClock):
+    """
+    # Summary
+
+    Time-compressed clock.  sleep(seconds) waits seconds / speed in real time, and monotonic()
+    and time() advance `speed` times faster than real time, so that code measuring elapsed time
+    (timeouts, backoff) behaves as if the full time had passed.
+
+    A speed of 0 means infinite compression: sleep() returns immediately and time advances
+    only by the amounts slept.
+
+    ## Properties
+
+    - speed: (getter/setter) The compression factor. Default is 1000.
+
+    ## Usage
+
+    ```python
+    context.clock = NdScaledClock()
+    context.clock.speed = 1000  # A 10-second polling interval takes 10 milliseconds
+    ```
+    """
+
+    def __init__(self) -> None:
+        self._real_anchor: float = time.monotonic()
+        self._virtual_anchor: float = self._real_anchor
+        self._epoch_offset: float = time.time() - self._real_anchor
+        self._speed: float = 1000
+
+    def monotonic(self) -> float:
+        """
+        Return seconds from an arbitrary origin, advancing speed times faster than real time.
+        """
+        if self._speed == 0:
+            return self._virtual_anchor
+        return self._virtual_anchor + (time.monotonic() - self._real_anchor) * self._speed
+
+    def sleep(self, seconds: float) -> None:
+        """
+        Wait for seconds / speed in real time (not at all if speed is 0).
+        """
+        if seconds <= 0:
+            return
+        if self._speed == 0:
+            self._virtual_anchor += seconds
+            return
+        time.sleep(seconds / self._speed)
+
+    def time(self) -> float:
+        """
+        Return seconds since the epoch, advancing speed times faster than real time.
+        """
+        return self.monotonic() + self._epoch_offset
+
+    @property
+    def speed(self) -> float:
+        """
+        getter: return the compression factor.
+        setter: set the compression factor. Time does not jump when the speed changes.
+        """
+        return self._speed
+
+    @speed.setter
+    def speed(self, value: float) -> None:
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0:
+            raise NdParameterError("Invalid speed: not a non-negative number.")
+        self._virtual_anchor = self.monotonic()
+        self._real_anchor = time.monotonic()
+        self._speed = value
+
+
+class NdVirtualClock(NdClock):
+    """
+    # Summary
+
+    Virtual clock for simulations and tests.  sleep(seconds) returns immediately and advances
+    the clock by seconds, so code that waits hours runs in microseconds and is fully deterministic.
+
+    ## Methods
+
+    - advance(seconds): Advance the clock without sleeping (e.g. to model time spent in a request).
+
+    ## Usage
+
+    ```python
+    clock = NdVirtualClock()
+    context.clock = clock
+    nd_poll_bootstrap_status.commit()
+    print(f"Polling took {clock.monotonic()} virtual seconds")
+    ```
+    """
+
+    def __init__(self, start: float = 0.0) -> None:
+        self._now: float = start
+        self._lock = threading.Lock()
+
+    def advance(self, seconds: float) -> None:
+        """
+        Advance the clock by seconds.
+        """
+        if seconds > 0:
+            with self._lock:
+                self._now += seconds
+
+    def monotonic(self) -> float:
+        """
+        Return the virtual time.
+        """
+        return self._now
+
+    def sleep(self, seconds: float) -> None:
+        """
+        Advance the clock by seconds, without waiting.
+        """
+        self.advance(seconds)
+
+    def time(self) -> float:
+        """
+        Return the virtual time (seconds since the virtual epoch).
+        """
+        return self._now
@@ -0,0 +1,299 @@
+"""
+Nexus Dashboard Cluster State
+
+In-memory progress state of each cluster being bootstrapped, shared with dashboards in-process or through a state directory.
+"""
+
+import inspect
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass, field, fields
+
+from nd_bootstrap.exceptions import NdParameterError
+
+
+@dataclass
+class NdClusterState:
+    """
+    # Summary
+
+    Progress of one cluster bootstrap, updated in memory by NdBootstrap (stage), the pollers
+    (progress, overallStatus, state), NdLogin (re-authentications) and failures (last_error).
+
+    Updating state never sends a request or touches the disk, so it is safe to do on every poll.
+    Readers (NdDashboard, NdClusterStateRegistry.publish) take copies with snapshot().
+
+    ## Fields
+
+    - cluster_name, nd_ip: Identify the cluster.
+    - stage: The NdBootstrap stage in progress, e.g. "validation" or "poll_install"; "completed" or "failed" at the end.
+    - progress: The last overallProgress reported by a poller (0-100).
+    - overall_status, state: The last overallStatus and state reported by a poller.
+    - last_error: The last error seen (network error, unexpected status code, or the exception that ended the run).
+    - reauth_count: The number of re-authentications (401s, login refreshes).
+    - started, updated: Epoch seconds when the run started and when the state last changed.
+    - stage_started: Epoch seconds when the current stage started.
+    - version: Incremented on every change.
+
+    ## Usage
+
+    ```python
+    context.cluster_state.update(stage="poll_install", progress=40)
+    print(context.cluster_state.eta)
+    ```
+    """
+
+    cluster_name: str = ""
+    nd_ip: str = ""
+    stage: str = "starting"
+    progress: int = 0
+    overall_status: str = ""
+    state: str = ""
+    last_error: str = ""
+    reauth_count: int = 0
+    started: float = field(default_factory=time.time)
+    updated: float = field(default_factory=time.time)
+    stage_started: float = field(default_factory=time.time)
+    # (epoch seconds, progress) of the first progress sample of the current stage, for the ETA
+    progress_anchor: tuple[float, int] | None = None
+    version: int = 0
+
+    def __post_init__(self) -> None:
+        self._lock = threading.Lock()
+
+    def update(self, **values: object) -> None:
+        """
+        Set the fields named in values (see Fields) and bump version.  Changing stage restarts the ETA estimate.
+
+        Raises if:
+            - a field does not exist
+        """
+        names = {item.name for item in fields(self)} - {"version", "progress_anchor"}
+        with self._lock:
+            now = time.time()
+            for name, value in values.items():
+                if name not in names:
+                    raise NdParameterError(f"Invalid cluster state field: {name}.")
+                if name == "stage" and value != self.stage:
+                    self.stage_started = now
+                    self.progress_anchor = None
+                setattr(self, name, value)
+            if "progress" in values and self.progress_anchor is None:
+                self.progress_anchor = (now, self.progress)
+            self.updated = now
+            self.version += 1
+
+    def add_reauth(self) -> None:
+        """
+        Count one re-authentication.
+        """
+        with self._lock:
+            self.reauth_count += 1
+            self.updated = time.time()
+            self.version += 1
+
+    @property
+    def eta(self) -> float | None:
+        """
+        Seconds until progress reaches 100 at the rate observed since the first sample of the current stage, or None if unknown.
+        """
+        anchor = self.progress_anchor
+        if anchor is None or self.progress >= 100:
+            return None
+        anchor_time, anchor_progress = anchor
+        elapsed = time.time() - anchor_time
+        gained = self.progress - anchor_progress
+        if gained <= 0 or elapsed <= 0:
+            return None
+        return (100 - self.progress) * elapsed / gained
+
+    @property
+    def key(self) -> str:
+        """
+        The registry key: cluster_name, or nd_ip if the name is not known yet.
+        """
+        return self.cluster_name or self.nd_ip or "unknown"
+
+    def snapshot(self) -> "NdClusterState":
+        """
+        Return a consistent copy, for rendering or publishing.
+        """
+        with self._lock:
+            copy = NdClusterState(**{item.name: getattr(self, item.name) for item in fields(self)})
+        return copy
+
+    def to_dict(self) -> dict:
+        """
+        Return the fields as a dictionary (for JSON).
+        """
+        return asdict(self.snapshot())
+
+
+class NdClusterStateRegistry:
+    """
+    # Summary
+
+    The NdClusterState of every cluster being bootstrapped by this process (one per NdContext),
+    for NdDashboard to render.
+
+    With state_dir set, `start_publishing()` writes each state that changed to
+    `<state_dir>/<cluster>.json` (atomically) at most every publish_interval seconds, from a background
+    thread, so that `python -m nd_bootstrap.dashboard STATE_DIR` can show several nd_bootstrap.py
+    processes in one table.  `load(state_dir)` reads them back.
+
+    ## Properties
+
+    - publish_interval: (getter/setter) Seconds between writes to state_dir. Default is 1.
+    - state_dir: (getter/setter) Directory to publish states to. Default is "" (not published).
+
+    ## Usage
+
+    ```python
+    registry = NdClusterStateRegistry()
+    registry.register(context.cluster_state)
+    registry.state_dir = "/tmp/nd_bootstrap_state"
+    registry.start_publishing()
+    ...
+    registry.stop_publishing()
+    ```
+    """
+
+    def __init__(self) -> None:
+        self.class_name: str = self.__class__.__name__
+        self._lock = threading.Lock()
+        self._published: dict[int, int] = {}
+        self._publish_interval: float = 1.0
+        self._publisher: threading.Thread | None = None
+        self._state_dir: str = ""
+        self._states: list[NdClusterState] = []
+        self._stop = threading.Event()
+
+    def register(self, state: NdClusterState) -> None:
+        """
+        Add state to the registry.
+        """
+        with self._lock:
+            if not any(registered is state for registered in self._states):
+                self._states.append(state)
+
+    def snapshot(self) -> list[NdClusterState]:
+        """
+        Return copies of every registered state, in registration order.
+        """
+        with self._lock:
+            states = list(self._states)
+        return [state.snapshot() for state in states]
+
+    @property
+    def version(self) -> int:
+        """
+        getter: return a number that changes whenever any registered state changes.
+        """
+        with self._lock:
+            return sum(state.version for state in self._states) + len(self._states)
+
+    def publish(self) -> None:
+        """
+        Write every state that changed since the last publish to state_dir.
+        """
+        with self._lock:
+            states = list(self._states)
+        for state in states:
+            if self._published.get(id(state)) == state.version:
+                continue
+            snapshot = state.snapshot()
+            path = os.path.join(self._state_dir, f"{snapshot.key.replace(os.sep, '_')}.json")
+            with tempfile.NamedTemporaryFile("w", dir=self._state_dir, delete=False, suffix=".tmp", encoding="utf-8") as temp_file:
+                json.dump(asdict(snapshot), temp_file)
+            os.replace(temp_file.name, path)
+            self._published[id(state)] = snapshot.version
+
+    def start_publishing(self) -> None:
+        """
+        Publish to state_dir every publish_interval seconds from a background thread, until stop_publishing().
+
+        Raises if:
+            - instance.state_dir is not set
+        """
+        method_name: str = inspect.stack()[0][3]
+        msg: str = ""
+
+        if not self._state_dir:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "instance.state_dir must be set before calling instance.start_publishing."
+            raise NdParameterError(msg)
+        os.makedirs(self._state_dir, exist_ok=True)
+        self._stop.clear()
+
+        def run() -> None:
+            while not self._stop.wait(self._publish_interval):
+                self.publish()
+
+        self._publisher = threading.Thread(target=run, name="nd-state-publisher", daemon=True)
+        self._publisher.start()
+
+    def stop_publishing(self) -> None:
+        """
+        Stop the background publisher and publish the final states.
+        """
+        self._stop.set()
+        if self._publisher is not None:
+            self._publisher.join()
+            self._publisher = None
+        if self._state_dir:
+            self.publish()
+
+    @staticmethod
+    def load(state_dir: str) -> list[NdClusterState]:
+        """
+        Return the states published to state_dir (by any number of processes), sorted by start time.
+        """
+        states: list[NdClusterState] = []
+        try:
+            names = sorted(os.listdir(state_dir))
+        except OSError:
+            return states
+        for name in names:
+            if not name.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(state_dir, name), "r", encoding="utf-8") as state_file:
+                    data = json.load(state_file)
+                anchor = data.get("progress_anchor")
+                data["progress_anchor"] = tuple(anchor) if anchor else None
+                states.append(NdClusterState(**data))
+            except (OSError, ValueError, TypeError):
+                # Being replaced, or not a state file.
+                continue
+        return sorted(states, key=lambda state: state.started)
+
+    @property
+    def publish_interval(self) -> float:
+        """
+        getter: return the number of seconds between writes to state_dir.
+        setter: set the number of seconds between writes to state_dir.
+        """
+        return self._publish_interval
+
+    @publish_interval.setter
+    def publish_interval(self, value: float) -> None:
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+            raise NdParameterError("Invalid publish_interval: not a positive number.")
+        self._publish_interval = float(value)
+
+    @property
+    def state_dir(self) -> str:
+        """
+        getter: return the directory states are published to.
+        setter: set the directory states are published to.
+        """
+        return self._state_dir
+
+    @state_dir.setter
+    def state_dir(self, value: str) -> None:
+        if not value or not isinstance(value, str):
+            raise NdParameterError("Invalid state_dir: empty or not a string.")
+        self._state_dir = value
@@ -5,17 +5,18 @@ Loads and validates bootstrap configuration files.
 """
 
 import inspect
-from sys import exit as sys_exit
 
 from yaml import safe_load
 
+from nd_bootstrap.exceptions import NdConfigError, NdParameterError
+
 
 class NdBootstrapConfig:
     """
     Load and validate a Nexus Dashboard bootstrap configuration file.
 
     Properties:
-        - config: (getter) Returns the configuration dictionary loaded from config_file
+        - config: (getter/setter) The configuration dictionary loaded from config_file, or set directly
         - config_file: (getter/setter) The path to the YAML configuration file
         - nd_cluster_name: (getter) The name of the cluster, retrieved from config_file clusterConfig.name
     """
@@ -36,7 +37,7 @@ class NdBootstrapConfig:
         Sets:
             self._config: Dictionary containing the parsed YAML configuration
 
-        Exits with error message if:
+        Raises if:
             - the configuration file doesn't exist
             - the YAML file is malformed
             - 'clusterConfig' is not in the configuration
@@ -47,52 +48,50 @@ class NdBootstrapConfig:
         msg: str = ""
         if not self._config_file:
             msg = f"{self.class_name}.{method_name}: "
-            msg += "instance.config_file must be set before calling instance.load_yaml_config, exiting."
-            print(msg)
-            sys_exit(1)
+            msg += "instance.config_file must be set before calling instance.load_yaml_config."
+            raise NdParameterError(msg)
         try:
             with open(self._config_file, "r", encoding="utf-8") as config_file:
                 self._config = safe_load(config_file)
-        except FileNotFoundError:
+        except FileNotFoundError as e:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Error: Configuration file '{self._config_file}' not found."
-            print(msg)
-            sys_exit(1)
+            raise NdConfigError(msg) from e
         except IOError as e:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Error reading configuration file '{self._config_file}': {str(e)}"
-            print(msg)
-            sys_exit(1)
+            raise NdConfigError(msg) from e
 
     def validate_config(self) -> None:
         """
         Validate the loaded configuration.
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = "validate_config"
         msg: str = ""
 
         if "clusterConfig" not in self._config:
             msg = f"{self.class_name}.{method_name}: "
-            msg += "'clusterConfig' not found in config, exiting."
-            print(msg)
-            sys_exit(1)
+            msg += "'clusterConfig' not found in config."
+            raise NdConfigError(msg)
         if not self._config.get("nodes", []):
             msg = f"{self.class_name}.{method_name}: "
-            msg += "No nodes defined in 'config', exiting."
-            print(msg)
-            sys_exit(1)
+            msg += "No nodes defined in 'config'."
+            raise NdConfigError(msg)
         self._nd_cluster_name = self._config["clusterConfig"].get("name", "")
         if not self._nd_cluster_name:
             msg = f"{self.class_name}.{method_name}: "
-            msg += "'clusterConfig.name' is empty, exiting."
-            print(msg)
-            sys_exit(1)
+            msg += "'clusterConfig.name' is empty."
+            raise NdConfigError(msg)
 
     def commit(self) -> None:
         """
         Load and validate the configuration file.
+
+        If config_file is not set but config was set directly (e.g. by NdConfigGenerator),
+        validate config without loading a file.
         """
-        self.load_config()
+        if self._config_file or not self._config:
+            self.load_config()
         self.validate_config()
 
     @property
@@ -106,8 +105,7 @@ class NdBootstrapConfig:
     @config_file.setter
     def config_file(self, value: str) -> None:
         if not value or not isinstance(value, str):
-            print("Invalid config_file: empty or not a string, exiting.")
-            sys_exit(1)
+            raise NdParameterError("Invalid config_file: empty or not a string.")
         self._config_file = value
 
     @property
@@ -123,8 +121,7 @@ class NdBootstrapConfig:
     @config.setter
     def config(self, value: dict) -> None:
         if not isinstance(value, dict):
-            print("Invalid config: not a dictionary, exiting.")
-            sys_exit(1)
+            raise NdParameterError("Invalid config: not a dictionary.")
         self._config = value
 
     @property
@@ -0,0 +1,228 @@
+"""
+Nexus Dashboard Bootstrap Configuration Generator
+
+Renders bootstrap configurations from one template and an inventory of per-cluster variables.
+"""
+
+import csv
+import inspect
+import ipaddress
+from collections.abc import Callable, Iterator
+from string import Template
+
+from yaml import safe_load
+
+from nd_bootstrap.config import NdBootstrapConfig
+from nd_bootstrap.exceptions import NdConfigError, NdParameterError
+
+
+class NdConfigGenerator:
+    """
+    # Summary
+
+    Lazily render Nexus Dashboard bootstrap configurations from a YAML template and an inventory file.
+
+    The template is parsed once.  Each inventory row is then rendered in memory and yielded as a
+    validated NdBootstrapConfig instance, so that nothing is written to disk and the first cluster
+    is available as soon as the first inventory row is read.
+
+    ## Template
+
+    A bootstrap YAML file in which string values may contain `${variable}` placeholders.
+
+    - A value that is exactly one placeholder (e.g. `pool: ${mgmt_pool}`) is replaced by the
+      variable's value as-is, so lists (such as the derived pools below) can be substituted.
+    - Otherwise, placeholders are substituted as strings (e.g. `name: ND-${site}-c1`).
+
+    ## Inventory
+
+    - CSV (`*.csv`): a header row of variable names followed by one row per cluster.  Rows are read lazily.
+    - YAML (any other extension): a list of mappings, one per cluster.
+
+    ## Derived variables
+
+    For each inventory variable `<name>`:
+
+    - If the value is an interface in CIDR notation (e.g. `mgmt_ip: 192.168.7.7/24`):
+        - `<name>_address`: the address without prefix length, e.g. 192.168.7.7
+        - `<name>_network`: the network, e.g. 192.168.7.0/24
+        - `<name>_gateway`: the first host in the network, e.g. 192.168.7.1
+    - If `<name>_pool_start` and `<name>_pool_size` are both set:
+        - `<name>_pool`: a list of `<name>_pool_size` consecutive addresses starting at `<name>_pool_start`
+
+    Variables given explicitly in the inventory take precedence over derived ones.
+
+    ## Properties
+
+    - inventory_file: (getter/setter) Path to the CSV or YAML inventory file
+    - template_file: (getter/setter) Path to the YAML template file
+
+    ## Usage
+
+    ```python
+    instance = NdConfigGenerator()
+    instance.template_file = "nd_bootstrap_template.yaml"
+    instance.inventory_file = "nd_bootstrap_inventory.csv"
+    for nd_bootstrap_config in instance.generate():
+        print(nd_bootstrap_config.nd_cluster_name)
+    ```
+    """
+
+    def __init__(self) -> None:
+        self.class_name: str = self.__class__.__name__
+        self._inventory_file: str = ""
+        self._template_file: str = ""
+
+    def load_template(self) -> Callable[[dict], object]:
+        """
+        Parse the template file once and compile it into a render function.
+
+        Returns:
+            A function that takes a variables dictionary and returns a rendered configuration dictionary.
+
+        Raises if:
+            - the template file doesn't exist or cannot be read
+        """
+        method_name: str = inspect.stack()[0][3]
+        msg: str = ""
+        try:
+            with open(self._template_file, "r", encoding="utf-8") as template_file:
+                template = safe_load(template_file)
+        except IOError as e:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Error reading template file '{self._template_file}': {str(e)}"
+            raise NdConfigError(msg) from e
+        return self.compile(template)
+
+    def compile(self, node: object) -> Callable[[dict], object]:
+        """
+        Compile a parsed template node into a render function.
+
+        String templates are parsed once here rather than once per inventory row.  Every
+        rendered configuration is a fresh tree, since NdBootstrap updates nodes in place.
+        """
+        if isinstance(node, dict):
+            compiled_items = [(key, self.compile(value)) for key, value in node.items()]
+            return lambda variables: {key: render(variables) for key, render in compiled_items}
+        if isinstance(node, list):
+            compiled_list = [self.compile(value) for value in node]
+            return lambda variables: [render(variables) for render in compiled_list]
+        if isinstance(node, str) and "$" in node:
+            template = Template(node)
+            identifiers = template.get_identifiers()
+            if len(identifiers) == 1 and node.strip() in (f"${identifiers[0]}", f"${{{identifiers[0]}}}"):
+                name = identifiers[0]
+                return lambda variables: variables[name]
+            return template.substitute
+        return lambda variables: node
+
+    def read_inventory(self) -> Iterator[dict]:
+        """
+        Yield one dictionary of variables per inventory row.
+
+        Raises if:
+            - the inventory file doesn't exist or cannot be read
+            - a YAML inventory is not a list of mappings
+        """
+        method_name: str = inspect.stack()[0][3]
+        msg: str = ""
+        try:
+            with open(self._inventory_file, "r", encoding="utf-8", newline="") as inventory_file:
+                if self._inventory_file.lower().endswith(".csv"):
+                    for row in csv.DictReader(inventory_file):
+                        yield {key.strip(): value.strip() for key, value in row.items() if key and value is not None and value.strip()}
+                    return
+                rows = safe_load(inventory_file)
+        except IOError as e:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Error reading inventory file '{self._inventory_file}': {str(e)}"
+            raise NdConfigError(msg) from e
+        if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Inventory file '{self._inventory_file}' must contain a list of mappings."
+            raise NdConfigError(msg)
+        yield from rows
+
+    @staticmethod
+    def derive_variables(variables: dict) -> dict:
+        """
+        Return variables with derived subnet and pool variables added.
+        """
+        derived: dict = {}
+        for name, value in variables.items():
+            if isinstance(value, str) and "/" in value:
+                try:
+                    interface = ipaddress.ip_interface(value)
+                except ValueError:
+                    continue
+                derived[f"{name}_address"] = str(interface.ip)
+                derived[f"{name}_network"] = str(interface.network)
+                derived[f"{name}_gateway"] = str(next(interface.network.hosts(), interface.ip))
+            if name.endswith("_pool_start") and f"{name[: -len('_start')]}_size" in variables:
+                prefix = name[: -len("_start")]
+                start = ipaddress.ip_address(value)
+                derived[prefix] = [str(start + offset) for offset in range(int(variables[f"{prefix}_size"]))]
+        derived.update(variables)
+        return derived
+
+    def generate(self) -> Iterator[NdBootstrapConfig]:
+        """
+        Render and validate one NdBootstrapConfig per inventory row.
+
+        Raises if:
+            - instance.template_file or instance.inventory_file is not set
+            - a row is missing a variable used by the template
+            - a rendered configuration fails NdBootstrapConfig validation
+        """
+        method_name: str = inspect.stack()[0][3]
+        msg: str = ""
+
+        if not self._template_file or not self._inventory_file:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "instance.template_file and instance.inventory_file must be set before calling instance.generate."
+            raise NdParameterError(msg)
+
+        render = self.load_template()
+        for row_number, variables in enumerate(self.read_inventory(), start=1):
+            try:
+                config = render(self.derive_variables(variables))
+            except (KeyError, ValueError) as e:
+                msg = f"{self.class_name}.{method_name}: "
+                msg += f"Inventory row {row_number}: cannot render template, missing or invalid variable {str(e)}."
+                raise NdConfigError(msg) from e
+            if not isinstance(config, dict):
+                msg = f"{self.class_name}.{method_name}: "
+                msg += f"Template file '{self._template_file}' must contain a mapping."
+                raise NdConfigError(msg)
+            nd_bootstrap_config = NdBootstrapConfig()
+            nd_bootstrap_config.config = config
+            nd_bootstrap_config.commit()
+            yield nd_bootstrap_config
+
+    @property
+    def inventory_file(self) -> str:
+        """
+        getter: return the inventory file path.
+        setter: set the inventory file path.
+        """
+        return self._inventory_file
+
+    @inventory_file.setter
+    def inventory_file(self, value: str) -> None:
+        if not value or not isinstance(value, str):
+            raise NdParameterError("Invalid inventory_file: empty or not a string.")
+        self._inventory_file = value
+
+    @property
+    def template_file(self) -> str:
+        """
+        getter: return the template file path.
+        setter: set the template file path.
+        """
+        return self._template_file
+
+    @template_file.setter
+    def template_file(self, value: str) -> None:
+        if not value or not isinstance(value, str):
+            raise NdParameterError("Invalid template_file: empty or not a string.")
+        self._template_file = value
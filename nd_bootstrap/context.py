@@ -0,0 +1,508 @@
+"""
+Nexus Dashboard Target Context
+
+Carries everything needed to talk to one Nexus Dashboard target.
+"""
+
+import inspect
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from nd_bootstrap.auth_manager import NdAuthManager
+from nd_bootstrap.clock import NdClock
+from nd_bootstrap.cluster_state import NdClusterState
+from nd_bootstrap.deadline import NdDeadline
+from nd_bootstrap.dual_stack import NdDualStack
+from nd_bootstrap.environment import NdEnvironment
+from nd_bootstrap.events import NdEvent, NdEventBus
+from nd_bootstrap.exceptions import NdConfigError, NdParameterError
+from nd_bootstrap.profiler import NdProfiler
+from nd_bootstrap.tracing import NdSpan, NdTracer
+from nd_bootstrap.transport import NdTransportAdapter
+
+# Where the Nexus Dashboard address of a bootstrap configuration comes from: ND_IP4 / ND_IP6, or the
+# configuration itself (see NdContext.from_config).
+ADDRESS_SOURCES: tuple[str, ...] = ("environment", "config")
+
+
+class NdContext:  # pylint: disable=too-many-public-methods
+    """
+    # Summary
+
+    Per-target context: address(es), IP protocol, domain, credentials, session, and settings
+    for one Nexus Dashboard.
+
+    An NdContext is passed explicitly to every class that talks to Nexus Dashboard (via each
+    class's `context` property), so that several targets can be driven from one process, e.g.
+    one context per thread.  Environment variables are just one way to build a context
+    (see `from_environment()`).  Classes whose `context` is not set build one from the
+    environment on first use.
+
+    ## Properties
+
+    - adapter: (getter/setter) The requests HTTPAdapter mounted for https:// on sessions created by NdLogin
+      (e.g. NdCassetteRecorder or NdCassettePlayer). Default is an NdTransportAdapter, shared by those sessions
+      (one connection pool, with TLS session resumption), created on first use.
+    - auth: (getter/setter) The NdAuthManager that coalesces re-authentications with contexts sharing it. Default is NdAuthManager().
+    - clock: (getter/setter) The NdClock used for every wait (polling intervals, backoff). Default is NdClock() (wall clock).
+    - cluster_state: (getter/setter) The NdClusterState updated with the progress of this target (for NdDashboard). Default is NdClusterState().
+    - deadline: (getter/setter) The NdDeadline that bounds the run and each stage. Default is a disabled NdDeadline().
+    - events: (getter/setter) The NdEventBus that delivers progress notifications. Default is an NdEventBus() with no sinks.
+    - nd_domain: (getter/setter) The domain for authentication. Default is "local".
+    - nd_host: (getter) nd_ip, formatted for use in a URL (IPv6 addresses are enclosed in brackets).
+    - nd_ip: (getter) The address to use, based on nd_ip_protocol.
+    - nd_ip_protocol: (getter/setter) "IP4", "IP6", or "DUAL". Default is "IP4".
+    - nd_ip4: (getter/setter) The IPv4 address.
+    - nd_ip6: (getter/setter) The IPv6 address.
+    - nd_password: (getter/setter) The password for authentication.
+    - nd_username: (getter/setter) The username for authentication.
+    - profiler: (getter/setter) The NdProfiler that records per-phase timing. Default is a disabled NdProfiler().
+    - session: (getter/setter) The authenticated requests.Session shared by all classes using this context. Set by NdLogin.
+    - tracer: (getter/setter) The NdTracer that records trace spans. Default is a disabled NdTracer().
+    - transport: (getter) The NdTransportAdapter that requests go through, or None (e.g. when replaying a cassette).
+    - verify: (getter/setter) Whether to verify the TLS certificate of Nexus Dashboard. Default is False.
+
+    ## Methods
+
+    - emit(kind, **data): Send a progress event for this target through events.
+    - failover(): When nd_ip_protocol is DUAL, switch to the other address family if the current one is unreachable.
+    - phase(name, attributes): Context manager that records a workflow stage with the profiler, the tracer and cluster_state,
+      within the budget of the stage (if any).
+    - prewarm(): Open the connection to Nexus Dashboard from a background thread, ahead of the first request.
+
+    ## Usage
+
+    ```python
+    context = NdContext()
+    context.nd_ip4 = "192.168.7.7"
+    context.nd_username = "admin"
+    context.nd_password = "MyPassword"
+
+    nd_login = NdLogin()
+    nd_login.context = context
+    nd_login.commit()  # sets context.session
+
+    nd_version = NdVersion()
+    nd_version.context = context
+    nd_version.commit()
+    ```
+    """
+
+    def __init__(self) -> None:
+        self.class_name: str = self.__class__.__name__
+        # Created on first use: an NdTransportAdapter loads the CA certificates, which costs milliseconds and
+        # memory that contexts given another adapter (cassettes, simulations, NdFleetMonitor logins) never need.
+        self._adapter: HTTPAdapter | None = None
+        self._auth: NdAuthManager = NdAuthManager()
+        self._clock: NdClock = NdClock()
+        self._cluster_state: NdClusterState = NdClusterState()
+        self._deadline: NdDeadline = NdDeadline()
+        self._dual_stack: NdDualStack | None = None
+        self._events: NdEventBus = NdEventBus()
+        self._nd_domain: str = "local"
+        self._nd_ip_protocol: str = "IP4"
+        self._nd_ip4: str = ""
+        self._nd_ip6: str = ""
+        self._nd_password: str = ""
+        self._nd_username: str = ""
+        self._profiler: NdProfiler = NdProfiler()
+        self._session: requests.Session | None = None
+        self._tracer: NdTracer = NdTracer()
+        self._verify: bool = False
+
+    @classmethod
+    def from_environment(cls) -> "NdContext":
+        """
+        Build a context from the ND_* environment variables (see NdEnvironment).
+
+        Credentials are validated here, so a missing ND_USERNAME or ND_PASSWORD raises NdConfigError
+        with the same message as before.
+        """
+        nd_environment = NdEnvironment()
+        context = cls()
+        context.nd_domain = nd_environment.nd_domain
+        context.nd_ip_protocol = nd_environment.nd_ip_protocol
+        context.nd_ip4 = nd_environment.nd_ip4
+        context.nd_ip6 = nd_environment.nd_ip6
+        context.nd_username = nd_environment.nd_username
+        context.nd_password = nd_environment.nd_password
+        if context.nd_ip_protocol == "DUAL":
+            # Share the address selection with every other context built for the same addresses.
+            context._dual_stack = nd_environment.dual_stack  # pylint: disable=protected-access
+        return context
+
+    @classmethod
+    def from_config(cls, config: dict) -> "NdContext":
+        """
+        Build a context from the environment (see from_environment), targeting the Nexus Dashboard of a
+        bootstrap configuration: the managementNetwork address(es) of the node with `self: true` (the node
+        on which the CLI-based initial setup was performed), instead of ND_IP4 / ND_IP6.
+
+        Raises if:
+            - no node has `self: true` with a managementNetwork address (NdConfigError)
+        """
+        method_name: str = "from_config"
+        msg: str = ""
+
+        context = cls.from_environment()
+        for node in config.get("nodes", []):
+            if node.get("self") is not True:
+                continue
+            network = node.get("managementNetwork") or {}
+            nd_ip4 = str(network.get("ipSubnet") or "").split("/", maxsplit=1)[0]
+            nd_ip6 = str(network.get("ipv6Subnet") or "").split("/", maxsplit=1)[0]
+            if nd_ip4 or nd_ip6:
+                context.nd_ip4 = nd_ip4
+                context.nd_ip6 = nd_ip6
+                context.nd_ip_protocol = "IP4" if nd_ip4 else "IP6"
+                return context
+        msg = f"{cls.__name__}.{method_name}: "
+        msg += "No node with 'self: true' and a managementNetwork address in the configuration, so the Nexus Dashboard address is unknown."
+        raise NdConfigError(msg)
+
+    @property
+    def adapter(self) -> HTTPAdapter:
+        """
+        getter: return the HTTPAdapter mounted on new sessions.
+        setter: set the HTTPAdapter mounted on new sessions.
+        """
+        if self._adapter is None:
+            self._adapter = NdTransportAdapter()
+        return self._adapter
+
+    @adapter.setter
+    def adapter(self, value: HTTPAdapter) -> None:
+        if not isinstance(value, HTTPAdapter):
+            raise NdParameterError("Invalid adapter: not a requests.adapters.HTTPAdapter instance.")
+        self._adapter = value
+
+    @property
+    def auth(self) -> NdAuthManager:
+        """
+        getter: return the NdAuthManager that coalesces re-authentications.
+        setter: set the NdAuthManager that coalesces re-authentications (share one between contexts to coalesce across them).
+        """
+        return self._auth
+
+    @auth.setter
+    def auth(self, value: NdAuthManager) -> None:
+        if not isinstance(value, NdAuthManager):
+            raise NdParameterError("Invalid auth: not an NdAuthManager instance.")
+        self._auth = value
+
+    @property
+    def clock(self) -> NdClock:
+        """
+        getter: return the NdClock used for every wait.
+        setter: set the NdClock used for every wait.
+        """
+        return self._clock
+
+    @clock.setter
+    def clock(self, value: NdClock) -> None:
+        if not isinstance(value, NdClock):
+            raise NdParameterError("Invalid clock: not an NdClock instance.")
+        self._clock = value
+
+    @property
+    def cluster_state(self) -> NdClusterState:
+        """
+        getter: return the NdClusterState updated with the progress of this target.
+        setter: set the NdClusterState updated with the progress of this target.
+        """
+        return self._cluster_state
+
+    @cluster_state.setter
+    def cluster_state(self, value: NdClusterState) -> None:
+        if not isinstance(value, NdClusterState):
+            raise NdParameterError("Invalid cluster_state: not an NdClusterState instance.")
+        self._cluster_state = value
+
+    @property
+    def deadline(self) -> NdDeadline:
+        """
+        getter: return the NdDeadline that bounds the run and each stage.
+        setter: set the NdDeadline that bounds the run and each stage.
+        """
+        return self._deadline
+
+    @deadline.setter
+    def deadline(self, value: NdDeadline) -> None:
+        if not isinstance(value, NdDeadline):
+            raise NdParameterError("Invalid deadline: not an NdDeadline instance.")
+        self._deadline = value
+
+    @property
+    def dual_stack(self) -> NdDualStack:
+        """
+        Return the NdDualStack instance for this context, creating it on first access.
+
+        Raises if:
+            - nd_ip4 or nd_ip6 is not set
+        """
+        method_name: str = inspect.stack()[0][3]
+        if not self._nd_ip4 or not self._nd_ip6:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "nd_ip_protocol is set to DUAL but nd_ip4 and/or nd_ip6 is not set"
+            raise NdConfigError(msg)
+        if self._dual_stack is None:
+            self._dual_stack = NdDualStack(self._nd_ip4, self._nd_ip6)
+        return self._dual_stack
+
+    def emit(self, kind: str, **data: object) -> None:
+        """
+        Send a progress event of kind with data for this target through events.  Returns immediately
+        (without building the event) if no sink is configured, so this is safe to call on every poll.
+        """
+        if not self._events.enabled:
+            return
+        self._events.emit(NdEvent(kind=kind, cluster=self._cluster_state.key, nd_ip=self._cluster_state.nd_ip, data=data))
+
+    @property
+    def events(self) -> NdEventBus:
+        """
+        getter: return the NdEventBus that delivers progress notifications.
+        setter: set the NdEventBus that delivers progress notifications.
+        """
+        return self._events
+
+    @events.setter
+    def events(self, value: NdEventBus) -> None:
+        if not isinstance(value, NdEventBus):
+            raise NdParameterError("Invalid events: not an NdEventBus instance.")
+        self._events = value
+
+    def failover(self) -> str:
+        """
+        Signal that the current Nexus Dashboard address is unreachable.
+
+        When nd_ip_protocol is DUAL, re-race the address families and switch to whichever
+        connects first.  Otherwise, this is a no-op.
+
+        Returns:
+            str: The address to use from now on.
+        """
+        if self._nd_ip_protocol == "DUAL":
+            return self.dual_stack.failover()
+        return self.nd_ip
+
+    @contextmanager
+    def phase(self, name: str, attributes: dict[str, object] | None = None) -> Iterator[NdSpan]:
+        """
+        Record the enclosed block as a workflow stage called name: a profiler phase, a trace span with attributes,
+        the stage of cluster_state, and a "stage.started" event, within the budget of the stage in deadline (if any).  If the block raises, cluster_state records the error
+        and the "failed" stage, and a "stage.failed" event is sent.
+
+        Yields the NdSpan, so that attributes learned during the stage (e.g. the firmware version) can be added.
+        """
+        self._cluster_state.update(stage=name)
+        self.emit("stage.started", stage=name)
+        try:
+            with self._deadline.stage(name), self._profiler.phase(name), self._tracer.span(name, attributes) as span:
+                yield span
+        except Exception as e:
+            # Enclosing phases see the same exception; record it once, where it happened.
+            if self._cluster_state.stage != "failed":
+                self._cluster_state.update(stage="failed", last_error=str(e))
+                self.emit("stage.failed", stage=name, error=str(e), error_type=type(e).__name__)
+            raise
+
+    def prewarm(self) -> None:
+        """
+        Open a connection to Nexus Dashboard (TCP and TLS handshakes) from a background thread, and leave it
+        in the pool for the first request, so that the handshakes overlap with local work such as configuration loading.
+
+        Does nothing unless requests go through the NdTransportAdapter (e.g. not when replaying a cassette).
+        Errors are ignored: the first request reports them.
+        """
+        transport = self.transport
+        if transport is not None:
+            # nd_host is read in the background too: with DUAL, it races the address families.
+            transport.prewarm(lambda: f"https://{self.nd_host}/", self._verify)
+
+    @property
+    def nd_domain(self) -> str:
+        """
+        getter: return the domain for authentication.
+        setter: set the domain for authentication.
+        """
+        return self._nd_domain
+
+    @nd_domain.setter
+    def nd_domain(self, value: str) -> None:
+        self._nd_domain = value
+
+    @property
+    def nd_host(self) -> str:
+        """
+        Return nd_ip formatted for use as the host portion of a URL.
+
+        Returns:
+            str: nd_ip, with IPv6 addresses enclosed in brackets.
+        """
+        nd_ip = self.nd_ip
+        if ":" in nd_ip:
+            return f"[{nd_ip}]"
+        return nd_ip
+
+    @property
+    def nd_ip(self) -> str:
+        """
+        Return the Nexus Dashboard address, based on nd_ip_protocol.
+
+        Raises if:
+            - nd_ip_protocol is not "IP4", "IP6", or "DUAL"
+            - the address(es) required by nd_ip_protocol are not set
+        """
+        method_name: str = "nd_ip"
+        msg: str = ""
+        if self._nd_ip_protocol == "IP4":
+            if not self._nd_ip4:
+                msg = f"{self.class_name}.{method_name}: "
+                msg += "nd_ip_protocol is set to IP4 but nd_ip4 is not set"
+                raise NdConfigError(msg)
+            return self._nd_ip4
+        if self._nd_ip_protocol == "IP6":
+            if not self._nd_ip6:
+                msg = f"{self.class_name}.{method_name}: "
+                msg += "nd_ip_protocol is set to IP6 but nd_ip6 is not set"
+                raise NdConfigError(msg)
+            return self._nd_ip6
+        if self._nd_ip_protocol == "DUAL":
+            return self.dual_stack.nd_ip
+        msg = f"{self.class_name}.{method_name}: "
+        msg += f"Invalid nd_ip_protocol '{self._nd_ip_protocol}', must be 'IP4', 'IP6', or 'DUAL'"
+        raise NdConfigError(msg)
+
+    @property
+    def nd_ip_protocol(self) -> str:
+        """
+        getter: return the IP protocol, "IP4", "IP6", or "DUAL".
+        setter: set the IP protocol.
+        """
+        return self._nd_ip_protocol
+
+    @nd_ip_protocol.setter
+    def nd_ip_protocol(self, value: str) -> None:
+        self._nd_ip_protocol = value
+
+    @property
+    def nd_ip4(self) -> str:
+        """
+        getter: return the IPv4 address.
+        setter: set the IPv4 address.
+        """
+        return self._nd_ip4
+
+    @nd_ip4.setter
+    def nd_ip4(self, value: str) -> None:
+        self._nd_ip4 = value
+        self._dual_stack = None
+
+    @property
+    def nd_ip6(self) -> str:
+        """
+        getter: return the IPv6 address.
+        setter: set the IPv6 address.
+        """
+        return self._nd_ip6
+
+    @nd_ip6.setter
+    def nd_ip6(self, value: str) -> None:
+        self._nd_ip6 = value
+        self._dual_stack = None
+
+    @property
+    def nd_password(self) -> str:
+        """
+        getter: return the password for authentication.
+        setter: set the password for authentication.
+        """
+        return self._nd_password
+
+    @nd_password.setter
+    def nd_password(self, value: str) -> None:
+        self._nd_password = value
+
+    @property
+    def nd_username(self) -> str:
+        """
+        getter: return the username for authentication.
+        setter: set the username for authentication.
+        """
+        return self._nd_username
+
+    @nd_username.setter
+    def nd_username(self, value: str) -> None:
+        self._nd_username = value
+
+    @property
+    def profiler(self) -> NdProfiler:
+        """
+        getter: return the NdProfiler that records per-phase timing.
+        setter: set the NdProfiler that records per-phase timing.
+        """
+        return self._profiler
+
+    @profiler.setter
+    def profiler(self, value: NdProfiler) -> None:
+        if not isinstance(value, NdProfiler):
+            raise NdParameterError("Invalid profiler: not an NdProfiler instance.")
+        self._profiler = value
+
+    @property
+    def session(self) -> requests.Session | None:
+        """
+        getter: return the authenticated requests.Session, or None before login.
+        setter: set the authenticated requests.Session.
+        """
+        return self._session
+
+    @session.setter
+    def session(self, value: requests.Session) -> None:
+        if not isinstance(value, requests.Session):
+            raise NdParameterError("Invalid session: not a requests.Session instance.")
+        self._session = value
+
+    @property
+    def tracer(self) -> NdTracer:
+        """
+        getter: return the NdTracer that records trace spans.
+        setter: set the NdTracer that records trace spans.
+        """
+        return self._tracer
+
+    @tracer.setter
+    def tracer(self, value: NdTracer) -> None:
+        if not isinstance(value, NdTracer):
+            raise NdParameterError("Invalid tracer: not an NdTracer instance.")
+        self._tracer = value
+
+    @property
+    def transport(self) -> NdTransportAdapter | None:
+        """
+        getter: return the NdTransportAdapter that requests go through (possibly wrapped by other adapters), or None.
+        """
+        if self._adapter is None:
+            # Nothing was sent yet, and the default adapter is the transport.
+            self._adapter = NdTransportAdapter()
+        adapter: HTTPAdapter | None = self._adapter
+        # Wrapping adapters (profiler, tracer, hedging, deadline) hold the adapter they wrap in inner.
+        while adapter is not None and not isinstance(adapter, NdTransportAdapter):
+            adapter = getattr(adapter, "inner", None)
+        return adapter
+
+    @property
+    def verify(self) -> bool:
+        """
+        getter: return whether to verify the TLS certificate of Nexus Dashboard.
+        setter: set whether to verify the TLS certificate of Nexus Dashboard.
+        """
+        return self._verify
+
+    @verify.setter
+    def verify(self, value: bool) -> None:
+        self._verify = value
@@ -0,0 +1,210 @@
+"""
+Nexus Dashboard Bootstrap Terminal Dashboard
+
+Live table of every cluster being bootstrapped, rendered from in-memory state (no extra Nexus Dashboard requests).
+
+Usage:
+
+    # In one terminal, start any number of runs that publish their state
+    ./nd_bootstrap.py cluster1.yaml --poll-status --state-dir /tmp/nd_state > cluster1.log &
+    ./nd_bootstrap.py cluster2.yaml --poll-status --state-dir /tmp/nd_state > cluster2.log &
+    # In another, watch them all
+    python -m nd_bootstrap.dashboard /tmp/nd_state
+"""
+
+import argparse
+import shutil
+import sys
+import threading
+import time
+from collections.abc import Callable
+from typing import TextIO
+
+from nd_bootstrap.cluster_state import NdClusterState, NdClusterStateRegistry
+from nd_bootstrap.exceptions import NdParameterError
+
+# ANSI escape sequences: cursor home, clear to end of line, clear to end of screen, hide/show cursor
+CURSOR_HOME: str = "\x1b[H"
+CLEAR_LINE: str = "\x1b[K"
+CLEAR_BELOW: str = "\x1b[J"
+HIDE_CURSOR: str = "\x1b[?25l"
+SHOW_CURSOR: str = "\x1b[?25h"
+
+
+def format_duration(seconds: float | None) -> str:
+    """
+    Return seconds as "1h02m", "12m05s" or "42s", or "-" if seconds is None.
+    """
+    if seconds is None:
+        return "-"
+    seconds = int(seconds)
+    if seconds >= 3600:
+        return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
+    if seconds >= 60:
+        return f"{seconds // 60}m{seconds % 60:02d}s"
+    return f"{seconds}s"
+
+
+def progress_bar(progress: int, width: int = 20) -> str:
+    """
+    Return a progress bar like "[#########-----------]".
+    """
+    filled = max(0, min(width, progress * width // 100))
+    return f"[{'#' * filled}{'-' * (width - filled)}]"
+
+
+class NdDashboard:
+    """
+    # Summary
+
+    Terminal dashboard: one row per cluster with stage, progress bar, overallStatus, ETA, last
+    error and re-authentication count.
+
+    Rows are rendered from NdClusterState snapshots supplied by `source` (by default, an
+    NdClusterStateRegistry in this process, or the states published to a state directory by
+    other processes), so the dashboard never sends requests to Nexus Dashboard.
+
+    The screen is redrawn from a background thread at `fps` frames per second (default 2), and
+    only when a state changed or a second passed (for the elapsed/ETA columns).  Each frame is
+    built as one string and written with one write(), rows beyond the terminal height are
+    summarized in a final line, so hundreds of clusters cost a few milliseconds per frame.
+
+    ## Properties
+
+    - fps: (getter/setter) Frames per second. Default is 2.
+    - output: (getter/setter) The stream to draw on. Default is sys.__stdout__ (the terminal, even if sys.stdout is redirected).
+
+    ## Usage
+
+    ```python
+    registry = NdClusterStateRegistry()
+    registry.register(context.cluster_state)
+    dashboard = NdDashboard(registry.snapshot)
+    dashboard.start()
+    ...
+    dashboard.stop()
+    ```
+    """
+
+    def __init__(self, source: Callable[[], list[NdClusterState]]) -> None:
+        self.class_name: str = self.__class__.__name__
+        self._fps: float = 2.0
+        self._output: TextIO = sys.__stdout__ or sys.stdout
+        self._source = source
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @staticmethod
+    def render_row(state: NdClusterState, now: float) -> str:
+        """
+        Return one table row for state.
+        """
+        elapsed = format_duration(now - state.started)
+        eta = format_duration(state.eta) if state.stage.startswith("poll") else "-"
+        last_error = state.last_error.replace("\n", " ")[:60]
+        row = f"{state.key[:24]:<24} {state.stage[:16]:<16} {progress_bar(state.progress)} {state.progress:>3}% "
+        row += f"{state.overall_status[:14]:<14} {elapsed:>7} {eta:>7} {state.reauth_count:>6}  {last_error}"
+        return row
+
+    def render(self, states: list[NdClusterState], height: int, width: int) -> str:
+        """
+        Return one frame for states, fitted to a terminal of height rows and width columns.
+        """
+        now = time.time()
+        header = f"{'cluster':<24} {'stage':<16} {'progress':<27} {'status':<14} {'elapsed':>7} {'eta':>7} {'reauth':>6}  last error"
+        lines = [f"nd_bootstrap: {len(states)} cluster(s), {time.strftime('%H:%M:%S')}", header]
+        room = max(1, height - len(lines) - 1)
+        for state in states[:room]:
+            lines.append(self.render_row(state, now))
+        if len(states) > room:
+            lines.append(f"... {len(states) - room} more cluster(s) not shown")
+        return CURSOR_HOME + "".join(f"{line[:width]}{CLEAR_LINE}\n" for line in lines) + CLEAR_BELOW
+
+    def draw(self) -> None:
+        """
+        Render the current states and write the frame.
+        """
+        size = shutil.get_terminal_size()
+        self._output.write(self.render(self._source(), size.lines, size.columns))
+        self._output.flush()
+
+    def run(self) -> None:
+        """
+        Redraw at fps until stop() is called.  Frames are skipped while nothing changed and less than a second passed.
+        """
+        last_signature: tuple = ()
+        last_draw: float = 0.0
+        self._output.write(HIDE_CURSOR)
+        try:
+            while not self._stop.is_set():
+                states = self._source()
+                signature = tuple((state.key, state.version) for state in states)
+                now = time.monotonic()
+                if signature != last_signature or now - last_draw >= 1.0:
+                    size = shutil.get_terminal_size()
+                    self._output.write(self.render(states, size.lines, size.columns))
+                    self._output.flush()
+                    last_signature = signature
+                    last_draw = now
+                self._stop.wait(1.0 / self._fps)
+        finally:
+            self.draw()
+            self._output.write(SHOW_CURSOR)
+            self._output.flush()
+
+    def start(self) -> None:
+        """
+        Start redrawing from a background thread.
+        """
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run, name="nd-dashboard", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop redrawing, after drawing a final frame.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    @property
+    def fps(self) -> float:
+        """
+        getter: return the number of frames per second.
+        setter: set the number of frames per second.
+        """
+        return self._fps
+
+    @fps.setter
+    def fps(self, value: float) -> None:
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or not 0 < value <= 30:
+            raise NdParameterError("Invalid fps: not a number between 0 (exclusive) and 30.")
+        self._fps = float(value)
+
+    @property
+    def output(self) -> TextIO:
+        """
+        getter: return the stream the dashboard draws on.
+        setter: set the stream the dashboard draws on.
+        """
+        return self._output
+
+    @output.setter
+    def output(self, value: TextIO) -> None:
+        self._output = value
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Live table of the nd_bootstrap.py runs publishing their state (--state-dir) to STATE_DIR")
+    parser.add_argument("state_dir", help="Directory given to nd_bootstrap.py --state-dir")
+    parser.add_argument("--fps", type=float, default=2, help="Frames per second. Default is 2")
+    args = parser.parse_args()
+
+    dashboard = NdDashboard(lambda: NdClusterStateRegistry.load(args.state_dir))
+    dashboard.fps = args.fps
+    try:
+        dashboard.run()
+    except KeyboardInterrupt:
+        pass
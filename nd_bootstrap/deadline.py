@@ -0,0 +1,293 @@
+"""
+Nexus Dashboard Bootstrap Deadline
+
+One deadline for a whole run, with optional per-stage budgets, applied to every request timeout and every wait.
+"""
+
+import inspect
+import threading
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from nd_bootstrap.clock import NdClock
+from nd_bootstrap.exceptions import NdDeadlineExceededError, NdParameterError
+
+if TYPE_CHECKING:
+    # NdContext holds an NdDeadline, so import it for type checking only.
+    from nd_bootstrap.context import NdContext
+
+
+class NdDeadlineAdapter(HTTPAdapter):
+    """
+    # Summary
+
+    requests transport adapter that bounds the timeout of every request by the time left before the
+    deadline (and by NdDeadline.request_timeout if the caller set none), and refuses to send once the
+    deadline has passed, then hands the request to an inner adapter.
+
+    Installed by NdDeadline.attach().
+    """
+
+    def __init__(self, deadline: "NdDeadline", inner: HTTPAdapter | None = None) -> None:
+        super().__init__()
+        self.inner: HTTPAdapter = inner if inner is not None else HTTPAdapter()
+        self.deadline = deadline
+
+    def send(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: float | tuple[float, float] | tuple[float, None] | None = None,
+        verify: bool | str = True,
+        cert: bytes | str | tuple[bytes | str, bytes | str] | None = None,
+        proxies: Mapping[str, str] | None = None,
+    ) -> requests.Response:
+        """
+        Send the request with the inner adapter, with its timeout bounded by the deadline.
+        """
+        bounded = self.deadline.timeout(timeout, f"{request.method} {request.url}")
+        return self.inner.send(request, stream=stream, timeout=bounded, verify=verify, cert=cert, proxies=proxies)
+
+    def close(self) -> None:
+        """
+        Close the inner adapter.
+        """
+        self.inner.close()
+        super().close()
+
+
+class NdDeadlineClock(NdClock):
+    """
+    # Summary
+
+    Clock that refuses to wait past the deadline: sleep(seconds) raises NdDeadlineExceededError at once
+    if the deadline would expire before the wait ends, instead of sleeping and failing later.
+    Time is read from the inner clock (the wall clock, or e.g. an NdScaledClock when replaying).
+
+    Installed by NdDeadline.attach().
+    """
+
+    def __init__(self, deadline: "NdDeadline", inner: NdClock) -> None:
+        self.deadline = deadline
+        self.inner = inner
+
+    def monotonic(self) -> float:
+        """
+        Return the monotonic time of the inner clock.
+        """
+        return self.inner.monotonic()
+
+    def sleep(self, seconds: float) -> None:
+        """
+        Wait for seconds with the inner clock.
+
+        Raises if:
+            - the deadline expires before the wait would end (NdDeadlineExceededError)
+        """
+        self.deadline.check(f"a {seconds:g}-second wait", seconds)
+        self.inner.sleep(seconds)
+
+    def time(self) -> float:
+        """
+        Return the time of the inner clock.
+        """
+        return self.inner.time()
+
+
+class NdDeadline:
+    """
+    # Summary
+
+    A deadline for a whole run (seconds, counted from attach()), plus optional budgets for individual
+    stages (e.g. {"poll_install": 1800}), counted from the start of the stage.  The earliest of the
+    deadlines in force applies.
+
+    Once attached to a context, the deadline bounds:
+
+    - every request sent by a session created by NdLogin (including re-logins and login_refresh):
+      the timeout becomes the smaller of the caller's timeout (or request_timeout, if the caller set
+      none) and the time left, and nothing is sent once the deadline has passed;
+    - every wait through context.clock (polling intervals, login_refresh backoff, node discovery):
+      a wait that would end after the deadline raises at once.
+
+    so a run finishes, one way or the other, by about the deadline.  Expiry raises
+    NdDeadlineExceededError, whose scope is "run" or the stage name.
+
+    Stage budgets are entered by NdContext.phase(), so every NdBootstrap stage can have one:
+    bootstrap (the whole workflow), load_config, login, serial_numbers, node_discovery, reconcile, version, validation, post,
+    poll_bootstrap, poll_install, verify_health.
+
+    ## Properties
+
+    - budgets: (getter/setter) Stage name to seconds. Default is {} (no stage budgets).
+    - enabled: (getter) True once attached with seconds or budgets set.
+    - request_timeout: (getter/setter) Timeout (seconds) for requests sent without one. Default is 30.
+    - seconds: (getter/setter) The deadline of the whole run, in seconds. Default is 0 (none).
+
+    ## Usage
+
+    ```python
+    deadline = NdDeadline()
+    deadline.seconds = 3600
+    deadline.budgets = {"poll_install": 2400}
+    deadline.attach(context)  # after any other adapter or clock is set
+    NdBootstrap(...).commit()  # raises NdDeadlineExceededError if the hour runs out
+    ```
+    """
+
+    def __init__(self) -> None:
+        self.class_name: str = self.__class__.__name__
+        self._budgets: dict[str, float] = {}
+        self._clock: NdClock = NdClock()
+        self._enabled: bool = False
+        self._lock = threading.Lock()
+        self._request_timeout: float = 30.0
+        self._seconds: float = 0.0
+        # (scope, expires) for the run and each stage with a budget that is in progress
+        self._stack: list[tuple[str, float]] = []
+
+    def attach(self, context: "NdContext") -> None:
+        """
+        Start the run deadline, set context.deadline to this deadline, and wrap context.adapter and
+        context.clock so that every request and wait is bounded.
+
+        Call this before NdLogin creates the session, and after any other adapter or clock is set.
+        """
+        self._clock = context.clock
+        self._enabled = bool(self._seconds or self._budgets)
+        if self._seconds:
+            self._stack = [("run", self._clock.monotonic() + self._seconds)]
+        context.deadline = self
+        context.adapter = NdDeadlineAdapter(self, context.adapter)
+        context.clock = NdDeadlineClock(self, context.clock)
+
+    def earliest(self) -> tuple[str, float] | None:
+        """
+        Return the (scope, expires) of the earliest deadline in force, or None if there is none.
+        """
+        with self._lock:
+            if not self._stack:
+                return None
+            return min(self._stack, key=lambda entry: entry[1])
+
+    def remaining(self) -> float | None:
+        """
+        Return the seconds left before the earliest deadline in force, or None if there is none.
+        """
+        earliest = self.earliest()
+        if earliest is None:
+            return None
+        return earliest[1] - self._clock.monotonic()
+
+    def check(self, action: str, needed: float = 0.0) -> float | None:
+        """
+        Return the seconds left, or None if no deadline is in force.
+
+        Raises if:
+            - fewer than needed seconds are left before the earliest deadline (NdDeadlineExceededError)
+        """
+        method_name: str = inspect.stack()[0][3]
+        msg: str = ""
+
+        earliest = self.earliest()
+        if earliest is None:
+            return None
+        scope, expires = earliest
+        remaining = expires - self._clock.monotonic()
+        if remaining <= 0 or remaining < needed:
+            msg = f"{self.class_name}.{method_name}: "
+            if scope == "run":
+                msg += f"Run deadline of {self._seconds:g} seconds "
+            else:
+                msg += f"Budget of {self._budgets[scope]:g} seconds for stage '{scope}' "
+            msg += f"{'expired' if remaining <= 0 else f'expires in {remaining:.1f} seconds'}, before {action}."
+            raise NdDeadlineExceededError(msg, scope=scope)
+        return remaining
+
+    def timeout(self, requested: float | tuple[float, float] | tuple[float, None] | None, action: str) -> float | tuple[float, float] | tuple[float, None] | None:
+        """
+        Return requested (or request_timeout, if None) bounded by the time left before the deadline.
+
+        Raises if:
+            - the deadline has passed (NdDeadlineExceededError)
+        """
+        remaining = self.check(action)
+        if requested is None:
+            requested = self._request_timeout
+        if remaining is None:
+            return requested
+        if isinstance(requested, tuple):
+            connect, read = requested
+            return (min(connect, remaining), min(read, remaining) if read is not None else remaining)
+        return min(requested, remaining)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Apply the budget of stage name (if any) to the enclosed block.
+        """
+        budget = self._budgets.get(name) if self._enabled else None
+        if budget is None:
+            yield
+            return
+        entry = (name, self._clock.monotonic() + budget)
+        with self._lock:
+            self._stack.append(entry)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._stack.remove(entry)
+
+    @property
+    def budgets(self) -> dict[str, float]:
+        """
+        getter: return the budget, in seconds, of each stage that has one.
+        setter: set the budget, in seconds, of each stage that has one.
+        """
+        return self._budgets
+
+    @budgets.setter
+    def budgets(self, value: dict[str, float]) -> None:
+        if not isinstance(value, dict) or not all(isinstance(seconds, (int, float)) and seconds > 0 for seconds in value.values()):
+            raise NdParameterError("Invalid budgets: not a dictionary of stage names to positive numbers of seconds.")
+        self._budgets = {str(name): float(seconds) for name, seconds in value.items()}
+
+    @property
+    def enabled(self) -> bool:
+        """
+        getter: return True once attached with seconds or budgets set.
+        """
+        return self._enabled
+
+    @property
+    def request_timeout(self) -> float:
+        """
+        getter: return the timeout, in seconds, of requests sent without one.
+        setter: set the timeout, in seconds, of requests sent without one.
+        """
+        return self._request_timeout
+
+    @request_timeout.setter
+    def request_timeout(self, value: float) -> None:
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+            raise NdParameterError("Invalid request_timeout: not a positive number.")
+        self._request_timeout = float(value)
+
+    @property
+    def seconds(self) -> float:
+        """
+        getter: return the deadline of the whole run, in seconds (0 for none).
+        setter: set the deadline of the whole run, in seconds (0 for none).
+        """
+        return self._seconds
+
+    @seconds.setter
+    def seconds(self, value: float) -> None:
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0:
+            raise NdParameterError("Invalid seconds: not a non-negative number.")
+        self._seconds = float(value)
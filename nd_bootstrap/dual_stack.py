@@ -0,0 +1,208 @@
+"""
+Nexus Dashboard Dual-Stack Address Selection
+
+Races IPv4 and IPv6 connections to Nexus Dashboard and tracks the address family in use.
+"""
+
+import inspect
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from time import monotonic
+
+
+class NdDualStack:
+    """
+    # Summary
+
+    Select the Nexus Dashboard address to use when both an IPv4 and an IPv6 address are configured.
+
+    Connection attempts are raced "happy eyeballs" style (RFC 8305).  The IPv6 attempt starts
+    first and the IPv4 attempt starts after `attempt_delay` seconds (or immediately if the IPv6
+    attempt fails early).  The first address to complete a TCP connection wins and is used for
+    all subsequent requests until `failover()` is called.
+
+    ## Properties
+
+    - attempt_delay: (getter/setter) Seconds to wait before starting the IPv4 attempt. Default is 0.25.
+    - connect_timeout: (getter/setter) Seconds to wait for each TCP connection attempt. Default is 3.
+    - nd_ip: (getter) The selected address. Races the address families on first access.
+    - nd_ip4: (getter) The IPv4 address.
+    - nd_ip6: (getter) The IPv6 address.
+    - port: (getter/setter) The TCP port used for connection attempts. Default is 443.
+
+    ## Usage
+
+    ```python
+    dual_stack = NdDualStack("192.168.7.7", "2001:db8::7")
+    print(dual_stack.nd_ip)  # the first address to connect
+    # ... connection to the selected address fails ...
+    dual_stack.failover()
+    ```
+    """
+
+    def __init__(self, nd_ip4: str, nd_ip6: str) -> None:
+        self.class_name: str = self.__class__.__name__
+        self._attempt_delay: float = 0.25
+        self._connect_timeout: float = 3.0
+        self._lock = threading.Lock()
+        self._nd_ip: str = ""
+        self._nd_ip4: str = nd_ip4
+        self._nd_ip6: str = nd_ip6
+        self._port: int = 443
+
+    def _connect(self, index: int, address: str, start_events: list[threading.Event], decided: threading.Event) -> float:
+        """
+        Open (and immediately close) a TCP connection to address.
+
+        The attempt starts after index * attempt_delay seconds, or earlier if the previous
+        attempt failed.  A failed attempt releases the next one.
+
+        Returns:
+            float: The connection latency in seconds.
+
+        Raises:
+            OSError: If the connection fails or the race was already decided.
+        """
+        start_events[index].wait(index * self._attempt_delay)
+        if decided.is_set():
+            raise OSError(f"Connection attempt to {address} cancelled")
+        started = monotonic()
+        try:
+            with socket.create_connection((address, self._port), timeout=self._connect_timeout):
+                return monotonic() - started
+        except OSError:
+            if index + 1 < len(start_events):
+                start_events[index + 1].set()
+            raise
+
+    def race(self, exclude: str = "") -> str:
+        """
+        Race connection attempts to the configured addresses and return the first to connect.
+
+        Args:
+            exclude: An address to try last (e.g. the one that just failed).
+
+        Returns:
+            str: The winning address, or an empty string if no address could be reached.
+        """
+        method_name: str = inspect.stack()[0][3]
+        msg: str = ""
+
+        candidates = [address for address in (self._nd_ip6, self._nd_ip4) if address and address != exclude]
+        if exclude:
+            candidates.append(exclude)
+
+        start_events = [threading.Event() for _ in candidates]
+        decided = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=len(candidates))
+        futures = {executor.submit(self._connect, index, address, start_events, decided): address for index, address in enumerate(candidates)}
+        try:
+            for future in as_completed(futures):
+                if future.exception() is not None:
+                    continue
+                decided.set()
+                winner = futures[future]
+                msg = f"{self.class_name}.{method_name}: "
+                msg += f"Selected {winner} (connected in {future.result() * 1000:.1f} ms)."
+                print(msg)
+                return winner
+            return ""
+        finally:
+            decided.set()
+            for event in start_events:
+                event.set()
+            # Do not wait for slower attempts, they close their own sockets.
+            executor.shutdown(wait=False)
+
+    def failover(self) -> str:
+        """
+        Re-race the address families, preferring the address not currently in use.
+
+        Call this when a request to the current address fails.  If no address is reachable,
+        the current address is kept so that callers continue to retry it.
+
+        Returns:
+            str: The address to use from now on.
+        """
+        method_name: str = inspect.stack()[0][3]
+        msg: str = ""
+
+        with self._lock:
+            previous = self._nd_ip
+            winner = self.race(exclude=previous)
+            if not winner:
+                msg = f"{self.class_name}.{method_name}: "
+                msg += f"Neither {self._nd_ip4} nor {self._nd_ip6} is reachable. Keeping {previous or self._nd_ip6}."
+                print(msg)
+                self._nd_ip = previous or self._nd_ip6
+                return self._nd_ip
+            if winner != previous:
+                msg = f"{self.class_name}.{method_name}: "
+                msg += f"Switching Nexus Dashboard address from {previous} to {winner}."
+                print(msg)
+            self._nd_ip = winner
+            return self._nd_ip
+
+    @property
+    def attempt_delay(self) -> float:
+        """
+        getter: return the delay in seconds before the IPv4 attempt starts.
+        setter: set the delay in seconds before the IPv4 attempt starts.
+        """
+        return self._attempt_delay
+
+    @attempt_delay.setter
+    def attempt_delay(self, value: float) -> None:
+        self._attempt_delay = value
+
+    @property
+    def connect_timeout(self) -> float:
+        """
+        getter: return the TCP connection timeout in seconds.
+        setter: set the TCP connection timeout in seconds.
+        """
+        return self._connect_timeout
+
+    @connect_timeout.setter
+    def connect_timeout(self, value: float) -> None:
+        self._connect_timeout = value
+
+    @property
+    def nd_ip(self) -> str:
+        """
+        Return the selected Nexus Dashboard address, racing the address families on first access.
+
+        If neither address is reachable on first access, the IPv6 address is returned so that
+        callers fail (and retry) through their normal error handling.
+        """
+        with self._lock:
+            if not self._nd_ip:
+                self._nd_ip = self.race() or self._nd_ip6
+            return self._nd_ip
+
+    @property
+    def nd_ip4(self) -> str:
+        """
+        getter: return the IPv4 address.
+        """
+        return self._nd_ip4
+
+    @property
+    def nd_ip6(self) -> str:
+        """
+        getter: return the IPv6 address.
+        """
+        return self._nd_ip6
+
+    @property
+    def port(self) -> int:
+        """
+        getter: return the TCP port used for connection attempts.
+        setter: set the TCP port used for connection attempts.
+        """
+        return self._port
+
+    @port.setter
+    def port(self, value: int) -> None:
+        self._port = value
@@ -5,8 +5,16 @@ Reads and provides property-based access to ND environment variables.
 """
 
 import inspect
+import threading
 from os import environ
-from sys import exit as sys_exit
+
+from nd_bootstrap.dual_stack import NdDualStack
+from nd_bootstrap.exceptions import NdConfigError
+
+# NdDualStack instances shared by every NdEnvironment for the same (ND_IP4, ND_IP6) pair,
+# so that all classes agree on the address family in use and fail over together.
+_dual_stacks: dict[tuple[str, str], NdDualStack] = {}
+_dual_stacks_lock = threading.Lock()
 
 
 class NdEnvironment:
@@ -16,7 +24,8 @@ class NdEnvironment:
     Read the environment variables below for Nexus Dashboard and provide property access.
 
     - ND_DOMAIN: The domain for Nexus Dashboard authentication. Default is "local".
-    - ND_IP_PROTOCOL: The preferred IP protocol to use, either "IP4" or "IP6". Default is "IP4".
+    - ND_IP_PROTOCOL: The preferred IP protocol to use, either "IP4", "IP6", or "DUAL". Default is "IP4".
+        - DUAL: race ND_IP4 and ND_IP6 and use whichever connects first (see NdDualStack).
     - ND_IP4: The IPv4 address of the Nexus Dashboard
     - ND_IP6: The IPv6 address of the Nexus Dashboard
     - ND_PASSWORD: The password for Nexus Dashboard authentication
@@ -25,8 +34,9 @@ class NdEnvironment:
     ## Properties
 
     - nd_domain: The domain for Nexus Dashboard authentication. Default is "local".
+    - nd_host: nd_ip, formatted for use in a URL (IPv6 addresses are enclosed in brackets).
     - nd_ip: The IP address of the Nexus Dashboard, based on the preferred IP protocol.
-    - nd_ip_protocol: The preferred IP protocol, either "IP4" or "IP6". Default is "IP4".
+    - nd_ip_protocol: The preferred IP protocol, either "IP4", "IP6", or "DUAL". Default is "IP4".
     - nd_ip4: The IPv4 address of the Nexus Dashboard.
     - nd_ip6: The IPv6 address of the Nexus Dashboard.
     - nd_password: The password for Nexus Dashboard authentication.
@@ -40,6 +50,10 @@ class NdEnvironment:
     print(nd_env.nd_username)  # Prints the username
     # etc...
     ```
+
+    ## Methods
+
+    - failover(): When ND_IP_PROTOCOL is DUAL, switch to the other address family if the current one is unreachable.
     """
 
     def __init__(self) -> None:
@@ -52,6 +66,39 @@ class NdEnvironment:
         self._nd_password: str = environ.get("ND_PASSWORD", "")
         self._nd_username: str = environ.get("ND_USERNAME", "")
 
+    @property
+    def dual_stack(self) -> NdDualStack:
+        """
+        Return the NdDualStack instance shared by all NdEnvironment instances with the same ND_IP4 and ND_IP6.
+
+        Raises if:
+            - ND_IP4 or ND_IP6 is not set
+        """
+        method_name: str = inspect.stack()[0][3]
+        if not self._nd_ip4 or not self._nd_ip6:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "ND_IP_PROTOCOL is set to DUAL but ND_IP4 and/or ND_IP6 environment variable is not set"
+            raise NdConfigError(msg)
+        key = (self._nd_ip4, self._nd_ip6)
+        with _dual_stacks_lock:
+            if key not in _dual_stacks:
+                _dual_stacks[key] = NdDualStack(self._nd_ip4, self._nd_ip6)
+            return _dual_stacks[key]
+
+    def failover(self) -> str:
+        """
+        Signal that the current Nexus Dashboard address is unreachable.
+
+        When ND_IP_PROTOCOL is DUAL, re-race the address families and switch to whichever
+        connects first.  Otherwise, this is a no-op.
+
+        Returns:
+            str: The address to use from now on.
+        """
+        if self._nd_ip_protocol == "DUAL":
+            return self.dual_stack.failover()
+        return self.nd_ip
+
     @property
     def nd_domain(self) -> str:
         """
@@ -62,6 +109,19 @@ class NdEnvironment:
         """
         return self._nd_domain
 
+    @property
+    def nd_host(self) -> str:
+        """
+        Return nd_ip formatted for use as the host portion of a URL.
+
+        Returns:
+            str: nd_ip, with IPv6 addresses enclosed in brackets.
+        """
+        nd_ip = self.nd_ip
+        if ":" in nd_ip:
+            return f"[{nd_ip}]"
+        return nd_ip
+
     @property
     def nd_ip(self) -> str:
         """
@@ -70,30 +130,30 @@ class NdEnvironment:
         Returns:
             str: The IP address of the Nexus Dashboard.
 
-        Exits with error message if:
-            - ND_IP_PROTOCOL is not set to "IP4" or "IP6"
+        Raises if:
+            - ND_IP_PROTOCOL is not set to "IP4", "IP6", or "DUAL"
             - ND_IP_PROTOCOL is "IP4" but ND_IP4 is not set
             - ND_IP_PROTOCOL is "IP6" but ND_IP6 is not set
+            - ND_IP_PROTOCOL is "DUAL" but ND_IP4 or ND_IP6 is not set
         """
         method_name: str = inspect.stack()[0][3]
         if self._nd_ip_protocol == "IP4":
             if not self._nd_ip4:
                 msg = f"{self.class_name}.{method_name}: "
                 msg += "ND_IP_PROTOCOL is set to IP4 but ND_IP4 environment variable is not set"
-                print(msg)
-                sys_exit(1)
+                raise NdConfigError(msg)
             return self._nd_ip4
         if self._nd_ip_protocol == "IP6":
             if not self._nd_ip6:
                 msg = f"{self.class_name}.{method_name}: "
                 msg += "ND_IP_PROTOCOL is set to IP6 but ND_IP6 environment variable is not set"
-                print(msg)
-                sys_exit(1)
+                raise NdConfigError(msg)
             return self._nd_ip6
+        if self._nd_ip_protocol == "DUAL":
+            return self.dual_stack.nd_ip
         msg = f"{self.class_name}.{method_name}: "
-        msg += f"Invalid ND_IP_PROTOCOL '{self._nd_ip_protocol}', must be 'IP4' or 'IP6'"
-        print(msg)
-        sys_exit(1)
+        msg += f"Invalid ND_IP_PROTOCOL '{self._nd_ip_protocol}', must be 'IP4', 'IP6', or 'DUAL'"
+        raise NdConfigError(msg)
 
     @property
     def nd_ip_protocol(self) -> str:
@@ -101,7 +161,7 @@ class NdEnvironment:
         Retrieve ND_IP_PROTOCOL.
 
         Returns:
-            str: The preferred IP protocol, either "IP4" or "IP6". Defaults to "IP4".
+            str: The preferred IP protocol, either "IP4", "IP6", or "DUAL". Defaults to "IP4".
         """
         return self._nd_ip_protocol
 
@@ -133,7 +193,7 @@ class NdEnvironment:
         Returns:
             str: The password for Nexus Dashboard authentication.
 
-        Exits with error message if:
+        Raises if:
             - ND_PASSWORD is not set
         """
         method_name: str = inspect.stack()[0][3]
@@ -141,8 +201,7 @@ class NdEnvironment:
         if not self._nd_password:
             msg = f"{self.class_name}.{method_name}: "
             msg += "ND_PASSWORD environment variable not set"
-            print(msg)
-            sys_exit(1)
+            raise NdConfigError(msg)
         return self._nd_password
 
     @property
@@ -153,7 +212,7 @@ class NdEnvironment:
         Returns:
             str: The username for Nexus Dashboard authentication.
 
-        Exits with error message if:
+        Raises if:
             - ND_USERNAME is not set
         """
         method_name: str = inspect.stack()[0][3]
@@ -161,6 +220,5 @@ class NdEnvironment:
         if not self._nd_username:
             msg = f"{self.class_name}.{method_name}: "
             msg += "ND_USERNAME environment variable not set"
-            print(msg)
-            sys_exit(1)
+            raise NdConfigError(msg)
         return self._nd_username
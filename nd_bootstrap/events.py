@@ -0,0 +1,646 @@
+"""
+Nexus Dashboard Bootstrap Events
+
+Progress notifications (stage changes, validation results, poll progress, completion, failure)
+delivered to webhooks, files and Unix sockets from background workers, so that a slow or
+unreachable receiver never delays a poll.
+
+A local test receiver prints the events it receives:
+
+    python -m nd_bootstrap.events --http 127.0.0.1:8765      # then: nd_bootstrap.py ... --notify-webhook http://127.0.0.1:8765/
+    python -m nd_bootstrap.events --unix /tmp/nd_events.sock # then: nd_bootstrap.py ... --notify-socket /tmp/nd_events.sock
+"""
+
+import abc
+import argparse
+import inspect
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from nd_bootstrap.exceptions import NdConnectionError, NdParameterError
+
+OVERFLOW_POLICIES: tuple[str, ...] = ("drop_oldest", "drop_newest")
+
+
+@dataclass
+class NdEvent:
+    """
+    One progress notification.
+
+    - kind: e.g. "stage.started", "stage.failed", "validation", "poll.progress", "bootstrap.completed".
+    - cluster: The cluster name (or Nexus Dashboard address, before the configuration is loaded).
+    - nd_ip: The Nexus Dashboard address.
+    - time: Epoch seconds when the event was emitted.
+    - data: Event-specific values, e.g. {"stage": "poll_install"} or {"progress": 40, ...}.
+    """
+
+    kind: str
+    cluster: str = ""
+    nd_ip: str = ""
+    time: float = field(default_factory=time.time)
+    data: dict = field(default_factory=dict)
+
+    @property
+    def coalesce_key(self) -> str:
+        """
+        Events with the same coalesce_key supersede one another while queued.
+        """
+        return f"{self.cluster}|{self.kind}"
+
+    def to_dict(self) -> dict:
+        """
+        Return the event as a dictionary (for JSON).
+        """
+        return {"kind": self.kind, "cluster": self.cluster, "nd_ip": self.nd_ip, "time": self.time, "data": self.data}
+
+
+class NdEventSink(abc.ABC):
+    """
+    # Summary
+
+    Base class for event sinks.  send() is only ever called from the sink's NdEventChannel worker
+    thread, with a batch of event dictionaries, and raises to report a failed delivery.
+
+    send() is abstract, so a sink that does not implement it fails when it is created.
+    """
+
+    @property
+    def name(self) -> str:
+        """
+        getter: return a description of the sink, for messages.
+        """
+        return self.__class__.__name__
+
+    @abc.abstractmethod
+    def send(self, batch: list[dict]) -> None:
+        """
+        Deliver batch.  Raises on failure.
+        """
+
+    def close(self) -> None:
+        """
+        Release resources (sockets, files).
+        """
+
+
+class NdWebhookSink(NdEventSink):
+    """
+    # Summary
+
+    POST each batch to an HTTP(S) webhook as `{"events": [...]}`.
+
+    ## Properties
+
+    - timeout: (getter/setter) Seconds each POST may take. Default is 5.
+    - url: (getter/setter) The webhook URL.
+    """
+
+    def __init__(self) -> None:
+        self.class_name: str = self.__class__.__name__
+        self._session: requests.Session | None = None
+        self._timeout: float = 5.0
+        self._url: str = ""
+
+    @property
+    def name(self) -> str:
+        return f"webhook {self._url}"
+
+    def send(self, batch: list[dict]) -> None:
+        method_name: str = inspect.stack()[0][3]
+        msg: str = ""
+
+        if self._session is None:
+            self._session = requests.Session()
+        try:
+            response = self._session.post(self._url, json={"events": batch}, timeout=self._timeout)
+        except requests.RequestException as e:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"POST to {self._url} failed: {str(e)}"
+            raise NdConnectionError(msg) from e
+        if not 200 <= response.status_code < 300:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"POST to {self._url} failed with status code {response.status_code}"
+            raise NdConnectionError(msg)
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    @property
+    def timeout(self) -> float:
+        """
+        getter: return the number of seconds each POST may take.
+        setter: set the number of seconds each POST may take.
+        """
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, value: float) -> None:
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+            raise NdParameterError("Invalid timeout: not a positive number.")
+        self._timeout = float(value)
+
+    @property
+    def url(self) -> str:
+        """
+        getter: return the webhook URL.
+        setter: set the webhook URL.
+        """
+        return self._url
+
+    @url.setter
+    def url(self, value: str) -> None:
+        if not isinstance(value, str) or not value.startswith(("http://", "https://")):
+            raise NdParameterError("Invalid url: not an http:// or https:// URL.")
+        self._url = value
+
+
+class NdFileSink(NdEventSink):
+    """
+    # Summary
+
+    Append each event to a file as one JSON object per line.
+
+    ## Properties
+
+    - path: (getter/setter) The file to append to.
+    """
+
+    def __init__(self) -> None:
+        self.class_name: str = self.__class__.__name__
+        self._path: str = ""
+
+    @property
+    def name(self) -> str:
+        return f"file {self._path}"
+
+    def send(self, batch: list[dict]) -> None:
+        with open(self._path, "a", encoding="utf-8") as event_file:
+            event_file.write("".join(json.dumps(event) + "\n" for event in batch))
+
+    @property
+    def path(self) -> str:
+        """
+        getter: return the file events are appended to.
+        setter: set the file events are appended to.
+        """
+        return self._path
+
+    @path.setter
+    def path(self, value: str) -> None:
+        if not value or not isinstance(value, str):
+            raise NdParameterError("Invalid path: empty or not a string.")
+        self._path = value
+
+
+class NdUnixSocketSink(NdEventSink):
+    """
+    # Summary
+
+    Write each event, as one JSON object per line, to a Unix stream socket.  The connection is
+    kept open between batches and re-established after a failure.
+
+    ## Properties
+
+    - path: (getter/setter) The socket path.
+    - timeout: (getter/setter) Seconds each connect or write may take. Default is 5.
+    """
+
+    def __init__(self) -> None:
+        self.class_name: str = self.__class__.__name__
+        self._path: str = ""
+        self._socket: socket.socket | None = None
+        self._timeout: float = 5.0
+
+    @property
+    def name(self) -> str:
+        return f"socket {self._path}"
+
+    def send(self, batch: list[dict]) -> None:
+        method_name: str = inspect.stack()[0][3]
+        msg: str = ""
+
+        payload = "".join(json.dumps(event) + "\n" for event in batch).encode("utf-8")
+        try:
+            if self._socket is None:
+                self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                self._socket.settimeout(self._timeout)
+                self._socket.connect(self._path)
+            self._socket.sendall(payload)
+        except OSError as e:
+            self.close()
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Write to {self._path} failed: {str(e)}"
+            raise NdConnectionError(msg) from e
+
+    def close(self) -> None:
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    @property
+    def path(self) -> str:
+        """
+        getter: return the socket path.
+        setter: set the socket path.
+        """
+        return self._path
+
+    @path.setter
+    def path(self, value: str) -> None:
+        if not value or not isinstance(value, str):
+            raise NdParameterError("Invalid path: empty or not a string.")
+        self._path = value
+
+    @property
+    def timeout(self) -> float:
+        """
+        getter: return the number of seconds each connect or write may take.
+        setter: set the number of seconds each connect or write may take.
+        """
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, value: float) -> None:
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+            raise NdParameterError("Invalid timeout: not a positive number.")
+        self._timeout = float(value)
+
+
+class NdEventChannel:
+    """
+    # Summary
+
+    A bounded queue of events for one sink, drained by a background worker thread in batches.
+
+    put() never blocks on the sink: it takes a lock for a few microseconds and returns.
+
+    - Coalescing: while an event is queued, a newer event with the same coalesce_key (and a kind
+      in coalesce_kinds) replaces its data instead of being queued, so a slow sink receives the
+      latest progress rather than a backlog of stale progress.
+    - Overflow: when max_queue events are queued, "drop_oldest" discards the oldest queued event,
+      and "drop_newest" discards the new event.
+    - Batching: the worker waits up to linger seconds for batch_size events, then sends what it has.
+    - Failures: a failed batch is retried up to max_attempts times with exponential backoff (1, 2, 4...
+      seconds, at most 30); meanwhile events keep queuing, subject to the overflow policy.
+
+    Counters (delivered, dropped, coalesced, failed) are reported by NdEventBus.close().
+
+    Created by NdEventBus.add_sink().
+    """
+
+    # pylint: disable=too-many-instance-attributes,too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        sink: NdEventSink,
+        max_queue: int = 1000,
+        batch_size: int = 50,
+        linger: float = 0.5,
+        overflow: str = "drop_oldest",
+        coalesce_kinds: frozenset[str] = frozenset(),
+    ) -> None:
+        self.class_name: str = self.__class__.__name__
+        self.sink = sink
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.linger = linger
+        self.overflow = overflow
+        self.coalesce_kinds = coalesce_kinds
+        self.max_attempts: int = 3
+        self.delivered: int = 0
+        self.dropped: int = 0
+        self.coalesced: int = 0
+        self.failed: int = 0
+        self._condition = threading.Condition()
+        self._closing: bool = False
+        self._pending: deque[NdEvent] = deque()
+        # coalesce_key -> the queued event it would replace
+        self._queued: dict[str, NdEvent] = {}
+        self._thread = threading.Thread(target=self.run, name=f"nd-events-{sink.name}", daemon=True)
+        self._thread.start()
+
+    def put(self, event: NdEvent) -> None:
+        """
+        Queue event for delivery, coalescing or dropping per the policies.  Never blocks on the sink.
+        """
+        with self._condition:
+            if self._closing:
+                self.dropped += 1
+                return
+            if event.kind in self.coalesce_kinds:
+                queued = self._queued.get(event.coalesce_key)
+                if queued is not None:
+                    queued.time = event.time
+                    queued.data = event.data
+                    self.coalesced += 1
+                    return
+            if len(self._pending) >= self.max_queue:
+                self.dropped += 1
+                if self.overflow == "drop_newest":
+                    return
+                self.forget(self._pending.popleft())
+            self._pending.append(event)
+            if event.kind in self.coalesce_kinds:
+                self._queued[event.coalesce_key] = event
+            self._condition.notify()
+
+    def forget(self, event: NdEvent) -> None:
+        """
+        Remove event from the coalescing index (caller holds the lock).
+        """
+        if self._queued.get(event.coalesce_key) is event:
+            del self._queued[event.coalesce_key]
+
+    def take(self) -> list[NdEvent]:
+        """
+        Wait for events and return a batch, or an empty list when closing with nothing queued.
+        """
+        with self._condition:
+            while not self._pending and not self._closing:
+                self._condition.wait()
+            if not self._closing and len(self._pending) < self.batch_size:
+                # Give a burst (e.g. several stage changes) a moment to arrive as one batch.
+                self._condition.wait_for(lambda: self._closing or len(self._pending) >= self.batch_size, timeout=self.linger)
+            batch: list[NdEvent] = []
+            while self._pending and len(batch) < self.batch_size:
+                event = self._pending.popleft()
+                self.forget(event)
+                batch.append(event)
+            return batch
+
+    def run(self) -> None:
+        """
+        Worker loop: deliver batches until closed and drained.
+        """
+        while True:
+            batch = self.take()
+            if not batch:
+                break
+            payload = [event.to_dict() for event in batch]
+            for attempt in range(self.max_attempts):
+                try:
+                    self.sink.send(payload)
+                    self.delivered += len(batch)
+                    break
+                except Exception:  # pylint: disable=broad-exception-caught
+                    # Any sink failure (including a bug in a custom sink) must not kill the worker.
+                    if attempt == self.max_attempts - 1:
+                        self.failed += len(batch)
+                        break
+                    with self._condition:
+                        if self._closing:
+                            self.failed += len(batch)
+                            break
+                        self._condition.wait(timeout=min(30.0, 2.0**attempt))
+        self.sink.close()
+
+    def close(self, timeout: float) -> None:
+        """
+        Stop accepting events, and wait up to timeout seconds for the queued events to be delivered.
+        """
+        with self._condition:
+            self._closing = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+
+    @property
+    def pending(self) -> int:
+        """
+        getter: return the number of queued events.
+        """
+        with self._condition:
+            return len(self._pending)
+
+
+class NdEventBus:
+    """
+    # Summary
+
+    Fan out progress events to any number of sinks, each with its own bounded queue and
+    background worker (NdEventChannel), so that notifications never slow down the workflow:
+    emit() only appends to in-memory queues, and a slow or unreachable sink only affects its
+    own queue.
+
+    With no sinks, emit() returns immediately, so events cost nothing unless notifications are configured.
+
+    Events are emitted through `context.emit(kind, **data)` by:
+
+    - NdContext.phase(): "stage.started" for every NdBootstrap stage, and "stage.failed" (once, where it failed).
+    - NdBootstrap: "bootstrap.started" and "bootstrap.completed".
+    - NdNtpServersValidate, NdVerifyRemoteServices: "validation" (with ok, cached, and the failure detail).
+    - NdPollBootstrapStatus, NdPollInstallStatus: "poll.progress" when progress, overallStatus or state changes.
+
+    ## Properties
+
+    - coalesce_kinds: (getter/setter) Event kinds that supersede one another while queued. Default is {"poll.progress"}.
+
+    ## Usage
+
+    ```python
+    sink = NdWebhookSink()
+    sink.url = "https://chat.example.com/hooks/nd"
+    context.events.add_sink(sink, max_queue=100, overflow="drop_oldest")
+    ...
+    context.events.close()  # waits up to 5 seconds for queued events
+    ```
+    """
+
+    def __init__(self) -> None:
+        self.class_name: str = self.__class__.__name__
+        self._channels: list[NdEventChannel] = []
+        self._coalesce_kinds: frozenset[str] = frozenset({"poll.progress"})
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def add_sink(self, sink: NdEventSink, max_queue: int = 1000, batch_size: int = 50, linger: float = 0.5, overflow: str = "drop_oldest") -> NdEventChannel:
+        """
+        Deliver events to sink from a new background worker, and return its NdEventChannel.
+
+        Raises if:
+            - sink is not an NdEventSink
+            - max_queue or batch_size is not a positive int, or linger is negative
+            - overflow is not one of OVERFLOW_POLICIES
+        """
+        if not isinstance(sink, NdEventSink):
+            raise NdParameterError("Invalid sink: not an NdEventSink instance.")
+        if not isinstance(max_queue, int) or max_queue < 1 or not isinstance(batch_size, int) or batch_size < 1:
+            raise NdParameterError("Invalid max_queue or batch_size: not a positive int.")
+        if linger < 0:
+            raise NdParameterError("Invalid linger: negative.")
+        if overflow not in OVERFLOW_POLICIES:
+            raise NdParameterError(f"Invalid overflow: {overflow}. Expected one of {', '.join(OVERFLOW_POLICIES)}.")
+        channel = NdEventChannel(sink, max_queue, batch_size, linger, overflow, self._coalesce_kinds)
+        self._channels.append(channel)
+        return channel
+
+    def emit(self, event: NdEvent) -> None:
+        """
+        Queue event on every sink.  Never blocks on a sink.
+        """
+        for channel in self._channels:
+            # Each channel may coalesce its copy in place, so do not share the object.
+            channel.put(NdEvent(kind=event.kind, cluster=event.cluster, nd_ip=event.nd_ip, time=event.time, data=dict(event.data)))
+
+    def close(self, timeout: float = 5.0) -> None:
+        """
+        Stop every worker after delivering the queued events, waiting at most timeout seconds in total,
+        and print the delivery counters of each sink.
+        """
+        method_name: str = inspect.stack()[0][3]
+        msg: str = ""
+
+        deadline = time.monotonic() + timeout
+        for channel in self._channels:
+            channel.close(max(0.0, deadline - time.monotonic()))
+        for channel in self._channels:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"{channel.sink.name}: delivered {channel.delivered} event(s), coalesced {channel.coalesced}, "
+            msg += f"dropped {channel.dropped}, failed {channel.failed}, undelivered {channel.pending}."
+            print(msg)
+        self._channels = []
+
+    @property
+    def enabled(self) -> bool:
+        """
+        getter: return True if any sink is configured.
+        """
+        return bool(self._channels)
+
+    @property
+    def coalesce_kinds(self) -> frozenset[str]:
+        """
+        getter: return the event kinds that supersede one another while queued.
+        setter: set the event kinds that supersede one another while queued (for sinks added afterwards).
+        """
+        return self._coalesce_kinds
+
+    @coalesce_kinds.setter
+    def coalesce_kinds(self, value: frozenset[str]) -> None:
+        if isinstance(value, str) or not all(isinstance(kind, str) for kind in value):
+            raise NdParameterError("Invalid coalesce_kinds: not a collection of strings.")
+        self._coalesce_kinds = frozenset(value)
+
+
+class NdEventReceiver:
+    """
+    # Summary
+
+    Local test receiver for NdWebhookSink and NdUnixSocketSink: prints one line per event received.
+
+    delay simulates a slow receiver (seconds per request or connection read), to check that
+    a bootstrap is not slowed down by its notifications.
+
+    ## Usage
+
+    ```bash
+    python -m nd_bootstrap.events --http 127.0.0.1:8765 --delay 3
+    python -m nd_bootstrap.events --unix /tmp/nd_events.sock
+    ```
+    """
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.class_name: str = self.__class__.__name__
+        self.delay = delay
+        self._lock = threading.Lock()
+
+    def show(self, event: dict) -> None:
+        """
+        Print event as one line.
+        """
+        stamp = time.strftime("%H:%M:%S", time.localtime(event.get("time", 0)))
+        with self._lock:
+            print(f"{stamp} {event.get('cluster', '')} {event.get('kind', '')} {json.dumps(event.get('data', {}), sort_keys=True)}", flush=True)
+
+    def serve_http(self, host: str, port: int) -> None:
+        """
+        Serve webhook POSTs on host:port until interrupted.
+        """
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """
+            Print the events of each POST.
+            """
+
+            def do_POST(self) -> None:  # pylint: disable=invalid-name
+                """
+                Handle one webhook POST.
+                """
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                time.sleep(receiver.delay)
+                try:
+                    events = json.loads(body).get("events", [])
+                except (ValueError, AttributeError):
+                    self.send_response(400)
+                    self.end_headers()
+                    return
+                for event in events:
+                    receiver.show(event)
+                self.send_response(204)
+                self.end_headers()
+
+            def log_message(self, format: str, *log_args: object) -> None:  # pylint: disable=redefined-builtin
+                """
+                Silence the per-request access log.
+                """
+
+        with ThreadingHTTPServer((host, port), Handler) as server:
+            print(f"{self.class_name}: listening on http://{host}:{port}/", flush=True)
+            server.serve_forever()
+
+    def serve_unix(self, path: str) -> None:
+        """
+        Serve Unix socket connections on path until interrupted.
+        """
+        receiver = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            """
+            Print each JSON line of a connection.
+            """
+
+            def handle(self) -> None:
+                for line in self.rfile:
+                    time.sleep(receiver.delay)
+                    try:
+                        receiver.show(json.loads(line))
+                    except ValueError:
+                        continue
+
+        if os.path.exists(path):
+            os.unlink(path)
+        with socketserver.ThreadingUnixStreamServer(path, Handler) as server:
+            print(f"{self.class_name}: listening on {path}", flush=True)
+            try:
+                server.serve_forever()
+            finally:
+                os.unlink(path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Print the events sent by nd_bootstrap.py --notify-webhook or --notify-socket")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--http", metavar="HOST:PORT", help="Serve webhook POSTs, e.g. 127.0.0.1:8765")
+    group.add_argument("--unix", metavar="PATH", help="Serve a Unix stream socket at PATH")
+    parser.add_argument("--delay", type=float, default=0, help="Seconds to wait before handling each request or line (simulates a slow receiver)")
+    args = parser.parse_args()
+
+    nd_event_receiver = NdEventReceiver(delay=args.delay)
+    try:
+        if args.http:
+            http_host, _, http_port = args.http.rpartition(":")
+            nd_event_receiver.serve_http(http_host or "127.0.0.1", int(http_port))
+        else:
+            nd_event_receiver.serve_unix(args.unix)
+    except KeyboardInterrupt:
+        sys.exit(0)
@@ -0,0 +1,128 @@
+"""
+Nexus Dashboard Bootstrap Exceptions
+
+Exception hierarchy raised by the nd_bootstrap package.
+
+The package never exits the process.  Every failure is raised as a subclass of
+NdBootstrapError, and the command line script (nd_bootstrap.py) is the only place
+that maps failures to exit codes.  A long-running caller (e.g. a fleet runner) can
+therefore catch NdBootstrapError for one cluster and carry on with the others.
+"""
+
+
+class NdBootstrapError(Exception):
+    """
+    Base class for all nd_bootstrap errors.
+    """
+
+
+class NdParameterError(NdBootstrapError, ValueError):
+    """
+    A property was set to an invalid value, or a required property was not set before calling a method.
+    """
+
+
+class NdConfigError(NdBootstrapError):
+    """
+    The bootstrap configuration, template, inventory, or target settings (e.g. ND_* environment variables) are missing or invalid.
+    """
+
+
+class NdConnectionError(NdBootstrapError):
+    """
+    A request to Nexus Dashboard failed at the network level (connection refused, timeout, TLS error, etc.).
+    """
+
+
+class NdAuthenticationError(NdBootstrapError):
+    """
+    Login or session refresh with Nexus Dashboard failed.
+    """
+
+
+class NdApiError(NdBootstrapError):
+    """
+    Nexus Dashboard returned an unexpected HTTP status code or response body.
+
+    ## Attributes
+
+    - status_code: The HTTP status code, or 0 if not applicable.
+    """
+
+    def __init__(self, message: str, status_code: int = 0) -> None:
+        super().__init__(message)
+        self.status_code: int = status_code
+
+
+class NdNodeDiscoveryError(NdBootstrapError):
+    """
+    A node in the configuration is not (yet) known to Nexus Dashboard, or has no serial number.
+    """
+
+
+class NdValidationError(NdBootstrapError):
+    """
+    Nexus Dashboard pre-flight validation (DNS and/or NTP) failed.
+    """
+
+
+class NdReconcileConflictError(NdBootstrapError):
+    """
+    Nexus Dashboard is already bootstrapped with a configuration that differs from the desired configuration.
+
+    ## Attributes
+
+    - differences: List of (path, desired, actual) tuples.
+    """
+
+    def __init__(self, message: str, differences: list[tuple[str, object, object]]) -> None:
+        super().__init__(message)
+        self.differences: list[tuple[str, object, object]] = differences
+
+
+class NdBootstrapFailedError(NdBootstrapError):
+    """
+    Nexus Dashboard reported that the cluster bootstrap or services install failed.
+
+    ## Attributes
+
+    - phase: "bootstrap" or "install".
+    - overall_progress: The last overallProgress reported.
+    - overall_status: The last overallStatus reported.
+    - state: The last state reported.
+    """
+
+    def __init__(self, message: str, phase: str, overall_progress: int, overall_status: str, state: str) -> None:
+        super().__init__(message)
+        self.phase: str = phase
+        self.overall_progress: int = overall_progress
+        self.overall_status: str = overall_status
+        self.state: str = state
+
+
+class NdHealthCheckError(NdBootstrapError):
+    """
+    One or more post-install node health checks failed.
+
+    ## Attributes
+
+    - result: The NdHealthResult, with every check (passed and failed).
+    """
+
+    def __init__(self, message: str, result: object) -> None:
+        super().__init__(message)
+        self.result: object = result
+
+
+class NdDeadlineExceededError(NdBootstrapError):
+    """
+    The run deadline, or the budget of a stage, expired (see NdDeadline).
+
+    ## Attributes
+
+    - scope: "run" for the overall deadline, or the name of the stage whose budget expired.
+    """
+
+    def __init__(self, message: str, scope: str) -> None:
+        super().__init__(message)
+        self.scope: str = scope
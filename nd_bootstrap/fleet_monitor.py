@@ -0,0 +1,687 @@
+"""
+Nexus Dashboard Fleet Monitor
+
+Compact bootstrap/install status monitoring of thousands of clusters from one process: per-cluster state held
+in arrays (struct of arrays), one scheduler, one pool of worker threads, and one session and connection pool.
+
+Benchmark:
+
+    python -m nd_bootstrap.fleet_monitor --clusters 10000 --duration 60
+"""
+
+import argparse
+import gc
+import heapq
+import inspect
+import json
+import os
+import queue
+import random
+import re
+import resource
+import sys
+import threading
+import time
+from array import array
+from collections import Counter, deque
+from collections.abc import Mapping
+from io import BytesIO
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.response import HTTPResponse
+
+from nd_bootstrap.clock import NdClock
+from nd_bootstrap.cluster_state import NdClusterState
+from nd_bootstrap.context import NdContext
+from nd_bootstrap.exceptions import NdConnectionError, NdParameterError
+from nd_bootstrap.login import NdLogin
+from nd_bootstrap.poll_bootstrap_status import NdPollBootstrapStatus
+from nd_bootstrap.poll_install_status import NdPollInstallStatus
+from nd_bootstrap.transport import NdTransportAdapter
+
+# Phase of a monitored cluster: index into PHASES.  Clusters in the last two are no longer polled.
+PHASES: tuple[str, ...] = ("bootstrap", "install", "completed", "failed")
+BOOTSTRAP, INSTALL, COMPLETED, FAILED = range(len(PHASES))
+# Status path polled in each active phase.
+PHASE_PATHS: tuple[str, ...] = ("/clusterstatus/bootstrap", "/clusterstatus/install")
+
+
+class NdFleetMonitor:  # pylint: disable=too-many-instance-attributes,too-many-public-methods
+    """
+    # Summary
+
+    Poll the bootstrap status, then the install status, of many clusters (one Nexus Dashboard each) until each
+    completes or fails, like NdPollBootstrapStatus and NdPollInstallStatus do for one, with a small, fixed cost per cluster.
+
+    A poller per cluster carries an NdContext (with its own connection pool and CA store), a requests.Session,
+    a URL string and an instance __dict__.  Here, a cluster is an index into arrays (struct of arrays):
+    host, credential id, phase, progress, overallStatus id, state id, next-due time, and counters, about
+    a hundred bytes each.  Status strings and credentials are interned in shared tables.
+
+    - One scheduler thread keeps a heap of (next-due time, cluster) and hands due clusters to max_workers worker threads.
+    - Every request goes through one requests.Session, whose cookie jar keeps the login cookie of each host, and one
+      NdTransportAdapter, which keeps connections to the pool_connections most recently polled hosts and resumes
+      the TLS sessions of the others.
+    - Logins use NdLogin with a throwaway NdContext, on first poll and after a 401.
+    - Like the pollers, a 404 is ignored and a state containing "fail" ends monitoring of the cluster (phase "failed").
+      Network errors and unexpected status codes back off, doubling the interval up to max_backoff times.
+
+    Every wait goes through clock.
+
+    ## Properties
+
+    - adapter: (getter/setter) The HTTPAdapter mounted on session. Default is an NdTransportAdapter(pool_connections, 1), created on first use.
+    - clock: (getter/setter) The NdClock for scheduling. Default is NdClock() (wall clock).
+    - interval: (getter/setter) Seconds between polls of a cluster. Default is 10.
+    - max_backoff: (getter/setter) Largest multiple of interval between polls of a failing cluster. Default is 8.
+    - max_workers: (getter/setter) Number of worker threads (concurrent requests). Default is 32.
+    - pool_connections: (getter/setter) Number of hosts whose connections are kept open. Default is 256.
+    - session: (getter) The requests.Session shared by every cluster.
+    - timeout: (getter/setter) Timeout in seconds of each status request. Default is 30.
+    - verify: (getter/setter) Whether to verify TLS certificates. Default is False.
+
+    ## Usage
+
+    ```python
+    monitor = NdFleetMonitor()
+    for nd_ip in addresses:
+        monitor.add(nd_ip, "admin", password)
+    monitor.start()
+    while not monitor.wait(10):
+        print(monitor.counts())
+    print(monitor.snapshot(0))  # NdClusterState of the first cluster
+    ```
+    """
+
+    def __init__(self) -> None:
+        self.class_name: str = self.__class__.__name__
+        self._adapter: HTTPAdapter | None = None
+        self._clock: NdClock = NdClock()
+        self._interval: float = 10.0
+        self._max_backoff: int = 8
+        self._max_workers: int = 32
+        self._pool_connections: int = 256
+        self._session: requests.Session | None = None
+        self._timeout: float = 30.0
+        self._verify: bool = False
+        # Per-cluster state, indexed by cluster id.
+        self._hosts: list[str] = []
+        self._credential: array = array("H")
+        self._phase: bytearray = bytearray()
+        self._progress: bytearray = bytearray()
+        self._status: array = array("H")
+        self._state: array = array("H")
+        self._next_due: array = array("d")
+        self._polls: array = array("I")
+        self._errors: array = array("H")
+        self._reauths: array = array("H")
+        self._logged_in: bytearray = bytearray()
+        # Interned (domain, username, password) and status/state strings.
+        self._credentials: list[tuple[str, str, str]] = []
+        self._credential_ids: dict[tuple[str, str, str], int] = {}
+        self._strings: list[str] = ["Unknown"]
+        self._string_ids: dict[str, int] = {"Unknown": 0}
+        # Scheduling
+        self._active: int = 0
+        self._done = threading.Event()
+        self._due: list[tuple[float, int]] = []
+        self._in_flight: int = 0
+        self._lateness: deque[float] = deque(maxlen=10000)
+        self._lock = threading.Lock()
+        self._polls_sent: int = 0
+        self._queue: queue.SimpleQueue[tuple[int, float] | None] = queue.SimpleQueue()
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+
+    def __len__(self) -> int:
+        return len(self._hosts)
+
+    def intern(self, value: str) -> int:
+        """
+        Return the id of the status or state string value, adding it to the table on first use.
+        """
+        string_id = self._string_ids.get(value)
+        if string_id is None:
+            with self._lock:
+                string_id = self._string_ids.setdefault(value, len(self._strings))
+                if string_id == len(self._strings):
+                    self._strings.append(value)
+        return string_id
+
+    def add(self, nd_ip: str, nd_username: str, nd_password: str, nd_domain: str = "local", phase: str = "bootstrap") -> int:
+        """
+        Monitor the cluster of the Nexus Dashboard at nd_ip (IPv4 or IPv6), starting with phase ("bootstrap" or "install").
+        Clusters may be added before or after start().
+
+        Returns:
+            int: The cluster id, for snapshot().
+
+        Raises if:
+            - phase is not "bootstrap" or "install"
+        """
+        method_name: str = "add"
+        msg: str = ""
+
+        if phase not in PHASES[: len(PHASE_PATHS)]:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Invalid phase '{phase}', must be one of {', '.join(PHASES[: len(PHASE_PATHS)])}."
+            raise NdParameterError(msg)
+        credential = (nd_domain, nd_username, nd_password)
+        with self._lock:
+            credential_id = self._credential_ids.setdefault(credential, len(self._credentials))
+            if credential_id == len(self._credentials):
+                self._credentials.append(credential)
+            index = len(self._hosts)
+            self._hosts.append(f"[{nd_ip}]" if ":" in nd_ip else nd_ip)
+            self._credential.append(credential_id)
+            self._phase.append(PHASES.index(phase))
+            self._progress.append(0)
+            self._status.append(0)
+            self._state.append(0)
+            self._next_due.append(self._clock.monotonic())
+            self._polls.append(0)
+            self._errors.append(0)
+            self._reauths.append(0)
+            self._logged_in.append(0)
+            self._active += 1
+            self._done.clear()
+            heapq.heappush(self._due, (self._next_due[index], index))
+        return index
+
+    def login(self, index: int) -> bool:
+        """
+        Log in to the Nexus Dashboard of cluster index through the shared session.
+
+        Returns:
+            bool: True if the login succeeded.
+        """
+        nd_domain, nd_username, nd_password = self._credentials[self._credential[index]]
+        nd_ip = self._hosts[index].strip("[]")
+        context = NdContext()
+        if ":" in nd_ip:
+            context.nd_ip6 = nd_ip
+            context.nd_ip_protocol = "IP6"
+        else:
+            context.nd_ip4 = nd_ip
+        context.nd_domain = nd_domain
+        context.nd_username = nd_username
+        context.nd_password = nd_password
+        context.adapter = self.adapter
+        context.clock = self._clock
+        context.verify = self._verify
+        nd_login = NdLogin()
+        nd_login.context = context
+        nd_login.session = self.session
+        try:
+            nd_login.commit()
+        except NdConnectionError:
+            return False
+        self._logged_in[index] = nd_login.status
+        return nd_login.status
+
+    def backoff(self, index: int, now: float) -> float:
+        """
+        Count an error for cluster index, and return when to poll it next.
+        """
+        errors = min(self._errors[index] + 1, 0xFFFF)
+        self._errors[index] = errors
+        multiple: int = min(2 ** min(errors, 16), self._max_backoff)
+        return now + self._interval * multiple
+
+    def poll(self, index: int) -> float | None:  # pylint: disable=too-many-return-statements
+        """
+        Poll the status of cluster index once and update its state.
+
+        Returns:
+            float | None: When to poll it next, or None if it completed or failed.
+        """
+        now = self._clock.monotonic()
+        if not self._logged_in[index] and not self.login(index):
+            return self.backoff(index, now)
+        phase = self._phase[index]
+        self._polls[index] += 1
+        try:
+            response = self.session.get(f"https://{self._hosts[index]}{PHASE_PATHS[phase]}", timeout=self._timeout)
+        except requests.RequestException:
+            return self.backoff(index, now)
+        if response.status_code == 401:
+            self._logged_in[index] = 0
+            self._reauths[index] = min(self._reauths[index] + 1, 0xFFFF)
+            self.login(index)
+            return now + self._interval
+        if response.status_code == 404:
+            # As in the pollers: the status endpoints return 404 for a short time after the POST.
+            return now + self._interval
+        if response.status_code != 200:
+            return self.backoff(index, now)
+        try:
+            body = response.json()
+            progress = min(max(int(body.get("overallProgress", self._progress[index])), 0), 100)
+        except (ValueError, TypeError, AttributeError):
+            return self.backoff(index, now)
+        state = str(body.get("state", "Unknown"))
+        self._errors[index] = 0
+        self._progress[index] = progress
+        self._status[index] = self.intern(str(body.get("overallStatus", "Unknown")))
+        self._state[index] = self.intern(state)
+        if re.search(r"fail", state, re.IGNORECASE):
+            self._phase[index] = FAILED
+            return None
+        if progress == 100:
+            self._phase[index] = INSTALL if phase == BOOTSTRAP else COMPLETED
+            if phase == BOOTSTRAP:
+                self._progress[index] = 0
+                return now + self._interval
+            return None
+        return now + self._interval
+
+    def schedule(self) -> None:
+        """
+        Scheduler thread: hand due clusters to the workers (at most two per worker queued), then wait for the next due time.
+        """
+        limit = 2 * self._max_workers
+        while not self._stop.is_set():
+            with self._lock:
+                now = self._clock.monotonic()
+                while self._due and self._due[0][0] <= now and self._in_flight < limit:
+                    due, index = heapq.heappop(self._due)
+                    self._in_flight += 1
+                    self._queue.put((index, due))
+                if self._in_flight >= limit:
+                    delay = 0.005
+                else:
+                    delay = self._due[0][0] - now if self._due else self._interval
+            # Bounded, so that stop() and clusters added meanwhile are noticed.
+            self._clock.sleep(min(max(delay, 0.001), 1.0))
+
+    def work(self) -> None:
+        """
+        Worker thread: poll the clusters handed over by the scheduler, and reschedule them.
+        """
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            index, due = item
+            next_due: float | None = None
+            self._lateness.append(self._clock.monotonic() - due)
+            try:
+                next_due = self.poll(index)
+            except Exception:  # pylint: disable=broad-exception-caught
+                # Never lose a cluster (or a worker) to an unexpected error.
+                next_due = self.backoff(index, self._clock.monotonic())
+            with self._lock:
+                self._in_flight -= 1
+                self._polls_sent += 1
+                if next_due is None:
+                    self._active -= 1
+                    if self._active == 0:
+                        self._done.set()
+                else:
+                    self._next_due[index] = next_due
+                    heapq.heappush(self._due, (next_due, index))
+
+    def start(self) -> None:
+        """
+        Start the scheduler and worker threads.  Does nothing if they are running.
+        """
+        if self._threads:
+            return
+        self._stop.clear()
+        if self._active == 0:
+            self._done.set()
+        self._threads = [threading.Thread(target=self.work, name=f"nd-fleet-worker-{number}", daemon=True) for number in range(self._max_workers)]
+        self._threads.append(threading.Thread(target=self.schedule, name="nd-fleet-scheduler", daemon=True))
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop the scheduler, let the workers finish the polls in progress, and stop them.  Polls already queued are
+        put back on the schedule, so start() resumes where monitoring stopped.
+        """
+        self._stop.set()
+        for _ in range(self._max_workers):
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        with self._lock:
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not None:
+                    self._in_flight -= 1
+                    heapq.heappush(self._due, (item[1], item[0]))
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """
+        Wait (in real time) up to timeout seconds for every cluster to complete or fail.
+
+        Returns:
+            bool: True if every cluster completed or failed.
+        """
+        return self._done.wait(timeout)
+
+    def commit(self) -> dict[str, int]:
+        """
+        Monitor every cluster until each completes or fails.
+
+        Returns:
+            dict[str, int]: The number of clusters per phase (see counts()).
+        """
+        self.start()
+        try:
+            self.wait()
+        finally:
+            self.stop()
+        return self.counts()
+
+    def counts(self) -> dict[str, int]:
+        """
+        Return the number of clusters in each phase ("bootstrap", "install", "completed", "failed").
+        """
+        counts = Counter(bytes(self._phase))
+        return {name: counts.get(number, 0) for number, name in enumerate(PHASES)}
+
+    def snapshot(self, index: int) -> NdClusterState:
+        """
+        Return the state of cluster index as an NdClusterState (e.g. for reporting); stage is its phase.
+
+        Raises if:
+            - index is not a cluster id
+        """
+        method_name: str = inspect.stack()[0][3]
+        msg: str = ""
+
+        if not 0 <= index < len(self._hosts):
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Invalid cluster id {index}, there are {len(self._hosts)} clusters."
+            raise NdParameterError(msg)
+        return NdClusterState(
+            nd_ip=self._hosts[index].strip("[]"),
+            stage=PHASES[self._phase[index]],
+            progress=self._progress[index],
+            overall_status=self._strings[self._status[index]],
+            state=self._strings[self._state[index]],
+            last_error=f"{self._errors[index]} consecutive errors" if self._errors[index] else "",
+            reauth_count=self._reauths[index],
+        )
+
+    @property
+    def lateness(self) -> list[float]:
+        """
+        getter: return how late (seconds after the due time) each of the last 10000 polls started.
+        """
+        return list(self._lateness)
+
+    @property
+    def polls(self) -> int:
+        """
+        getter: return the number of polls (requests or failed logins) so far.
+        """
+        return self._polls_sent
+
+    @property
+    def adapter(self) -> HTTPAdapter:
+        """
+        getter: return the HTTPAdapter mounted on session.
+        setter: set the HTTPAdapter mounted on session (before the first poll).
+        """
+        if self._adapter is None:
+            self._adapter = NdTransportAdapter(pool_connections=self._pool_connections, pool_maxsize=1)
+        return self._adapter
+
+    @adapter.setter
+    def adapter(self, value: HTTPAdapter) -> None:
+        if not isinstance(value, HTTPAdapter):
+            raise NdParameterError("Invalid adapter: not a requests.adapters.HTTPAdapter instance.")
+        self._adapter = value
+        if self._session is not None:
+            self._session.mount("https://", value)
+
+    @property
+    def clock(self) -> NdClock:
+        """
+        getter: return the NdClock used for scheduling.
+        setter: set the NdClock used for scheduling (before adding clusters).
+        """
+        return self._clock
+
+    @clock.setter
+    def clock(self, value: NdClock) -> None:
+        if not isinstance(value, NdClock):
+            raise NdParameterError("Invalid clock: not an NdClock instance.")
+        self._clock = value
+
+    @property
+    def interval(self) -> float:
+        """
+        getter: return the number of seconds between polls of a cluster.
+        setter: set the number of seconds between polls of a cluster.
+        """
+        return self._interval
+
+    @interval.setter
+    def interval(self, value: float) -> None:
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+            raise NdParameterError("Invalid interval: not a positive number.")
+        self._interval = float(value)
+
+    @property
+    def max_backoff(self) -> int:
+        """
+        getter: return the largest multiple of interval between polls of a failing cluster.
+        setter: set the largest multiple of interval between polls of a failing cluster.
+        """
+        return self._max_backoff
+
+    @max_backoff.setter
+    def max_backoff(self, value: int) -> None:
+        if not isinstance(value, int) or value <= 0:
+            raise NdParameterError("Invalid max_backoff: not a positive int.")
+        self._max_backoff = value
+
+    @property
+    def max_workers(self) -> int:
+        """
+        getter: return the number of worker threads.
+        setter: set the number of worker threads (before start()).
+        """
+        return self._max_workers
+
+    @max_workers.setter
+    def max_workers(self, value: int) -> None:
+        if not isinstance(value, int) or value <= 0:
+            raise NdParameterError("Invalid max_workers: not a positive int.")
+        self._max_workers = value
+
+    @property
+    def pool_connections(self) -> int:
+        """
+        getter: return the number of hosts whose connections are kept open.
+        setter: set the number of hosts whose connections are kept open (before the first poll).
+        """
+        return self._pool_connections
+
+    @pool_connections.setter
+    def pool_connections(self, value: int) -> None:
+        if not isinstance(value, int) or value <= 0:
+            raise NdParameterError("Invalid pool_connections: not a positive int.")
+        self._pool_connections = value
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        getter: return the requests.Session shared by every cluster, created on first use.
+        """
+        if self._session is None:
+            session = requests.Session()
+            session.verify = self._verify
+            session.headers.update({"Content-Type": "application/json"})
+            session.mount("https://", self.adapter)
+            self._session = session
+        return self._session
+
+    @property
+    def timeout(self) -> float:
+        """
+        getter: return the timeout in seconds of each status request.
+        setter: set the timeout in seconds of each status request.
+        """
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, value: float) -> None:
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+            raise NdParameterError("Invalid timeout: not a positive number.")
+        self._timeout = float(value)
+
+    @property
+    def verify(self) -> bool:
+        """
+        getter: return whether to verify TLS certificates.
+        setter: set whether to verify TLS certificates.
+        """
+        return self._verify
+
+    @verify.setter
+    def verify(self, value: bool) -> None:
+        self._verify = value
+        if self._session is not None:
+            self._session.verify = value
+
+
+class NdSimulatedFleet(HTTPAdapter):
+    """
+    # Summary
+
+    requests transport adapter that answers for any number of simulated Nexus Dashboards, for benchmarking
+    NdFleetMonitor without a network.  Each host (e.g. 198.18.3.7) bootstraps from the adapter's creation, with
+    bootstrap and install durations drawn from a random generator seeded with the host, so no per-host state is kept.
+    """
+
+    def __init__(self, clock: NdClock, seed: int = 0) -> None:
+        super().__init__()
+        self.clock = clock
+        self.seed = seed
+        self.start: float = clock.monotonic()
+
+    def answer(self, host: str, path: str) -> tuple[int, dict]:
+        """
+        Return the (status code, JSON body) that the Nexus Dashboard at host would send for path.
+        """
+        if path == "/login":
+            return 200, {}
+        if path not in PHASE_PATHS:
+            return 404, {}
+        rng = random.Random(f"{self.seed}/{host}")
+        bootstrap_duration = rng.uniform(240.0, 900.0)
+        install_duration = rng.uniform(600.0, 1800.0)
+        elapsed = self.clock.monotonic() - self.start
+        start, duration = (0.0, bootstrap_duration) if path == PHASE_PATHS[0] else (bootstrap_duration, install_duration)
+        if elapsed >= start + duration:
+            return 200, {"overallProgress": 100, "overallStatus": "Healthy", "state": "Completed"}
+        progress = int(100 * max(0.0, elapsed - start) / duration)
+        return 200, {"overallProgress": min(progress, 99), "overallStatus": "InProgress", "state": "InProgress"}
+
+    def send(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: float | tuple[float, float] | tuple[float, None] | None = None,
+        verify: bool | str = True,
+        cert: bytes | str | tuple[bytes | str, bytes | str] | None = None,
+        proxies: Mapping[str, str] | None = None,
+    ) -> requests.Response:
+        """
+        Answer the request for its host.
+        """
+        url = urlsplit(str(request.url))
+        status, body = self.answer(url.hostname or "", url.path)
+        content = json.dumps(body).encode("utf-8")
+        raw = HTTPResponse(body=BytesIO(content), headers={"Content-Type": "application/json"}, status=status, preload_content=False)
+        return self.build_response(request, raw)
+
+
+def rss_bytes() -> int:
+    """
+    Return the resident set size of this process in bytes (the peak, where the current one is not available).
+    """
+    try:
+        with open("/proc/self/statm", encoding="utf-8") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+def benchmark(clusters: int, duration: float, interval: float, max_workers: int, compare: int) -> None:  # pylint: disable=too-many-locals
+    """
+    Monitor clusters simulated clusters (NdSimulatedFleet) for duration seconds and print memory and scheduling figures,
+    then build compare per-cluster pollers (NdContext, NdLogin and both pollers, as nd_bootstrap.py does) for comparison.
+    """
+    mib = 2**20
+    gc.collect()
+    baseline = rss_bytes()
+    monitor = NdFleetMonitor()
+    monitor.interval = interval
+    monitor.max_workers = max_workers
+    monitor.adapter = NdSimulatedFleet(monitor.clock)
+    # Skip the per-request proxy/netrc environment lookups; nothing leaves the process.
+    monitor.session.trust_env = False
+    for index in range(clusters):
+        monitor.add(f"198.18.{index // 256 % 256}.{index % 256}" if index < 65536 else f"2001:db8::{index:x}", "admin", "password")
+    added = rss_bytes()
+    print(f"NdFleetMonitor: {clusters} clusters added, RSS {baseline / mib:.1f} -> {added / mib:.1f} MiB")
+    monitor.start()
+    started = time.monotonic()
+    peak = added
+    while (elapsed := time.monotonic() - started) < duration:
+        time.sleep(min(5.0, duration - elapsed))
+        peak = max(peak, rss_bytes())
+        print(f"NdFleetMonitor: {time.monotonic() - started:5.0f}s polls {monitor.polls:>8} {monitor.counts()} RSS {peak / mib:.1f} MiB")
+    monitor.stop()
+    lateness = sorted(monitor.lateness) or [0.0]
+    p95 = lateness[int(0.95 * (len(lateness) - 1))]
+    print(f"NdFleetMonitor: {monitor.polls} polls in {duration:.0f}s ({monitor.polls / duration:.0f}/s, {clusters / interval:.0f}/s due)")
+    print(f"NdFleetMonitor: poll start lateness p50 {lateness[len(lateness) // 2] * 1000:.1f} ms, p95 {p95 * 1000:.1f} ms, max {lateness[-1] * 1000:.1f} ms")
+    print(f"NdFleetMonitor: peak RSS {peak / mib:.1f} MiB, {(peak - baseline) / clusters:.0f} bytes per cluster over the baseline")
+    if compare <= 0:
+        return
+    gc.collect()
+    before = rss_bytes()
+    started = time.monotonic()
+    pollers = []
+    for _ in range(compare):
+        context = NdContext()
+        context.nd_ip4 = "198.18.0.1"
+        nd_login = NdLogin()
+        nd_login.context = context
+        context.session = nd_login.session
+        nd_login.session.mount("https://", context.adapter)
+        nd_bootstrap_status = NdPollBootstrapStatus()
+        nd_bootstrap_status.context = context
+        nd_install_status = NdPollInstallStatus()
+        nd_install_status.context = context
+        pollers.append((context, nd_login, nd_bootstrap_status, nd_install_status))
+    per_cluster = (rss_bytes() - before) / compare
+    print(
+        f"Per-cluster pollers: {per_cluster:.0f} bytes and {(time.monotonic() - started) / compare * 1000:.1f} ms per cluster, "
+        f"{per_cluster * clusters / mib:.0f} MiB for {clusters} clusters"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark NdFleetMonitor against simulated Nexus Dashboards: memory per cluster and scheduling lateness")
+    parser.add_argument("--clusters", type=int, default=10000, help="Number of monitored clusters. Default is 10000")
+    parser.add_argument("--duration", type=float, default=60, help="Seconds to monitor. Default is 60")
+    parser.add_argument("--interval", type=float, default=10, help="Seconds between polls of a cluster. Default is 10")
+    parser.add_argument("--workers", type=int, default=32, help="Worker threads. Default is 32")
+    parser.add_argument("--compare", type=int, default=100, help="Per-cluster pollers to build for comparison, 0 to skip. Default is 100")
+    args = parser.parse_args()
+    benchmark(args.clusters, args.duration, args.interval, args.workers, args.compare)
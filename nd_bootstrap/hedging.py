@@ -0,0 +1,326 @@
+"""
+Nexus Dashboard Bootstrap Request Hedging
+
+Hedged GETs: if a status, cluster or syscfg GET has no response by the observed p95 latency, send it again on
+another pooled connection and use whichever response arrives first, within a budget of extra requests.
+"""
+
+import threading
+import time
+from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from nd_bootstrap.exceptions import NdParameterError
+
+if TYPE_CHECKING:
+    # NdContext is only passed to attach(), so import it for type checking only.
+    from nd_bootstrap.context import NdContext
+
+# Idempotent GETs whose latency matters: the status pollers, node discovery / serial numbers, and the firmware version.
+HEDGED_PATHS: tuple[str, ...] = ("/clusterstatus/bootstrap", "/clusterstatus/install", "/v2/bootstrap/cluster", "/v2/bootstrap/syscfg")
+
+Timeout = float | tuple[float, float] | tuple[float, None] | None
+
+
+class NdHedgingAdapter(HTTPAdapter):
+    """
+    # Summary
+
+    requests transport adapter that hedges GETs to NdHedger.paths: the request is sent from a worker
+    thread, and if no response has arrived after NdHedger.delay() (the p95 of recent latencies), and
+    the hedging budget allows, a copy is sent on another pooled connection of the inner adapter.
+    The first response wins; the other is closed when it arrives.  Other requests are handed to the
+    inner adapter directly.
+
+    Installed by NdHedger.attach().
+    """
+
+    def __init__(self, hedger: "NdHedger", inner: HTTPAdapter | None = None) -> None:
+        super().__init__()
+        self.inner: HTTPAdapter = inner if inner is not None else HTTPAdapter()
+        self.hedger = hedger
+        self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="nd-hedge")
+
+    def attempt(self, request: requests.PreparedRequest, timeout: Timeout, options: dict) -> requests.Response:
+        """
+        Send one attempt with the inner adapter, and record its latency.
+        """
+        started = time.monotonic()
+        response = self.inner.send(request, timeout=timeout, **options)
+        self.hedger.record_latency(time.monotonic() - started)
+        return response
+
+    def send(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: Timeout = None,
+        verify: bool | str = True,
+        cert: bytes | str | tuple[bytes | str, bytes | str] | None = None,
+        proxies: Mapping[str, str] | None = None,
+    ) -> requests.Response:
+        """
+        Send the request with the inner adapter, hedged if it is a GET to one of NdHedger.paths.
+        """
+        if request.method != "GET" or urlsplit(request.url or "").path not in self.hedger.paths:
+            return self.inner.send(request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+
+        self.hedger.record_request()
+        options = {"stream": stream, "verify": verify, "cert": cert, "proxies": proxies}
+        started = time.monotonic()
+        primary: Future[requests.Response] = self._executor.submit(self.attempt, request, timeout, options)
+        delay = self.hedger.delay()
+        if delay is None or primary in wait([primary], timeout=delay).done or not self.hedger.spend():
+            return primary.result()
+        return self.race(primary, self._executor.submit(self.attempt, request.copy(), self.remaining(timeout, time.monotonic() - started), options))
+
+    def race(self, primary: "Future[requests.Response]", hedge: "Future[requests.Response]") -> requests.Response:
+        """
+        Return the first response of primary and hedge, and close the other when it arrives.
+
+        Raises if:
+            - both fail (the exception of primary)
+        """
+        pending: set[Future[requests.Response]] = {primary, hedge}
+        error: BaseException | None = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is not None:
+                    # Keep the error of the first request, unless the other one answers.
+                    if future is primary or error is None:
+                        error = future.exception()
+                    continue
+                for loser in pending:
+                    loser.add_done_callback(self.discard)
+                if future is hedge:
+                    self.hedger.record_win()
+                return future.result()
+        assert error is not None
+        raise error
+
+    @staticmethod
+    def discard(future: Future) -> None:
+        """
+        Close the response of an attempt that lost the race, releasing its connection.
+        """
+        if future.exception() is None:
+            future.result().close()
+
+    @staticmethod
+    def remaining(timeout: Timeout, elapsed: float) -> Timeout:
+        """
+        Return timeout, less the elapsed seconds, so that the hedge ends no later than the first request would.
+        """
+        if timeout is None:
+            return None
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            if read is None:
+                return (max(0.001, connect - elapsed), None)
+            return (max(0.001, connect - elapsed), max(0.001, read - elapsed))
+        return max(0.001, timeout - elapsed)
+
+    def close(self) -> None:
+        """
+        Close the inner adapter.
+        """
+        self._executor.shutdown(wait=False)
+        self.inner.close()
+        super().close()
+
+
+class NdHedger:
+    """
+    # Summary
+
+    Hedge the latency-sensitive, idempotent GETs (by default the /clusterstatus/* polls, the cluster
+    GET and syscfg, see HEDGED_PATHS): a request still unanswered after the p95 of the last 200
+    latencies is sent again on another connection, and the first response is used.  A single slow
+    response (e.g. while Nexus Dashboard is busy installing services) then costs about the p95
+    instead of many seconds.
+
+    Extra load is capped by a token bucket: each hedgeable request earns `budget` tokens (up to 5),
+    and each hedge spends one, so at most about budget * 100 percent of requests are sent twice.
+    No request is hedged until `min_samples` latencies have been observed, and never sooner than
+    `min_delay` seconds.
+
+    ## Properties
+
+    - budget: (getter/setter) Fraction of hedgeable requests that may be hedged. Default is 0.1.
+    - hedged: (getter) Number of requests hedged.
+    - min_delay: (getter/setter) Seconds to wait, at least, before hedging. Default is 0.05.
+    - min_samples: (getter/setter) Latencies to observe before hedging. Default is 20.
+    - paths: (getter/setter) URL paths of the GETs to hedge. Default is HEDGED_PATHS.
+    - requests: (getter) Number of hedgeable requests sent.
+    - wins: (getter) Number of hedged requests answered first by the hedge.
+
+    ## Usage
+
+    ```python
+    hedger = NdHedger()
+    hedger.budget = 0.05
+    hedger.attach(context)  # before NdLogin creates the session
+    ...
+    print(hedger.summary())
+    ```
+    """
+
+    def __init__(self) -> None:
+        self.class_name: str = self.__class__.__name__
+        self._budget: float = 0.1
+        self._hedged: int = 0
+        self._latencies: deque[float] = deque(maxlen=200)
+        self._lock = threading.Lock()
+        self._min_delay: float = 0.05
+        self._min_samples: int = 20
+        self._paths: tuple[str, ...] = HEDGED_PATHS
+        self._requests: int = 0
+        self._tokens: float = 0.0
+        self._wins: int = 0
+
+    def attach(self, context: "NdContext") -> None:
+        """
+        Wrap context.adapter so that sessions created by NdLogin hedge requests.
+
+        Attach after any cassette adapter, and before the profiler, tracer and deadline, so that those
+        see one request per hedged exchange.
+        """
+        context.adapter = NdHedgingAdapter(self, context.adapter)
+
+    def delay(self) -> float | None:
+        """
+        Return the seconds to wait before hedging (the p95 of recent latencies, at least min_delay),
+        or None if too few latencies have been observed.
+        """
+        with self._lock:
+            if len(self._latencies) < self._min_samples:
+                return None
+            ordered = sorted(self._latencies)
+        return max(self._min_delay, ordered[int(len(ordered) * 0.95) - 1])
+
+    def record_latency(self, seconds: float) -> None:
+        """
+        Add the latency of one attempt to the window.
+        """
+        with self._lock:
+            self._latencies.append(seconds)
+
+    def record_request(self) -> None:
+        """
+        Count a hedgeable request, and add budget tokens.
+        """
+        with self._lock:
+            self._requests += 1
+            self._tokens = min(5.0, self._tokens + self._budget)
+
+    def record_win(self) -> None:
+        """
+        Count a hedged request answered first by the hedge.
+        """
+        with self._lock:
+            self._wins += 1
+
+    def spend(self) -> bool:
+        """
+        Take a token for a hedge.  Return False, without hedging, if the budget is used up.
+        """
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            self._hedged += 1
+            return True
+
+    def summary(self) -> str:
+        """
+        Return a one-line summary of the requests hedged.
+        """
+        delay = self.delay()
+        msg = f"{self.class_name}: {self._hedged} of {self._requests} request(s) hedged"
+        msg += f" ({self._hedged * 100 / max(1, self._requests):.1f}%), {self._wins} answered first by the hedge"
+        msg += f", hedging delay {delay * 1000:.0f} ms." if delay is not None else ", too few samples for a hedging delay."
+        return msg
+
+    @property
+    def budget(self) -> float:
+        """
+        getter: return the fraction of hedgeable requests that may be hedged.
+        setter: set the fraction of hedgeable requests that may be hedged.
+        """
+        return self._budget
+
+    @budget.setter
+    def budget(self, value: float) -> None:
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or not 0 <= value <= 1:
+            raise NdParameterError("Invalid budget: not a number between 0 and 1.")
+        self._budget = float(value)
+
+    @property
+    def hedged(self) -> int:
+        """
+        getter: return the number of requests hedged.
+        """
+        return self._hedged
+
+    @property
+    def min_delay(self) -> float:
+        """
+        getter: return the minimum seconds to wait before hedging.
+        setter: set the minimum seconds to wait before hedging.
+        """
+        return self._min_delay
+
+    @min_delay.setter
+    def min_delay(self, value: float) -> None:
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0:
+            raise NdParameterError("Invalid min_delay: not a non-negative number.")
+        self._min_delay = float(value)
+
+    @property
+    def min_samples(self) -> int:
+        """
+        getter: return the number of latencies to observe before hedging.
+        setter: set the number of latencies to observe before hedging.
+        """
+        return self._min_samples
+
+    @min_samples.setter
+    def min_samples(self, value: int) -> None:
+        if isinstance(value, bool) or not isinstance(value, int) or not 1 <= value <= 200:
+            raise NdParameterError("Invalid min_samples: not an int between 1 and 200.")
+        self._min_samples = value
+
+    @property
+    def paths(self) -> tuple[str, ...]:
+        """
+        getter: return the URL paths of the GETs to hedge.
+        setter: set the URL paths of the GETs to hedge.
+        """
+        return self._paths
+
+    @paths.setter
+    def paths(self, value: tuple[str, ...]) -> None:
+        if not isinstance(value, (list, tuple)) or not all(isinstance(path, str) and path.startswith("/") for path in value):
+            raise NdParameterError("Invalid paths: not a list of URL paths starting with '/'.")
+        self._paths = tuple(value)
+
+    @property
+    def requests(self) -> int:
+        """
+        getter: return the number of hedgeable requests sent.
+        """
+        return self._requests
+
+    @property
+    def wins(self) -> int:
+        """
+        getter: return the number of hedged requests answered first by the hedge.
+        """
+        return self._wins
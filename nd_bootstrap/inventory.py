@@ -0,0 +1,215 @@
+"""
+Nexus Dashboard Cluster Inventory
+
+Indexes the nodes reported by Nexus Dashboard for matching against configured nodes.
+"""
+
+import ipaddress
+
+from nd_bootstrap.exceptions import NdConfigError, NdNodeDiscoveryError, NdParameterError, NdValidationError
+
+
+class NdClusterInventory:
+    """
+    # Summary
+
+    Index of the nodes reported by Nexus Dashboard (the `nodes` list of the /v2/bootstrap/cluster
+    response), built once per run, and used to enrich the configured nodes in a single pass.
+
+    Nodes are indexed by:
+
+    - management IP address (managementNetwork.ipSubnet and managementNetwork.ipv6Subnet)
+    - data IP address (dataNetwork.ipSubnet and dataNetwork.ipv6Subnet)
+    - hostname (case-insensitive)
+    - serial number
+
+    IP addresses are normalized with the ipaddress module, so "192.168.7.8/24", "192.168.7.8",
+    and " 192.168.7.8/32 " all match, as do different spellings of the same IPv6 address.
+
+    A configured node is matched by management IP address first.  If that fails, enrich() falls back to
+    the data IP address, then the hostname, and says which key matched.  Two configured nodes that match
+    the same reported node are rejected, rather than given the same serial number.
+
+    ## Properties
+
+    - nodes: (getter/setter) The nodes reported by Nexus Dashboard. Setting nodes rebuilds the indexes.
+
+    ## Usage
+
+    ```python
+    inventory = NdClusterInventory()
+    inventory.nodes = response.json().get("nodes", [])
+    for node in config["nodes"]:
+        inventory.enrich(node)  # sets nodeController.ipAddress and serialNumber
+    ```
+    """
+
+    def __init__(self) -> None:
+        self.class_name: str = self.__class__.__name__
+        self._nodes: list[dict] = []
+        self._by_data_ip: dict[str, dict] = {}
+        self._by_hostname: dict[str, dict] = {}
+        self._by_management_ip: dict[str, dict] = {}
+        self._by_serial_number: dict[str, dict] = {}
+        # id() of each reported node matched by enrich(), with the management IP address of the configured node it matched.
+        self._claimed: dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    @staticmethod
+    def normalize_ip(value: object) -> str:
+        """
+        Return the address portion of an IP address or interface (with or without prefix length) in canonical form.
+
+        Returns "" if value is not a valid IP address.
+        """
+        if not isinstance(value, str) or not value.strip():
+            return ""
+        try:
+            return str(ipaddress.ip_interface(value.strip()).ip)
+        except ValueError:
+            return ""
+
+    @classmethod
+    def network_ips(cls, node: dict, network: str) -> list[str]:
+        """
+        Return the normalized IPv4 and IPv6 addresses of node[network], e.g. network "managementNetwork".
+        """
+        settings = node.get(network) or {}
+        ips = [cls.normalize_ip(settings.get(key)) for key in ("ipSubnet", "ipv6Subnet")]
+        return [ip for ip in ips if ip]
+
+    def by_data_ip(self, value: str) -> dict | None:
+        """
+        Return the node whose data IP address matches value, or None.
+        """
+        return self._by_data_ip.get(self.normalize_ip(value))
+
+    def by_hostname(self, value: str) -> dict | None:
+        """
+        Return the node whose hostname matches value (case-insensitive), or None.
+        """
+        return self._by_hostname.get(value.strip().lower())
+
+    def by_management_ip(self, value: str) -> dict | None:
+        """
+        Return the node whose management IP address matches value, or None.
+        """
+        return self._by_management_ip.get(self.normalize_ip(value))
+
+    def by_serial_number(self, value: str) -> dict | None:
+        """
+        Return the node whose serial number matches value, or None.
+        """
+        return self._by_serial_number.get(value.strip())
+
+    def find(self, config_node: dict) -> tuple[dict | None, str]:
+        """
+        Return (node, key): the node reported by Nexus Dashboard that corresponds to config_node (or None),
+        and the key that matched it ("management IP", "data IP", "hostname", or "" if none matched).
+
+        Matches by management IP address first, then data IP address, then hostname.
+        """
+        for ip in self.network_ips(config_node, "managementNetwork"):
+            if ip in self._by_management_ip:
+                return self._by_management_ip[ip], "management IP"
+        for ip in self.network_ips(config_node, "dataNetwork"):
+            if ip in self._by_data_ip:
+                return self._by_data_ip[ip], "data IP"
+        hostname = config_node.get("hostName", "")
+        if isinstance(hostname, str) and hostname.strip():
+            node = self.by_hostname(hostname)
+            if node is not None:
+                return node, "hostname"
+        return None, ""
+
+    def match(self, config_node: dict) -> dict | None:
+        """
+        Return the node reported by Nexus Dashboard that corresponds to config_node, or None (see find()).
+        """
+        return self.find(config_node)[0]
+
+    def enrich(self, config_node: dict) -> None:
+        """
+        Update config_node in place:
+
+        - nodeController.ipAddress: set from managementNetwork.ipSubnet (without prefix length) if not already set.
+        - serialNumber: set from the matching node reported by Nexus Dashboard.
+
+        Raises if:
+            - config_node has no valid managementNetwork.ipSubnet (NdConfigError)
+            - no node reported by Nexus Dashboard matches config_node, or the match has no serialNumber (NdNodeDiscoveryError)
+            - the match was already matched by another configured node (NdValidationError)
+        """
+        method_name: str = "enrich"
+        msg: str = ""
+
+        mgmt_ip_subnet = (config_node.get("managementNetwork") or {}).get("ipSubnet", "")
+        mgmt_ip = self.normalize_ip(mgmt_ip_subnet)
+        if not mgmt_ip:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Node managementNetwork.ipSubnet is missing, empty, or not a valid IP address: '{mgmt_ip_subnet}'."
+            raise NdConfigError(msg)
+
+        node_controller = config_node.get("nodeController")
+        if isinstance(node_controller, dict) and not node_controller.get("ipAddress"):
+            node_controller["ipAddress"] = mgmt_ip
+
+        matched_node, key = self.find(config_node)
+        if not matched_node:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"No matching node found for managementNetwork.ipSubnet {mgmt_ip_subnet}."
+            raise NdNodeDiscoveryError(msg)
+        claimant = self._claimed.setdefault(id(matched_node), mgmt_ip)
+        if claimant != mgmt_ip:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Nodes with managementNetwork.ipSubnet {claimant} and {mgmt_ip_subnet} both match the node reported by Nexus Dashboard "
+            msg += f"with hostName {matched_node.get('hostName', 'UNKNOWN')} and serialNumber {matched_node.get('serialNumber', 'UNKNOWN')} "
+            msg += f"(the second by {key})."
+            raise NdValidationError(msg)
+        if key != "management IP":
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"No reported node has management IP address {mgmt_ip}. Matched node with managementNetwork.ipSubnet {mgmt_ip_subnet} "
+            msg += f"by {key} instead, to the node with hostName {matched_node.get('hostName', 'UNKNOWN')}."
+            print(msg)
+
+        serial_number = matched_node.get("serialNumber", "")
+        if not serial_number:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Matched node for managementNetwork.ipSubnet {mgmt_ip_subnet} has no serialNumber."
+            raise NdNodeDiscoveryError(msg)
+        config_node["serialNumber"] = serial_number
+        msg = f"{self.class_name}.{method_name}: "
+        msg += f"Updated node with managementNetwork.ipSubnet {mgmt_ip_subnet} to serialNumber {serial_number}."
+        print(msg)
+
+    @property
+    def nodes(self) -> list[dict]:
+        """
+        getter: return the nodes reported by Nexus Dashboard.
+        setter: set the nodes reported by Nexus Dashboard and rebuild the indexes.
+        """
+        return self._nodes
+
+    @nodes.setter
+    def nodes(self, value: list[dict]) -> None:
+        if not isinstance(value, list) or not all(isinstance(node, dict) for node in value):
+            raise NdParameterError("Invalid nodes: not a list of dictionaries.")
+        self._nodes = value
+        self._by_data_ip = {}
+        self._by_hostname = {}
+        self._by_management_ip = {}
+        self._by_serial_number = {}
+        self._claimed = {}
+        for node in value:
+            for ip in self.network_ips(node, "managementNetwork"):
+                self._by_management_ip.setdefault(ip, node)
+            for ip in self.network_ips(node, "dataNetwork"):
+                self._by_data_ip.setdefault(ip, node)
+            hostname = node.get("hostName", "")
+            if isinstance(hostname, str) and hostname.strip():
+                self._by_hostname.setdefault(hostname.strip().lower(), node)
+            serial_number = node.get("serialNumber", "")
+            if isinstance(serial_number, str) and serial_number.strip():
+                self._by_serial_number.setdefault(serial_number.strip(), node)
@@ -0,0 +1,584 @@
+"""
+Nexus Dashboard Bootstrap Job Queue
+
+A work queue of bootstrap jobs shared by any number of runner processes, on one or several hosts,
+through a SQLite database.  Runners claim jobs with time-limited leases renewed by heartbeat, and
+jobs of a runner that stopped heartbeating are resumed by another runner from their last checkpoint.
+
+Usage:
+
+    ./nd_bootstrap.py cluster1.yaml --queue-submit /shared/nd_jobs.db
+    ./nd_bootstrap.py template.yaml --inventory inventory.csv --queue-submit /shared/nd_jobs.db
+    ./nd_bootstrap.py --queue-run /shared/nd_jobs.db --poll-status      # on each runner host, any number of times
+    python -m nd_bootstrap.job_queue /shared/nd_jobs.db                 # job states
+"""
+
+import argparse
+import inspect
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+
+from nd_bootstrap.auth_manager import NdAuthManager
+from nd_bootstrap.bootstrap import NdBootstrap
+from nd_bootstrap.config import NdBootstrapConfig
+from nd_bootstrap.context import ADDRESS_SOURCES, NdContext
+from nd_bootstrap.events import NdEventBus
+from nd_bootstrap.exceptions import NdBootstrapError, NdParameterError
+
+SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    cluster_name TEXT NOT NULL,
+    config TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending',
+    owner TEXT NOT NULL DEFAULT '',
+    lease_expires REAL NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    checkpoint TEXT NOT NULL DEFAULT '',
+    result TEXT NOT NULL DEFAULT '',
+    error TEXT NOT NULL DEFAULT '',
+    created REAL NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_state ON jobs (state, lease_expires);
+"""
+
+# Stages after which Nexus Dashboard may have received the configuration.  A job resumed from one of
+# these runs in reconcile mode, which polls an in-progress bootstrap instead of validating and POSTing again.
+POSTED_STAGES: frozenset[str] = frozenset({"post", "poll_bootstrap", "poll_install", "verify_health", "completed"})
+
+
+@dataclass
+class NdJob:
+    """
+    One bootstrap job.
+
+    - id: The job id.
+    - cluster_name: clusterConfig.name.
+    - config: The bootstrap configuration dictionary.
+    - state: "pending", "running", "done" or "failed".
+    - owner: The runner holding (or last holding) the lease.
+    - lease_expires: Epoch seconds when the lease expires, unless renewed.
+    - attempts: The number of times the job was claimed.
+    - checkpoint: The last NdBootstrap stage recorded by the owner, e.g. "validation" or "poll_install".
+    """
+
+    id: int
+    cluster_name: str
+    config: dict
+    state: str
+    owner: str
+    lease_expires: float
+    attempts: int
+    checkpoint: str
+
+
+class NdJobQueue:
+    """
+    # Summary
+
+    Bootstrap jobs in a SQLite database shared by every runner.
+
+    - submit(): Add a job (the configuration is stored in the database, so runners need no shared files).
+    - claim(): Atomically take the oldest job that is pending, or running with an expired lease
+      (its runner crashed or lost contact), and lease it to a runner for lease seconds.
+    - renew(), checkpoint(): Extend the lease, and record the current stage, if the runner still holds it.
+    - complete(), fail(): Record the outcome, if the runner still holds the lease.
+
+    Claims use `BEGIN IMMEDIATE` transactions, so exactly one runner gets each job.  Every operation
+    is one short transaction on a new connection, so the queue can be used from several threads.
+
+    For runners on several hosts, put the database on a filesystem with working POSIX locks
+    (the default rollback journal is used, not WAL, which needs shared memory on one host).
+
+    ## Properties
+
+    - database: (getter/setter) The SQLite database file. Created on first use.
+    - max_attempts: (getter/setter) Claims per job before a job whose lease expired is marked failed. Default is 3.
+
+    ## Usage
+
+    ```python
+    queue = NdJobQueue()
+    queue.database = "/shared/nd_jobs.db"
+    queue.submit(nd_bootstrap_config)
+    job = queue.claim("runner-1", lease=30)
+    ```
+    """
+
+    def __init__(self) -> None:
+        self.class_name: str = self.__class__.__name__
+        self._database: str = ""
+        self._initialized: bool = False
+        self._max_attempts: int = 3
+
+    @contextmanager
+    def transaction(self, immediate: bool = False) -> Iterator[sqlite3.Connection]:
+        """
+        Yield a connection inside a transaction, committed on success and rolled back on error.
+
+        immediate takes the write lock at the start, so that a read followed by a write (claim) is atomic.
+        """
+        method_name: str = inspect.stack()[0][3]
+        msg: str = ""
+
+        if not self._database:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "instance.database must be set before using the queue."
+            raise NdParameterError(msg)
+        connection = sqlite3.connect(self._database, timeout=30, isolation_level=None)
+        connection.row_factory = sqlite3.Row
+        try:
+            if not self._initialized:
+                connection.executescript(SCHEMA)
+                self._initialized = True
+            connection.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+            try:
+                yield connection
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+        finally:
+            connection.close()
+
+    def submit(self, nd_bootstrap_config: NdBootstrapConfig) -> int:
+        """
+        Add a job for the (validated) configuration of nd_bootstrap_config and return its id.
+        """
+        now = time.time()
+        with self.transaction() as connection:
+            cursor = connection.execute(
+                "INSERT INTO jobs (cluster_name, config, created, updated) VALUES (?, ?, ?, ?)",
+                (nd_bootstrap_config.nd_cluster_name, json.dumps(nd_bootstrap_config.config), now, now),
+            )
+        return int(cursor.lastrowid or 0)
+
+    def claim(self, owner: str, lease: float) -> NdJob | None:
+        """
+        Lease the oldest claimable job to owner for lease seconds and return it, or None if there is none.
+        """
+        now = time.time()
+        with self.transaction(immediate=True) as connection:
+            # Jobs abandoned too often are not retried forever.
+            connection.execute(
+                "UPDATE jobs SET state = 'failed', error = 'lease expired ' || attempts || ' time(s)', updated = ? "
+                "WHERE state = 'running' AND lease_expires < ? AND attempts >= ?",
+                (now, now, self._max_attempts),
+            )
+            row = connection.execute(
+                "SELECT * FROM jobs WHERE state = 'pending' OR (state = 'running' AND lease_expires < ?) ORDER BY id LIMIT 1",
+                (now,),
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute(
+                "UPDATE jobs SET state = 'running', owner = ?, lease_expires = ?, attempts = attempts + 1, updated = ? WHERE id = ?",
+                (owner, now + lease, now, row["id"]),
+            )
+        return NdJob(
+            id=row["id"],
+            cluster_name=row["cluster_name"],
+            config=json.loads(row["config"]),
+            state="running",
+            owner=owner,
+            lease_expires=now + lease,
+            attempts=row["attempts"] + 1,
+            checkpoint=row["checkpoint"],
+        )
+
+    def update_owned(self, job_id: int, owner: str, assignments: str, values: tuple) -> bool:
+        """
+        Apply assignments (SQL) with values to job_id if owner still holds its lease.  Return False if not.
+        """
+        with self.transaction() as connection:
+            cursor = connection.execute(
+                f"UPDATE jobs SET {assignments}, updated = ? WHERE id = ? AND owner = ? AND state = 'running'",
+                (*values, time.time(), job_id, owner),
+            )
+        return cursor.rowcount == 1
+
+    def renew(self, job_id: int, owner: str, lease: float) -> bool:
+        """
+        Extend the lease of job_id by lease seconds.  Return False if owner no longer holds it.
+        """
+        return self.update_owned(job_id, owner, "lease_expires = ?", (time.time() + lease,))
+
+    def checkpoint(self, job_id: int, owner: str, stage: str, lease: float) -> bool:
+        """
+        Record stage as the checkpoint of job_id and extend its lease.  Return False if owner no longer holds it.
+        """
+        return self.update_owned(job_id, owner, "checkpoint = ?, lease_expires = ?", (stage, time.time() + lease))
+
+    def complete(self, job_id: int, owner: str, result: dict) -> bool:
+        """
+        Mark job_id done with result.  Return False if owner no longer holds it.
+        """
+        return self.update_owned(job_id, owner, "state = 'done', checkpoint = 'completed', result = ?", (json.dumps(result, default=str),))
+
+    def fail(self, job_id: int, owner: str, error: str) -> bool:
+        """
+        Mark job_id failed with error.  Return False if owner no longer holds it.
+        """
+        return self.update_owned(job_id, owner, "state = 'failed', error = ?", (error,))
+
+    def counts(self) -> dict[str, int]:
+        """
+        Return the number of jobs in each state.
+        """
+        with self.transaction() as connection:
+            rows = connection.execute("SELECT state, COUNT(*) AS count FROM jobs GROUP BY state").fetchall()
+        return {row["state"]: row["count"] for row in rows}
+
+    def jobs(self) -> list[dict]:
+        """
+        Return every job (without its configuration), oldest first.
+        """
+        with self.transaction() as connection:
+            rows = connection.execute("SELECT id, cluster_name, state, owner, lease_expires, attempts, checkpoint, error, created, updated FROM jobs ORDER BY id").fetchall()
+        return [dict(row) for row in rows]
+
+    @property
+    def database(self) -> str:
+        """
+        getter: return the SQLite database file.
+        setter: set the SQLite database file.
+        """
+        return self._database
+
+    @database.setter
+    def database(self, value: str) -> None:
+        if not value or not isinstance(value, str):
+            raise NdParameterError("Invalid database: empty or not a string.")
+        self._database = value
+        self._initialized = False
+
+    @property
+    def max_attempts(self) -> int:
+        """
+        getter: return the number of claims per job before a job whose lease expired is marked failed.
+        setter: set the number of claims per job before a job whose lease expired is marked failed.
+        """
+        return self._max_attempts
+
+    @max_attempts.setter
+    def max_attempts(self, value: int) -> None:
+        if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+            raise NdParameterError("Invalid max_attempts: not a positive int.")
+        self._max_attempts = value
+
+
+class NdJobRunner:
+    """
+    # Summary
+
+    Run bootstrap jobs from an NdJobQueue with `workers` concurrent bootstraps.  Start one runner per
+    process, on as many hosts as needed: each worker claims its own job, so throughput grows with
+    the number of runners until Nexus Dashboard or the queue database is the bottleneck.
+
+    While a job runs, a heartbeat thread renews its lease every `lease / 3` seconds, and records
+    the bootstrap stage (from `context.cluster_state`) as the job's checkpoint within a second of
+    each stage change.  If the runner dies, the lease expires and another runner claims the job:
+
+    - with a checkpoint before "post", the job runs again from the start;
+    - with a checkpoint of "post" or later, the job runs in reconcile mode, which polls the
+      in-progress bootstrap instead of validating and POSTing again (a repeated POST is answered with
+      405 and treated as already sent, so a checkpoint lost in the last second is also safe).
+
+    ## Properties
+
+    - address_source: (getter/setter) "environment" (ND_IP4 / ND_IP6) or "config" (see NdContext.from_config). Default is "environment".
+    - configure: (getter/setter) Optional callable, called with each NdBootstrap before commit.
+    - events: (getter/setter) Optional NdEventBus shared by every bootstrap. Default is None.
+    - exit_when_idle: (getter/setter) Return once no job is pending or running. Default is False (run until stop()).
+    - lease: (getter/setter) Lease duration in seconds. Default is 30.
+    - queue: (getter/setter) The NdJobQueue.
+    - runner_id: (getter) "<hostname>-<pid>", the owner recorded on claimed jobs.
+    - workers: (getter/setter) Concurrent bootstraps in this runner. Default is 4.
+
+    ## Usage
+
+    ```python
+    runner = NdJobRunner()
+    runner.queue = queue
+    runner.configure = lambda instance: setattr(instance, "poll", True)
+    runner.commit()
+    ```
+    """
+
+    def __init__(self) -> None:
+        self.class_name: str = self.__class__.__name__
+        self._address_source: str = "environment"
+        self._configure: Callable[[NdBootstrap], None] | None = None
+        self._auth: NdAuthManager = NdAuthManager()
+        self._events: NdEventBus | None = None
+        self._exit_when_idle: bool = False
+        self._idle_wait: float = 1.0
+        self._lease: float = 30.0
+        self._queue: NdJobQueue | None = None
+        self._runner_id: str = f"{socket.gethostname()}-{os.getpid()}"
+        self._stop = threading.Event()
+        self._workers: int = 4
+
+    def heartbeat(self, job: NdJob, context: NdContext, done: threading.Event) -> None:
+        """
+        Renew the lease of job and record checkpoints until done is set.  Runs in its own thread.
+        """
+        method_name: str = inspect.stack()[0][3]
+        msg: str = ""
+
+        stage = job.checkpoint
+        renewed = time.monotonic()
+        while not done.wait(1.0):
+            current = context.cluster_state.stage
+            if current != stage and current not in ("starting", "failed"):
+                held = self.queue.checkpoint(job.id, self._runner_id, current, self._lease)
+                stage = current
+            elif time.monotonic() - renewed >= self._lease / 3:
+                held = self.queue.renew(job.id, self._runner_id, self._lease)
+            else:
+                continue
+            renewed = time.monotonic()
+            if not held:
+                msg = f"{self.class_name}.{method_name}: "
+                msg += f"Job {job.id} ({job.cluster_name}): lease lost to another runner; its result will not be recorded."
+                print(msg)
+                return
+
+    def run_job(self, job: NdJob) -> None:
+        """
+        Bootstrap one claimed job and record its outcome.  The job fails if the bootstrap raises (any exception,
+        qualified with its module if it is not an NdBootstrapError), or if its result reports a failure
+        (see NdBootstrapResult.failure: e.g. the POST was not accepted, or polling ran out of retries).
+        """
+        method_name: str = inspect.stack()[0][3]
+        msg: str = ""
+
+        resumed = job.attempts > 1
+        msg = f"{self.class_name}.{method_name}: "
+        msg += f"Job {job.id} ({job.cluster_name}): attempt {job.attempts}"
+        msg += f", resuming from checkpoint '{job.checkpoint or 'none'}'." if resumed else "."
+        print(msg)
+
+        done = threading.Event()
+        try:
+            nd_bootstrap_config = NdBootstrapConfig()
+            nd_bootstrap_config.config = job.config
+            context = NdContext.from_config(job.config) if self._address_source == "config" else NdContext.from_environment()
+            if self._events is not None:
+                context.events = self._events
+            # Jobs for the same Nexus Dashboard re-authenticate once between them.
+            context.auth = self._auth
+            heartbeat = threading.Thread(target=self.heartbeat, args=(job, context, done), name=f"nd-lease-{job.id}", daemon=True)
+            heartbeat.start()
+            instance = NdBootstrap()
+            instance.context = context
+            instance.nd_bootstrap_config = nd_bootstrap_config
+            if self._configure is not None:
+                self._configure(instance)
+            if resumed and job.checkpoint in POSTED_STAGES:
+                instance.reconcile = True
+            result = instance.commit()
+            error = result.failure
+        except NdBootstrapError as bootstrap_error:
+            error = str(bootstrap_error)
+        except Exception as unexpected_error:  # pylint: disable=broad-exception-caught
+            error = f"{type(unexpected_error).__module__}.{type(unexpected_error).__name__}: {str(unexpected_error)}"
+        finally:
+            done.set()
+        if error:
+            self.queue.fail(job.id, self._runner_id, error)
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Job {job.id} ({job.cluster_name}) failed: {error}"
+            print(msg)
+            return
+        if self.queue.complete(job.id, self._runner_id, asdict(result)):
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Job {job.id} ({job.cluster_name}) done: {result.action}."
+        else:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Job {job.id} ({job.cluster_name}) finished after its lease was lost; result not recorded."
+        print(msg)
+
+    def work(self) -> None:
+        """
+        Claim and run jobs until stop() is called (or, with exit_when_idle, until no job is pending or running).
+
+        An error while recording a job's outcome (e.g. sqlite3.OperationalError) is printed, and the worker
+        carries on: the job's lease expires, and it is resumed like the job of a runner that crashed.
+        """
+        method_name: str = inspect.stack()[0][3]
+        msg: str = ""
+
+        while not self._stop.is_set():
+            job = self.queue.claim(self._runner_id, self._lease)
+            if job is not None:
+                try:
+                    self.run_job(job)
+                except Exception as error:  # pylint: disable=broad-exception-caught
+                    msg = f"{self.class_name}.{method_name}: "
+                    msg += f"Job {job.id} ({job.cluster_name}): {type(error).__module__}.{type(error).__name__}: {str(error)}"
+                    print(msg)
+                continue
+            if self._exit_when_idle and not self.queue.counts().get("running") and not self.queue.counts().get("pending"):
+                return
+            self._stop.wait(self._idle_wait)
+
+    def commit(self) -> None:
+        """
+        Run `workers` worker threads until they return (see work()).
+
+        Raises if:
+            - instance.queue is not set
+        """
+        method_name: str = inspect.stack()[0][3]
+        msg: str = ""
+
+        if self._queue is None:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "instance.queue must be set before calling instance.commit."
+            raise NdParameterError(msg)
+        self._stop.clear()
+        threads = [threading.Thread(target=self.work, name=f"nd-job-worker-{index}", daemon=True) for index in range(self._workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            # join() with a timeout, so that KeyboardInterrupt is delivered to the main thread.
+            while thread.is_alive():
+                thread.join(0.5)
+
+    def stop(self) -> None:
+        """
+        Stop claiming jobs.  commit() returns once the jobs in progress are finished.
+        """
+        self._stop.set()
+
+    @property
+    def address_source(self) -> str:
+        """
+        getter: return where the Nexus Dashboard address of each job comes from.
+        setter: set where the Nexus Dashboard address of each job comes from ("environment" or "config").
+        """
+        return self._address_source
+
+    @address_source.setter
+    def address_source(self, value: str) -> None:
+        if value not in ADDRESS_SOURCES:
+            raise NdParameterError(f"Invalid address_source: {value}. Expected one of {', '.join(ADDRESS_SOURCES)}.")
+        self._address_source = value
+
+    @property
+    def configure(self) -> Callable[[NdBootstrap], None] | None:
+        """
+        getter: return the callable applied to each NdBootstrap before commit, or None.
+        setter: set the callable applied to each NdBootstrap before commit.
+        """
+        return self._configure
+
+    @configure.setter
+    def configure(self, value: Callable[[NdBootstrap], None]) -> None:
+        if not callable(value):
+            raise NdParameterError("Invalid configure: not callable.")
+        self._configure = value
+
+    @property
+    def events(self) -> NdEventBus | None:
+        """
+        getter: return the NdEventBus shared by every bootstrap, or None.
+        setter: set the NdEventBus shared by every bootstrap.
+        """
+        return self._events
+
+    @events.setter
+    def events(self, value: NdEventBus) -> None:
+        if not isinstance(value, NdEventBus):
+            raise NdParameterError("Invalid events: not an NdEventBus instance.")
+        self._events = value
+
+    @property
+    def exit_when_idle(self) -> bool:
+        """
+        getter: return True if commit() returns once no job is pending or running.
+        setter: set whether commit() returns once no job is pending or running.
+        """
+        return self._exit_when_idle
+
+    @exit_when_idle.setter
+    def exit_when_idle(self, value: bool) -> None:
+        if not isinstance(value, bool):
+            raise NdParameterError("Invalid exit_when_idle: not a boolean.")
+        self._exit_when_idle = value
+
+    @property
+    def lease(self) -> float:
+        """
+        getter: return the lease duration in seconds.
+        setter: set the lease duration in seconds.
+        """
+        return self._lease
+
+    @lease.setter
+    def lease(self, value: float) -> None:
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 3:
+            raise NdParameterError("Invalid lease: not a number of at least 3 seconds.")
+        self._lease = float(value)
+
+    @property
+    def queue(self) -> NdJobQueue:
+        """
+        getter: return the NdJobQueue.
+        setter: set the NdJobQueue.
+        """
+        if self._queue is None:
+            raise NdParameterError("Invalid queue: not set.")
+        return self._queue
+
+    @queue.setter
+    def queue(self, value: NdJobQueue) -> None:
+        if not isinstance(value, NdJobQueue):
+            raise NdParameterError("Invalid queue: not an NdJobQueue instance.")
+        self._queue = value
+
+    @property
+    def runner_id(self) -> str:
+        """
+        getter: return the owner recorded on claimed jobs.
+        """
+        return self._runner_id
+
+    @property
+    def workers(self) -> int:
+        """
+        getter: return the number of concurrent bootstraps in this runner.
+        setter: set the number of concurrent bootstraps in this runner.
+        """
+        return self._workers
+
+    @workers.setter
+    def workers(self, value: int) -> None:
+        if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+            raise NdParameterError("Invalid workers: not a positive int.")
+        self._workers = value
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Show the jobs of an nd_bootstrap.py job queue (--queue-submit / --queue-run)")
+    parser.add_argument("database", help="The queue database")
+    args = parser.parse_args()
+
+    nd_job_queue = NdJobQueue()
+    nd_job_queue.database = args.database
+    for queued in nd_job_queue.jobs():
+        line = f"{queued['id']:>6} {queued['cluster_name']:<32} {queued['state']:<8} attempts {queued['attempts']} "
+        line += f"checkpoint {queued['checkpoint'] or '-':<14} owner {queued['owner'] or '-'}"
+        if queued["error"]:
+            line += f" error: {queued['error']}"
+        print(line)
+    print(", ".join(f"{state}: {count}" for state, count in sorted(nd_job_queue.counts().items())) or "No jobs.")
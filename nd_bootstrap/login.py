@@ -4,12 +4,11 @@ Nexus Dashboard Login
 Handles authentication to Nexus Dashboard and maintains the session.
 """
 
-import inspect
-
 import requests
 import urllib3
 
-from nd_bootstrap.environment import NdEnvironment
+from nd_bootstrap.context import NdContext
+from nd_bootstrap.exceptions import NdConnectionError, NdParameterError
 
 # Disable warnings for self-signed certificates (if applicable)
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -26,12 +25,16 @@ class NdLogin:
 
     ## Properties
 
-    - session: (getter) The requests.Session object.
+    - context: (getter/setter) The NdContext for the target. Built from the environment if not set.
+    - session: (getter/setter) The requests.Session object. Default is a new session; set it to log in through
+      a session shared by many targets (e.g. NdFleetMonitor), whose cookie jar keeps one login cookie per host.
+    - status: (getter) True if the last commit() (or reauthenticate()) logged in successfully.
 
     ## Usage
 
     ```python
     nd_login = NdLogin()
+    nd_login.context = context  # optional, defaults to NdContext.from_environment()
     nd_login.commit()
     if nd_login.status:
         print("Login successful")
@@ -45,18 +48,12 @@ class NdLogin:
 
     def __init__(self) -> None:
         self.class_name: str = self.__class__.__name__
+        self._context: NdContext | None = None
         self._status: bool = False  # True if successful login, False otherwise
         self._session = requests.Session()
         self._session.verify = False
         self._session.headers.update({"Content-Type": "application/json"})
-        self.nd_environment: NdEnvironment = NdEnvironment()
-        self._url: str = f"https://{self.nd_environment.nd_ip}/login"
-
-        self._payload: dict[str, str] = {
-            "domain": self.nd_environment.nd_domain,
-            "userName": self.nd_environment.nd_username,
-            "userPasswd": self.nd_environment.nd_password,
-        }
+        self._url: str = ""
 
     def commit(self) -> None:
         """
@@ -67,32 +64,103 @@ class NdLogin:
         ## On successful login
 
         - Set the auth_token header in the session
+        - Set context.session to the session
         - Set status to True
 
         ## On unsuccessful login
 
         - Print an error message
         - Set status to False
+
+        ## Raises if:
+
+        - Nexus Dashboard cannot be reached (NdConnectionError)
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = "commit"
         msg: str = ""
 
-        response = self._session.post(self._url, json=self._payload, timeout=10)
-        if response.status_code != 200:
-            msg = f"{self.class_name}.{method_name}: "
-            msg += f"Authentication failed: {response.status_code} : {response.text}"
-            print(msg)
-            self._status = False
-        else:
-            self._status = True
+        # Build the URL at commit time so that a re-login follows a dual-stack failover.
+        self._url = f"https://{self.context.nd_host}/login"
+        self._session.verify = self.context.verify
+        # Shared by every session of the context, so a re-login reuses its pooled connections (and TLS sessions).
+        # Mounting reorders session.adapters, which must not happen while a shared session is in use by other threads.
+        if self._session.adapters.get("https://") is not self.context.adapter:
+            self._session.mount("https://", self.context.adapter)
+        payload: dict[str, str] = {
+            "domain": self.context.nd_domain,
+            "userName": self.context.nd_username,
+            "userPasswd": self.context.nd_password,
+        }
+        with self.context.tracer.span("nd_login", {"nd.domain": self.context.nd_domain}) as span:
+            try:
+                response = self._session.post(self._url, json=payload, timeout=10)
+            except requests.RequestException as e:
+                msg = f"{self.class_name}.{method_name}: "
+                msg += f"Error logging in to Nexus Dashboard at {self.context.nd_ip}: {str(e)}"
+                raise NdConnectionError(msg) from e
+            span.set_attribute("http.response.status_code", response.status_code)
+            if response.status_code != 200:
+                msg = f"{self.class_name}.{method_name}: "
+                msg += f"Authentication failed: {response.status_code} : {response.text}"
+                print(msg)
+                self._status = False
+            else:
+                self._status = True
+                if self.context.session is not None:
+                    # A re-authentication (401 during polling, or a login refresh).
+                    self.context.cluster_state.add_reauth()
+                self.context.session = self._session
+                # So that a re-authentication by another context sharing context.auth updates this session too.
+                self.context.auth.register(self.context)
+            span.set_attribute("nd.login.status", self._status)
+
+    def reauthenticate(self, seen: int | None = None) -> bool:
+        """
+        Log in again through context.auth, which coalesces concurrent re-authentications for the same target:
+        if another caller sharing context.auth logged in since generation seen (see NdAuthManager.generation()),
+        or is logging in now, its login is used instead of sending another /login.
+
+        Returns:
+            bool: The login status, also available as instance.status.
+        """
+
+        def login() -> bool:
+            self.commit()
+            return self._status
+
+        self._status = self.context.auth.reauthenticate(self.context, seen, login)
+        return self._status
+
+    @property
+    def context(self) -> NdContext:
+        """
+        getter: return the NdContext for the target Nexus Dashboard. Built from the environment if not set.
+        setter: set the NdContext for the target Nexus Dashboard.
+        """
+        if self._context is None:
+            self._context = NdContext.from_environment()
+        return self._context
+
+    @context.setter
+    def context(self, value: NdContext) -> None:
+        if not isinstance(value, NdContext):
+            raise NdParameterError("Invalid context: not an NdContext instance.")
+        self._context = value
 
     @property
     def session(self) -> requests.Session:
         """
         - getter: return the requests.Session object.
+        - setter: set the requests.Session object to log in with.
         """
         return self._session
 
+    @session.setter
+    def session(self, value: requests.Session) -> None:
+        if not isinstance(value, requests.Session):
+            raise NdParameterError("Invalid session: not a requests.Session instance.")
+        self._session = value
+
     @property
     def status(self) -> bool:
         """
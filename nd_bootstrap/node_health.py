@@ -0,0 +1,271 @@
+"""
+Nexus Dashboard Node Health
+
+Post-install health checks of every node and externalServices address, run concurrently.
+"""
+
+import errno
+import inspect
+import ipaddress
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from nd_bootstrap.context import NdContext
+from nd_bootstrap.exceptions import NdHealthCheckError, NdParameterError
+from nd_bootstrap.results import NdHealthCheck, NdHealthResult
+
+
+class NdNodeHealth:
+    """
+    # Summary
+
+    Verify, after NdPollInstallStatus reports 100%, that every node and every externalServices
+    address of the cluster is healthy, instead of checking each node by hand.
+
+    Checks, for every node in `config["nodes"]`:
+
+    - reachable: management and data addresses (IPv4 and IPv6, if configured) answer on `port`.
+      A refused connection counts as reachable (the host answered); a timeout does not.
+    - api: the node's management address serves the Nexus Dashboard API, and reports the services
+      install as complete (GET /clusterstatus/install with the authenticated context.session).
+
+    and for every address in `clusterConfig.externalServices[].pool`:
+
+    - reachable: the address answers on `port`.
+
+    Checks run concurrently in a thread pool of at most max_workers threads, each bounded by
+    timeout seconds, so verifying a large cluster takes about as long as the slowest single check.
+
+    ## Endpoint
+
+    Path: /clusterstatus/install (on each node's management address)
+    Verb: GET
+
+    ## Properties
+
+    - config: (getter/setter) The bootstrap configuration dictionary.
+    - context: (getter/setter) The NdContext for the target. Built from the environment if not set.
+    - max_workers: (getter/setter) The maximum number of concurrent checks. Default is 16.
+    - port: (getter/setter) The TCP port used for reachability checks. Default is 443.
+    - timeout: (getter/setter) Seconds each check may take. Default is 5.
+
+    ## Usage
+
+    ```python
+    instance = NdNodeHealth()
+    instance.context = context
+    instance.config = nd_bootstrap_config.config
+    result = instance.commit()  # raises NdHealthCheckError if any check fails
+    print(result.matrix)
+    ```
+    """
+
+    def __init__(self) -> None:
+        self.class_name: str = self.__class__.__name__
+        self._config: dict = {}
+        self._context: NdContext | None = None
+        self._max_workers: int = 16
+        self._path: str = "/clusterstatus/install"
+        self._port: int = 443
+        self._timeout: float = 5.0
+
+    @staticmethod
+    def addresses(network: object) -> list[str]:
+        """
+        Return the IP addresses (without prefix length) of a managementNetwork or dataNetwork dictionary.
+        """
+        if not isinstance(network, dict):
+            return []
+        addresses: list[str] = []
+        for key in ("ipSubnet", "ipv6Subnet"):
+            try:
+                addresses.append(str(ipaddress.ip_interface(str(network.get(key) or "").strip()).ip))
+            except ValueError:
+                continue
+        return addresses
+
+    def plan(self) -> list[tuple[str, str, str]]:
+        """
+        Return the (target, address, check) tuples to run, in configuration order.
+        """
+        plan: list[tuple[str, str, str]] = []
+        for node in self._config.get("nodes", []):
+            target = node.get("hostName") or "UNKNOWN"
+            management_addresses = self.addresses(node.get("managementNetwork"))
+            for address in management_addresses:
+                plan.append((target, address, "reachable"))
+            for address in self.addresses(node.get("dataNetwork")):
+                plan.append((target, address, "reachable"))
+            if management_addresses:
+                plan.append((target, management_addresses[0], "api"))
+        for service in self._config.get("clusterConfig", {}).get("externalServices") or []:
+            target = f"externalServices/{service.get('target', 'UNKNOWN')}"
+            for address in service.get("pool") or []:
+                plan.append((target, str(address), "reachable"))
+        return plan
+
+    def check_reachable(self, address: str) -> tuple[bool, str]:
+        """
+        Return (ok, detail) for a TCP connection attempt to address:port.
+        """
+        try:
+            with socket.create_connection((address, self._port), timeout=self._timeout):
+                return True, f"port {self._port} open"
+        except ConnectionRefusedError:
+            return True, f"host answered, port {self._port} refused"
+        except socket.timeout:
+            return False, f"no answer within {self._timeout:g} seconds"
+        except OSError as e:
+            if e.errno in (errno.EHOSTUNREACH, errno.ENETUNREACH):
+                return False, "unreachable"
+            return False, str(e)
+
+    def check_api(self, address: str) -> tuple[bool, str]:
+        """
+        Return (ok, detail) for GET /clusterstatus/install on the node at address.
+        """
+        session = self.context.session
+        if session is None:
+            return False, "not logged in"
+        host = f"[{address}]" if ":" in address else address
+        try:
+            response = session.get(f"https://{host}{self._path}", timeout=self._timeout)
+        except requests.RequestException as e:
+            return False, f"request failed: {type(e).__name__}"
+        if response.status_code != 200:
+            return False, f"status code {response.status_code}"
+        try:
+            data = response.json()
+        except ValueError:
+            return False, "response is not JSON"
+        overall_progress = data.get("overallProgress")
+        state = data.get("state", "Unknown")
+        if overall_progress != 100 or "fail" in str(state).lower():
+            return False, f"state {state}, overallProgress {overall_progress}"
+        return True, f"state {state}"
+
+    def run_check(self, target: str, address: str, check: str) -> NdHealthCheck:
+        """
+        Run one check and return its NdHealthCheck.
+        """
+        started = time.monotonic()
+        if check == "api":
+            ok, detail = self.check_api(address)
+        else:
+            ok, detail = self.check_reachable(address)
+        return NdHealthCheck(target=target, address=address, check=check, ok=ok, detail=detail, elapsed=time.monotonic() - started)
+
+    def commit(self) -> NdHealthResult:
+        """
+        Run every check concurrently and print the per-node matrix.
+
+        Raises if:
+            - instance.config is not set
+            - any check fails (NdHealthCheckError, whose result holds every check)
+
+        Returns:
+            NdHealthResult
+        """
+        method_name: str = inspect.stack()[0][3]
+        msg: str = ""
+
+        if not self._config.get("nodes"):
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "instance.config (with nodes) must be set before calling instance.commit."
+            raise NdParameterError(msg)
+
+        plan = self.plan()
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=max(1, min(self._max_workers, len(plan)))) as executor:
+            # map() preserves the plan order, so the matrix reads like the configuration.
+            checks = list(executor.map(lambda item: self.run_check(*item), plan))
+        result = NdHealthResult(checks=checks, elapsed=time.monotonic() - started)
+
+        msg = f"{self.class_name}.{method_name}: "
+        msg += f"Ran {len(checks)} health check(s) in {result.elapsed:.1f} seconds:"
+        for check in checks:
+            msg += f"\n  {check.target:<32} {check.address:<40} {check.check:<9} {'OK' if check.ok else 'FAILED':<6} {check.detail}"
+        print(msg)
+
+        failed = [check for check in checks if not check.ok]
+        if failed:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"{len(failed)} of {len(checks)} health check(s) failed: "
+            msg += ", ".join(f"{check.target} {check.address} {check.check}" for check in failed)
+            raise NdHealthCheckError(msg, result=result)
+        return result
+
+    @property
+    def config(self) -> dict:
+        """
+        getter: return the bootstrap configuration dictionary.
+        setter: set the bootstrap configuration dictionary.
+        """
+        return self._config
+
+    @config.setter
+    def config(self, value: dict) -> None:
+        if not isinstance(value, dict):
+            raise NdParameterError("Invalid config: not a dictionary.")
+        self._config = value
+
+    @property
+    def context(self) -> NdContext:
+        """
+        getter: return the NdContext for the target Nexus Dashboard. Built from the environment if not set.
+        setter: set the NdContext for the target Nexus Dashboard.
+        """
+        if self._context is None:
+            self._context = NdContext.from_environment()
+        return self._context
+
+    @context.setter
+    def context(self, value: NdContext) -> None:
+        if not isinstance(value, NdContext):
+            raise NdParameterError("Invalid context: not an NdContext instance.")
+        self._context = value
+
+    @property
+    def max_workers(self) -> int:
+        """
+        getter: return the maximum number of concurrent checks.
+        setter: set the maximum number of concurrent checks.
+        """
+        return self._max_workers
+
+    @max_workers.setter
+    def max_workers(self, value: int) -> None:
+        if not isinstance(value, int) or value < 1:
+            raise NdParameterError("Invalid max_workers: not a positive int.")
+        self._max_workers = value
+
+    @property
+    def port(self) -> int:
+        """
+        getter: return the TCP port used for reachability checks.
+        setter: set the TCP port used for reachability checks.
+        """
+        return self._port
+
+    @port.setter
+    def port(self, value: int) -> None:
+        if not isinstance(value, int) or not 0 < value < 65536:
+            raise NdParameterError("Invalid port: not an int between 1 and 65535.")
+        self._port = value
+
+    @property
+    def timeout(self) -> float:
+        """
+        getter: return the number of seconds each check may take.
+        setter: set the number of seconds each check may take.
+        """
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, value: float) -> None:
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+            raise NdParameterError("Invalid timeout: not a positive number.")
+        self._timeout = float(value)
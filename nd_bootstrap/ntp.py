@@ -4,12 +4,12 @@ Nexus Dashboard NTP Server Validation
 Validates NTP server reachability and compatibility.
 """
 
-import inspect
-from sys import exit as sys_exit
-
 import requests
 
-from nd_bootstrap.environment import NdEnvironment
+from nd_bootstrap.context import NdContext
+from nd_bootstrap.exceptions import NdConfigError, NdConnectionError, NdParameterError, NdValidationError
+from nd_bootstrap.results import NdValidationResult
+from nd_bootstrap.validation_cache import NdValidationCache
 
 
 class NdNtpServersValidate:
@@ -23,8 +23,12 @@ class NdNtpServersValidate:
 
     ## Properties
 
+    - cache: (getter/setter) Optional NdValidationCache. If set, a cached successful result for the same
+      ND address, firmware version, and payload is returned without contacting ND. Default is None.
     - config: (getter/setter) The configuration dictionary containing clusterConfig.ntpConfig.servers
-    - session: (getter/setter) The requests.Session object instance with authentication cookies set
+    - context: (getter/setter) The NdContext for the target. Built from the environment if not set.
+    - firmware_version: (getter/setter) The ND firmware version, used in the cache key. Default is "".
+    - session: (getter/setter) context.session, the requests.Session object instance with authentication cookies set
 
     ## Usage
 
@@ -32,51 +36,50 @@ class NdNtpServersValidate:
     instance = NdNtpServersValidate()
     instance.session = configured_requests_session_instance
     instance.config = your_nd_bootstrap_configuration_dict
-    instance.commit()  # Validates the NTP servers, exits on failure
+    instance.commit()  # Validates the NTP servers, raises NdValidationError on failure
     ```
     """
 
     def __init__(self) -> None:
         self.class_name: str = self.__class__.__name__
+        self._context: NdContext | None = None
+        self._cache: NdValidationCache | None = None
         self._config: dict = {}
-        self._session: requests.Session
-        self.nd_environment = NdEnvironment()
+        self._firmware_version: str = ""
 
-    def commit(self) -> None:
+    def commit(self) -> NdValidationResult:
         """
         Validate the NTP servers in the configuration.
 
-        Exits if:
+        Raises if:
             - instance.session is not set
             - instance.config is not set
             - instance.config contains no NTP servers
+            - the POST fails with a connection error (NdConnectionError)
             - validation fails for one or more NTP servers
 
         Returns:
-            None
+            NdValidationResult
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = "commit"
         msg: str = ""
 
-        if not self._session:
+        session = self.context.session
+        if session is None:
             msg = f"{self.class_name}.{method_name}: "
-            msg += "instance.session must be set before calling instance.commit, exiting."
-            print(msg)
-            sys_exit(1)
+            msg += "instance.session must be set before calling instance.commit."
+            raise NdParameterError(msg)
         if not self._config:
             msg = f"{self.class_name}.{method_name}: "
-            msg += "instance.config must be set before calling instance.commit, exiting."
-            print(msg)
-            sys_exit(1)
+            msg += "instance.config must be set before calling instance.commit."
+            raise NdParameterError(msg)
 
         ntp_servers = self._config.get("clusterConfig", {}).get("ntpConfig", {}).get("servers", [])
         if not ntp_servers:
             msg = f"{self.class_name}.{method_name}: "
-            msg += "At least one NTP server must be specified in the configuration. Exiting."
-            print(msg)
-            sys_exit(1)
+            msg += "At least one NTP server must be specified in the configuration."
+            raise NdConfigError(msg)
 
-        url = f"https://{self.nd_environment.nd_ip}/v2/bootstrap/verifyntp"
         payload = {
             "nameServers": [server["host"] for server in ntp_servers],
             "ntpConfig": {
@@ -84,17 +87,64 @@ class NdNtpServersValidate:
                 "keys": [],
             },
         }
-        response = self._session.post(
-            url,
-            json=payload,
-            timeout=60,
-        )
+        cache_key: str = ""
+        if self._cache is not None:
+            cache_key = self._cache.key("ntp", self.context.nd_ip, self._firmware_version, payload)
+            cached_result = self._cache.get(cache_key)
+            if cached_result is not None:
+                self.context.emit("validation", validator="ntp", ok=True, cached=True)
+                return cached_result
+
+        response = self.post(session, payload)
+        result = self.invalid_servers(response)
+        if not result:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "NTP servers validation succeeded."
+            print(msg)
+            self.context.emit("validation", validator="ntp", ok=True, cached=False)
+            return self.cache_result(cache_key, NdValidationResult(validator="ntp", ntp_servers=[server["host"] for server in ntp_servers]))
+        msg = f"{self.class_name}.{method_name}: "
+        msg += "NTP servers validation failed. "
+        msg += f"Status Code: {response.status_code}. "
+        msg += f"Response: {response.text}.\n"
+        msg += f"Invalid NTP servers: {result}"
+        self.context.emit("validation", validator="ntp", ok=False, cached=False, detail=f"invalid NTP servers: {sorted(name for name, _, _ in result)}")
+        raise NdValidationError(msg)
+
+    def post(self, session: requests.Session, payload: dict) -> requests.Response:
+        """
+        POST payload to /v2/bootstrap/verifyntp and return the response.
+
+        Raises if:
+            - the POST fails with a connection error (NdConnectionError)
+            - the status code is not 200 (NdValidationError)
+        """
+        method_name: str = "post"
+        msg: str = ""
+
+        url = f"https://{self.context.nd_host}/v2/bootstrap/verifyntp"
+        try:
+            response = session.post(
+                url,
+                json=payload,
+                timeout=60,
+            )
+        except requests.RequestException as e:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Error validating NTP servers: {str(e)}"
+            raise NdConnectionError(msg) from e
         if response.status_code not in [200]:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"NTP servers validation failed with status code {response.status_code}, response.text: {response.text}"
-            print(msg)
-            sys_exit(1)
+            self.context.emit("validation", validator="ntp", ok=False, cached=False, detail=f"status code {response.status_code}")
+            raise NdValidationError(msg)
+        return response
 
+    @staticmethod
+    def invalid_servers(response: requests.Response) -> set[tuple[str, str, str]]:
+        """
+        Return the (name, error, info) of each NTP server that the verifyntp response does not report as valid.
+        """
         result = set()
         for server in response.json():
             #  ND <= 4.2.x  -> [{"name":"192.168.7.6","error":"","info":"valid"}]
@@ -106,33 +156,57 @@ class NdNtpServersValidate:
             info = server.get("info", "")
             if error != "NONE" or info.lower() != "valid":
                 result.add((name, error, info))
-        if not result:
-            msg = f"{self.class_name}.{method_name}: "
-            msg += "NTP servers validation succeeded."
-            print(msg)
-            return
-        msg = f"{self.class_name}.{method_name}: "
-        msg += "NTP servers validation failed. "
-        msg += f"Status Code: {response.status_code}. "
-        msg += f"Response: {response.text}.\n"
-        msg += f"Invalid NTP servers: {result}"
-        print(msg)
-        sys_exit(1)
+        return result
+
+    def cache_result(self, cache_key: str, validation_result: NdValidationResult) -> NdValidationResult:
+        """
+        Store a successful validation_result in the cache (if set) and return it.
+        """
+        if self._cache is not None:
+            self._cache.put(cache_key, validation_result)
+        return validation_result
 
     @property
-    def session(self) -> requests.Session:
+    def cache(self) -> NdValidationCache | None:
         """
-        getter: return the authentication cookie dictionary.
-        setter: set and validate the authentication cookie dictionary.
+        getter: return the NdValidationCache, or None if caching is disabled.
+        setter: set the NdValidationCache.
         """
-        return self._session
+        return self._cache
+
+    @cache.setter
+    def cache(self, value: NdValidationCache) -> None:
+        if not isinstance(value, NdValidationCache):
+            raise NdParameterError("Invalid cache: not an NdValidationCache instance.")
+        self._cache = value
+
+    @property
+    def context(self) -> NdContext:
+        """
+        getter: return the NdContext for the target Nexus Dashboard. Built from the environment if not set.
+        setter: set the NdContext for the target Nexus Dashboard.
+        """
+        if self._context is None:
+            self._context = NdContext.from_environment()
+        return self._context
+
+    @context.setter
+    def context(self, value: NdContext) -> None:
+        if not isinstance(value, NdContext):
+            raise NdParameterError("Invalid context: not an NdContext instance.")
+        self._context = value
+
+    @property
+    def session(self) -> requests.Session | None:
+        """
+        getter: return context.session, the requests.Session instance with authentication cookies set.
+        setter: set context.session.
+        """
+        return self.context.session
 
     @session.setter
     def session(self, value: requests.Session) -> None:
-        if not isinstance(value, requests.Session):
-            print("Invalid session: not a requests.Session instance, exiting.")
-            sys_exit(1)
-        self._session = value
+        self.context.session = value
 
     @property
     def config(self) -> dict:
@@ -145,6 +219,19 @@ class NdNtpServersValidate:
     @config.setter
     def config(self, value: dict) -> None:
         if not isinstance(value, dict):
-            print("Invalid config: not a dictionary, exiting.")
-            sys_exit(1)
+            raise NdParameterError("Invalid config: not a dictionary.")
         self._config = value
+
+    @property
+    def firmware_version(self) -> str:
+        """
+        getter: return the ND firmware version used in the cache key.
+        setter: set the ND firmware version used in the cache key.
+        """
+        return self._firmware_version
+
+    @firmware_version.setter
+    def firmware_version(self, value: str) -> None:
+        if not isinstance(value, str):
+            raise NdParameterError("Invalid firmware_version: not a string.")
+        self._firmware_version = value
@@ -6,13 +6,13 @@ Polls cluster bootstrap installation status.
 
 import inspect
 import re
-from sys import exit as sys_exit
-from time import sleep
 
 import requests
 
-from nd_bootstrap.environment import NdEnvironment
+from nd_bootstrap.context import NdContext
+from nd_bootstrap.exceptions import NdBootstrapFailedError, NdConnectionError, NdParameterError
 from nd_bootstrap.login import NdLogin
+from nd_bootstrap.results import NdPollResult
 
 
 class NdPollBootstrapStatus:
@@ -31,7 +31,8 @@ class NdPollBootstrapStatus:
 
     ## Properties
 
-    - session: (getter/setter) The requests.Session object instance with authentication cookies set
+    - context: (getter/setter) The NdContext for the target. Built from the environment if not set.
+    - session: (getter/setter) context.session, the requests.Session object instance with authentication cookies set
     - retries: (getter/setter) The number of retries for polling the install status. Default is 10.
     - interval: The interval in seconds between polling attempts. Default is 10 seconds.
 
@@ -59,41 +60,60 @@ class NdPollBootstrapStatus:
 
     def __init__(self) -> None:
         self.class_name: str = self.__class__.__name__
+        self._context: NdContext | None = None
         self._interval: int = 10
         self._retries: int = 10
         self._last_overall_progress: int = 0
         self._last_overall_status: str = "Unknown"
         self._last_state: str = "Unknown"
-        self._session: requests.Session
-        self.nd_environment = NdEnvironment()
-        self._url: str = f"https://{self.nd_environment.nd_ip}/clusterstatus/bootstrap"
+        self._path: str = "/clusterstatus/bootstrap"
+
+    def record_status(self, overall_progress: int, overall_status: str, state: str) -> None:
+        """
+        Store the status of one poll, and share it with the trace span, cluster_state and (if it changed) event sinks.
+        """
+        if (overall_progress, overall_status, state) != (self._last_overall_progress, self._last_overall_status, self._last_state):
+            self.context.emit("poll.progress", poll="bootstrap", progress=overall_progress, overall_status=overall_status, state=state)
+        self._last_overall_progress = overall_progress
+        self._last_overall_status = overall_status
+        self._last_state = state
+        # Recorded on the poll span opened by commit().
+        self.context.tracer.set_attribute("nd.progress", overall_progress)
+        self.context.tracer.set_attribute("nd.overall_status", overall_status)
+        self.context.tracer.set_attribute("nd.state", state)
+        self.context.cluster_state.update(progress=overall_progress, overall_status=overall_status, state=state)
 
     def poll_once(self) -> int:
         """
         Poll the install status once.
 
-        Exits if:
+        Raises if:
             - instance.session is not set
-            - instance.state indicates failure
+            - instance.state indicates failure (NdBootstrapFailedError)
         Returns:
             overall_progress: int: The overall progress percentage.
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = "poll_once"
         msg: str = ""
 
-        if not self._session:
+        session = self.context.session
+        if session is None:
             msg = f"{self.class_name}.{method_name}: "
-            msg += "instance.session must be set before calling instance.poll_once, exiting."
-            print(msg)
-            sys_exit(1)
+            msg += "instance.session must be set before calling instance.poll_once."
+            raise NdParameterError(msg)
 
+        # Re-authentications since this point (e.g. by another worker for the same target) make a 401 stale.
+        seen = self.context.auth.generation(self.context)
         try:
-            response = self._session.get(self._url)
-        except requests.RequestException:
+            response = session.get(self.url, timeout=30)
+        except requests.RequestException as e:
+            self.context.cluster_state.update(last_error=f"{type(e).__name__} polling bootstrap status")
             # Handle network/connection errors
             msg = f"{self.class_name}.{method_name}: "
             msg += "Ignoring recoverable and temporary network error. You may see this message multiple times."
             print(msg)
+            # With ND_IP_PROTOCOL=DUAL, switch address family if the current one went down.
+            self.context.failover()
             return self._last_overall_progress
 
         if response.status_code == 404:
@@ -101,9 +121,16 @@ class NdPollBootstrapStatus:
             return self._last_overall_progress
 
         if response.status_code == 401:
+            self.context.tracer.set_attribute("nd.relogin", True)
             nd_login = NdLogin()
-            nd_login.commit()
-            self._session = nd_login.session
+            nd_login.context = self.context
+            try:
+                nd_login.reauthenticate(seen)
+            except NdConnectionError as e:
+                # The 401 may come just before Nexus Dashboard goes unreachable; retry the login on the next poll.
+                self.context.cluster_state.update(last_error=f"{type(e).__name__} re-authenticating during bootstrap polling")
+                self.context.failover()
+                return self._last_overall_progress
             msg = f"{self.class_name}.{method_name}: "
             msg += "Re-authenticated during bootstrap polling."
             print(msg)
@@ -113,6 +140,7 @@ class NdPollBootstrapStatus:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Failed to get install status. status code: {response.status_code}, response.text: {response.text}. "
             print(msg)
+            self.context.cluster_state.update(last_error=f"status code {response.status_code} polling bootstrap status")
             return self._last_overall_progress
 
         overall_progress: int = response.json().get("overallProgress", self._last_overall_progress)
@@ -122,76 +150,116 @@ class NdPollBootstrapStatus:
         msg += f"Bootstrap status: retries: {self._retries}, state: {state}, overall_progress: {overall_progress}, overall_status: {overall_status}"
         print(msg)
 
-        self._last_overall_progress = overall_progress
-        self._last_overall_status = overall_status
-        self._last_state = state
-        # Exit if bootstrap failed
+        self.record_status(overall_progress, overall_status, state)
+        # Raise if bootstrap failed
         if re.search(r"fail", state, re.IGNORECASE):
             msg = f"{self.class_name}.{method_name}: "
-            msg += "Bootstrap encountered an error, exiting. "
+            msg += "Bootstrap encountered an error. "
             msg += f"overallProgress: {self._last_overall_progress}, "
             msg += f"overallStatus: {self._last_overall_status}, "
             msg += f"state: {self._last_state}"
-            print(msg)
-            sys_exit(1)
-        # While self._last_overall_progress will be 100% for failures, we exit above on failure.
+            raise NdBootstrapFailedError(
+                msg,
+                phase="bootstrap",
+                overall_progress=self._last_overall_progress,
+                overall_status=self._last_overall_status,
+                state=self._last_state,
+            )
+        # While self._last_overall_progress will be 100% for failures, we raise above on failure.
         # Hence, self._last_overall_progress will reflect actual progress toward success.
         return self._last_overall_progress
 
-    def commit(self) -> None:
+    def commit(self) -> NdPollResult:
         """
         Poll the bootstrap status until overallProgress == 100.
 
-        Exits if:
+        Raises if:
             - instance.session is not set
+            - instance.state indicates failure (NdBootstrapFailedError)
 
         Returns:
-            None
+            NdPollResult: completed is False if retries were exhausted before overallProgress reached 100.
         """
         method_name: str = inspect.stack()[0][3]
         msg: str = ""
 
-        if not self._session:
+        session = self.context.session
+        if session is None:
             msg = f"{self.class_name}.{method_name}: "
-            msg += "instance.session must be set before calling instance.commit, exiting."
-            print(msg)
-            sys_exit(1)
+            msg += "instance.session must be set before calling instance.commit."
+            raise NdParameterError(msg)
 
         msg = f"{self.class_name}.{method_name}: "
         msg += "Polling bootstrap status until complete. "
         msg += f"Max retries: {self._retries}, interval: {self._interval} seconds."
         print(msg)
 
+        polls: int = 0
         while True:
             self._retries -= 1
             if self._retries <= 0:
                 msg = f"{self.class_name}.{method_name}: "
                 msg += "Exceeded maximum retries. Returning."
                 print(msg)
-                return
+                return self.result(completed=False, polls=polls)
 
-            overall_progress = self.poll_once()
+            with self.context.tracer.span("poll_bootstrap_status", {"nd.poll": polls + 1, "nd.retries_left": self._retries}):
+                overall_progress = self.poll_once()
+            polls += 1
 
             if overall_progress == 100:
                 print(f"{self.class_name}.{method_name}: Bootstrap complete.")
-                return
+                return self.result(completed=True, polls=polls)
 
-            sleep(self._interval)
+            self.context.clock.sleep(self._interval)
+
+    def result(self, completed: bool, polls: int) -> NdPollResult:
+        """
+        Return an NdPollResult describing the last status seen.
+        """
+        return NdPollResult(
+            phase="bootstrap",
+            completed=completed,
+            overall_progress=self._last_overall_progress,
+            overall_status=self._last_overall_status,
+            state=self._last_state,
+            polls=polls,
+        )
+
+    @property
+    def context(self) -> NdContext:
+        """
+        getter: return the NdContext for the target Nexus Dashboard. Built from the environment if not set.
+        setter: set the NdContext for the target Nexus Dashboard.
+        """
+        if self._context is None:
+            self._context = NdContext.from_environment()
+        return self._context
+
+    @context.setter
+    def context(self, value: NdContext) -> None:
+        if not isinstance(value, NdContext):
+            raise NdParameterError("Invalid context: not an NdContext instance.")
+        self._context = value
 
     @property
-    def session(self) -> requests.Session:
+    def session(self) -> requests.Session | None:
         """
-        getter: return the authentication cookie dictionary.
-        setter: set and validate the authentication cookie dictionary.
+        getter: return context.session, the requests.Session instance with authentication cookies set.
+        setter: set context.session.
         """
-        return self._session
+        return self.context.session
 
     @session.setter
     def session(self, value: requests.Session) -> None:
-        if not isinstance(value, requests.Session):
-            print("Invalid session: not a requests.Session instance, exiting.")
-            sys_exit(1)
-        self._session = value
+        self.context.session = value
+
+    @property
+    def url(self) -> str:
+        """
+        getter: return the status URL, built from the Nexus Dashboard address currently in use.
+        """
+        return f"https://{self.context.nd_host}{self._path}"
 
     @property
     def retries(self) -> int:
@@ -204,8 +272,7 @@ class NdPollBootstrapStatus:
     @retries.setter
     def retries(self, value: int) -> None:
         if not isinstance(value, int):
-            print("Invalid retries: not an int, exiting.")
-            sys_exit(1)
+            raise NdParameterError("Invalid retries: not an int.")
         self._retries = value
 
     @property
@@ -219,6 +286,5 @@ class NdPollBootstrapStatus:
     @interval.setter
     def interval(self, value: int) -> None:
         if not isinstance(value, int):
-            print("Invalid interval: not an int, exiting.")
-            sys_exit(1)
+            raise NdParameterError("Invalid interval: not an int.")
         self._interval = value
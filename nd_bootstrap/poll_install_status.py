@@ -8,13 +8,13 @@ Polls cluster install status.
 
 import inspect
 import re
-from sys import exit as sys_exit
-from time import sleep
 
 import requests
 
-from nd_bootstrap.environment import NdEnvironment
+from nd_bootstrap.context import NdContext
+from nd_bootstrap.exceptions import NdAuthenticationError, NdBootstrapFailedError, NdDeadlineExceededError, NdParameterError
 from nd_bootstrap.login import NdLogin
+from nd_bootstrap.results import NdPollResult
 
 
 class NdPollInstallStatus:
@@ -33,7 +33,8 @@ class NdPollInstallStatus:
 
     ## Properties
 
-    - session: (getter/setter) The requests.Session object instance with authentication cookies set
+    - context: (getter/setter) The NdContext for the target. Built from the environment if not set.
+    - session: (getter/setter) context.session, the requests.Session object instance with authentication cookies set
     - retries: (getter/setter) The number of retries for polling the install status. Default is 10.
     - interval: The interval in seconds between polling attempts. Default is 10 seconds.
 
@@ -61,22 +62,23 @@ class NdPollInstallStatus:
 
     def __init__(self) -> None:
         self.class_name: str = self.__class__.__name__
+        self._context: NdContext | None = None
         self._interval: int = 10
         self._retries: int = 10
         self._login_attempt_retries: int = 10
         self._last_overall_progress: int = 0
         self._last_overall_status: str = "Unknown"
         self._last_state: str = "Unknown"
-        self._session: requests.Session | None = None
-        self.nd_environment = NdEnvironment()
-        self._url: str = f"https://{self.nd_environment.nd_ip}/clusterstatus/install"
+        self._path: str = "/clusterstatus/install"
 
-    def login_refresh(self) -> None:
+    def login_refresh(self, seen: int | None = None) -> None:
         """
-        Refresh the login session.
+        Refresh the login session, through context.auth: if another worker for the same target re-authenticates
+        since generation seen, or while this one is waiting, its login is used instead of sending another.
 
-        Exits if:
+        Raises if:
             - Unable to re-authenticate after self._login_attempt_retries attempts
+            - the deadline (context.deadline) expires (NdDeadlineExceededError)
         """
         method_name = inspect.stack()[0][3]
 
@@ -84,64 +86,91 @@ class NdPollInstallStatus:
         msg += "Refreshing login. You may see this message multiple times during install polling."
         print(msg)
 
+        if seen is None:
+            seen = self.context.auth.generation(self.context)
         nd_login = NdLogin()
+        nd_login.context = self.context
         login_counter = 0
         msg = f"{self.class_name}.{method_name}: "
         msg += "Sleeping 10 seconds before attempting re-authentication."
         print(msg)
-        sleep(10)
+        self.context.clock.sleep(10)
         while nd_login.status is False and login_counter < self._login_attempt_retries:
             login_counter += 1
-            try:
-                nd_login.commit()
-            except Exception as error:
-                msg = f"{self.class_name}.{method_name}: "
-                if "refused" in str(error):
-                    msg += "Connection refused. Retrying login refresh."
-                else:
-                    msg += f"Retrying login refresh due to exception: {error}"
-                print(msg)
-            sleep(10)
+            with self.context.tracer.span("login_refresh", {"nd.login.attempt": login_counter}) as span:
+                try:
+                    nd_login.reauthenticate(seen)
+                except NdDeadlineExceededError:
+                    # Out of time: retrying cannot help.
+                    raise
+                except Exception as error:
+                    span.record_exception(error)
+                    msg = f"{self.class_name}.{method_name}: "
+                    if "refused" in str(error):
+                        msg += "Connection refused. Retrying login refresh."
+                    else:
+                        msg += f"Retrying login refresh due to exception: {error}"
+                    print(msg)
+                    self.context.failover()
+            self.context.clock.sleep(10)
         if nd_login.status is False:
             msg = f"{self.class_name}.{method_name}: "
-            msg += "Exceeded maximum login attempts during install polling, exiting."
-            print(msg)
-            sys_exit(1)
-        self._session = nd_login.session
+            msg += "Exceeded maximum login attempts during install polling."
+            raise NdAuthenticationError(msg)
         msg = f"{self.class_name}.{method_name}: "
         msg += "Re-authentication successful."
         print(msg)
 
+    def record_status(self, overall_progress: int, overall_status: str, state: str) -> None:
+        """
+        Store the status of one poll, and share it with the trace span, cluster_state and (if it changed) event sinks.
+        """
+        if (overall_progress, overall_status, state) != (self._last_overall_progress, self._last_overall_status, self._last_state):
+            self.context.emit("poll.progress", poll="install", progress=overall_progress, overall_status=overall_status, state=state)
+        self._last_overall_progress = overall_progress
+        self._last_overall_status = overall_status
+        self._last_state = state
+        # Recorded on the poll span opened by commit().
+        self.context.tracer.set_attribute("nd.progress", overall_progress)
+        self.context.tracer.set_attribute("nd.overall_status", overall_status)
+        self.context.tracer.set_attribute("nd.state", state)
+        self.context.cluster_state.update(progress=overall_progress, overall_status=overall_status, state=state)
+
     def poll_once(self) -> int:
         """
         Poll the install status once.
 
-        Exits if:
+        Raises if:
             - instance.session is not set
         Returns:
             overall_progress: int: The overall progress percentage.
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = "poll_once"
         msg: str = ""
 
-        if self._session is None:
+        session = self.context.session
+        if session is None:
             msg = f"{self.class_name}.{method_name}: "
-            msg += "instance.session must be set before calling instance.poll_once, exiting."
-            print(msg)
-            sys_exit(1)
+            msg += "instance.session must be set before calling instance.poll_once."
+            raise NdParameterError(msg)
 
+        seen = self.context.auth.generation(self.context)
         try:
-            response = self._session.get(self._url)
-        except requests.RequestException:
-            # Attempt to handle network/connection errors
-            self.login_refresh()
+            response = session.get(self.url, timeout=30)
+        except requests.RequestException as e:
+            self.context.cluster_state.update(last_error=f"{type(e).__name__} polling install status")
+            # Attempt to handle network/connection errors.
+            # With ND_IP_PROTOCOL=DUAL, switch address family if the current one went down.
+            self.context.failover()
+            self.login_refresh(seen)
             return self._last_overall_progress
 
         # print(f"{self.class_name}.{method_name}: response.status_code: {response.status_code}")
         # print(f"{self.class_name}.{method_name}: response.text: {response.text}")
 
         if response.status_code == 401:
-            self.login_refresh()
+            self.context.tracer.set_attribute("nd.relogin", True)
+            self.login_refresh(seen)
             return self._last_overall_progress
 
         if response.status_code == 404:
@@ -153,6 +182,7 @@ class NdPollInstallStatus:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Failed to get install status. status code: {response.status_code}, response.text: {response.text}. "
             print(msg)
+            self.context.cluster_state.update(last_error=f"status code {response.status_code} polling install status")
             return self._last_overall_progress
 
         overall_progress: int = response.json().get("overallProgress", self._last_overall_progress)
@@ -162,76 +192,116 @@ class NdPollInstallStatus:
         msg += f"Install status: retries {self._retries}, state: {state}, overall_progress: {overall_progress}, overall_status: {overall_status}"
         print(msg)
 
-        self._last_overall_progress = overall_progress
-        self._last_overall_status = overall_status
-        self._last_state = state
-        # Exit if install failed
+        self.record_status(overall_progress, overall_status, state)
+        # Raise if install failed
         if re.search(r"fail", state, re.IGNORECASE):
             msg = f"{self.class_name}.{method_name}: "
-            msg += "Install encountered an error, exiting. "
+            msg += "Install encountered an error. "
             msg += f"overallProgress: {self._last_overall_progress}, "
             msg += f"overallStatus: {self._last_overall_status}, "
             msg += f"state: {self._last_state}"
-            print(msg)
-            sys_exit(1)
-        # While self._last_overall_progress will be 100% for failures, we exit above on failure.
+            raise NdBootstrapFailedError(
+                msg,
+                phase="install",
+                overall_progress=self._last_overall_progress,
+                overall_status=self._last_overall_status,
+                state=self._last_state,
+            )
+        # While self._last_overall_progress will be 100% for failures, we raise above on failure.
         # Hence, self._last_overall_progress will reflect actual progress toward success
         return self._last_overall_progress
 
-    def commit(self) -> None:
+    def commit(self) -> NdPollResult:
         """
         Poll the install status until overallProgress == 100 and overallStatus indicates success.
 
-        Exits if:
+        Raises if:
             - instance.session is not set
+            - instance.state indicates failure (NdBootstrapFailedError)
 
         Returns:
-            None
+            NdPollResult: completed is False if retries were exhausted before overallProgress reached 100.
         """
         method_name: str = inspect.stack()[0][3]
         msg: str = ""
 
-        if self._session is None:
+        session = self.context.session
+        if session is None:
             msg = f"{self.class_name}.{method_name}: "
-            msg += "instance.session must be set before calling instance.commit, exiting."
-            print(msg)
-            sys_exit(1)
+            msg += "instance.session must be set before calling instance.commit."
+            raise NdParameterError(msg)
 
         msg = f"{self.class_name}.{method_name}: "
         msg += "Polling install status until complete. "
         msg += f"Max retries: {self._retries}, interval: {self._interval} seconds."
         print(msg)
 
+        polls: int = 0
         while True:
             self._retries -= 1
             if self._retries <= 0:
                 msg = f"{self.class_name}.{method_name}: "
                 msg += "Exceeded maximum retries. Returning."
                 print(msg)
-                return
+                return self.result(completed=False, polls=polls)
 
-            overall_progress = self.poll_once()
+            with self.context.tracer.span("poll_install_status", {"nd.poll": polls + 1, "nd.retries_left": self._retries}):
+                overall_progress = self.poll_once()
+            polls += 1
 
             if overall_progress == 100:
                 print(f"{self.class_name}.{method_name}: Install complete.")
-                return
+                return self.result(completed=True, polls=polls)
+
+            self.context.clock.sleep(self._interval)
+
+    def result(self, completed: bool, polls: int) -> NdPollResult:
+        """
+        Return an NdPollResult describing the last status seen.
+        """
+        return NdPollResult(
+            phase="install",
+            completed=completed,
+            overall_progress=self._last_overall_progress,
+            overall_status=self._last_overall_status,
+            state=self._last_state,
+            polls=polls,
+        )
+
+    @property
+    def context(self) -> NdContext:
+        """
+        getter: return the NdContext for the target Nexus Dashboard. Built from the environment if not set.
+        setter: set the NdContext for the target Nexus Dashboard.
+        """
+        if self._context is None:
+            self._context = NdContext.from_environment()
+        return self._context
 
-            sleep(self._interval)
+    @context.setter
+    def context(self, value: NdContext) -> None:
+        if not isinstance(value, NdContext):
+            raise NdParameterError("Invalid context: not an NdContext instance.")
+        self._context = value
 
     @property
     def session(self) -> requests.Session | None:
         """
-        getter: return the authentication cookie dictionary.
-        setter: set and validate the authentication cookie dictionary.
+        getter: return context.session, the requests.Session instance with authentication cookies set.
+        setter: set context.session.
         """
-        return self._session
+        return self.context.session
 
     @session.setter
     def session(self, value: requests.Session) -> None:
-        if not isinstance(value, requests.Session):
-            print("Invalid session: not a requests.Session instance, exiting.")
-            sys_exit(1)
-        self._session = value
+        self.context.session = value
+
+    @property
+    def url(self) -> str:
+        """
+        getter: return the status URL, built from the Nexus Dashboard address currently in use.
+        """
+        return f"https://{self.context.nd_host}{self._path}"
 
     @property
     def retries(self) -> int:
@@ -244,8 +314,7 @@ class NdPollInstallStatus:
     @retries.setter
     def retries(self, value: int) -> None:
         if not isinstance(value, int):
-            print("Invalid retries: not an int, exiting.")
-            sys_exit(1)
+            raise NdParameterError("Invalid retries: not an int.")
         self._retries = value
 
     @property
@@ -259,6 +328,5 @@ class NdPollInstallStatus:
     @interval.setter
     def interval(self, value: int) -> None:
         if not isinstance(value, int):
-            print("Invalid interval: not an int, exiting.")
-            sys_exit(1)
+            raise NdParameterError("Invalid interval: not an int.")
         self._interval = value
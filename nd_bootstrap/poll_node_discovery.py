@@ -0,0 +1,311 @@
+"""
+Nexus Dashboard Node Discovery Polling
+
+Polls the cluster endpoint until every configured node has registered with a serial number.
+"""
+
+import inspect
+
+import requests
+
+from nd_bootstrap.context import NdContext
+from nd_bootstrap.exceptions import NdDeadlineExceededError, NdNodeDiscoveryError, NdParameterError
+from nd_bootstrap.inventory import NdClusterInventory
+from nd_bootstrap.login import NdLogin
+from nd_bootstrap.results import NdDiscoveryResult
+
+
+class NdPollNodeDiscovery:
+    """
+    # Summary
+
+    Poll Nexus Dashboard until every node in `config` has registered with a serial number.
+
+    Nodes that are still booting (vnodes, physical nodes) are missing from the /v2/bootstrap/cluster
+    response, or are present without a serialNumber.  This class re-polls with exponential backoff
+    (initial_interval, doubling up to max_interval), prints the nodes that are still missing, and
+    returns as soon as the last node appears.
+
+    Nodes are matched with NdClusterInventory (management IP, then data IP, then hostname).
+
+    ## Endpoint
+
+    Path: /v2/bootstrap/cluster
+    Verb: GET
+
+    ## Properties
+
+    - cluster_data: (getter) The last /v2/bootstrap/cluster response body.
+    - config: (getter/setter) The bootstrap configuration dictionary.
+    - context: (getter/setter) The NdContext for the target. Built from the environment if not set.
+    - initial_interval: (getter/setter) Seconds to wait after the first unsuccessful poll. Default is 2.
+    - inventory: (getter/setter) The NdClusterInventory to index the nodes into. Default is a new instance.
+    - max_interval: (getter/setter) Upper bound for the backoff interval, in seconds. Default is 30.
+    - timeout: (getter/setter) Seconds to wait for all nodes before giving up. Default is 1800.
+
+    ## Usage
+
+    ```python
+    instance = NdPollNodeDiscovery()
+    instance.context = context
+    instance.config = nd_bootstrap_config.config
+    instance.commit()  # raises NdNodeDiscoveryError if nodes are still missing after timeout seconds
+    ```
+    """
+
+    def __init__(self) -> None:
+        self.class_name: str = self.__class__.__name__
+        self._cluster_data: dict = {}
+        self._config: dict = {}
+        self._context: NdContext | None = None
+        self._initial_interval: int = 2
+        self._inventory: NdClusterInventory = NdClusterInventory()
+        self._max_interval: int = 30
+        self._path: str = "/v2/bootstrap/cluster"
+        self._timeout: int = 1800
+
+    @staticmethod
+    def node_label(node: dict) -> str:
+        """
+        Return a human-readable label for a configured node.
+        """
+        mgmt_ip_subnet = (node.get("managementNetwork") or {}).get("ipSubnet", "")
+        hostname = node.get("hostName", "")
+        if hostname and mgmt_ip_subnet:
+            return f"{hostname} ({mgmt_ip_subnet})"
+        return hostname or mgmt_ip_subnet or "UNKNOWN"
+
+    def missing_nodes(self) -> list[str]:
+        """
+        Return the labels of the configured nodes that the inventory cannot match to a node with a serialNumber.
+        """
+        missing: list[str] = []
+        for node in self._config.get("nodes", []):
+            matched_node = self._inventory.match(node)
+            if not matched_node or not matched_node.get("serialNumber"):
+                missing.append(self.node_label(node))
+        return missing
+
+    def poll_once(self) -> list[str]:
+        """
+        GET the cluster endpoint once, re-index the inventory, and return the labels of the nodes that are still missing.
+
+        Network errors, 404, and other non-200 responses are treated as "all nodes missing" so that polling continues.
+        A 401 triggers a re-login.
+
+        Raises if:
+            - instance.session is not set
+        """
+        method_name: str = "poll_once"
+        msg: str = ""
+
+        session = self.context.session
+        if session is None:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "instance.session must be set before calling instance.poll_once."
+            raise NdParameterError(msg)
+
+        seen = self.context.auth.generation(self.context)
+        try:
+            response = session.get(self.url, timeout=10)
+        except requests.RequestException as e:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Ignoring network error while waiting for nodes: {str(e)}"
+            print(msg)
+            self.context.cluster_state.update(last_error=f"{type(e).__name__} polling node discovery")
+            # With ND_IP_PROTOCOL=DUAL, switch address family if the current one went down.
+            self.context.failover()
+            return self.missing_nodes()
+
+        if response.status_code == 401:
+            self.context.tracer.set_attribute("nd.relogin", True)
+            nd_login = NdLogin()
+            nd_login.context = self.context
+            try:
+                nd_login.reauthenticate(seen)
+            except NdDeadlineExceededError:
+                # Out of time: retrying cannot help.
+                raise
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                # The 401 may come just before Nexus Dashboard goes unreachable; retry the login on the next poll.
+                self.context.tracer.current_span().record_exception(error)
+                msg = f"{self.class_name}.{method_name}: "
+                msg += f"Re-authentication failed during node discovery polling, retrying on the next poll: {error}"
+                print(msg)
+                self.context.cluster_state.update(last_error=f"{type(error).__name__} re-authenticating during node discovery polling")
+                self.context.failover()
+                return self.missing_nodes()
+            msg = f"{self.class_name}.{method_name}: "
+            if nd_login.status:
+                msg += "Re-authenticated during node discovery polling."
+            else:
+                msg += "Re-authentication rejected during node discovery polling, retrying on the next poll."
+                self.context.cluster_state.update(last_error="login rejected re-authenticating during node discovery polling")
+            print(msg)
+            return self.missing_nodes()
+
+        if response.status_code not in (200, 201):
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Unexpected status code {response.status_code} while waiting for nodes, response.text: {response.text}"
+            print(msg)
+            self.context.cluster_state.update(last_error=f"status code {response.status_code} polling node discovery")
+            return self.missing_nodes()
+
+        self._cluster_data = response.json()
+        nodes_info = self._cluster_data.get("nodes") or []
+        self._inventory.nodes = [node for node in nodes_info if isinstance(node, dict)]
+        return self.missing_nodes()
+
+    def commit(self) -> NdDiscoveryResult:
+        """
+        Poll until every configured node has registered with a serial number.
+
+        Raises if:
+            - instance.config is not set
+            - instance.session is not set
+            - nodes are still missing after instance.timeout seconds (NdNodeDiscoveryError)
+
+        Returns:
+            NdDiscoveryResult
+        """
+        method_name: str = inspect.stack()[0][3]
+        msg: str = ""
+
+        if not self._config.get("nodes"):
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "instance.config (with nodes) must be set before calling instance.commit."
+            raise NdParameterError(msg)
+
+        start = self.context.clock.monotonic()
+        deadline = start + self._timeout
+        interval = self._initial_interval
+        polls: int = 0
+        previous_missing: list[str] = []
+        while True:
+            with self.context.tracer.span("poll_node_discovery", {"nd.poll": polls + 1}) as span:
+                missing = self.poll_once()
+                span.set_attribute("nd.nodes.missing", len(missing))
+            total = len(self._config["nodes"])
+            self.context.cluster_state.update(progress=(total - len(missing)) * 100 // total, state=f"{total - len(missing)}/{total} nodes")
+            polls += 1
+            elapsed = self.context.clock.monotonic() - start
+            if not missing:
+                msg = f"{self.class_name}.{method_name}: "
+                msg += f"All {len(self._config['nodes'])} node(s) discovered after {elapsed:.1f} seconds ({polls} poll(s))."
+                print(msg)
+                return NdDiscoveryResult(completed=True, polls=polls, elapsed=elapsed)
+
+            remaining = deadline - self.context.clock.monotonic()
+            if remaining <= 0:
+                msg = f"{self.class_name}.{method_name}: "
+                msg += f"Timed out after {elapsed:.1f} seconds waiting for node(s) to register with Nexus Dashboard: "
+                msg += f"{', '.join(missing)}."
+                raise NdNodeDiscoveryError(msg)
+
+            if missing != previous_missing:
+                msg = f"{self.class_name}.{method_name}: "
+                msg += f"Waiting for {len(missing)} of {len(self._config['nodes'])} node(s): {', '.join(missing)}."
+                print(msg)
+                previous_missing = missing
+            self.context.clock.sleep(min(interval, remaining))
+            interval = min(interval * 2, self._max_interval)
+
+    @property
+    def cluster_data(self) -> dict:
+        """
+        getter: return the last /v2/bootstrap/cluster response body.
+        """
+        return self._cluster_data
+
+    @property
+    def config(self) -> dict:
+        """
+        getter: return the bootstrap configuration dictionary.
+        setter: set the bootstrap configuration dictionary.
+        """
+        return self._config
+
+    @config.setter
+    def config(self, value: dict) -> None:
+        if not isinstance(value, dict):
+            raise NdParameterError("Invalid config: not a dictionary.")
+        self._config = value
+
+    @property
+    def context(self) -> NdContext:
+        """
+        getter: return the NdContext for the target Nexus Dashboard. Built from the environment if not set.
+        setter: set the NdContext for the target Nexus Dashboard.
+        """
+        if self._context is None:
+            self._context = NdContext.from_environment()
+        return self._context
+
+    @context.setter
+    def context(self, value: NdContext) -> None:
+        if not isinstance(value, NdContext):
+            raise NdParameterError("Invalid context: not an NdContext instance.")
+        self._context = value
+
+    @property
+    def initial_interval(self) -> int:
+        """
+        getter: return the interval, in seconds, after the first unsuccessful poll.
+        setter: set the interval, in seconds, after the first unsuccessful poll.
+        """
+        return self._initial_interval
+
+    @initial_interval.setter
+    def initial_interval(self, value: int) -> None:
+        if not isinstance(value, int) or value < 0:
+            raise NdParameterError("Invalid initial_interval: not a non-negative int.")
+        self._initial_interval = value
+
+    @property
+    def inventory(self) -> NdClusterInventory:
+        """
+        getter: return the NdClusterInventory the discovered nodes are indexed into.
+        setter: set the NdClusterInventory the discovered nodes are indexed into.
+        """
+        return self._inventory
+
+    @inventory.setter
+    def inventory(self, value: NdClusterInventory) -> None:
+        if not isinstance(value, NdClusterInventory):
+            raise NdParameterError("Invalid inventory: not an NdClusterInventory instance.")
+        self._inventory = value
+
+    @property
+    def max_interval(self) -> int:
+        """
+        getter: return the upper bound for the backoff interval, in seconds.
+        setter: set the upper bound for the backoff interval, in seconds.
+        """
+        return self._max_interval
+
+    @max_interval.setter
+    def max_interval(self, value: int) -> None:
+        if not isinstance(value, int) or value < 0:
+            raise NdParameterError("Invalid max_interval: not a non-negative int.")
+        self._max_interval = value
+
+    @property
+    def timeout(self) -> int:
+        """
+        getter: return the number of seconds to wait for all nodes.
+        setter: set the number of seconds to wait for all nodes.
+        """
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, value: int) -> None:
+        if not isinstance(value, int) or value < 0:
+            raise NdParameterError("Invalid timeout: not a non-negative int.")
+        self._timeout = value
+
+    @property
+    def url(self) -> str:
+        """
+        getter: return the cluster URL, built from the Nexus Dashboard address currently in use.
+        """
+        return f"https://{self.context.nd_host}{self._path}"
@@ -0,0 +1,346 @@
+"""
+Nexus Dashboard Fleet Pre-flight Audit
+
+Run the pre-flight steps of a bootstrap (login, version, serial numbers, DNS/NTP validation) against many
+Nexus Dashboard targets concurrently, without posting anything, and report a per-target matrix.
+"""
+
+import inspect
+import json
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+
+from nd_bootstrap.auth_manager import NdAuthManager
+from nd_bootstrap.bootstrap import NdBootstrap
+from nd_bootstrap.config import NdBootstrapConfig
+from nd_bootstrap.context import ADDRESS_SOURCES, NdContext
+from nd_bootstrap.exceptions import NdBootstrapError, NdConnectionError, NdNodeDiscoveryError, NdParameterError, NdValidationError
+from nd_bootstrap.results import NdPreflightCheck, NdPreflightResult, NdPreflightTarget
+from nd_bootstrap.version import NdVersion
+
+PREFLIGHT_CHECKS: tuple[str, ...] = ("reachable", "credentials", "firmware", "nodes", "dns_ntp")
+
+
+class NdPreflightAudit:
+    """
+    # Summary
+
+    Before a maintenance window, find out which clusters would fail pre-flight, instead of finding out
+    one bootstrap at a time.
+
+    For every configuration in configs (e.g. every cluster rendered from an inventory), in its own NdContext:
+
+    - reachable, credentials: log in (NdBootstrap.login). A connection error fails reachable; a rejected login fails credentials.
+    - firmware: detect the firmware version (NdVersion). Fails if NdBootstrap.select_validator does not recognize it.
+    - nodes: retrieve the nodes registered with Nexus Dashboard, and match every configured node to a
+      serial number (NdBootstrap.update_node_serial_numbers).
+    - dns_ntp: run the version-appropriate validator (NdBootstrap.validate_configuration), ignoring cached results.
+
+    Nothing is posted.  Checks that cannot run because login failed are "skipped"; the other checks
+    run even if an earlier one failed, so one audit reports every problem of a target.
+
+    Targets are audited concurrently in a thread pool of at most max_workers threads.  Each request is
+    bounded by its own timeout, so with max_workers at least the number of targets, auditing the whole
+    manifest takes about as long as the slowest single target.
+
+    Each NdContext is built from the environment (credentials, ND_IP_PROTOCOL), with its address from:
+
+    - address_source "config": the managementNetwork address(es) of the node with `self: true`.
+    - address_source "environment": ND_IP4 / ND_IP6.  Every configuration then targets the same Nexus
+      Dashboard, so commit() rejects it when configs name more than one cluster.
+
+    ## Properties
+
+    - address_source: (getter/setter) "config" or "environment". Default is "config".
+    - configs: (getter/setter) The NdBootstrapConfig instances (config set) to audit.
+    - configure: (getter/setter) Optional callable, called with each NdBootstrap before its audit (e.g. to attach a deadline).
+    - max_workers: (getter/setter) The maximum number of targets audited concurrently. Default is 256.
+
+    ## Usage
+
+    ```python
+    generator = NdConfigGenerator()
+    generator.template_file = "nd_bootstrap_template.yaml"
+    generator.inventory_file = "nd_bootstrap_inventory.csv"
+    instance = NdPreflightAudit()
+    instance.configs = generator.generate()
+    result = instance.commit()
+    instance.write_report("preflight.json")
+    print(result.matrix)
+    ```
+    """
+
+    def __init__(self) -> None:
+        self.class_name: str = self.__class__.__name__
+        self._address_source: str = "config"
+        self._auth: NdAuthManager = NdAuthManager()
+        self._configs: list[NdBootstrapConfig] = []
+        self._configure: Callable[[NdBootstrap], None] | None = None
+        self._max_workers: int = 256
+        self._result: NdPreflightResult = NdPreflightResult()
+
+    def context_for(self, nd_bootstrap_config: NdBootstrapConfig) -> NdContext:
+        """
+        Return a new NdContext for the Nexus Dashboard targeted by nd_bootstrap_config (see address_source).
+        """
+        if self._address_source == "config":
+            context = NdContext.from_config(nd_bootstrap_config.config)
+        else:
+            context = NdContext.from_environment()
+        context.auth = self._auth
+        return context
+
+    @staticmethod
+    def run_check(target: NdPreflightTarget, check: str, step: Callable[[], str]) -> bool:
+        """
+        Run step, which returns the detail of a passed check or raises, and append its NdPreflightCheck to target.
+
+        Returns True if the check passed.
+        """
+        started = time.monotonic()
+        status, detail = "ok", ""
+        try:
+            detail = step()
+        except NdBootstrapError as error:
+            status, detail = "failed", f"{type(error).__name__}: {str(error)}"
+        target.checks.append(NdPreflightCheck(check=check, status=status, detail=detail, elapsed=time.monotonic() - started))
+        return status == "ok"
+
+    def login(self, instance: NdBootstrap, target: NdPreflightTarget) -> bool:
+        """
+        Log in to the target, and append its reachable and credentials checks to target.
+
+        Returns True if the login succeeded.
+        """
+        started = time.monotonic()
+        try:
+            with instance.context.phase("login"):
+                instance.login()
+        except NdConnectionError as error:
+            target.checks.append(NdPreflightCheck(check="reachable", status="failed", detail=f"{type(error).__name__}: {str(error)}", elapsed=time.monotonic() - started))
+            target.checks.append(NdPreflightCheck(check="credentials", status="skipped", detail="not reachable"))
+            return False
+        except NdBootstrapError as error:
+            target.checks.append(NdPreflightCheck(check="reachable", status="ok", detail="login answered", elapsed=time.monotonic() - started))
+            target.checks.append(NdPreflightCheck(check="credentials", status="failed", detail=f"{type(error).__name__}: {str(error)}"))
+            return False
+        target.checks.append(NdPreflightCheck(check="reachable", status="ok", detail="login answered", elapsed=time.monotonic() - started))
+        target.checks.append(NdPreflightCheck(check="credentials", status="ok", detail=f"logged in as {instance.context.nd_username}"))
+        return True
+
+    def audit(self, nd_bootstrap_config: NdBootstrapConfig) -> NdPreflightTarget:
+        """
+        Audit one target and return its NdPreflightTarget.  Runs in a worker thread, and never raises NdBootstrapError.
+        """
+        started = time.monotonic()
+        target = NdPreflightTarget(cluster_name=nd_bootstrap_config.nd_cluster_name)
+        try:
+            context = self.context_for(nd_bootstrap_config)
+        except NdBootstrapError as error:
+            target.checks.append(NdPreflightCheck(check="reachable", status="failed", detail=f"{type(error).__name__}: {str(error)}"))
+            target.checks.extend(NdPreflightCheck(check=check, status="skipped", detail="address unknown") for check in PREFLIGHT_CHECKS[1:])
+            return target
+        instance = NdBootstrap()
+        instance.context = context
+        instance.nd_bootstrap_config = nd_bootstrap_config
+        if self._configure is not None:
+            self._configure(instance)
+        # A cached success could hide a DNS/NTP server that failed since.  The new result is cached for the bootstrap itself.
+        instance.revalidate = True
+        try:
+            with context.phase("preflight", {"nd.cluster.name": target.cluster_name}):
+                context.prewarm()
+                instance.load_config()
+                target.nd_ip = context.nd_ip
+                if not self.login(instance, target):
+                    target.checks.extend(NdPreflightCheck(check=check, status="skipped", detail="not logged in") for check in PREFLIGHT_CHECKS[2:])
+                    return target
+                self.run_check(target, "firmware", lambda: self.detect_firmware(context, target))
+                self.run_check(target, "nodes", lambda: self.discover_nodes(instance))
+                self.run_check(target, "dns_ntp", lambda: self.validate(instance, target.firmware_version))
+        except NdBootstrapError as error:
+            # e.g. a configuration error in load_config(), or the deadline of a configure()d NdDeadline.
+            done = {check.check for check in target.checks}
+            target.checks.extend(NdPreflightCheck(check=check, status="skipped", detail=f"{type(error).__name__}: {str(error)}") for check in PREFLIGHT_CHECKS if check not in done)
+        finally:
+            target.elapsed = time.monotonic() - started
+            if context.session is not None:
+                # Also closes the pooled connections of context.adapter, so a large manifest does not hold one socket per target.
+                context.session.close()
+        return target
+
+    @staticmethod
+    def detect_firmware(context: NdContext, target: NdPreflightTarget) -> str:
+        """
+        Detect the firmware version of the target (stored in target.firmware_version), and return the check detail.
+
+        Raises NdValidationError if select_validator does not recognize the version.
+        """
+        with context.phase("version"):
+            nd_version = NdVersion()
+            nd_version.context = context
+            target.firmware_version = nd_version.commit().firmware_version
+        if not NdBootstrap.supports_firmware(target.firmware_version):
+            raise NdValidationError(f"Unsupported firmware version {target.firmware_version}.")
+        return target.firmware_version
+
+    @staticmethod
+    def discover_nodes(instance: NdBootstrap) -> str:
+        """
+        Match every configured node to a node registered with Nexus Dashboard, and return the check detail.
+        """
+        with instance.context.phase("serial_numbers"):
+            instance.update_node_serial_numbers()
+        nodes = instance.config.get("nodes", [])
+        if not nodes:
+            raise NdNodeDiscoveryError("No nodes in the configuration.")
+        return f"{len(nodes)} node(s) registered"
+
+    @staticmethod
+    def validate(instance: NdBootstrap, firmware_version: str) -> str:
+        """
+        Run the version-appropriate validator, and return the check detail.
+        """
+        with instance.context.phase("validation"):
+            validation = instance.validate_configuration(firmware_version)
+        return f"{validation.validator}: {len(validation.name_servers)} DNS, {len(validation.ntp_servers)} NTP server(s)"
+
+    def commit(self) -> NdPreflightResult:
+        """
+        Audit every target concurrently and print the matrix.
+
+        Raises if:
+            - instance.configs is not set
+            - address_source is "environment" and configs name more than one cluster (NdParameterError)
+
+        Returns:
+            NdPreflightResult, which holds failed checks rather than raising them.
+        """
+        method_name: str = inspect.stack()[0][3]
+        msg: str = ""
+
+        if not self._configs:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "instance.configs must be set before calling instance.commit."
+            raise NdParameterError(msg)
+        cluster_names = {config.nd_cluster_name for config in self._configs}
+        if self._address_source == "environment" and len(cluster_names) > 1:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"address_source 'environment' would audit the Nexus Dashboard at ND_IP4/ND_IP6 once for each of {len(cluster_names)} clusters. "
+            msg += "Use address_source 'config' to audit each cluster's own Nexus Dashboard."
+            raise NdParameterError(msg)
+
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=max(1, min(self._max_workers, len(self._configs)))) as executor:
+            # map() preserves the manifest order, so the matrix reads like the inventory.
+            targets = list(executor.map(self.audit, self._configs))
+        self._result = NdPreflightResult(targets=targets, elapsed=time.monotonic() - started)
+        print(self.table())
+        return self._result
+
+    def table(self) -> str:
+        """
+        Return the matrix of the last commit() as a table: one row per target, one column per check,
+        followed by the detail of every failed check.
+        """
+        targets = self._result.targets
+        passed = sum(1 for target in targets if target.passed)
+        width = max([len("CLUSTER")] + [len(target.cluster_name) for target in targets])
+        lines = [f"Pre-flight audit of {len(targets)} target(s) in {self._result.elapsed:.1f} seconds: {passed} passed, {len(targets) - passed} failed."]
+        lines.append(f"{'CLUSTER':<{width}}  {'ND IP':<39}  {'FIRMWARE':<10}  " + "  ".join(f"{check.upper():<11}" for check in PREFLIGHT_CHECKS) + "  ELAPSED")
+        failures: list[str] = []
+        for target in targets:
+            statuses = {check.check: check.status for check in target.checks}
+            row = f"{target.cluster_name:<{width}}  {target.nd_ip or '-':<39}  {target.firmware_version or '-':<10}  "
+            row += "  ".join(f"{statuses.get(check, '-'):<11}" for check in PREFLIGHT_CHECKS)
+            lines.append(row + f"  {target.elapsed:6.1f}s")
+            failures.extend(f"  {target.cluster_name} {check.check}: {' '.join(check.detail.split())}" for check in target.checks if check.status == "failed")
+        if failures:
+            lines.append("Failed checks:")
+            lines.extend(failures)
+        return "\n".join(lines)
+
+    def report(self) -> dict:
+        """
+        Return the matrix of the last commit() as a JSON-serializable dictionary.
+        """
+        return {
+            "elapsed": self._result.elapsed,
+            "passed": self._result.passed,
+            "checks": list(PREFLIGHT_CHECKS),
+            "matrix": self._result.matrix,
+            "targets": [dict(asdict(target), passed=target.passed) for target in self._result.targets],
+        }
+
+    def write_report(self, path: str) -> None:
+        """
+        Write report() to path as JSON.
+        """
+        with open(path, "w", encoding="utf-8") as report_file:
+            json.dump(self.report(), report_file, indent=2)
+
+    @property
+    def address_source(self) -> str:
+        """
+        getter: return where each target's Nexus Dashboard address comes from ("environment" or "config").
+        setter: set where each target's Nexus Dashboard address comes from.
+        """
+        return self._address_source
+
+    @address_source.setter
+    def address_source(self, value: str) -> None:
+        if value not in ADDRESS_SOURCES:
+            raise NdParameterError(f"Invalid address_source: {value}. Expected one of {', '.join(ADDRESS_SOURCES)}.")
+        self._address_source = value
+
+    @property
+    def configs(self) -> list[NdBootstrapConfig]:
+        """
+        getter: return the NdBootstrapConfig instances to audit.
+        setter: set the NdBootstrapConfig instances to audit (any iterable, e.g. NdConfigGenerator.generate()).
+        """
+        return self._configs
+
+    @configs.setter
+    def configs(self, value: Iterable[NdBootstrapConfig]) -> None:
+        configs = list(value)
+        if not all(isinstance(config, NdBootstrapConfig) for config in configs):
+            raise NdParameterError("Invalid configs: not an iterable of NdBootstrapConfig instances.")
+        self._configs = configs
+
+    @property
+    def configure(self) -> Callable[[NdBootstrap], None] | None:
+        """
+        getter: return the callable applied to each NdBootstrap before its audit, or None.
+        setter: set the callable applied to each NdBootstrap before its audit.
+        """
+        return self._configure
+
+    @configure.setter
+    def configure(self, value: Callable[[NdBootstrap], None]) -> None:
+        if not callable(value):
+            raise NdParameterError("Invalid configure: not callable.")
+        self._configure = value
+
+    @property
+    def max_workers(self) -> int:
+        """
+        getter: return the maximum number of targets audited concurrently.
+        setter: set the maximum number of targets audited concurrently.
+        """
+        return self._max_workers
+
+    @max_workers.setter
+    def max_workers(self, value: int) -> None:
+        if not isinstance(value, int) or value < 1:
+            raise NdParameterError("Invalid max_workers: not a positive int.")
+        self._max_workers = value
+
+    @property
+    def result(self) -> NdPreflightResult:
+        """
+        getter: return the result of the last commit().
+        """
+        return self._result
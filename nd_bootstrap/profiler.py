@@ -0,0 +1,261 @@
+"""
+Nexus Dashboard Bootstrap Profiler
+
+Per-phase timing (wall time, CPU time, requests, bytes) for a bootstrap run, with optional cProfile output.
+"""
+
+import cProfile
+import inspect
+import threading
+import time
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from nd_bootstrap.exceptions import NdParameterError
+
+if TYPE_CHECKING:
+    # NdContext holds an NdProfiler, so import it for type checking only.
+    from nd_bootstrap.context import NdContext
+
+
+@dataclass
+class NdPhaseTiming:
+    """
+    Timing of one phase of a run.  Counts include those of the children.
+
+    - name: The phase name, e.g. "login" or "poll_install".
+    - wall: Wall-clock seconds.
+    - cpu: CPU seconds used by the process.
+    - requests: HTTP requests sent.
+    - bytes_sent: Request body bytes sent.
+    - bytes_received: Response body bytes received.
+    - children: Nested phases, in the order they started.
+    """
+
+    name: str
+    wall: float = 0.0
+    cpu: float = 0.0
+    requests: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    children: list["NdPhaseTiming"] = field(default_factory=list)
+
+
+class NdProfilingAdapter(HTTPAdapter):
+    """
+    # Summary
+
+    requests transport adapter that counts the requests and body bytes of every exchange
+    for an NdProfiler, then hands the request to an inner adapter (the requests default adapter,
+    or e.g. an NdCassetteRecorder or NdCassettePlayer).
+
+    Installed by NdProfiler.attach().
+    """
+
+    def __init__(self, profiler: "NdProfiler", inner: HTTPAdapter | None = None) -> None:
+        super().__init__()
+        self.inner: HTTPAdapter = inner if inner is not None else HTTPAdapter()
+        self.profiler = profiler
+
+    def send(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: float | tuple[float, float] | tuple[float, None] | None = None,
+        verify: bool | str = True,
+        cert: bytes | str | tuple[bytes | str, bytes | str] | None = None,
+        proxies: Mapping[str, str] | None = None,
+    ) -> requests.Response:
+        """
+        Send the request with the inner adapter and count the exchange.
+        """
+        body = request.body or b""
+        bytes_sent = len(body.encode("utf-8") if isinstance(body, str) else body)
+        try:
+            response = self.inner.send(request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+        except requests.RequestException:
+            self.profiler.record_request(bytes_sent, 0)
+            raise
+        self.profiler.record_request(bytes_sent, len(response.content or b""))
+        return response
+
+    def close(self) -> None:
+        """
+        Close the inner adapter.
+        """
+        self.inner.close()
+        super().close()
+
+
+class NdProfiler:
+    """
+    # Summary
+
+    Record a timing tree for a run: wall time, CPU time, request count and bytes transferred
+    for every phase (load_config, login, serial_numbers, validation, post, poll_bootstrap, ...),
+    so that the phase where the time went can be found without attaching an external profiler.
+
+    Phases are opened with `phase(name)` and may be nested.  Requests are counted by an
+    NdProfilingAdapter installed on the context by `attach()`, and attributed to every open phase.
+    When disabled (the default on a new NdContext), `phase()` records nothing.
+
+    If profile_file is set, cProfile also runs for the duration of the outermost phase, and its
+    statistics are written to profile_file (read them with `python -m pstats FILE`).
+
+    ## Properties
+
+    - enabled: (getter/setter) Whether phases are recorded. Default is False.
+    - phases: (getter) The top-level NdPhaseTiming instances recorded so far.
+    - profile_file: (getter/setter) Path to write cProfile statistics to. Default is "" (cProfile is not run).
+
+    ## Usage
+
+    ```python
+    profiler = NdProfiler()
+    profiler.enabled = True
+    profiler.profile_file = "nd_bootstrap.pstats"  # optional
+    profiler.attach(context)  # before NdLogin creates the session
+    try:
+        nd_bootstrap.commit()
+    finally:
+        profiler.print_report()
+    ```
+    """
+
+    def __init__(self) -> None:
+        self.class_name: str = self.__class__.__name__
+        self._cprofile: cProfile.Profile | None = None
+        self._enabled: bool = False
+        self._lock = threading.Lock()
+        self._phases: list[NdPhaseTiming] = []
+        self._profile_file: str = ""
+        self._stack: list[NdPhaseTiming] = []
+
+    def attach(self, context: "NdContext") -> None:
+        """
+        Set context.profiler to this profiler and wrap context.adapter so that requests are counted.
+
+        Call this before NdLogin creates the session, and after any other adapter (e.g. a cassette) is set.
+        """
+        context.profiler = self
+        context.adapter = NdProfilingAdapter(self, context.adapter)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[NdPhaseTiming | None]:
+        """
+        Record the enclosed block as a phase called name, nested in the phase currently open (if any).
+
+        Yields the NdPhaseTiming being recorded, or None if the profiler is disabled.
+        """
+        if not self._enabled:
+            yield None
+            return
+        timing = NdPhaseTiming(name=name)
+        with self._lock:
+            (self._stack[-1].children if self._stack else self._phases).append(timing)
+            self._stack.append(timing)
+            outermost = len(self._stack) == 1
+        if outermost and self._profile_file:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield timing
+        finally:
+            timing.wall = time.perf_counter() - wall_start
+            timing.cpu = time.process_time() - cpu_start
+            with self._lock:
+                self._stack.remove(timing)
+            if outermost and self._cprofile is not None:
+                self._cprofile.disable()
+                self._cprofile.dump_stats(self._profile_file)
+                self._cprofile = None
+
+    def record_request(self, bytes_sent: int, bytes_received: int) -> None:
+        """
+        Count one request in every open phase.
+        """
+        if not self._enabled:
+            return
+        with self._lock:
+            for timing in self._stack:
+                timing.requests += 1
+                timing.bytes_sent += bytes_sent
+                timing.bytes_received += bytes_received
+
+    def report_lines(self) -> list[str]:
+        """
+        Return the timing tree as table lines, one per phase, children indented below their parent.
+        """
+        total = sum(timing.wall for timing in self._phases) or 1.0
+        lines = [f"{'phase':<32} {'wall s':>9} {'%':>6} {'cpu s':>8} {'requests':>8} {'sent':>10} {'received':>10}"]
+
+        def add(timing: NdPhaseTiming, depth: int) -> None:
+            name = f"{'  ' * depth}{timing.name}"
+            line = f"{name:<32} {timing.wall:>9.3f} {100 * timing.wall / total:>6.1f} {timing.cpu:>8.3f} "
+            line += f"{timing.requests:>8} {timing.bytes_sent:>10} {timing.bytes_received:>10}"
+            lines.append(line)
+            for child in timing.children:
+                add(child, depth + 1)
+
+        for timing in self._phases:
+            add(timing, 0)
+        return lines
+
+    def print_report(self) -> None:
+        """
+        Print the timing tree (and where the cProfile statistics were written, if anywhere).
+        """
+        method_name: str = inspect.stack()[0][3]
+        msg: str = ""
+
+        if not self._enabled:
+            return
+        msg = f"{self.class_name}.{method_name}: "
+        msg += "Per-phase timing (counts include nested phases):\n"
+        msg += "\n".join(self.report_lines())
+        if self._profile_file:
+            msg += f"\n{self.class_name}.{method_name}: "
+            msg += f"cProfile statistics written to {self._profile_file}. Read them with: python -m pstats {self._profile_file}"
+        print(msg)
+
+    @property
+    def enabled(self) -> bool:
+        """
+        getter: return whether phases are recorded.
+        setter: set whether phases are recorded.
+        """
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        if not isinstance(value, bool):
+            raise NdParameterError("Invalid enabled: not a boolean.")
+        self._enabled = value
+
+    @property
+    def phases(self) -> list[NdPhaseTiming]:
+        """
+        getter: return the top-level phases recorded so far.
+        """
+        return self._phases
+
+    @property
+    def profile_file(self) -> str:
+        """
+        getter: return the path cProfile statistics are written to.
+        setter: set the path cProfile statistics are written to.
+        """
+        return self._profile_file
+
+    @profile_file.setter
+    def profile_file(self, value: str) -> None:
+        if not isinstance(value, str):
+            raise NdParameterError("Invalid profile_file: not a string.")
+        self._profile_file = value
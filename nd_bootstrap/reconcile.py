@@ -0,0 +1,284 @@
+"""
+Nexus Dashboard Bootstrap Reconciliation
+
+Compares the desired bootstrap configuration against the current state of Nexus Dashboard.
+"""
+
+import inspect
+import re
+
+import requests
+
+from nd_bootstrap.context import NdContext
+from nd_bootstrap.exceptions import NdApiError, NdConnectionError, NdParameterError
+from nd_bootstrap.results import NdReconcileResult
+
+
+class NdReconcile:
+    """
+    # Summary
+
+    Compare the desired bootstrap configuration with the cluster state reported by Nexus Dashboard
+    and decide what the bootstrap workflow needs to do.
+
+    The desired configuration is expected to be fully enriched (credentials, nodeController.ipAddress,
+    and serialNumber already filled in) so that it is directly comparable to what ND reports.
+
+    ## Actions
+
+    - bootstrap: ND has not been bootstrapped, or a previous bootstrap failed. Validate and POST as usual.
+    - poll: A bootstrap is running, or ND is bootstrapped with the desired configuration.
+      Skip validation and the POST and go straight to the status checks.
+    - conflict: ND is bootstrapped with a configuration that differs from the desired configuration.
+      ND cannot be re-bootstrapped, so the differences are reported and nothing is sent.
+
+    ## Endpoints
+
+    - Path: /v2/bootstrap/cluster
+    - Verb: GET
+
+    - Path: /clusterstatus/bootstrap
+    - Verb: GET
+
+    ## Properties
+
+    - action: (getter) The action decided by commit(): "bootstrap", "poll", or "conflict".
+    - cluster_data: (getter/setter) The /v2/bootstrap/cluster response body. Retrieved by commit() if not set.
+    - config: (getter/setter) The desired (enriched) configuration dictionary.
+    - differences: (getter) List of (path, desired, actual) tuples for fields that differ.
+    - context: (getter/setter) The NdContext for the target. Built from the environment if not set.
+    - session: (getter/setter) context.session, the requests.Session object instance with authentication cookies set
+    - state: (getter) The bootstrap state reported by /clusterstatus/bootstrap, or "NotStarted".
+
+    ## Usage
+
+    ```python
+    instance = NdReconcile()
+    instance.session = configured_requests_session_instance
+    instance.config = enriched_bootstrap_configuration_dict
+    instance.cluster_data = cluster_get_response_body  # optional, avoids a second GET
+    instance.commit()
+    if instance.action == "bootstrap":
+        ...
+    ```
+    """
+
+    # Fields that are write-only on ND (never reported back) and are therefore excluded from the comparison.
+    ignored_keys: frozenset[str] = frozenset({"loginPassword"})
+
+    def __init__(self) -> None:
+        self.class_name: str = self.__class__.__name__
+        self._context: NdContext | None = None
+        self._action: str = "bootstrap"
+        self._cluster_data: dict = {}
+        self._config: dict = {}
+        self._differences: list[tuple[str, object, object]] = []
+        self._state: str = "NotStarted"
+
+    def get_cluster_data(self, session: requests.Session) -> None:
+        """
+        Retrieve the cluster configuration from Nexus Dashboard.
+
+        Raises if:
+            - The GET request fails
+        """
+        method_name: str = inspect.stack()[0][3]
+        msg: str = ""
+
+        url = f"https://{self.context.nd_host}/v2/bootstrap/cluster"
+        try:
+            response = session.get(url, timeout=10)
+        except requests.RequestException as e:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Error retrieving cluster configuration: {str(e)}"
+            raise NdConnectionError(msg) from e
+        if response.status_code not in (200, 201):
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Failed to retrieve cluster configuration. Status code: {response.status_code} : {response.text}"
+            raise NdApiError(msg, status_code=response.status_code)
+        self._cluster_data = response.json()
+
+    def get_bootstrap_state(self, session: requests.Session) -> None:
+        """
+        Retrieve the bootstrap state from Nexus Dashboard.
+
+        A 404, a non-200 response, or a network error is treated as "NotStarted".
+        """
+        url = f"https://{self.context.nd_host}/clusterstatus/bootstrap"
+        try:
+            response = session.get(url, timeout=10)
+        except requests.RequestException:
+            self._state = "NotStarted"
+            return
+        if response.status_code != 200:
+            self._state = "NotStarted"
+            return
+        self._state = response.json().get("state", "") or "NotStarted"
+
+    def compare(self, desired: object, actual: object, path: str) -> None:
+        """
+        Recursively compare desired with actual, appending differences to self._differences.
+
+        - Keys in desired that ND does not report are skipped, since there is nothing to compare them against.
+        - Nodes are matched by serialNumber rather than by position.
+        """
+        if isinstance(desired, dict) and isinstance(actual, dict):
+            for key, value in desired.items():
+                if key in self.ignored_keys or key not in actual:
+                    continue
+                self.compare(value, actual[key], f"{path}.{key}" if path else key)
+            return
+        if isinstance(desired, list) and isinstance(actual, list):
+            if path == "nodes":
+                self.compare_nodes(desired, actual)
+                return
+            if len(desired) != len(actual):
+                self._differences.append((path, desired, actual))
+                return
+            for index, (desired_item, actual_item) in enumerate(zip(desired, actual)):
+                self.compare(desired_item, actual_item, f"{path}[{index}]")
+            return
+        if desired != actual:
+            self._differences.append((path, desired, actual))
+
+    def compare_nodes(self, desired_nodes: list, actual_nodes: list) -> None:
+        """
+        Compare the desired nodes with the nodes reported by ND, matching them by serialNumber.
+        """
+        actual_by_serial = {node.get("serialNumber", ""): node for node in actual_nodes}
+        for desired_node in desired_nodes:
+            serial_number = desired_node.get("serialNumber", "")
+            path = f"nodes[{serial_number}]"
+            actual_node = actual_by_serial.get(serial_number)
+            if actual_node is None:
+                self._differences.append((path, "present", "missing"))
+                continue
+            self.compare(desired_node, actual_node, path)
+
+    def commit(self) -> NdReconcileResult:
+        """
+        Retrieve the current ND state, compare it with the desired configuration, and set action.
+
+        Raises if:
+            - instance.session is not set
+            - instance.config is not set
+
+        Returns:
+            NdReconcileResult
+        """
+        method_name: str = inspect.stack()[0][3]
+        msg: str = ""
+
+        session = self.context.session
+        if session is None:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "instance.session must be set before calling instance.commit."
+            raise NdParameterError(msg)
+        if not self._config:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "instance.config must be set before calling instance.commit."
+            raise NdParameterError(msg)
+
+        if not self._cluster_data:
+            self.get_cluster_data(session)
+        self.get_bootstrap_state(session)
+
+        self._differences = []
+        if self._cluster_data.get("clusterConfig"):
+            self.compare(self._config, self._cluster_data, "")
+
+        if self._state == "InProgress":
+            self._action = "poll"
+        elif re.search(r"fail", self._state, re.IGNORECASE):
+            # ND asks the user to "check and retry" after a failed bring up.
+            self._action = "bootstrap"
+        elif self._state == "Completed" or self._cluster_data.get("clusterConfig"):
+            self._action = "conflict" if self._differences else "poll"
+        else:
+            self._action = "bootstrap"
+
+        msg = f"{self.class_name}.{method_name}: "
+        msg += f"Bootstrap state: {self._state}, differences: {len(self._differences)}, action: {self._action}."
+        print(msg)
+        for path, desired, actual in self._differences:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"  {path}: desired {desired!r}, actual {actual!r}"
+            print(msg)
+        return NdReconcileResult(action=self._action, state=self._state, differences=list(self._differences))
+
+    @property
+    def action(self) -> str:
+        """
+        getter: return the action decided by commit(): "bootstrap", "poll", or "conflict".
+        """
+        return self._action
+
+    @property
+    def cluster_data(self) -> dict:
+        """
+        getter: return the /v2/bootstrap/cluster response body.
+        setter: set the /v2/bootstrap/cluster response body.
+        """
+        return self._cluster_data
+
+    @cluster_data.setter
+    def cluster_data(self, value: dict) -> None:
+        if not isinstance(value, dict):
+            raise NdParameterError("Invalid cluster_data: not a dictionary.")
+        self._cluster_data = value
+
+    @property
+    def config(self) -> dict:
+        """
+        getter: return the desired configuration dictionary.
+        setter: set and validate the desired configuration dictionary.
+        """
+        return self._config
+
+    @config.setter
+    def config(self, value: dict) -> None:
+        if not isinstance(value, dict):
+            raise NdParameterError("Invalid config: not a dictionary.")
+        self._config = value
+
+    @property
+    def differences(self) -> list[tuple[str, object, object]]:
+        """
+        getter: return the list of (path, desired, actual) tuples for fields that differ.
+        """
+        return self._differences
+
+    @property
+    def context(self) -> NdContext:
+        """
+        getter: return the NdContext for the target Nexus Dashboard. Built from the environment if not set.
+        setter: set the NdContext for the target Nexus Dashboard.
+        """
+        if self._context is None:
+            self._context = NdContext.from_environment()
+        return self._context
+
+    @context.setter
+    def context(self, value: NdContext) -> None:
+        if not isinstance(value, NdContext):
+            raise NdParameterError("Invalid context: not an NdContext instance.")
+        self._context = value
+
+    @property
+    def session(self) -> requests.Session | None:
+        """
+        getter: return context.session, the requests.Session instance with authentication cookies set.
+        setter: set context.session.
+        """
+        return self.context.session
+
+    @session.setter
+    def session(self, value: requests.Session) -> None:
+        self.context.session = value
+
+    @property
+    def state(self) -> str:
+        """
+        getter: return the bootstrap state reported by /clusterstatus/bootstrap, or "NotStarted".
+        """
+        return self._state
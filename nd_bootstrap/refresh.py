@@ -5,12 +5,12 @@ Refreshes authentication to Nexus Dashboard and maintains the session.
 """
 
 import inspect
-from sys import exit as sys_exit
 
 import requests
 import urllib3
 
-from nd_bootstrap.environment import NdEnvironment
+from nd_bootstrap.context import NdContext
+from nd_bootstrap.exceptions import NdAuthenticationError, NdConnectionError, NdParameterError
 
 # Disable warnings for self-signed certificates (if applicable)
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -27,13 +27,14 @@ class NdRefresh:
 
     ## Properties
 
-    - session: (getter) The requests.Session object.
+    - context: (getter/setter) The NdContext for the target. Built from the environment if not set.
+    - session: (getter/setter) context.session, the requests.Session object to refresh.
 
     ## Usage
 
     ```python
     nd_refresh = NdRefresh()
-    nd_refresh.session = existing_session
+    nd_refresh.context = context  # context.session is refreshed
     nd_refresh.commit()
     ```
 
@@ -41,44 +42,63 @@ class NdRefresh:
 
     def __init__(self) -> None:
         self.class_name: str = self.__class__.__name__
-        self._session = requests.Session()
-        self._session.verify = False
-        self._session.headers.update({"Content-Type": "application/json"})
-        self.nd_environment = NdEnvironment()
-        self._url: str = f"https://{self.nd_environment.nd_ip}/refresh"
+        self._context: NdContext | None = None
 
     def commit(self) -> None:
         """
         Refresh authentication to Nexus Dashboard and, if successful, set the auth_token.
-        If not successful, sys_exit(1) with an error message.
+        If not successful, raise NdAuthenticationError.
+
+        Raises if:
+            - instance.session is not set (NdParameterError)
+            - the request fails (NdConnectionError)
+            - Nexus Dashboard rejects the refresh (NdAuthenticationError)
         """
         method_name: str = inspect.stack()[0][3]
         msg: str = ""
 
-        response = self._session.post(self._url, timeout=10)
+        session = self.context.session
+        if session is None:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "instance.session must be set before calling instance.commit."
+            raise NdParameterError(msg)
+
+        url = f"https://{self.context.nd_host}/refresh"
+        try:
+            response = session.post(url, timeout=10)
+        except requests.RequestException as e:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Error refreshing authentication to Nexus Dashboard at {self.context.nd_ip}: {str(e)}"
+            raise NdConnectionError(msg) from e
         if response.status_code != 200:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Refresh failed: {response.status_code} : {response.text}"
-            print(msg)
-            sys_exit(1)
+            raise NdAuthenticationError(msg)
 
     @property
-    def session(self) -> requests.Session:
+    def context(self) -> NdContext:
         """
-        getter: return the requests.Session object.
-        setter: set and validate the requests.Session object.
+        getter: return the NdContext for the target Nexus Dashboard. Built from the environment if not set.
+        setter: set the NdContext for the target Nexus Dashboard.
         """
-        return self._session
+        if self._context is None:
+            self._context = NdContext.from_environment()
+        return self._context
 
-    @session.setter
-    def session(self, value: requests.Session) -> None:
-        method_name: str = inspect.stack()[0][3]
-        msg: str = ""
+    @context.setter
+    def context(self, value: NdContext) -> None:
+        if not isinstance(value, NdContext):
+            raise NdParameterError("Invalid context: not an NdContext instance.")
+        self._context = value
 
-        if not isinstance(value, requests.Session):
-            msg = f"{self.class_name}.{method_name}: "
-            msg += "instance.session must be set to a requests.Session object, exiting."
-            print(msg)
-            sys_exit(1)
+    @property
+    def session(self) -> requests.Session | None:
+        """
+        getter: return context.session, the requests.Session instance with authentication cookies set.
+        setter: set context.session.
+        """
+        return self.context.session
 
-        self._session = value
+    @session.setter
+    def session(self, value: requests.Session) -> None:
+        self.context.session = value
@@ -4,12 +4,12 @@ Nexus Dashboard Remote Services Validation
 Validates DNS and NTP server reachability for ND 4.2+ using the combined endpoint.
 """
 
-import inspect
-from sys import exit as sys_exit
-
 import requests
 
-from nd_bootstrap.environment import NdEnvironment
+from nd_bootstrap.context import NdContext
+from nd_bootstrap.exceptions import NdConfigError, NdConnectionError, NdParameterError, NdValidationError
+from nd_bootstrap.results import NdValidationResult
+from nd_bootstrap.validation_cache import NdValidationCache
 
 
 class NdVerifyRemoteServices:
@@ -25,8 +25,12 @@ class NdVerifyRemoteServices:
 
     ## Properties
 
+    - cache: (getter/setter) Optional NdValidationCache. If set, a cached successful result for the same
+      ND address, firmware version, and payload is returned without contacting ND. Default is None.
     - config: (getter/setter) The configuration dictionary containing clusterConfig
-    - session: (getter/setter) The requests.Session object instance with authentication cookies set
+    - context: (getter/setter) The NdContext for the target. Built from the environment if not set.
+    - firmware_version: (getter/setter) The ND firmware version, used in the cache key. Default is "".
+    - session: (getter/setter) context.session, the requests.Session object instance with authentication cookies set
 
     ## Usage
 
@@ -34,21 +38,22 @@ class NdVerifyRemoteServices:
     instance = NdVerifyRemoteServices()
     instance.session = configured_requests_session_instance
     instance.config = your_nd_bootstrap_configuration_dict
-    instance.commit()  # Validates DNS and NTP servers, exits on failure
+    instance.commit()  # Validates DNS and NTP servers, raises NdValidationError on failure
     ```
     """
 
     def __init__(self) -> None:
         self.class_name: str = self.__class__.__name__
+        self._context: NdContext | None = None
+        self._cache: NdValidationCache | None = None
         self._config: dict = {}
-        self._session: requests.Session
-        self.nd_environment = NdEnvironment()
+        self._firmware_version: str = ""
 
-    def commit(self) -> None:
+    def commit(self) -> NdValidationResult:
         """
         Validate the DNS and NTP servers in the configuration.
 
-        Exits if:
+        Raises if:
             - instance.session is not set
             - instance.config is not set
             - instance.config contains no DNS servers
@@ -56,45 +61,50 @@ class NdVerifyRemoteServices:
             - validation fails
 
         Returns:
-            None
+            NdValidationResult
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = "commit"
         msg: str = ""
 
-        if not self._session:
+        session = self.context.session
+        if session is None:
             msg = f"{self.class_name}.{method_name}: "
-            msg += "instance.session must be set before calling instance.commit, exiting."
-            print(msg)
-            sys_exit(1)
+            msg += "instance.session must be set before calling instance.commit."
+            raise NdParameterError(msg)
         if not self._config:
             msg = f"{self.class_name}.{method_name}: "
-            msg += "instance.config must be set before calling instance.commit, exiting."
-            print(msg)
-            sys_exit(1)
+            msg += "instance.config must be set before calling instance.commit."
+            raise NdParameterError(msg)
 
         name_servers = self._config.get("clusterConfig", {}).get("nameServers", [])
         if not name_servers:
             msg = f"{self.class_name}.{method_name}: "
-            msg += "At least one DNS server must be specified in clusterConfig.nameServers. Exiting."
-            print(msg)
-            sys_exit(1)
+            msg += "At least one DNS server must be specified in clusterConfig.nameServers."
+            raise NdConfigError(msg)
 
         ntp_servers = self._config.get("clusterConfig", {}).get("ntpConfig", {}).get("servers", [])
         if not ntp_servers:
             msg = f"{self.class_name}.{method_name}: "
-            msg += "At least one NTP server must be specified in clusterConfig.ntpConfig.servers. Exiting."
-            print(msg)
-            sys_exit(1)
+            msg += "At least one NTP server must be specified in clusterConfig.ntpConfig.servers."
+            raise NdConfigError(msg)
 
-        url = f"https://{self.nd_environment.nd_ip}/bootstrap/verifyremoteservices"
+        url = f"https://{self.context.nd_host}/bootstrap/verifyremoteservices"
         payload = {
             "nameServers": name_servers,
             "ntpConfig": {
                 "servers": [{"host": server["host"], "prefer": server["prefer"]} for server in ntp_servers],
             },
         }
+        cache_key: str = ""
+        if self._cache is not None:
+            cache_key = self._cache.key("remote_services", self.context.nd_ip, self._firmware_version, payload)
+            cached_result = self._cache.get(cache_key)
+            if cached_result is not None:
+                self.context.emit("validation", validator="remote_services", ok=True, cached=True)
+                return cached_result
+
         try:
-            response = self._session.post(
+            response = session.post(
                 url,
                 json=payload,
                 timeout=60,
@@ -102,33 +112,74 @@ class NdVerifyRemoteServices:
         except requests.RequestException as e:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Error validating remote services: {str(e)}"
-            print(msg)
-            sys_exit(1)
+            raise NdConnectionError(msg) from e
 
         if response.status_code not in [200]:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Remote services validation failed with status code {response.status_code}, response.text: {response.text}"
-            print(msg)
-            sys_exit(1)
+            self.context.emit("validation", validator="remote_services", ok=False, cached=False, detail=f"status code {response.status_code}")
+            raise NdValidationError(msg)
 
         msg = f"{self.class_name}.{method_name}: "
         msg += "Remote services (DNS + NTP) validation succeeded."
         print(msg)
+        self.context.emit("validation", validator="remote_services", ok=True, cached=False)
+        validation_result = NdValidationResult(
+            validator="remote_services",
+            name_servers=list(name_servers),
+            ntp_servers=[server["host"] for server in ntp_servers],
+        )
+        return self.cache_result(cache_key, validation_result)
+
+    def cache_result(self, cache_key: str, validation_result: NdValidationResult) -> NdValidationResult:
+        """
+        Store a successful validation_result in the cache (if set) and return it.
+        """
+        if self._cache is not None:
+            self._cache.put(cache_key, validation_result)
+        return validation_result
+
+    @property
+    def cache(self) -> NdValidationCache | None:
+        """
+        getter: return the NdValidationCache, or None if caching is disabled.
+        setter: set the NdValidationCache.
+        """
+        return self._cache
+
+    @cache.setter
+    def cache(self, value: NdValidationCache) -> None:
+        if not isinstance(value, NdValidationCache):
+            raise NdParameterError("Invalid cache: not an NdValidationCache instance.")
+        self._cache = value
 
     @property
-    def session(self) -> requests.Session:
+    def context(self) -> NdContext:
         """
-        getter: return the requests.Session instance.
-        setter: set and validate the requests.Session instance.
+        getter: return the NdContext for the target Nexus Dashboard. Built from the environment if not set.
+        setter: set the NdContext for the target Nexus Dashboard.
         """
-        return self._session
+        if self._context is None:
+            self._context = NdContext.from_environment()
+        return self._context
+
+    @context.setter
+    def context(self, value: NdContext) -> None:
+        if not isinstance(value, NdContext):
+            raise NdParameterError("Invalid context: not an NdContext instance.")
+        self._context = value
+
+    @property
+    def session(self) -> requests.Session | None:
+        """
+        getter: return context.session, the requests.Session instance with authentication cookies set.
+        setter: set context.session.
+        """
+        return self.context.session
 
     @session.setter
     def session(self, value: requests.Session) -> None:
-        if not isinstance(value, requests.Session):
-            print("Invalid session: not a requests.Session instance, exiting.")
-            sys_exit(1)
-        self._session = value
+        self.context.session = value
 
     @property
     def config(self) -> dict:
@@ -141,6 +192,19 @@ class NdVerifyRemoteServices:
     @config.setter
     def config(self, value: dict) -> None:
         if not isinstance(value, dict):
-            print("Invalid config: not a dictionary, exiting.")
-            sys_exit(1)
+            raise NdParameterError("Invalid config: not a dictionary.")
         self._config = value
+
+    @property
+    def firmware_version(self) -> str:
+        """
+        getter: return the ND firmware version used in the cache key.
+        setter: set the ND firmware version used in the cache key.
+        """
+        return self._firmware_version
+
+    @firmware_version.setter
+    def firmware_version(self, value: str) -> None:
+        if not isinstance(value, str):
+            raise NdParameterError("Invalid firmware_version: not a string.")
+        self._firmware_version = value
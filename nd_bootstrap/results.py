@@ -0,0 +1,258 @@
+"""
+Nexus Dashboard Bootstrap Results
+
+Structured results returned by the commit() methods of the nd_bootstrap classes.
+"""
+
+from dataclasses import dataclass, field
+
+
+@dataclass
+class NdVersionResult:
+    """
+    Result of NdVersion.commit().
+
+    - firmware_version: The firmware version reported by Nexus Dashboard, e.g. "4.2.1.10".
+    """
+
+    firmware_version: str
+
+
+@dataclass
+class NdDiscoveryResult:
+    """
+    Result of NdPollNodeDiscovery.commit().
+
+    - completed: True if every configured node registered with a serial number.
+    - polls: The number of cluster requests sent.
+    - elapsed: Seconds spent waiting.
+    """
+
+    completed: bool
+    polls: int
+    elapsed: float
+
+
+@dataclass
+class NdValidationResult:
+    """
+    Result of NdNtpServersValidate.commit() and NdVerifyRemoteServices.commit().
+
+    - validator: "ntp" or "remote_services".
+    - name_servers: The DNS servers that were validated (empty for "ntp").
+    - ntp_servers: The NTP servers that were validated.
+    """
+
+    validator: str
+    name_servers: list[str] = field(default_factory=list)
+    ntp_servers: list[str] = field(default_factory=list)
+
+
+@dataclass
+class NdReconcileResult:
+    """
+    Result of NdReconcile.commit().
+
+    - action: "bootstrap", "poll", or "conflict".
+    - state: The bootstrap state reported by Nexus Dashboard, or "NotStarted".
+    - differences: List of (path, desired, actual) tuples for fields that differ.
+    """
+
+    action: str
+    state: str
+    differences: list[tuple[str, object, object]] = field(default_factory=list)
+
+
+@dataclass
+class NdPollResult:
+    """
+    Result of NdPollBootstrapStatus.commit() and NdPollInstallStatus.commit().
+
+    - phase: "bootstrap" or "install".
+    - completed: True if overallProgress reached 100, False if retries were exhausted first.
+    - overall_progress: The last overallProgress reported.
+    - overall_status: The last overallStatus reported.
+    - state: The last state reported.
+    - polls: The number of status requests sent.
+    """
+
+    phase: str
+    completed: bool
+    overall_progress: int
+    overall_status: str
+    state: str
+    polls: int
+
+
+@dataclass
+class NdHealthCheck:
+    """
+    One post-install health check of one address.
+
+    - target: What the address belongs to, e.g. the node hostname, or "externalServices/Management".
+    - address: The IP address checked.
+    - check: "reachable" (the host answers on the check port) or "api" (the node serves the Nexus Dashboard API with services installed).
+    - ok: True if the check passed.
+    - detail: Why the check passed or failed.
+    - elapsed: Seconds the check took.
+    """
+
+    target: str
+    address: str
+    check: str
+    ok: bool
+    detail: str = ""
+    elapsed: float = 0.0
+
+
+@dataclass
+class NdHealthResult:
+    """
+    Result of NdNodeHealth.commit().
+
+    - checks: Every check, in the order of the configuration (nodes, then externalServices pools).
+    - elapsed: Seconds the whole verification took (about the slowest single check, since checks run concurrently).
+    """
+
+    checks: list[NdHealthCheck] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def healthy(self) -> bool:
+        """
+        True if every check passed.
+        """
+        return all(check.ok for check in self.checks)
+
+    @property
+    def matrix(self) -> dict[str, dict[str, bool]]:
+        """
+        Per-target results: {target: {"<address> <check>": ok}}.
+        """
+        matrix: dict[str, dict[str, bool]] = {}
+        for check in self.checks:
+            matrix.setdefault(check.target, {})[f"{check.address} {check.check}"] = check.ok
+        return matrix
+
+
+@dataclass
+class NdPreflightCheck:
+    """
+    One pre-flight check of one target.
+
+    - check: "reachable" (the API answers), "credentials" (login succeeds), "firmware" (select_validator recognizes
+      the version), "nodes" (every configured node is registered, with a serial number) or "dns_ntp" (the
+      version-appropriate validator accepts the DNS/NTP servers).
+    - status: "ok", "failed", or "skipped" (an earlier check failed, so this one could not run).
+    - detail: Why the check passed, failed or was skipped.
+    - elapsed: Seconds the check took.
+    """
+
+    check: str
+    status: str
+    detail: str = ""
+    elapsed: float = 0.0
+
+
+@dataclass
+class NdPreflightTarget:
+    """
+    Pre-flight results for one target of NdPreflightAudit.
+
+    - cluster_name: clusterConfig.name from the configuration.
+    - nd_ip: The Nexus Dashboard address audited, or "" if it is unknown.
+    - firmware_version: The detected firmware version, or "" if not detected.
+    - checks: One NdPreflightCheck per check, in the order of PREFLIGHT_CHECKS.
+    - elapsed: Seconds the audit of this target took.
+    """
+
+    cluster_name: str
+    nd_ip: str = ""
+    firmware_version: str = ""
+    checks: list[NdPreflightCheck] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def passed(self) -> bool:
+        """
+        True if every check passed.
+        """
+        return all(check.status == "ok" for check in self.checks)
+
+
+@dataclass
+class NdPreflightResult:
+    """
+    Result of NdPreflightAudit.commit().
+
+    - targets: Every target, in manifest order.
+    - elapsed: Seconds the whole audit took (about the slowest single target, since targets are audited concurrently).
+    """
+
+    targets: list[NdPreflightTarget] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def passed(self) -> bool:
+        """
+        True if every check of every target passed.
+        """
+        return all(target.passed for target in self.targets)
+
+    @property
+    def matrix(self) -> dict[str, dict[str, str]]:
+        """
+        Per-target check status: {cluster_name: {check: status}}.
+        """
+        return {target.cluster_name: {check.check: check.status for check in target.checks} for target in self.targets}
+
+
+@dataclass
+class NdBootstrapResult:
+    """
+    Result of NdBootstrap.commit().
+
+    - cluster_name: clusterConfig.name from the configuration.
+    - nd_ip: The Nexus Dashboard address used.
+    - action: "bootstrap" (validated and POSTed), "poll" (reconcile skipped validation and POST), or "dry_run".
+    - post_status_code: The HTTP status code of the bootstrap POST, 405 if it was already sent, or 0 if not sent (dry run).
+    - firmware_version: The detected firmware version, or "" if not detected.
+    - discovery: The node discovery result, if wait_for_nodes was set.
+    - validation: The pre-flight validation result, if validation ran.
+    - reconcile: The reconcile result, if reconcile mode ran.
+    - bootstrap_poll: The bootstrap status polling result, if polling ran.
+    - install_poll: The install status polling result, if polling ran.
+    - health: The post-install node health result, if verify_health was set and the install completed.
+    """
+
+    cluster_name: str
+    nd_ip: str
+    action: str = "bootstrap"
+    post_status_code: int = 0
+    firmware_version: str = ""
+    discovery: NdDiscoveryResult | None = None
+    validation: NdValidationResult | None = None
+    reconcile: NdReconcileResult | None = None
+    bootstrap_poll: NdPollResult | None = None
+    install_poll: NdPollResult | None = None
+    health: NdHealthResult | None = None
+
+    @property
+    def completed(self) -> bool:
+        """
+        True if both polling phases ran and reached 100%.
+        """
+        return bool(self.bootstrap_poll and self.bootstrap_poll.completed and self.install_poll and self.install_poll.completed)
+
+    @property
+    def failure(self) -> str:
+        """
+        Why the bootstrap did not succeed although commit() returned, or "" if it succeeded: the POST was
+        not accepted (200, 201, or 405 if already sent), or a polling phase ran out of retries.
+        """
+        if self.action == "bootstrap" and self.post_status_code not in (200, 201, 405):
+            return f"Bootstrap POST not accepted (status code {self.post_status_code})."
+        for poll in (self.bootstrap_poll, self.install_poll):
+            if poll is not None and not poll.completed:
+                return f"The {poll.phase} did not complete: state {poll.state}, overallProgress {poll.overall_progress} after {poll.polls} polls."
+        return ""
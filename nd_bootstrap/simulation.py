@@ -0,0 +1,426 @@
+"""
+Nexus Dashboard Polling Simulation
+
+Evaluates polling policies (interval, retries) against synthetic bootstrap timelines in virtual time.
+
+Usage:
+
+    python -m nd_bootstrap.simulation --timelines 2000 --policy 10:100 --policy 30:40 --policy 60:25
+"""
+
+import argparse
+import contextlib
+import inspect
+import json
+import os
+import random
+import statistics
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from io import BytesIO
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.response import HTTPResponse
+
+from nd_bootstrap.clock import NdClock, NdVirtualClock
+from nd_bootstrap.context import NdContext
+from nd_bootstrap.exceptions import NdBootstrapFailedError, NdParameterError
+from nd_bootstrap.login import NdLogin
+from nd_bootstrap.poll_bootstrap_status import NdPollBootstrapStatus
+from nd_bootstrap.poll_install_status import NdPollInstallStatus
+
+
+@dataclass
+class NdTimeline:
+    """
+    A synthetic bootstrap, in seconds since the bootstrap POST.
+
+    - bootstrap_duration: Time until /clusterstatus/bootstrap reports Completed.
+    - install_duration: Time, after bootstrap completes, until /clusterstatus/install reports Completed.
+    - not_found_window: Time after the POST during which /clusterstatus/bootstrap returns 404.
+    - failure_at: Time at which the bootstrap or install fails, or None if it succeeds.
+    """
+
+    bootstrap_duration: float
+    install_duration: float
+    not_found_window: float = 20.0
+    failure_at: float | None = None
+
+    @property
+    def completed_at(self) -> float:
+        """
+        Time at which the install completes (if it does not fail first).
+        """
+        return self.bootstrap_duration + self.install_duration
+
+
+@dataclass
+class NdPolicyReport:
+    """
+    Aggregate results of one polling policy over all timelines.
+
+    - interval, retries: The policy.
+    - runs: The number of timelines simulated.
+    - completed: Runs in which both pollers reported completion.
+    - gave_up: Successful runs in which retries were exhausted before completion was seen.
+    - failures: Runs whose timeline fails.
+    - failures_detected: Failing runs in which a poller raised NdBootstrapFailedError.
+    - requests: Status requests issued per run.
+    - detection_latency: Seconds between completion and the pollers returning, for completed runs.
+    - failure_detection: Seconds between a failure and NdBootstrapFailedError, for detected failures.
+    """
+
+    interval: int
+    retries: int
+    runs: int = 0
+    completed: int = 0
+    gave_up: int = 0
+    failures: int = 0
+    failures_detected: int = 0
+    requests: list[int] = field(default_factory=list)
+    detection_latency: list[float] = field(default_factory=list)
+    failure_detection: list[float] = field(default_factory=list)
+
+
+def mean_p95(values: list) -> str:
+    """
+    Return "mean / p95" of values, or "-" if values is empty.
+    """
+    if not values:
+        return "-"
+    ordered = sorted(values)
+    p95 = ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+    return f"{statistics.fmean(ordered):.1f} / {p95:.1f}"
+
+
+class NdSimulatedNd(HTTPAdapter):
+    """
+    # Summary
+
+    requests transport adapter that plays one NdTimeline against a virtual clock.
+
+    Answers POST /login with 200, and GET /clusterstatus/bootstrap and /clusterstatus/install with
+    the progress, status and state that Nexus Dashboard would report at the current virtual time.
+    Counts the status requests it answers.
+    """
+
+    def __init__(self, timeline: NdTimeline, clock: NdClock) -> None:
+        super().__init__()
+        self.clock = clock
+        self.start: float = clock.monotonic()
+        self.status_requests: int = 0
+        self.timeline = timeline
+
+    def phase_status(self, elapsed: float, start: float, duration: float) -> dict:
+        """
+        Return the status body for a phase that runs from start to start + duration.
+        """
+        failure_at = self.timeline.failure_at
+        if failure_at is not None and start <= failure_at <= elapsed:
+            return {"overallProgress": 100, "overallStatus": "Failed", "state": "Failed"}
+        if elapsed >= start + duration:
+            return {"overallProgress": 100, "overallStatus": "Healthy", "state": "Completed"}
+        progress = int(100 * max(0.0, elapsed - start) / duration) if duration else 0
+        return {"overallProgress": min(progress, 99), "overallStatus": "InProgress", "state": "InProgress"}
+
+    def send(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: float | tuple[float, float] | tuple[float, None] | None = None,
+        verify: bool | str = True,
+        cert: bytes | str | tuple[bytes | str, bytes | str] | None = None,
+        proxies: Mapping[str, str] | None = None,
+    ) -> requests.Response:
+        """
+        Answer the request from the timeline.
+        """
+        status, body = self.answer(request)
+        content = json.dumps(body).encode("utf-8")
+        raw = HTTPResponse(body=BytesIO(content), headers={"Content-Type": "application/json"}, status=status, preload_content=False)
+        return self.build_response(request, raw)
+
+    def answer(self, request: requests.PreparedRequest) -> tuple[int, dict]:
+        """
+        Return the (status code, JSON body) that Nexus Dashboard would send for request at the current virtual time.
+        """
+        elapsed = self.clock.monotonic() - self.start
+        status: int = 200
+        body: dict = {}
+        path = str(request.path_url)
+        if path == "/clusterstatus/bootstrap":
+            self.status_requests += 1
+            if elapsed < self.timeline.not_found_window:
+                status = 404
+            else:
+                body = self.phase_status(elapsed, 0.0, self.timeline.bootstrap_duration)
+        elif path == "/clusterstatus/install":
+            self.status_requests += 1
+            body = self.phase_status(elapsed, self.timeline.bootstrap_duration, self.timeline.install_duration)
+        elif path != "/login":
+            status = 404
+        return status, body
+
+
+class NdPollingSimulation:
+    """
+    # Summary
+
+    Run NdPollBootstrapStatus and NdPollInstallStatus, unmodified, against thousands of synthetic
+    bootstrap timelines in virtual time (NdVirtualClock), once per polling policy, and report:
+
+    - requests issued per run
+    - detection latency: how long after completion the pollers return
+    - failure-detection time: how long after a failure NdBootstrapFailedError is raised
+    - how often retries run out before a successful bootstrap completes
+
+    Every policy sees the same timelines (same seed), so results are directly comparable.
+
+    ## Properties
+
+    - bootstrap_duration: (getter/setter) (min, max) seconds of the bootstrap phase. Default is (240, 900).
+    - failure_rate: (getter/setter) Fraction of timelines that fail at a random point. Default is 0.05.
+    - install_duration: (getter/setter) (min, max) seconds of the install phase. Default is (600, 1800).
+    - policies: (getter/setter) List of (interval, retries) tuples. Default is [(10, 100)], the command line defaults.
+    - seed: (getter/setter) Random seed for the timelines. Default is 0.
+    - timelines: (getter/setter) Number of timelines. Default is 1000.
+
+    ## Usage
+
+    ```python
+    instance = NdPollingSimulation()
+    instance.policies = [(10, 100), (30, 60)]
+    for report in instance.commit():
+        print(report.interval, report.retries, report.completed)
+    instance.print_report()
+    ```
+    """
+
+    def __init__(self) -> None:
+        self.class_name: str = self.__class__.__name__
+        self._bootstrap_duration: tuple[float, float] = (240.0, 900.0)
+        self._failure_rate: float = 0.05
+        self._install_duration: tuple[float, float] = (600.0, 1800.0)
+        self._policies: list[tuple[int, int]] = [(10, 100)]
+        self._reports: list[NdPolicyReport] = []
+        self._seed: int = 0
+        self._timelines: int = 1000
+
+    def generate_timelines(self) -> list[NdTimeline]:
+        """
+        Return self.timelines random timelines.
+        """
+        rng = random.Random(self._seed)
+        timelines: list[NdTimeline] = []
+        for _ in range(self._timelines):
+            timeline = NdTimeline(
+                bootstrap_duration=rng.uniform(*self._bootstrap_duration),
+                install_duration=rng.uniform(*self._install_duration),
+            )
+            if rng.random() < self._failure_rate:
+                timeline.failure_at = rng.uniform(timeline.not_found_window, timeline.completed_at)
+            timelines.append(timeline)
+        return timelines
+
+    @staticmethod
+    def run_one(timeline: NdTimeline, interval: int, retries: int, report: NdPolicyReport) -> None:
+        """
+        Poll one timeline with one policy and add the outcome to report.
+        """
+        clock = NdVirtualClock()
+        adapter = NdSimulatedNd(timeline, clock)
+        context = NdContext()
+        context.nd_ip4 = "192.0.2.1"
+        context.clock = clock
+        context.adapter = adapter
+        nd_login = NdLogin()
+        nd_login.context = context
+        nd_login.commit()
+        if context.session is not None:
+            # Skip the per-request proxy/netrc environment lookups; nothing leaves the process.
+            context.session.trust_env = False
+
+        report.runs += 1
+        if timeline.failure_at is not None:
+            report.failures += 1
+        try:
+            completed = False
+            nd_bootstrap_status = NdPollBootstrapStatus()
+            nd_bootstrap_status.context = context
+            nd_bootstrap_status.retries = retries
+            nd_bootstrap_status.interval = interval
+            if nd_bootstrap_status.commit().completed:
+                nd_install_status = NdPollInstallStatus()
+                nd_install_status.context = context
+                nd_install_status.retries = retries
+                nd_install_status.interval = interval
+                completed = nd_install_status.commit().completed
+            if completed:
+                report.completed += 1
+                report.detection_latency.append(clock.monotonic() - adapter.start - timeline.completed_at)
+            elif timeline.failure_at is None:
+                report.gave_up += 1
+        except NdBootstrapFailedError:
+            report.failures_detected += 1
+            report.failure_detection.append(clock.monotonic() - adapter.start - (timeline.failure_at or 0.0))
+        report.requests.append(adapter.status_requests)
+
+    def commit(self) -> list[NdPolicyReport]:
+        """
+        Simulate every policy against the same timelines.
+
+        Returns:
+            One NdPolicyReport per policy, in the order of self.policies.
+        """
+        timelines = self.generate_timelines()
+        self._reports = []
+        # The pollers print every poll; discard that output for thousands of runs.
+        with open(os.devnull, "w", encoding="utf-8") as devnull:
+            for interval, retries in self._policies:
+                report = NdPolicyReport(interval=interval, retries=retries)
+                with contextlib.redirect_stdout(devnull):
+                    for timeline in timelines:
+                        self.run_one(timeline, interval, retries, report)
+                self._reports.append(report)
+        return self._reports
+
+    def print_report(self) -> None:
+        """
+        Print a summary table of the last commit().
+        """
+        method_name: str = inspect.stack()[0][3]
+        msg: str = ""
+
+        msg = f"{self.class_name}.{method_name}: "
+        msg += f"{self._timelines} timelines, seed {self._seed}, failure rate {self._failure_rate:.0%}, "
+        msg += f"bootstrap {self._bootstrap_duration[0]:.0f}-{self._bootstrap_duration[1]:.0f}s, "
+        msg += f"install {self._install_duration[0]:.0f}-{self._install_duration[1]:.0f}s"
+        print(msg)
+        header = f"{'interval':>8} {'retries':>7} {'completed':>9} {'gave up':>7} {'failures':>11} {'requests mean/p95':>18} "
+        header += f"{'latency s mean/p95':>19} {'fail detect s mean/p95':>23}"
+        print(header)
+        for report in self._reports:
+            line = f"{report.interval:>8} {report.retries:>7} {report.completed:>9} {report.gave_up:>7} "
+            line += f"{f'{report.failures_detected}/{report.failures}':>11} {mean_p95(report.requests):>18} "
+            line += f"{mean_p95(report.detection_latency):>19} {mean_p95(report.failure_detection):>23}"
+            print(line)
+
+    @property
+    def bootstrap_duration(self) -> tuple[float, float]:
+        """
+        getter: return the (min, max) duration of the bootstrap phase, in seconds.
+        setter: set the (min, max) duration of the bootstrap phase, in seconds.
+        """
+        return self._bootstrap_duration
+
+    @bootstrap_duration.setter
+    def bootstrap_duration(self, value: tuple[float, float]) -> None:
+        if len(value) != 2 or not 0 < value[0] <= value[1]:
+            raise NdParameterError("Invalid bootstrap_duration: not a (min, max) tuple of positive numbers.")
+        self._bootstrap_duration = (float(value[0]), float(value[1]))
+
+    @property
+    def failure_rate(self) -> float:
+        """
+        getter: return the fraction of timelines that fail.
+        setter: set the fraction of timelines that fail.
+        """
+        return self._failure_rate
+
+    @failure_rate.setter
+    def failure_rate(self, value: float) -> None:
+        if not 0 <= value <= 1:
+            raise NdParameterError("Invalid failure_rate: not between 0 and 1.")
+        self._failure_rate = value
+
+    @property
+    def install_duration(self) -> tuple[float, float]:
+        """
+        getter: return the (min, max) duration of the install phase, in seconds.
+        setter: set the (min, max) duration of the install phase, in seconds.
+        """
+        return self._install_duration
+
+    @install_duration.setter
+    def install_duration(self, value: tuple[float, float]) -> None:
+        if len(value) != 2 or not 0 < value[0] <= value[1]:
+            raise NdParameterError("Invalid install_duration: not a (min, max) tuple of positive numbers.")
+        self._install_duration = (float(value[0]), float(value[1]))
+
+    @property
+    def policies(self) -> list[tuple[int, int]]:
+        """
+        getter: return the (interval, retries) policies.
+        setter: set the (interval, retries) policies.
+        """
+        return self._policies
+
+    @policies.setter
+    def policies(self, value: list[tuple[int, int]]) -> None:
+        if not value or not all(len(policy) == 2 and all(isinstance(item, int) and item > 0 for item in policy) for policy in value):
+            raise NdParameterError("Invalid policies: not a non-empty list of (interval, retries) tuples of positive ints.")
+        self._policies = list(value)
+
+    @property
+    def reports(self) -> list[NdPolicyReport]:
+        """
+        getter: return the reports of the last commit().
+        """
+        return self._reports
+
+    @property
+    def seed(self) -> int:
+        """
+        getter: return the random seed.
+        setter: set the random seed.
+        """
+        return self._seed
+
+    @seed.setter
+    def seed(self, value: int) -> None:
+        if not isinstance(value, int):
+            raise NdParameterError("Invalid seed: not an int.")
+        self._seed = value
+
+    @property
+    def timelines(self) -> int:
+        """
+        getter: return the number of timelines.
+        setter: set the number of timelines.
+        """
+        return self._timelines
+
+    @timelines.setter
+    def timelines(self, value: int) -> None:
+        if not isinstance(value, int) or value <= 0:
+            raise NdParameterError("Invalid timelines: not a positive int.")
+        self._timelines = value
+
+
+def parse_policy(value: str) -> tuple[int, int]:
+    """
+    Parse an INTERVAL:RETRIES command line argument.
+    """
+    try:
+        interval, retries = (int(item) for item in value.split(":"))
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"Invalid policy '{value}', expected INTERVAL:RETRIES, e.g. 10:100") from e
+    return interval, retries
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Evaluate bootstrap/install polling policies against synthetic timelines in virtual time")
+    parser.add_argument("--policy", type=parse_policy, action="append", help="Polling policy INTERVAL:RETRIES (repeatable). Default is 10:100")
+    parser.add_argument("--timelines", type=int, default=1000, help="Number of synthetic timelines. Default is 1000")
+    parser.add_argument("--failure-rate", type=float, default=0.05, help="Fraction of timelines that fail. Default is 0.05")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed. Default is 0")
+    args = parser.parse_args()
+
+    simulation = NdPollingSimulation()
+    simulation.policies = args.policy or [(10, 100)]
+    simulation.timelines = args.timelines
+    simulation.failure_rate = args.failure_rate
+    simulation.seed = args.seed
+    simulation.commit()
+    simulation.print_report()
@@ -0,0 +1,856 @@
+"""
+Nexus Dashboard Fault-Injection Soak Test
+
+Runs many concurrent simulated bootstraps against a stand-in Nexus Dashboard that injects scripted faults
+(connection refused windows, 401 storms, slow and truncated bodies, 5xx bursts, progress regressions), and
+reports stuck pollers, leaked sessions, file descriptors and threads, memory growth and detection latency.
+
+Usage:
+
+    python -m nd_bootstrap.soak --duration 14400 --concurrency 64 --targets 8
+    python -m nd_bootstrap.soak --duration 600 --fault-interval 0 --fault unauthorized:300:60 --fault refused:900:120
+"""
+
+import argparse
+import bisect
+import contextlib
+import gc
+import inspect
+import json
+import os
+import random
+import resource
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from io import BytesIO
+
+import requests
+from urllib3.response import HTTPResponse
+
+from nd_bootstrap.auth_manager import NdAuthManager
+from nd_bootstrap.bootstrap import NdBootstrap
+from nd_bootstrap.clock import NdClock, NdScaledClock
+from nd_bootstrap.context import NdContext
+from nd_bootstrap.exceptions import NdApiError, NdAuthenticationError, NdBootstrapError, NdBootstrapFailedError, NdConnectionError, NdParameterError
+from nd_bootstrap.login import NdLogin
+from nd_bootstrap.poll_bootstrap_status import NdPollBootstrapStatus
+from nd_bootstrap.poll_install_status import NdPollInstallStatus
+from nd_bootstrap.simulation import NdSimulatedNd, NdTimeline, mean_p95, parse_policy
+
+# Fault kind: (default duration in seconds, default value).  The value is the delay in seconds for "slow",
+# the status code for "server_error", and the progress points lost for "regression".
+FAULT_KINDS: dict[str, tuple[float, float]] = {
+    "refused": (60.0, 0.0),
+    "unauthorized": (30.0, 0.0),
+    "slow": (120.0, 20.0),
+    "truncated": (60.0, 0.0),
+    "server_error": (60.0, 503.0),
+    "regression": (120.0, 30.0),
+}
+
+STATUS_PATHS: tuple[str, ...] = ("/clusterstatus/bootstrap", "/clusterstatus/install")
+
+
+@dataclass(order=True)
+class NdFault:
+    """
+    A window of virtual time, in seconds since the start of the soak test, during which the stand-in
+    Nexus Dashboard misbehaves.
+
+    - start, duration: The window.
+    - kind: One of FAULT_KINDS:
+      - refused: every request fails with a connection refused error.
+      - unauthorized: every request except /login returns 401 (the session token was revoked).
+      - slow: every response is delayed by value seconds; requests whose timeout is shorter time out.
+      - truncated: every response body is cut short of its Content-Length (the request fails while reading it).
+      - server_error: every request returns status code value (default 503).
+      - regression: status polls report value percentage points less progress than the timeline.
+    - value: See kind.
+    """
+
+    start: float
+    duration: float = field(compare=False)
+    kind: str = field(compare=False)
+    value: float = field(default=0.0, compare=False)
+
+    @property
+    def end(self) -> float:
+        """
+        Virtual time at which the fault ends.
+        """
+        return self.start + self.duration
+
+
+class NdFaultPlan:
+    """
+    # Summary
+
+    The faults of one stand-in Nexus Dashboard, sorted by start time.  Read-only once built, so it is shared
+    by every simulated bootstrap against that Nexus Dashboard: a 401 storm hits all of its pollers at once.
+
+    ## Usage
+
+    ```python
+    plan = NdFaultPlan([NdFault(start=600, duration=60, kind="unauthorized")])
+    plan.extend(NdFaultPlan.generate(random.Random(0), horizon=86400, interval=600))
+    plan.active(630)  # [NdFault(start=600, duration=60, kind='unauthorized', value=0.0)]
+    ```
+    """
+
+    def __init__(self, faults: list[NdFault] | None = None) -> None:
+        self._faults: list[NdFault] = []
+        self._starts: list[float] = []
+        self._longest: float = 0.0
+        self.extend(faults or [])
+
+    @staticmethod
+    def generate(rng: random.Random, horizon: float, interval: float) -> list[NdFault]:
+        """
+        Return random faults between 0 and horizon, on average one every interval seconds, of random kinds,
+        with the default duration and value of their kind.
+        """
+        faults: list[NdFault] = []
+        if interval <= 0:
+            return faults
+        now = rng.expovariate(1.0 / interval)
+        while now < horizon:
+            kind = rng.choice(sorted(FAULT_KINDS))
+            duration, value = FAULT_KINDS[kind]
+            faults.append(NdFault(start=now, duration=duration, kind=kind, value=value))
+            now += rng.expovariate(1.0 / interval)
+        return faults
+
+    def extend(self, faults: list[NdFault]) -> None:
+        """
+        Add faults to the plan.
+        """
+        self._faults = sorted(self._faults + list(faults))
+        self._starts = [fault.start for fault in self._faults]
+        self._longest = max((fault.duration for fault in self._faults), default=0.0)
+
+    def active(self, now: float) -> list[NdFault]:
+        """
+        Return the faults in effect at virtual time now.  Cheap enough to call on every request.
+        """
+        index = bisect.bisect_right(self._starts, now)
+        faults: list[NdFault] = []
+        while index > 0 and self._starts[index - 1] >= now - self._longest:
+            index -= 1
+            if self._faults[index].end > now:
+                faults.append(self._faults[index])
+        return faults
+
+    @property
+    def faults(self) -> list[NdFault]:
+        """
+        getter: return the faults, sorted by start time.
+        """
+        return list(self._faults)
+
+
+class NdFaultInjectingNd(NdSimulatedNd):
+    """
+    # Summary
+
+    requests transport adapter that plays one NdTimeline, like NdSimulatedNd, and injects the faults of an
+    NdFaultPlan that are active at the current time of clock.
+
+    The timeline starts at the first POST /v2/bootstrap/cluster; later POSTs return 405 (already sent).
+    Before the POST, the status endpoints return 404.  A truncated response to the POST still counts as sent,
+    so the caller's retry exercises the 405 path.
+
+    Records the number of requests and the time of the last one, so that a stuck poller can be told from a
+    waiting one.
+    """
+
+    def __init__(self, timeline: NdTimeline, clock: NdClock, plan: NdFaultPlan, origin: float = 0.0) -> None:
+        super().__init__(timeline, clock)
+        self.already_sent: int = 0
+        self.last_request: float = clock.monotonic()
+        self.origin = origin
+        self.plan = plan
+        self.posted: bool = False
+        self.requests: int = 0
+
+    def answer(self, request: requests.PreparedRequest) -> tuple[int, dict]:
+        """
+        Return the (status code, JSON body) for request: the POST starts the timeline, and status polls return 404 before it.
+        """
+        path = str(request.path_url)
+        if path == "/v2/bootstrap/cluster" and request.method == "POST":
+            if self.posted:
+                self.already_sent += 1
+                return 405, {"message": "Cluster bootstrap already in progress"}
+            self.posted = True
+            self.start = self.clock.monotonic()
+            return 200, {}
+        if path in STATUS_PATHS and not self.posted:
+            return 404, {}
+        return super().answer(request)
+
+    def send(  # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: float | tuple[float, float] | tuple[float, None] | None = None,
+        verify: bool | str = True,
+        cert: bytes | str | tuple[bytes | str, bytes | str] | None = None,
+        proxies: Mapping[str, str] | None = None,
+    ) -> requests.Response:
+        """
+        Answer the request from the timeline, with the active faults applied.
+        """
+        self.requests += 1
+        self.last_request = self.clock.monotonic()
+        faults = {fault.kind: fault for fault in self.plan.active(self.last_request - self.origin)}
+        if "refused" in faults:
+            raise requests.ConnectionError("[Errno 111] Connection refused (injected)", request=request)
+        if "slow" in faults:
+            delay = faults["slow"].value
+            read_timeout = timeout[1] if isinstance(timeout, tuple) else timeout
+            if read_timeout is not None and delay >= read_timeout:
+                self.clock.sleep(read_timeout)
+                raise requests.ReadTimeout(f"Read timed out. (read timeout={read_timeout}) (injected)", request=request)
+            self.clock.sleep(delay)
+        path = str(request.path_url)
+        body: dict
+        if "server_error" in faults:
+            status, body = int(faults["server_error"].value), {"message": "Service Unavailable (injected)"}
+        elif "unauthorized" in faults and path != "/login":
+            status, body = 401, {"message": "Unauthorized (injected)"}
+        else:
+            status, body = self.answer(request)
+            if "regression" in faults and path in STATUS_PATHS and body.get("state") == "InProgress":
+                body["overallProgress"] = max(0, body["overallProgress"] - int(faults["regression"].value))
+        content = json.dumps(body).encode("utf-8")
+        headers = {"Content-Type": "application/json", "Content-Length": str(len(content))}
+        if "truncated" in faults:
+            content = content[: len(content) // 2]
+        raw = HTTPResponse(body=BytesIO(content), headers=headers, status=status, preload_content=False)
+        return self.build_response(request, raw)
+
+
+@dataclass
+class NdSoakSample:
+    """
+    Process resources at one point of a soak test.
+
+    - elapsed: Real seconds since the start.
+    - runs: Simulated bootstraps finished so far.
+    - in_flight: Simulated bootstraps in progress.
+    - rss: Resident set size in bytes (peak RSS where the current one is not available).
+    - open_fds: Open file descriptors (sockets included), or -1 if unknown.
+    - sessions: Live requests.Session objects.
+    - threads: Live threads.
+    """
+
+    elapsed: float
+    runs: int
+    in_flight: int
+    rss: int
+    open_fds: int
+    sessions: int
+    threads: int
+
+
+@dataclass
+class NdSoakReport:  # pylint: disable=too-many-instance-attributes
+    """
+    Aggregate results of a soak test.
+
+    - runs: Simulated bootstraps finished.
+    - completed: Runs in which both pollers reported completion.
+    - gave_up: Successful runs in which retries were exhausted before completion was seen.
+    - failures: Runs whose timeline fails.
+    - failures_detected: Failing runs in which a poller raised NdBootstrapFailedError.
+    - already_sent: Runs whose POST was retried and answered 405 (already sent).
+    - errors: Runs that raised anything else, by exception type.
+    - unexpected: Exception types in errors that are not NdBootstrapError subclasses (bugs: the package only raises NdBootstrapError).
+    - stuck: Runs that sent no request for stuck_after virtual seconds, or did not finish after the soak test ended.
+    - relogins: Re-authentications, summed over runs.
+    - coalesced: Re-authentication demands served by another run's login.
+    - requests: Requests sent per run.
+    - detection_latency: Virtual seconds between completion and the pollers returning, for completed runs.
+    - failure_detection: Virtual seconds between a failure and NdBootstrapFailedError, for detected failures.
+    - samples: Process resources, sampled periodically (see NdSoakSample).
+    """
+
+    runs: int = 0
+    completed: int = 0
+    gave_up: int = 0
+    failures: int = 0
+    failures_detected: int = 0
+    already_sent: int = 0
+    errors: Counter = field(default_factory=Counter)
+    unexpected: set[str] = field(default_factory=set)
+    stuck: int = 0
+    relogins: int = 0
+    coalesced: int = 0
+    requests: list[int] = field(default_factory=list)
+    detection_latency: list[float] = field(default_factory=list)
+    failure_detection: list[float] = field(default_factory=list)
+    samples: list[NdSoakSample] = field(default_factory=list)
+
+    @property
+    def memory_growth(self) -> int:
+        """
+        RSS growth in bytes between the first sample after warm-up (the second sample) and the last.
+        """
+        if len(self.samples) < 3:
+            return 0
+        return self.samples[-1].rss - self.samples[1].rss
+
+    @property
+    def problems(self) -> list[str]:
+        """
+        Return a description of each problem found: stuck pollers, unexpected exceptions, and resources
+        (sessions, file descriptors, threads) still held after every run finished.
+        """
+        problems: list[str] = []
+        if self.stuck:
+            problems.append(f"{self.stuck} stuck poller(s)")
+        if self.unexpected:
+            problems.append(f"unexpected exception(s): {', '.join(sorted(self.unexpected))}")
+        if len(self.samples) >= 2:
+            first, last = self.samples[0], self.samples[-1]
+            if last.sessions > first.sessions:
+                problems.append(f"{last.sessions - first.sessions} session(s) leaked")
+            if 0 <= first.open_fds < last.open_fds:
+                problems.append(f"{last.open_fds - first.open_fds} file descriptor(s) leaked")
+            if last.threads > first.threads:
+                problems.append(f"{last.threads - first.threads} thread(s) leaked")
+        return problems
+
+
+def process_sample(elapsed: float, runs: int, in_flight: int) -> NdSoakSample:
+    """
+    Return an NdSoakSample of the resources of this process.
+    """
+    try:
+        with open("/proc/self/statm", encoding="utf-8") as statm:
+            rss = int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        # Peak, not current; kilobytes on Linux, bytes on macOS.
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        rss = maxrss if sys.platform == "darwin" else maxrss * 1024
+    try:
+        open_fds = len(os.listdir("/proc/self/fd"))
+    except OSError:
+        open_fds = -1
+    sessions = sum(1 for item in gc.get_objects() if isinstance(item, requests.Session))
+    return NdSoakSample(elapsed=elapsed, runs=runs, in_flight=in_flight, rss=rss, open_fds=open_fds, sessions=sessions, threads=threading.active_count())
+
+
+class NdSoakTest:  # pylint: disable=too-many-instance-attributes
+    """
+    # Summary
+
+    Run the real NdLogin, NdBootstrap.send_bootstrap_configuration(), NdPollBootstrapStatus and NdPollInstallStatus,
+    unmodified, as many concurrent simulated bootstraps for a long time, against stand-in Nexus Dashboards
+    (NdFaultInjectingNd) that inject faults, to exercise the paths that only real hiccups reach today:
+    login_refresh, the 401/404/RequestException branches of both poll_once() methods, and the 405 (already sent) path.
+
+    `concurrency` worker threads each run one bootstrap after another (random NdTimeline, as in NdPollingSimulation)
+    until `duration` real seconds have passed.  Bootstraps are spread over `targets` stand-in Nexus Dashboards,
+    each with its own NdFaultPlan (random faults, plus the scripted `faults`), and share one NdAuthManager,
+    so 401 storms exercise coalesced re-authentication too.  Time runs `speed` times faster than real time
+    (a shared NdScaledClock), so a four-hour soak covers about 8 days of polling at the default speed.
+
+    Reports, besides outcomes and detection latency:
+
+    - stuck pollers: bootstraps that sent no request for stuck_after virtual seconds (counted once), or still running
+      when the soak ends and the in-flight bootstraps have had time to finish.
+    - leaks: requests.Session objects, file descriptors and threads still held once every bootstrap finished, compared with the start.
+    - memory growth: RSS, sampled every sample_interval real seconds.
+
+    ## Properties
+
+    - concurrency: (getter/setter) Number of concurrent simulated bootstraps. Default is 32.
+    - duration: (getter/setter) Real seconds during which new bootstraps start. Default is 300.
+    - failure_rate: (getter/setter) Fraction of timelines that fail at a random point. Default is 0.05.
+    - fault_interval: (getter/setter) Mean virtual seconds between random faults, per target (0 for scripted faults only). Default is 600.
+    - faults: (getter/setter) Scripted NdFault list, applied to every target, in virtual seconds since the start. Default is [].
+    - policy: (getter/setter) The (interval, retries) of both pollers. Default is (10, 300).
+    - sample_interval: (getter/setter) Real seconds between resource samples. Default is 10.
+    - seed: (getter/setter) Random seed for timelines and faults. Default is 0.
+    - speed: (getter/setter) Time compression factor (see NdScaledClock). Default is 50.
+    - stuck_after: (getter/setter) Virtual seconds without a request after which a bootstrap is stuck. Default is 600.
+    - targets: (getter/setter) Number of stand-in Nexus Dashboards. Default is 4.
+
+    ## Usage
+
+    ```python
+    instance = NdSoakTest()
+    instance.duration = 4 * 3600
+    instance.faults = [NdFault(start=3600, duration=300, kind="refused")]
+    report = instance.commit()
+    instance.print_report()
+    print(report.problems)
+    ```
+    """
+
+    # Login attempts (10 virtual seconds apart) before a run gives up on logging in, and likewise for the POST.
+    login_attempts: int = 30
+    post_attempts: int = 30
+
+    def __init__(self) -> None:
+        self.class_name: str = self.__class__.__name__
+        self._concurrency: int = 32
+        self._duration: float = 300.0
+        self._failure_rate: float = 0.05
+        self._fault_interval: float = 600.0
+        self._faults: list[NdFault] = []
+        self._policy: tuple[int, int] = (10, 300)
+        self._sample_interval: float = 10.0
+        self._seed: int = 0
+        self._speed: float = 50.0
+        self._stuck_after: float = 600.0
+        self._targets: int = 4
+        self._lock = threading.Lock()
+        self._active: dict[int, NdFaultInjectingNd] = {}
+        self._auth: NdAuthManager = NdAuthManager()
+        self._clock: NdScaledClock = NdScaledClock()
+        self._origin: float = 0.0
+        self._plans: list[NdFaultPlan] = []
+        self._stuck: set[int] = set()
+        self._report: NdSoakReport = NdSoakReport()
+
+    def login(self, context: NdContext) -> None:
+        """
+        Log in to the stand-in Nexus Dashboard of context, retrying through faults.
+
+        Raises if:
+            - no attempt succeeded (NdAuthenticationError)
+        """
+        method_name: str = inspect.stack()[0][3]
+        msg: str = ""
+
+        for _ in range(self.login_attempts):
+            nd_login = NdLogin()
+            nd_login.context = context
+            with contextlib.suppress(NdConnectionError):
+                nd_login.commit()
+            if nd_login.status:
+                return
+            context.clock.sleep(10)
+        msg = f"{self.class_name}.{method_name}: "
+        msg += f"Unable to login to {context.nd_ip} after {self.login_attempts} attempts."
+        raise NdAuthenticationError(msg)
+
+    def post(self, context: NdContext) -> int:
+        """
+        POST the (empty) bootstrap configuration with NdBootstrap.send_bootstrap_configuration(), retrying through faults.
+
+        Returns:
+            int: The status code of the last attempt (0 if it raised NdConnectionError).
+        """
+        nd_bootstrap = NdBootstrap()
+        nd_bootstrap.context = context
+        status_code = 0
+        for _ in range(self.post_attempts):
+            try:
+                return nd_bootstrap.send_bootstrap_configuration()
+            except NdConnectionError:
+                status_code = 0
+            except NdApiError as error:
+                status_code = error.status_code
+            context.clock.sleep(10)
+        return status_code
+
+    def run_one(self, index: int, rng: random.Random) -> None:
+        """
+        Run one simulated bootstrap (login, POST, bootstrap and install polling) and add the outcome to the report.
+        """
+        interval, retries = self._policy
+        timeline = NdTimeline(bootstrap_duration=rng.uniform(240.0, 900.0), install_duration=rng.uniform(600.0, 1800.0))
+        if rng.random() < self._failure_rate:
+            timeline.failure_at = rng.uniform(timeline.not_found_window, timeline.completed_at)
+        target = index % self._targets
+        adapter = NdFaultInjectingNd(timeline, self._clock, self._plans[target], self._origin)
+        context = NdContext()
+        context.nd_ip4 = f"192.0.2.{target + 1}"
+        context.nd_username = "admin"
+        context.clock = self._clock
+        context.adapter = adapter
+        context.auth = self._auth
+        context.cluster_state.update(cluster_name=f"soak-{index}")
+        with self._lock:
+            self._active[index] = adapter
+
+        completed = False
+        error: str = ""
+        try:
+            self.login(context)
+            if context.session is not None:
+                # Skip the per-request proxy/netrc environment lookups; nothing leaves the process.
+                context.session.trust_env = False
+            self.post(context)
+            nd_bootstrap_status = NdPollBootstrapStatus()
+            nd_bootstrap_status.context = context
+            nd_bootstrap_status.retries = retries
+            nd_bootstrap_status.interval = interval
+            if nd_bootstrap_status.commit().completed:
+                nd_install_status = NdPollInstallStatus()
+                nd_install_status.context = context
+                nd_install_status.retries = retries
+                nd_install_status.interval = interval
+                completed = nd_install_status.commit().completed
+        except NdBootstrapFailedError:
+            error = "NdBootstrapFailedError"
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            error = type(e).__name__
+            if not isinstance(e, NdBootstrapError):
+                error = f"{type(e).__module__}.{error}"
+        finally:
+            with self._lock:
+                del self._active[index]
+                self.record(adapter, context, completed, error)
+
+    def record(self, adapter: NdFaultInjectingNd, context: NdContext, completed: bool, error: str) -> None:
+        """
+        Add the outcome of one simulated bootstrap to the report.  error is the name of the exception it raised, if any,
+        qualified with its module if it is not an NdBootstrapError.  Called with self._lock held.
+        """
+        timeline = adapter.timeline
+        elapsed = self._clock.monotonic() - adapter.start
+        report = self._report
+        report.runs += 1
+        report.requests.append(adapter.requests)
+        report.relogins += context.cluster_state.reauth_count
+        report.already_sent += 1 if adapter.already_sent else 0
+        if timeline.failure_at is not None:
+            report.failures += 1
+        if error == "NdBootstrapFailedError":
+            report.failures_detected += 1
+            report.failure_detection.append(elapsed - (timeline.failure_at or 0.0))
+        elif error:
+            report.errors[error] += 1
+            if "." in error:
+                report.unexpected.add(error)
+        elif completed:
+            report.completed += 1
+            report.detection_latency.append(elapsed - timeline.completed_at)
+        elif timeline.failure_at is None:
+            report.gave_up += 1
+
+    def check_stuck(self, everything: bool = False) -> None:
+        """
+        Count the bootstraps that sent no request for stuck_after virtual seconds (or, if everything is True, every bootstrap still running).
+        """
+        now = self._clock.monotonic()
+        with self._lock:
+            for index, adapter in self._active.items():
+                if index not in self._stuck and (everything or now - adapter.last_request > self._stuck_after):
+                    self._stuck.add(index)
+                    self._report.stuck += 1
+
+    def commit(self) -> NdSoakReport:  # pylint: disable=too-many-locals
+        """
+        Run the soak test.  Blocks for about duration real seconds, plus the time the last bootstraps take to finish.
+
+        Returns:
+            NdSoakReport
+        """
+        method_name: str = inspect.stack()[0][3]
+        msg: str = ""
+
+        self._report = NdSoakReport()
+        self._active = {}
+        self._stuck = set()
+        self._clock = NdScaledClock()
+        self._clock.speed = self._speed
+        self._origin = self._clock.monotonic()
+        self._auth = NdAuthManager()
+        # Long enough for the last bootstraps to finish, including the default fault durations.
+        drain = (900.0 + 1800.0 + self._stuck_after) * 2 / self._speed
+        horizon = (self._duration + drain) * self._speed
+        rng = random.Random(self._seed)
+        self._plans = []
+        for _ in range(self._targets):
+            plan = NdFaultPlan(self._faults)
+            plan.extend(NdFaultPlan.generate(rng, horizon, self._fault_interval))
+            self._plans.append(plan)
+        counter = iter(range(sys.maxsize))
+        stop = threading.Event()
+
+        def worker(seed: int) -> None:
+            worker_rng = random.Random(seed)
+            while not stop.is_set():
+                with self._lock:
+                    index = next(counter)
+                self.run_one(index, worker_rng)
+
+        out = sys.stdout
+        started = time.monotonic()
+        self._report.samples.append(process_sample(0.0, 0, 0))
+        msg = f"{self.class_name}.{method_name}: "
+        msg += f"{self._concurrency} concurrent bootstraps against {self._targets} stand-in Nexus Dashboard(s) for {self._duration:.0f}s at speed {self._speed:g}, "
+        msg += f"{sum(len(plan.faults) for plan in self._plans)} faults scheduled."
+        print(msg)
+        # The pollers print every poll; discard that output for thousands of runs.
+        with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+            threads = [threading.Thread(target=worker, args=(rng.getrandbits(64),), name=f"soak-{number}", daemon=True) for number in range(self._concurrency)]
+            for thread in threads:
+                thread.start()
+            while (elapsed := time.monotonic() - started) < self._duration:
+                time.sleep(min(self._sample_interval, self._duration - elapsed))
+                self.sample(started, out)
+            stop.set()
+            deadline = time.monotonic() + drain
+            while any(thread.is_alive() for thread in threads) and time.monotonic() < deadline:
+                time.sleep(min(self._sample_interval, max(0.0, deadline - time.monotonic())))
+                self.sample(started, out)
+            self.check_stuck(everything=True)
+        gc.collect()
+        self.sample(started, out)
+        return self._report
+
+    def sample(self, started: float, out: object) -> None:
+        """
+        Check for stuck bootstraps, record an NdSoakSample, and print it to out.
+        """
+        self.check_stuck()
+        with self._lock:
+            runs, in_flight, stuck = self._report.runs, len(self._active), self._report.stuck
+        sample = process_sample(time.monotonic() - started, runs, in_flight)
+        self._report.samples.append(sample)
+        line = f"{self.class_name}: {sample.elapsed:7.0f}s runs {runs:>6} in flight {in_flight:>4} stuck {stuck:>3} "
+        line += f"rss {sample.rss / 2**20:7.1f} MiB fds {sample.open_fds:>5} sessions {sample.sessions:>5} threads {sample.threads:>4}"
+        print(line, file=out, flush=True)  # type: ignore[call-overload]
+
+    def print_report(self) -> None:
+        """
+        Print a summary of the last commit().
+        """
+        method_name: str = inspect.stack()[0][3]
+        msg: str = ""
+
+        report = self._report
+        msg = f"{self.class_name}.{method_name}: "
+        msg += f"{report.runs} bootstraps, policy {self._policy[0]}:{self._policy[1]}, seed {self._seed}, failure rate {self._failure_rate:.0%}"
+        print(msg)
+        print(f"  completed {report.completed}, gave up {report.gave_up}, failures detected {report.failures_detected}/{report.failures}, stuck {report.stuck}")
+        print(f"  POST retried and answered 405: {report.already_sent}, re-logins {report.relogins}")
+        for error, count in sorted(report.errors.items()):
+            print(f"  error {error}: {count}")
+        print(f"  requests per run mean/p95: {mean_p95(report.requests)}")
+        print(f"  detection latency s mean/p95: {mean_p95(report.detection_latency)}, failure detection s mean/p95: {mean_p95(report.failure_detection)}")
+        if report.samples:
+            first, last = report.samples[0], report.samples[-1]
+            print(f"  rss {first.rss / 2**20:.1f} -> {last.rss / 2**20:.1f} MiB (growth after warm-up {report.memory_growth / 2**20:+.1f} MiB)")
+            print(f"  at start/end: fds {first.open_fds}/{last.open_fds}, sessions {first.sessions}/{last.sessions}, threads {first.threads}/{last.threads}")
+        problems = report.problems
+        print(f"  problems: {'; '.join(problems) if problems else 'none'}")
+
+    @property
+    def concurrency(self) -> int:
+        """
+        getter: return the number of concurrent simulated bootstraps.
+        setter: set the number of concurrent simulated bootstraps.
+        """
+        return self._concurrency
+
+    @concurrency.setter
+    def concurrency(self, value: int) -> None:
+        if not isinstance(value, int) or value <= 0:
+            raise NdParameterError("Invalid concurrency: not a positive int.")
+        self._concurrency = value
+
+    @property
+    def duration(self) -> float:
+        """
+        getter: return the real seconds during which new bootstraps start.
+        setter: set the real seconds during which new bootstraps start.
+        """
+        return self._duration
+
+    @duration.setter
+    def duration(self, value: float) -> None:
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+            raise NdParameterError("Invalid duration: not a positive number.")
+        self._duration = float(value)
+
+    @property
+    def failure_rate(self) -> float:
+        """
+        getter: return the fraction of timelines that fail.
+        setter: set the fraction of timelines that fail.
+        """
+        return self._failure_rate
+
+    @failure_rate.setter
+    def failure_rate(self, value: float) -> None:
+        if not 0 <= value <= 1:
+            raise NdParameterError("Invalid failure_rate: not between 0 and 1.")
+        self._failure_rate = value
+
+    @property
+    def fault_interval(self) -> float:
+        """
+        getter: return the mean virtual seconds between random faults, per target.
+        setter: set the mean virtual seconds between random faults, per target (0 disables random faults).
+        """
+        return self._fault_interval
+
+    @fault_interval.setter
+    def fault_interval(self, value: float) -> None:
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0:
+            raise NdParameterError("Invalid fault_interval: not a non-negative number.")
+        self._fault_interval = float(value)
+
+    @property
+    def faults(self) -> list[NdFault]:
+        """
+        getter: return the scripted faults.
+        setter: set the scripted faults, applied to every target.
+        """
+        return self._faults
+
+    @faults.setter
+    def faults(self, value: list[NdFault]) -> None:
+        if not all(isinstance(fault, NdFault) and fault.kind in FAULT_KINDS for fault in value):
+            raise NdParameterError(f"Invalid faults: not a list of NdFault with kind in {', '.join(FAULT_KINDS)}.")
+        self._faults = list(value)
+
+    @property
+    def policy(self) -> tuple[int, int]:
+        """
+        getter: return the (interval, retries) of both pollers.
+        setter: set the (interval, retries) of both pollers.
+        """
+        return self._policy
+
+    @policy.setter
+    def policy(self, value: tuple[int, int]) -> None:
+        if len(value) != 2 or not all(isinstance(item, int) and item > 0 for item in value):
+            raise NdParameterError("Invalid policy: not an (interval, retries) tuple of positive ints.")
+        self._policy = (value[0], value[1])
+
+    @property
+    def report(self) -> NdSoakReport:
+        """
+        getter: return the report of the last commit().
+        """
+        return self._report
+
+    @property
+    def sample_interval(self) -> float:
+        """
+        getter: return the real seconds between resource samples.
+        setter: set the real seconds between resource samples.
+        """
+        return self._sample_interval
+
+    @sample_interval.setter
+    def sample_interval(self, value: float) -> None:
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+            raise NdParameterError("Invalid sample_interval: not a positive number.")
+        self._sample_interval = float(value)
+
+    @property
+    def seed(self) -> int:
+        """
+        getter: return the random seed.
+        setter: set the random seed.
+        """
+        return self._seed
+
+    @seed.setter
+    def seed(self, value: int) -> None:
+        if not isinstance(value, int):
+            raise NdParameterError("Invalid seed: not an int.")
+        self._seed = value
+
+    @property
+    def speed(self) -> float:
+        """
+        getter: return the time compression factor.
+        setter: set the time compression factor.
+        """
+        return self._speed
+
+    @speed.setter
+    def speed(self, value: float) -> None:
+        # Speed 0 (see NdScaledClock) would make every thread's sleeps advance one shared virtual time.
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+            raise NdParameterError("Invalid speed: not a positive number.")
+        self._speed = float(value)
+
+    @property
+    def stuck_after(self) -> float:
+        """
+        getter: return the virtual seconds without a request after which a bootstrap counts as stuck.
+        setter: set the virtual seconds without a request after which a bootstrap counts as stuck.
+        """
+        return self._stuck_after
+
+    @stuck_after.setter
+    def stuck_after(self, value: float) -> None:
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+            raise NdParameterError("Invalid stuck_after: not a positive number.")
+        self._stuck_after = float(value)
+
+    @property
+    def targets(self) -> int:
+        """
+        getter: return the number of stand-in Nexus Dashboards.
+        setter: set the number of stand-in Nexus Dashboards.
+        """
+        return self._targets
+
+    @targets.setter
+    def targets(self, value: int) -> None:
+        if not isinstance(value, int) or value <= 0:
+            raise NdParameterError("Invalid targets: not a positive int.")
+        self._targets = value
+
+
+def parse_fault(value: str) -> NdFault:
+    """
+    Parse a KIND:START:DURATION[:VALUE] command line argument.
+    """
+    parts = value.split(":")
+    try:
+        if parts[0] not in FAULT_KINDS or len(parts) not in (3, 4):
+            raise ValueError(value)
+        default_value = FAULT_KINDS[parts[0]][1]
+        return NdFault(start=float(parts[1]), duration=float(parts[2]), kind=parts[0], value=float(parts[3]) if len(parts) == 4 else default_value)
+    except ValueError as e:
+        msg = f"Invalid fault '{value}', expected KIND:START:DURATION[:VALUE] with KIND one of {', '.join(FAULT_KINDS)}, e.g. unauthorized:600:60"
+        raise argparse.ArgumentTypeError(msg) from e
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Soak-test the pollers and re-authentication paths against stand-in Nexus Dashboards that inject faults")
+    parser.add_argument("--duration", type=float, default=300, help="Real seconds during which new bootstraps start. Default is 300")
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent simulated bootstraps. Default is 32")
+    parser.add_argument("--targets", type=int, default=4, help="Stand-in Nexus Dashboards, each with its own faults. Default is 4")
+    parser.add_argument("--speed", type=float, default=50, help="Time compression factor. Default is 50")
+    parser.add_argument("--policy", type=parse_policy, default=(10, 300), help="Polling policy INTERVAL:RETRIES of both pollers. Default is 10:300")
+    parser.add_argument("--fault", type=parse_fault, action="append", default=[], help="Scripted fault KIND:START:DURATION[:VALUE] in virtual seconds (repeatable)")
+    parser.add_argument("--fault-interval", type=float, default=600, help="Mean virtual seconds between random faults per target, 0 to disable. Default is 600")
+    parser.add_argument("--failure-rate", type=float, default=0.05, help="Fraction of timelines that fail. Default is 0.05")
+    parser.add_argument("--stuck-after", type=float, default=600, help="Virtual seconds without a request after which a poller is stuck. Default is 600")
+    parser.add_argument("--sample-interval", type=float, default=10, help="Real seconds between resource samples. Default is 10")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed. Default is 0")
+    args = parser.parse_args()
+
+    soak = NdSoakTest()
+    soak.duration = args.duration
+    soak.concurrency = args.concurrency
+    soak.targets = args.targets
+    soak.speed = args.speed
+    soak.policy = args.policy
+    soak.faults = args.fault
+    soak.fault_interval = args.fault_interval
+    soak.failure_rate = args.failure_rate
+    soak.stuck_after = args.stuck_after
+    soak.sample_interval = args.sample_interval
+    soak.seed = args.seed
+    soak.commit()
+    soak.print_report()
+    sys.exit(1 if soak.report.problems else 0)
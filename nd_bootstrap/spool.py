@@ -0,0 +1,499 @@
+"""
+Nexus Dashboard Bootstrap Spool Directory
+
+Watch a spool directory for bootstrap configuration files and bootstrap each one as it arrives.
+"""
+
+import ctypes
+import ctypes.util
+import inspect
+import json
+import os
+import select
+import socket
+import struct
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict
+
+from nd_bootstrap.auth_manager import NdAuthManager
+from nd_bootstrap.bootstrap import NdBootstrap
+from nd_bootstrap.config import NdBootstrapConfig
+from nd_bootstrap.context import ADDRESS_SOURCES, NdContext
+from nd_bootstrap.events import NdEventBus
+from nd_bootstrap.exceptions import NdBootstrapError, NdParameterError
+
+# inotify(7) constants
+IN_CLOSE_WRITE: int = 0x00000008
+IN_MOVED_TO: int = 0x00000080
+IN_Q_OVERFLOW: int = 0x00004000
+IN_NONBLOCK: int = 0o4000
+IN_CLOEXEC: int = 0o2000000
+INOTIFY_EVENT: struct.Struct = struct.Struct("iIII")
+
+SPOOL_SUFFIXES: tuple[str, ...] = (".yaml", ".yml")
+
+
+class NdInotify:
+    """
+    # Summary
+
+    Minimal inotify(7) binding through ctypes (Linux only).
+
+    Raises OSError from the constructor if inotify is not available, so callers can fall back to polling.
+    """
+
+    def __init__(self) -> None:
+        libc_name = ctypes.util.find_library("c")
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("inotify is not available on this platform")
+        self._libc = libc
+        self._fd: int = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+
+    def add_watch(self, path: str, mask: int) -> None:
+        """
+        Watch path for the events in mask.
+        """
+        if self._libc.inotify_add_watch(self._fd, os.fsencode(path), ctypes.c_uint32(mask)) < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error), path)
+
+    def read(self, timeout: float) -> list[tuple[int, str]]:
+        """
+        Wait up to timeout seconds, and return the (mask, name) of each event received.
+        """
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return []
+        try:
+            data = os.read(self._fd, 65536)
+        except BlockingIOError:
+            return []
+        events: list[tuple[int, str]] = []
+        offset = 0
+        while offset + INOTIFY_EVENT.size <= len(data):
+            _, mask, _, length = INOTIFY_EVENT.unpack_from(data, offset)
+            offset += INOTIFY_EVENT.size
+            end = offset + length
+            name = data[offset:end].rstrip(b"\0")
+            offset = end
+            events.append((mask, os.fsdecode(name)))
+        return events
+
+    def close(self) -> None:
+        """
+        Close the inotify file descriptor.
+        """
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class NdSpoolWatcher:
+    """
+    # Summary
+
+    Report the files that arrive in a directory: with inotify where available (files written and
+    closed, or moved in), otherwise by listing the directory every poll_interval seconds.
+
+    Files already present when watching starts are reported first, and the directory is listed again
+    if the inotify queue overflows, so no file is missed.
+
+    ## Properties
+
+    - mode: (getter) "inotify" or "polling", once watching has started.
+    - path: (getter/setter) The directory to watch.
+    - poll_interval: (getter/setter) Seconds between listings when polling, and the longest wait for stop. Default is 2.
+    """
+
+    def __init__(self) -> None:
+        self.class_name: str = self.__class__.__name__
+        self._mode: str = ""
+        self._path: str = ""
+        self._poll_interval: float = 2.0
+
+    def listing(self) -> set[str]:
+        """
+        Return the names of the regular files in path.
+        """
+        with os.scandir(self._path) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+
+    def watch(self, stop: threading.Event) -> Iterator[list[str]]:
+        """
+        Yield lists of names of files that arrived, until stop is set.
+        """
+        try:
+            inotify: NdInotify | None = NdInotify()
+        except OSError:
+            inotify = None
+        if inotify is None:
+            self._mode = "polling"
+            yield from self.poll(stop)
+            return
+        self._mode = "inotify"
+        try:
+            inotify.add_watch(self._path, IN_CLOSE_WRITE | IN_MOVED_TO)
+            yield sorted(self.listing())
+            while not stop.is_set():
+                events = inotify.read(self._poll_interval)
+                if any(mask & IN_Q_OVERFLOW for mask, _ in events):
+                    yield sorted(self.listing())
+                elif events:
+                    yield [name for _, name in events if name]
+        finally:
+            inotify.close()
+
+    def poll(self, stop: threading.Event) -> Iterator[list[str]]:
+        """
+        Yield lists of names of files that appeared since the previous listing, until stop is set.
+        """
+        seen: set[str] = set()
+        while not stop.is_set():
+            names = self.listing()
+            if names - seen:
+                yield sorted(names - seen)
+            seen = names
+            stop.wait(self._poll_interval)
+
+    @property
+    def mode(self) -> str:
+        """
+        getter: return "inotify" or "polling", once watching has started.
+        """
+        return self._mode
+
+    @property
+    def path(self) -> str:
+        """
+        getter: return the directory to watch.
+        setter: set the directory to watch.
+        """
+        return self._path
+
+    @path.setter
+    def path(self, value: str) -> None:
+        if not value or not isinstance(value, str):
+            raise NdParameterError("Invalid path: empty or not a string.")
+        self._path = value
+
+    @property
+    def poll_interval(self) -> float:
+        """
+        getter: return the number of seconds between listings when polling.
+        setter: set the number of seconds between listings when polling.
+        """
+        return self._poll_interval
+
+    @poll_interval.setter
+    def poll_interval(self, value: float) -> None:
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+            raise NdParameterError("Invalid poll_interval: not a positive number.")
+        self._poll_interval = float(value)
+
+
+class NdSpoolRunner:
+    """
+    # Summary
+
+    Bootstrap every configuration file (*.yaml, *.yml) that arrives in a spool directory, as soon as
+    it arrives, with up to max_workers bootstraps running concurrently.
+
+    ## Spool directory layout
+
+    - `<spool_dir>/`: Incoming configuration files.  Write them elsewhere (or with a leading ".") and
+      rename them in, so that a half-written file is never picked up.
+    - `<spool_dir>/claimed/`: Files being bootstrapped.  A file is claimed by renaming it here under a
+      unique name; rename is atomic, so when several runners watch the same spool directory, each file
+      is bootstrapped at most once.  Files left here by a runner that crashed need attention.
+    - `<spool_dir>/done/`: Files bootstrapped successfully, each with a `.json` summary of the result.
+    - `<spool_dir>/failed/`: Files that failed validation (NdBootstrapConfig) or bootstrap, each with a
+      `.json` summary of the error.  A bootstrap fails if it raises, or if its result reports a failure
+      (see NdBootstrapResult.failure: e.g. the POST was not accepted, or polling ran out of retries).
+
+    Each claimed file is validated with NdBootstrapConfig before a worker is used, and bootstrapped
+    with its own NdContext, built from the environment (credentials, ND_IP_PROTOCOL), whose address is:
+
+    - address_source "environment": ND_IP4 / ND_IP6 (every file targets the same Nexus Dashboard).
+    - address_source "config": the managementNetwork address(es) of the node with `self: true`
+      (the node on which the CLI-based initial setup was performed).
+
+    ## Properties
+
+    - address_source: (getter/setter) "environment" or "config". Default is "environment".
+    - configure: (getter/setter) Optional callable, called with each NdBootstrap before commit (e.g. to set poll, retries, interval).
+    - events: (getter/setter) Optional NdEventBus shared by every bootstrap. Default is None.
+    - max_workers: (getter/setter) The maximum number of concurrent bootstraps. Default is 4.
+    - poll_interval: (getter/setter) Seconds between directory listings if inotify is not available. Default is 2.
+    - spool_dir: (getter/setter) The spool directory.
+
+    ## Usage
+
+    ```python
+    runner = NdSpoolRunner()
+    runner.spool_dir = "/var/spool/nd_bootstrap"
+    runner.configure = lambda instance: setattr(instance, "poll", True)
+    runner.commit()  # runs until runner.stop() is called (e.g. from another thread) or KeyboardInterrupt
+    ```
+    """
+
+    def __init__(self) -> None:
+        self.class_name: str = self.__class__.__name__
+        self._address_source: str = "environment"
+        self._configure: Callable[[NdBootstrap], None] | None = None
+        self._counter: int = 0
+        self._auth: NdAuthManager = NdAuthManager()
+        self._events: NdEventBus | None = None
+        self._lock = threading.Lock()
+        self._max_workers: int = 4
+        self._poll_interval: float = 2.0
+        self._spool_dir: str = ""
+        self._stop = threading.Event()
+
+    def folder(self, name: str) -> str:
+        """
+        Return the path of the claimed, done or failed folder.
+        """
+        return os.path.join(self._spool_dir, name)
+
+    @staticmethod
+    def is_config(name: str) -> bool:
+        """
+        Return True if name looks like a configuration file (*.yaml or *.yml, not hidden).
+        """
+        return not name.startswith(".") and name.endswith(SPOOL_SUFFIXES)
+
+    def claim(self, name: str) -> str:
+        """
+        Atomically move name from the spool directory to the claimed folder, and return its new path,
+        or "" if name was claimed by another runner.
+        """
+        stem, suffix = os.path.splitext(name)
+        with self._lock:
+            self._counter += 1
+            job_id = f"{stem}.{time.strftime('%Y%m%dT%H%M%S')}.{socket.gethostname()}-{os.getpid()}-{self._counter}"
+        claimed = os.path.join(self.folder("claimed"), job_id + suffix)
+        try:
+            os.rename(os.path.join(self._spool_dir, name), claimed)
+        except FileNotFoundError:
+            # Another runner won.
+            return ""
+        return claimed
+
+    def finish(self, claimed: str, outcome: str, summary: dict) -> None:
+        """
+        Move claimed to the done or failed folder (outcome), with summary written next to it as JSON.
+        """
+        destination = os.path.join(self.folder(outcome), os.path.basename(claimed))
+        with open(os.path.splitext(destination)[0] + ".json", "w", encoding="utf-8") as summary_file:
+            json.dump(summary, summary_file, indent=2, default=str)
+        os.replace(claimed, destination)
+
+    def context_for(self, nd_bootstrap_config: NdBootstrapConfig) -> NdContext:
+        """
+        Return a new NdContext for the Nexus Dashboard targeted by nd_bootstrap_config (see address_source).
+        """
+        if self._address_source == "config":
+            context = NdContext.from_config(nd_bootstrap_config.config)
+        else:
+            context = NdContext.from_environment()
+        if self._events is not None:
+            context.events = self._events
+        # Jobs for the same Nexus Dashboard re-authenticate once between them.
+        context.auth = self._auth
+        return context
+
+    def run_job(self, claimed: str, nd_bootstrap_config: NdBootstrapConfig) -> None:
+        """
+        Bootstrap one claimed configuration file, then move it to done or failed.  Runs in a worker thread,
+        whose future nobody waits on, so every exception is recorded here: an error other than
+        NdBootstrapError moves the file to failed too, with its error_type qualified by its module.
+        """
+        method_name: str = inspect.stack()[0][3]
+        msg: str = ""
+
+        started = time.time()
+        summary: dict = {"config_file": os.path.basename(claimed), "cluster_name": nd_bootstrap_config.nd_cluster_name, "started": started}
+        try:
+            instance = NdBootstrap()
+            instance.context = self.context_for(nd_bootstrap_config)
+            instance.nd_bootstrap_config = nd_bootstrap_config
+            if self._configure is not None:
+                self._configure(instance)
+            result = instance.commit()
+            summary.update(result=asdict(result))
+            if result.failure:
+                summary.update(error=result.failure)
+        except NdBootstrapError as error:
+            summary.update(error=str(error), error_type=type(error).__name__)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            summary.update(error=str(error), error_type=f"{type(error).__module__}.{type(error).__name__}")
+        summary.update(elapsed=time.time() - started)
+        outcome = "failed" if "error" in summary else "done"
+        try:
+            self.finish(claimed, outcome, summary)
+        except OSError as error:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"{os.path.basename(claimed)}: unable to move to {outcome}, left in claimed: {str(error)}"
+            print(msg)
+            return
+        msg = f"{self.class_name}.{method_name}: "
+        if outcome == "failed":
+            msg += f"{os.path.basename(claimed)}: bootstrap failed: {summary['error']}"
+        else:
+            msg += f"{os.path.basename(claimed)}: {result.action} of cluster '{result.cluster_name}' done in {summary['elapsed']:.1f} seconds."
+        print(msg)
+
+    def accept(self, name: str, executor: ThreadPoolExecutor) -> Future | None:
+        """
+        Claim and validate name, and hand it to executor.  Invalid files go straight to the failed folder.
+        """
+        method_name: str = inspect.stack()[0][3]
+        msg: str = ""
+
+        claimed = self.claim(name)
+        if not claimed:
+            return None
+        nd_bootstrap_config = NdBootstrapConfig()
+        nd_bootstrap_config.config_file = claimed
+        try:
+            nd_bootstrap_config.commit()
+        except (NdBootstrapError, ValueError, AttributeError, TypeError) as error:
+            # Malformed YAML raises yaml.YAMLError (a ValueError subclass) or a type error on non-mapping content.
+            self.finish(claimed, "failed", {"config_file": os.path.basename(claimed), "error": str(error), "error_type": type(error).__name__})
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"{name}: invalid configuration, moved to failed: {str(error)}"
+            print(msg)
+            return None
+        msg = f"{self.class_name}.{method_name}: "
+        msg += f"{name}: claimed as {os.path.basename(claimed)}, bootstrapping cluster '{nd_bootstrap_config.nd_cluster_name}'."
+        print(msg)
+        return executor.submit(self.run_job, claimed, nd_bootstrap_config)
+
+    def commit(self) -> None:
+        """
+        Watch spool_dir and bootstrap each configuration file that arrives, until stop() is called.
+        Bootstraps in progress are finished before returning.
+
+        Raises if:
+            - instance.spool_dir is not set
+        """
+        method_name: str = inspect.stack()[0][3]
+        msg: str = ""
+
+        if not self._spool_dir:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "instance.spool_dir must be set before calling instance.commit."
+            raise NdParameterError(msg)
+        for name in ("claimed", "done", "failed"):
+            os.makedirs(self.folder(name), exist_ok=True)
+
+        watcher = NdSpoolWatcher()
+        watcher.path = self._spool_dir
+        watcher.poll_interval = self._poll_interval
+        self._stop.clear()
+        with ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="nd-spool") as executor:
+            for names in watcher.watch(self._stop):
+                names = [name for name in names if self.is_config(name)]
+                if names:
+                    msg = f"{self.class_name}.{method_name}: "
+                    msg += f"{len(names)} new file(s) in {self._spool_dir} ({watcher.mode})."
+                    print(msg)
+                for name in names:
+                    self.accept(name, executor)
+
+    def stop(self) -> None:
+        """
+        Stop watching.  commit() returns once the bootstraps in progress are finished.
+        """
+        self._stop.set()
+
+    @property
+    def address_source(self) -> str:
+        """
+        getter: return where the Nexus Dashboard address of each configuration comes from.
+        setter: set where the Nexus Dashboard address of each configuration comes from ("environment" or "config").
+        """
+        return self._address_source
+
+    @address_source.setter
+    def address_source(self, value: str) -> None:
+        if value not in ADDRESS_SOURCES:
+            raise NdParameterError(f"Invalid address_source: {value}. Expected one of {', '.join(ADDRESS_SOURCES)}.")
+        self._address_source = value
+
+    @property
+    def configure(self) -> Callable[[NdBootstrap], None] | None:
+        """
+        getter: return the callable applied to each NdBootstrap before commit, or None.
+        setter: set the callable applied to each NdBootstrap before commit.
+        """
+        return self._configure
+
+    @configure.setter
+    def configure(self, value: Callable[[NdBootstrap], None]) -> None:
+        if not callable(value):
+            raise NdParameterError("Invalid configure: not callable.")
+        self._configure = value
+
+    @property
+    def events(self) -> NdEventBus | None:
+        """
+        getter: return the NdEventBus shared by every bootstrap, or None.
+        setter: set the NdEventBus shared by every bootstrap.
+        """
+        return self._events
+
+    @events.setter
+    def events(self, value: NdEventBus) -> None:
+        if not isinstance(value, NdEventBus):
+            raise NdParameterError("Invalid events: not an NdEventBus instance.")
+        self._events = value
+
+    @property
+    def max_workers(self) -> int:
+        """
+        getter: return the maximum number of concurrent bootstraps.
+        setter: set the maximum number of concurrent bootstraps.
+        """
+        return self._max_workers
+
+    @max_workers.setter
+    def max_workers(self, value: int) -> None:
+        if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+            raise NdParameterError("Invalid max_workers: not a positive int.")
+        self._max_workers = value
+
+    @property
+    def poll_interval(self) -> float:
+        """
+        getter: return the number of seconds between directory listings if inotify is not available.
+        setter: set the number of seconds between directory listings if inotify is not available.
+        """
+        return self._poll_interval
+
+    @poll_interval.setter
+    def poll_interval(self, value: float) -> None:
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+            raise NdParameterError("Invalid poll_interval: not a positive number.")
+        self._poll_interval = float(value)
+
+    @property
+    def spool_dir(self) -> str:
+        """
+        getter: return the spool directory.
+        setter: set the spool directory.
+        """
+        return self._spool_dir
+
+    @spool_dir.setter
+    def spool_dir(self, value: str) -> None:
+        if not value or not isinstance(value, str):
+            raise NdParameterError("Invalid spool_dir: empty or not a string.")
+        self._spool_dir = value
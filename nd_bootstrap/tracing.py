@@ -0,0 +1,413 @@
+"""
+Nexus Dashboard Bootstrap Tracing
+
+Trace spans for workflow stages, polls and HTTP requests, exported to rotating local OTLP-JSON files.
+"""
+
+import inspect
+import json
+import os
+import socket
+import threading
+import time
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from nd_bootstrap.exceptions import NdParameterError
+
+if TYPE_CHECKING:
+    # NdContext holds an NdTracer, so import it for type checking only.
+    from nd_bootstrap.context import NdContext
+
+# OTLP span kinds and status codes (opentelemetry/proto/trace/v1/trace.proto)
+SPAN_KIND_INTERNAL: int = 1
+SPAN_KIND_CLIENT: int = 3
+STATUS_CODE_UNSET: int = 0
+STATUS_CODE_OK: int = 1
+STATUS_CODE_ERROR: int = 2
+
+
+def otlp_value(value: object) -> dict:
+    """
+    Return value as an OTLP-JSON AnyValue.
+    """
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        # 64-bit integers are encoded as strings in OTLP-JSON
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def otlp_attributes(attributes: dict[str, object]) -> list[dict]:
+    """
+    Return attributes as a list of OTLP-JSON KeyValue.
+    """
+    return [{"key": key, "value": otlp_value(value)} for key, value in attributes.items()]
+
+
+class NdSpan:
+    """
+    # Summary
+
+    One traced operation.  Created by NdTracer.span(); not recorded if the tracer is disabled.
+
+    ## Methods
+
+    - set_attribute(key, value): Set an attribute (str, int, float or bool).
+    - record_exception(error): Add an "exception" event and set the status to error.
+    """
+
+    def __init__(self, name: str, kind: int = SPAN_KIND_INTERNAL, trace_id: str = "", span_id: str = "", parent_span_id: str = "") -> None:
+        self.name = name
+        self.kind = kind
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.parent_span_id = parent_span_id
+        self.start_time: int = time.time_ns()
+        self.end_time: int = 0
+        self.attributes: dict[str, object] = {}
+        self.events: list[dict] = []
+        self.status_code: int = STATUS_CODE_UNSET
+        self.status_message: str = ""
+
+    def set_attribute(self, key: str, value: object) -> None:
+        """
+        Set the attribute key to value.  None values are ignored.
+        """
+        if value is not None:
+            self.attributes[key] = value
+
+    def record_exception(self, error: BaseException) -> None:
+        """
+        Add an "exception" event for error and set the span status to error.
+        """
+        self.events.append(
+            {
+                "timeUnixNano": str(time.time_ns()),
+                "name": "exception",
+                "attributes": otlp_attributes({"exception.type": type(error).__name__, "exception.message": str(error)}),
+            }
+        )
+        self.status_code = STATUS_CODE_ERROR
+        self.status_message = str(error)
+
+    def to_otlp(self) -> dict:
+        """
+        Return the span as an OTLP-JSON Span.
+        """
+        span: dict = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_time),
+            "endTimeUnixNano": str(self.end_time),
+            "attributes": otlp_attributes(self.attributes),
+            "status": {"code": self.status_code},
+        }
+        if self.parent_span_id:
+            span["parentSpanId"] = self.parent_span_id
+        if self.events:
+            span["events"] = self.events
+        if self.status_message:
+            span["status"]["message"] = self.status_message
+        return span
+
+
+class NdTracingAdapter(HTTPAdapter):
+    """
+    # Summary
+
+    requests transport adapter that opens a client span for every HTTP request, then hands the
+    request to an inner adapter (the requests default adapter, or e.g. an NdCassetteRecorder).
+
+    Installed by NdTracer.attach().
+    """
+
+    def __init__(self, tracer: "NdTracer", inner: HTTPAdapter | None = None) -> None:
+        super().__init__()
+        self.inner: HTTPAdapter = inner if inner is not None else HTTPAdapter()
+        self.tracer = tracer
+
+    def send(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: float | tuple[float, float] | tuple[float, None] | None = None,
+        verify: bool | str = True,
+        cert: bytes | str | tuple[bytes | str, bytes | str] | None = None,
+        proxies: Mapping[str, str] | None = None,
+    ) -> requests.Response:
+        """
+        Send the request with the inner adapter, inside a client span.
+        """
+        path = str(request.path_url)
+        with self.tracer.span(f"{request.method} {path}", kind=SPAN_KIND_CLIENT) as span:
+            span.set_attribute("http.request.method", request.method)
+            span.set_attribute("url.path", path)
+            span.set_attribute("server.address", urlsplit(str(request.url)).hostname)
+            response = self.inner.send(request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+            span.set_attribute("http.response.status_code", response.status_code)
+            if response.status_code >= 400:
+                span.status_code = STATUS_CODE_ERROR
+            return response
+
+    def close(self) -> None:
+        """
+        Close the inner adapter.
+        """
+        self.inner.close()
+        super().close()
+
+
+class NdTracer:
+    """
+    # Summary
+
+    Record trace spans for workflow stages (NdBootstrap.commit() phases), poll samples, logins
+    and HTTP requests, and export them to a local file in OTLP-JSON, one ExportTraceServiceRequest
+    per line (the format written by the OpenTelemetry Collector file exporter).  The file can be
+    loaded into a trace viewer (e.g. Jaeger or Grafana Tempo, through an OpenTelemetry Collector
+    otlpjsonfile receiver) to see where the time of a slow bootstrap went, across stages and retries.
+
+    Spans nest per thread: a span opened while another is open on the same thread is its child.
+    A span opened with none open starts a new trace.  Finished spans are buffered and written when
+    a trace's root span ends, or when max_buffered spans are waiting.
+
+    The file is rotated like logging.handlers.RotatingFileHandler: when a write would make it larger
+    than max_bytes, FILE is renamed FILE.1 (FILE.1 to FILE.2, ...), keeping backup_count old files.
+
+    When disabled (the default on a new NdContext), spans are not recorded or written.
+
+    ## Properties
+
+    - backup_count: (getter/setter) The number of rotated files to keep. Default is 5.
+    - enabled: (getter/setter) Whether spans are recorded. Default is False.
+    - max_buffered: (getter/setter) Write buffered spans when this many are waiting. Default is 512.
+    - max_bytes: (getter/setter) Rotate the file before it grows beyond this size. Default is 10 MiB. 0 disables rotation.
+    - trace_file: (getter/setter) The OTLP-JSON file spans are written to.
+
+    ## Usage
+
+    ```python
+    tracer = NdTracer()
+    tracer.trace_file = "nd_bootstrap.otlp.jsonl"
+    tracer.enabled = True
+    tracer.attach(context)  # before NdLogin creates the session
+    with tracer.span("bootstrap", {"nd.cluster.name": "nd-cluster-1"}):
+        ...
+    tracer.flush()
+    ```
+    """
+
+    def __init__(self) -> None:
+        self.class_name: str = self.__class__.__name__
+        self._backup_count: int = 5
+        self._buffer: list[NdSpan] = []
+        self._enabled: bool = False
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._max_buffered: int = 512
+        self._max_bytes: int = 10 * 1024 * 1024
+        self._resource_attributes: dict[str, object] = {
+            "service.name": "nd_bootstrap",
+            "host.name": socket.gethostname(),
+            "process.pid": os.getpid(),
+        }
+        self._trace_file: str = ""
+
+    def attach(self, context: "NdContext") -> None:
+        """
+        Set context.tracer to this tracer and wrap context.adapter so that every HTTP request gets a span.
+
+        Call this before NdLogin creates the session, and after any other adapter (e.g. a cassette) is set.
+        """
+        context.tracer = self
+        context.adapter = NdTracingAdapter(self, context.adapter)
+
+    @property
+    def stack(self) -> list[NdSpan]:
+        """
+        getter: return the spans open on the calling thread, innermost last.
+        """
+        stack: list[NdSpan] | None = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = []
+            self._local.stack = stack
+        return stack
+
+    def current_span(self) -> NdSpan:
+        """
+        Return the innermost span open on the calling thread, or an unrecorded span if there is none.
+        """
+        stack = self.stack
+        return stack[-1] if stack else NdSpan("unrecorded")
+
+    @contextmanager
+    def span(self, name: str, attributes: dict[str, object] | None = None, kind: int = SPAN_KIND_INTERNAL) -> Iterator[NdSpan]:
+        """
+        Record the enclosed block as a span called name, with attributes (keys follow OpenTelemetry naming, e.g. "nd.cluster.name").
+
+        An exception raised in the block is recorded on the span (and re-raised).
+        """
+        if not self._enabled:
+            yield NdSpan(name, kind)
+            return
+        stack = self.stack
+        parent = stack[-1] if stack else None
+        span = NdSpan(
+            name,
+            kind,
+            trace_id=parent.trace_id if parent else os.urandom(16).hex(),
+            span_id=os.urandom(8).hex(),
+            parent_span_id=parent.span_id if parent else "",
+        )
+        for key, value in (attributes or {}).items():
+            span.set_attribute(key, value)
+        stack.append(span)
+        try:
+            yield span
+        except BaseException as error:
+            span.record_exception(error)
+            raise
+        finally:
+            span.end_time = time.time_ns()
+            stack.pop()
+            with self._lock:
+                self._buffer.append(span)
+                flush = parent is None or len(self._buffer) >= self._max_buffered
+            if flush:
+                self.flush()
+
+    def set_attribute(self, key: str, value: object) -> None:
+        """
+        Set an attribute on the innermost span open on the calling thread (if any).
+        """
+        self.current_span().set_attribute(key, value)
+
+    def flush(self) -> None:
+        """
+        Write the buffered spans to trace_file as one OTLP-JSON line, rotating the file first if needed.
+        """
+        with self._lock:
+            spans, self._buffer = self._buffer, []
+            if not spans or not self._trace_file:
+                return
+            request = {
+                "resourceSpans": [
+                    {
+                        "resource": {"attributes": otlp_attributes(self._resource_attributes)},
+                        "scopeSpans": [{"scope": {"name": "nd_bootstrap"}, "spans": [span.to_otlp() for span in spans]}],
+                    }
+                ]
+            }
+            line = json.dumps(request, separators=(",", ":")) + "\n"
+            self.rotate(len(line.encode("utf-8")))
+            with open(self._trace_file, "a", encoding="utf-8") as trace_file:
+                trace_file.write(line)
+
+    def rotate(self, pending_bytes: int) -> None:
+        """
+        Rotate trace_file if writing pending_bytes would make it larger than max_bytes.  Called with the lock held.
+        """
+        if self._max_bytes <= 0 or self._backup_count <= 0:
+            return
+        try:
+            size = os.path.getsize(self._trace_file)
+        except OSError:
+            return
+        if size == 0 or size + pending_bytes <= self._max_bytes:
+            return
+        for index in range(self._backup_count - 1, 0, -1):
+            source = f"{self._trace_file}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self._trace_file}.{index + 1}")
+        os.replace(self._trace_file, f"{self._trace_file}.1")
+
+    @property
+    def backup_count(self) -> int:
+        """
+        getter: return the number of rotated files to keep.
+        setter: set the number of rotated files to keep.
+        """
+        return self._backup_count
+
+    @backup_count.setter
+    def backup_count(self, value: int) -> None:
+        if not isinstance(value, int) or value < 0:
+            raise NdParameterError("Invalid backup_count: not a non-negative int.")
+        self._backup_count = value
+
+    @property
+    def enabled(self) -> bool:
+        """
+        getter: return whether spans are recorded.
+        setter: set whether spans are recorded.
+
+        Raises if:
+            - enabled is set to True while trace_file is not set
+        """
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        method_name: str = inspect.stack()[0][3]
+        msg: str = ""
+
+        if not isinstance(value, bool):
+            raise NdParameterError("Invalid enabled: not a boolean.")
+        if value and not self._trace_file:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "instance.trace_file must be set before enabling the tracer."
+            raise NdParameterError(msg)
+        self._enabled = value
+
+    @property
+    def max_buffered(self) -> int:
+        """
+        getter: return the number of buffered spans that triggers a write.
+        setter: set the number of buffered spans that triggers a write.
+        """
+        return self._max_buffered
+
+    @max_buffered.setter
+    def max_buffered(self, value: int) -> None:
+        if not isinstance(value, int) or value < 1:
+            raise NdParameterError("Invalid max_buffered: not a positive int.")
+        self._max_buffered = value
+
+    @property
+    def max_bytes(self) -> int:
+        """
+        getter: return the size at which the file is rotated.
+        setter: set the size at which the file is rotated. 0 disables rotation.
+        """
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int) -> None:
+        if not isinstance(value, int) or value < 0:
+            raise NdParameterError("Invalid max_bytes: not a non-negative int.")
+        self._max_bytes = value
+
+    @property
+    def trace_file(self) -> str:
+        """
+        getter: return the OTLP-JSON file spans are written to.
+        setter: set the OTLP-JSON file spans are written to.
+        """
+        return self._trace_file
+
+    @trace_file.setter
+    def trace_file(self, value: str) -> None:
+        if not value or not isinstance(value, str):
+            raise NdParameterError("Invalid trace_file: empty or not a string.")
+        self._trace_file = value
@@ -0,0 +1,237 @@
+"""
+Nexus Dashboard Bootstrap Transport
+
+The HTTPS transport shared by every session of a context: one connection pool, TLS session resumption
+across re-logins, and pre-opening the connection to Nexus Dashboard while local work runs.
+"""
+
+import socket
+import ssl
+import threading
+from collections.abc import Callable, Mapping
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPConnectionPool
+from urllib3.util.wait import wait_for_read
+
+# (server_hostname, port) of a TLS connection
+SessionKey = tuple[str | bytes | None, int]
+
+
+class NdResumingSSLSocket(ssl.SSLSocket):  # pylint: disable=abstract-method
+    """
+    SSLSocket that hands its TLS session to its NdResumingSSLContext when closed, for the next connection
+    to the same host and port.  (With TLS 1.3, the session ticket only arrives after the handshake.)
+    """
+
+    session_key: SessionKey | None = None
+
+    def close(self) -> None:
+        """
+        Save the TLS session, then close the socket.
+        """
+        if isinstance(self.context, NdResumingSSLContext) and self.session_key is not None:
+            self.context.save_session(self.session_key, self.session)
+        super().close()
+
+
+class NdResumingSSLContext(ssl.SSLContext):
+    """
+    # Summary
+
+    Client SSLContext that resumes TLS sessions: each new connection to a host and port offers
+    the session of the last connection to it that was closed, so that a reconnect (e.g. after
+    Nexus Dashboard closed an idle connection, or restarted services during install) costs an
+    abbreviated handshake instead of a full one.
+
+    ## Properties
+
+    - handshakes: (getter) Number of TLS handshakes.
+    - resumed: (getter) Number of those that resumed a previous session.
+    """
+
+    def __init__(self, protocol: int = ssl.PROTOCOL_TLS_CLIENT) -> None:  # pylint: disable=unused-argument
+        # ssl.SSLContext.__new__ takes the protocol.
+        super().__init__()
+        self.sslsocket_class = NdResumingSSLSocket
+        self._handshakes: int = 0
+        self._lock = threading.Lock()
+        self._resumed: int = 0
+        self._sessions: dict[SessionKey, ssl.SSLSession] = {}
+
+    def save_session(self, key: SessionKey, session: ssl.SSLSession | None) -> None:
+        """
+        Remember session for the next connection to key.
+        """
+        if session is None:
+            return
+        with self._lock:
+            self._sessions[key] = session
+
+    def wrap_socket(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        sock: socket.socket,
+        server_side: bool = False,
+        do_handshake_on_connect: bool = True,
+        suppress_ragged_eofs: bool = True,
+        server_hostname: str | bytes | None = None,
+        session: ssl.SSLSession | None = None,
+    ) -> ssl.SSLSocket:
+        """
+        Wrap sock, offering the last session saved for the same host and port.
+        """
+        key: SessionKey = (server_hostname, sock.getpeername()[1])
+        if session is None:
+            with self._lock:
+                session = self._sessions.get(key)
+        try:
+            ssl_sock = super().wrap_socket(sock, server_side, do_handshake_on_connect, suppress_ragged_eofs, server_hostname, session)
+        except ssl.SSLError:
+            # Perhaps a session the server no longer accepts; the next attempt does a full handshake.
+            with self._lock:
+                self._sessions.pop(key, None)
+            raise
+        if isinstance(ssl_sock, NdResumingSSLSocket):
+            ssl_sock.session_key = key
+        with self._lock:
+            self._handshakes += 1
+            self._resumed += bool(ssl_sock.session_reused)
+        return ssl_sock
+
+    @property
+    def handshakes(self) -> int:
+        """
+        getter: return the number of TLS handshakes.
+        """
+        return self._handshakes
+
+    @property
+    def resumed(self) -> int:
+        """
+        getter: return the number of TLS handshakes that resumed a previous session.
+        """
+        return self._resumed
+
+
+class NdTransportAdapter(HTTPAdapter):
+    """
+    # Summary
+
+    requests transport adapter used by default (NdContext.adapter) for every session of a context,
+    so that the sessions NdLogin creates at startup and on each re-authentication share one
+    connection pool: a re-login reuses the open connection instead of doing a new TLS handshake.
+    New connections resume the previous TLS session (see NdResumingSSLContext).
+
+    prewarm() opens a pooled connection from a background thread, so that the TCP and TLS
+    handshakes overlap with local work.  The first request waits for that connection rather than
+    opening a second one.
+
+    pool_connections and pool_maxsize are those of HTTPAdapter: the number of hosts whose connections
+    are kept (least recently used first out), and the connections kept per host.  NdFleetMonitor shares
+    one adapter between thousands of Nexus Dashboards.
+
+    ## Properties
+
+    - handshakes: (getter) Number of TLS handshakes.
+    - resumed: (getter) Number of TLS handshakes that resumed a previous session.
+
+    ## Usage
+
+    ```python
+    context.prewarm()  # context.adapter is an NdTransportAdapter unless set to another adapter
+    ```
+    """
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10) -> None:
+        self.class_name: str = self.__class__.__name__
+        # urllib3 sets verify_mode per connection (from the session's verify) and, with check_hostname off,
+        # matches the hostname itself when verifying, so one SSLContext (and session cache) serves both.
+        self._ssl_context = NdResumingSSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        self._ssl_context.check_hostname = False
+        self._ssl_context.load_default_certs()
+        self._warming: threading.Thread | None = None
+        super().__init__(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Create the pool manager, with the resuming SSLContext for every HTTPS connection pool.
+        """
+        kwargs.setdefault("ssl_context", self._ssl_context)
+        super().init_poolmanager(*args, **kwargs)
+
+    def connect(self, url: str, verify: bool | str) -> None:
+        """
+        Open a connection to the host of url, and leave it in the pool for the next request.
+        """
+        request = requests.Request("GET", url).prepare()
+        pool = self.get_connection_with_tls_context(request, verify)
+        if not isinstance(pool, HTTPConnectionPool):
+            return
+        # urllib3 has no public API to open a pooled connection without sending a request.
+        connection = pool._get_conn()  # pylint: disable=protected-access
+        try:
+            connection.timeout = 10
+            connection.connect()
+            # Read the TLS 1.3 session tickets the server sends after the handshake; unread, they make
+            # the idle connection look dropped to urllib3, which would then discard it.
+            sock = getattr(connection, "sock", None)
+            if isinstance(sock, ssl.SSLSocket) and wait_for_read(sock, timeout=0.1):
+                timeout = sock.gettimeout()
+                sock.settimeout(0)
+                try:
+                    sock.recv(1)
+                except ssl.SSLWantReadError:
+                    pass
+                finally:
+                    sock.settimeout(timeout)
+        finally:
+            pool._put_conn(connection)  # pylint: disable=protected-access
+
+    def prewarm(self, url: Callable[[], str], verify: bool | str) -> None:
+        """
+        Call connect(url(), verify) from a background thread.  Errors are ignored: the first request reports them.
+        """
+
+        def warm() -> None:
+            try:
+                self.connect(url(), verify)
+            except Exception:  # pylint: disable=broad-exception-caught
+                pass
+
+        self._warming = threading.Thread(target=warm, name="nd-prewarm", daemon=True)
+        self._warming.start()
+
+    def send(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: float | tuple[float, float] | tuple[float, None] | None = None,
+        verify: bool | str = True,
+        cert: bytes | str | tuple[bytes | str, bytes | str] | None = None,
+        proxies: Mapping[str, str] | None = None,
+    ) -> requests.Response:
+        """
+        Send the request, after the connection being opened by prewarm() (if any) is in the pool.
+        """
+        warming = self._warming
+        if warming is not None:
+            # connect() is bounded by its own 10-second connect timeout.
+            warming.join()
+            self._warming = None
+        return super().send(request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+
+    @property
+    def handshakes(self) -> int:
+        """
+        getter: return the number of TLS handshakes.
+        """
+        return self._ssl_context.handshakes
+
+    @property
+    def resumed(self) -> int:
+        """
+        getter: return the number of TLS handshakes that resumed a previous session.
+        """
+        return self._ssl_context.resumed
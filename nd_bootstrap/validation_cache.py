@@ -0,0 +1,173 @@
+"""
+Nexus Dashboard Pre-flight Validation Cache
+
+Caches successful DNS/NTP pre-flight validation results on disk.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import asdict
+
+from nd_bootstrap.exceptions import NdParameterError
+from nd_bootstrap.results import NdValidationResult
+
+# Serializes read-modify-write of the cache file between threads in this process.
+_cache_lock = threading.Lock()
+
+
+class NdValidationCache:
+    """
+    # Summary
+
+    TTL cache of successful pre-flight validation results.
+
+    Entries are keyed by (validator, Nexus Dashboard address, firmware version, canonical hash of the
+    validation payload), so a cached result is only reused when the same DNS/NTP servers were
+    validated by the same ND, running the same firmware, within the last `ttl` seconds.  Changing any
+    other part of the bootstrap configuration does not invalidate the entry.
+
+    Only successful validations are cached; failures are always re-validated on the next run.
+
+    The cache is a JSON file, written atomically, so it is safe to share between consecutive runs
+    (e.g. dry-run iterations or CI re-runs).
+
+    ## Properties
+
+    - cache_file: (getter/setter) Path to the cache file.
+      Default is $XDG_CACHE_HOME/nd_bootstrap/validation_cache.json (~/.cache/... if XDG_CACHE_HOME is not set).
+    - revalidate: (getter/setter) If True, get() always misses, forcing re-validation. put() still updates the cache. Default is False.
+    - ttl: (getter/setter) Time-to-live of an entry, in seconds. Default is 3600.
+
+    ## Usage
+
+    ```python
+    cache = NdValidationCache()
+    key = cache.key("ntp", "192.168.7.7", "4.3.1.75", payload)
+    result = cache.get(key)
+    if result is None:
+        result = validate(payload)
+        cache.put(key, result)
+    ```
+    """
+
+    def __init__(self) -> None:
+        self.class_name: str = self.__class__.__name__
+        cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        self._cache_file: str = os.path.join(cache_home, "nd_bootstrap", "validation_cache.json")
+        self._revalidate: bool = False
+        self._ttl: int = 3600
+
+    @staticmethod
+    def key(validator: str, nd_ip: str, firmware_version: str, payload: dict) -> str:
+        """
+        Return the cache key for a validation payload sent to a given Nexus Dashboard.
+
+        The payload is hashed in canonical form (sorted keys, no whitespace), so that
+        key order in the YAML file does not matter.
+        """
+        canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+        payload_hash = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+        return f"{validator}|{nd_ip}|{firmware_version}|{payload_hash}"
+
+    def load(self) -> dict:
+        """
+        Return the cache file contents, or an empty dictionary if the file is missing or unreadable.
+        """
+        try:
+            with open(self._cache_file, "r", encoding="utf-8") as cache_file:
+                data = json.load(cache_file)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        return data
+
+    def get(self, key: str) -> NdValidationResult | None:
+        """
+        Return the cached result for key, or None if there is no unexpired entry (or revalidate is True).
+        """
+        method_name: str = "get"
+        msg: str = ""
+
+        if self._revalidate:
+            return None
+        with _cache_lock:
+            entry = self.load().get(key)
+        if not isinstance(entry, dict):
+            return None
+        age = time.time() - entry.get("timestamp", 0)
+        if age < 0 or age >= self._ttl:
+            return None
+        msg = f"{self.class_name}.{method_name}: "
+        msg += f"Using cached {entry['result']['validator']} validation result ({int(age)} seconds old). Use --revalidate to force validation."
+        print(msg)
+        return NdValidationResult(**entry["result"])
+
+    def put(self, key: str, result: NdValidationResult) -> None:
+        """
+        Store result under key, dropping expired entries.
+
+        Errors writing the cache file are reported and otherwise ignored, since the cache is only an optimization.
+        """
+        method_name: str = "put"
+        msg: str = ""
+
+        now = time.time()
+        with _cache_lock:
+            data = {k: v for k, v in self.load().items() if isinstance(v, dict) and 0 <= now - v.get("timestamp", 0) < self._ttl}
+            data[key] = {"timestamp": now, "result": asdict(result)}
+            tmp_file = f"{self._cache_file}.{os.getpid()}.tmp"
+            try:
+                os.makedirs(os.path.dirname(self._cache_file) or ".", exist_ok=True)
+                with open(tmp_file, "w", encoding="utf-8") as cache_file:
+                    json.dump(data, cache_file)
+                os.replace(tmp_file, self._cache_file)
+            except OSError as e:
+                msg = f"{self.class_name}.{method_name}: "
+                msg += f"Unable to write validation cache file '{self._cache_file}': {str(e)}"
+                print(msg)
+
+    @property
+    def cache_file(self) -> str:
+        """
+        getter: return the cache file path.
+        setter: set the cache file path.
+        """
+        return self._cache_file
+
+    @cache_file.setter
+    def cache_file(self, value: str) -> None:
+        if not value or not isinstance(value, str):
+            raise NdParameterError("Invalid cache_file: empty or not a string.")
+        self._cache_file = value
+
+    @property
+    def revalidate(self) -> bool:
+        """
+        getter: return the revalidate flag.
+        setter: set the revalidate flag.
+        """
+        return self._revalidate
+
+    @revalidate.setter
+    def revalidate(self, value: bool) -> None:
+        if not isinstance(value, bool):
+            raise NdParameterError("Invalid revalidate: not a boolean.")
+        self._revalidate = value
+
+    @property
+    def ttl(self) -> int:
+        """
+        getter: return the time-to-live of an entry, in seconds.
+        setter: set the time-to-live of an entry, in seconds.
+        """
+        return self._ttl
+
+    @ttl.setter
+    def ttl(self, value: int) -> None:
+        if not isinstance(value, int) or value < 0:
+            raise NdParameterError("Invalid ttl: not a non-negative int.")
+        self._ttl = value
@@ -4,12 +4,11 @@ Nexus Dashboard Version Detection
 Retrieves the firmware version from a Nexus Dashboard instance.
 """
 
-import inspect
-from sys import exit as sys_exit
-
 import requests
 
-from nd_bootstrap.environment import NdEnvironment
+from nd_bootstrap.context import NdContext
+from nd_bootstrap.exceptions import NdApiError, NdConnectionError, NdParameterError
+from nd_bootstrap.results import NdVersionResult
 
 
 class NdVersion:
@@ -24,7 +23,8 @@ class NdVersion:
     ## Properties
 
     - firmware_version: (getter) The firmware version string after commit()
-    - session: (getter/setter) The requests.Session object instance with authentication cookies set
+    - context: (getter/setter) The NdContext for the target. Built from the environment if not set.
+    - session: (getter/setter) context.session, the requests.Session object instance with authentication cookies set
 
     ## Usage
 
@@ -38,60 +38,57 @@ class NdVersion:
 
     def __init__(self) -> None:
         self.class_name: str = self.__class__.__name__
+        self._context: NdContext | None = None
         self._firmware_version: str = ""
-        self._session: requests.Session
-        self.nd_environment = NdEnvironment()
 
-    def commit(self) -> None:
+    def commit(self) -> NdVersionResult:
         """
         Retrieve the firmware version from Nexus Dashboard.
 
-        Exits if:
+        Raises if:
             - instance.session is not set
             - The GET request fails
             - FirmwareVersion is not found in the response
 
         Returns:
-            None
+            NdVersionResult
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = "commit"
         msg: str = ""
 
-        if not self._session:
+        session = self.context.session
+        if session is None:
             msg = f"{self.class_name}.{method_name}: "
-            msg += "instance.session must be set before calling instance.commit, exiting."
-            print(msg)
-            sys_exit(1)
+            msg += "instance.session must be set before calling instance.commit."
+            raise NdParameterError(msg)
 
-        url = f"https://{self.nd_environment.nd_ip}/v2/bootstrap/syscfg"
+        url = f"https://{self.context.nd_host}/v2/bootstrap/syscfg"
         try:
-            response = self._session.get(
+            response = session.get(
                 url,
                 timeout=60,
             )
         except requests.RequestException as e:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Error retrieving firmware version: {str(e)}"
-            print(msg)
-            sys_exit(1)
+            raise NdConnectionError(msg) from e
 
         if response.status_code not in [200]:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Failed to retrieve firmware version. Status code: {response.status_code} : {response.text}"
-            print(msg)
-            sys_exit(1)
+            raise NdApiError(msg, status_code=response.status_code)
 
         data = response.json()
         self._firmware_version = data.get("FirmwareVersion", "")
         if not self._firmware_version:
             msg = f"{self.class_name}.{method_name}: "
             msg += "FirmwareVersion not found in response."
-            print(msg)
-            sys_exit(1)
+            raise NdApiError(msg)
 
         msg = f"{self.class_name}.{method_name}: "
         msg += f"Detected ND firmware version: {self._firmware_version}"
         print(msg)
+        return NdVersionResult(firmware_version=self._firmware_version)
 
     @property
     def firmware_version(self) -> str:
@@ -101,16 +98,29 @@ class NdVersion:
         return self._firmware_version
 
     @property
-    def session(self) -> requests.Session:
+    def context(self) -> NdContext:
+        """
+        getter: return the NdContext for the target Nexus Dashboard. Built from the environment if not set.
+        setter: set the NdContext for the target Nexus Dashboard.
+        """
+        if self._context is None:
+            self._context = NdContext.from_environment()
+        return self._context
+
+    @context.setter
+    def context(self, value: NdContext) -> None:
+        if not isinstance(value, NdContext):
+            raise NdParameterError("Invalid context: not an NdContext instance.")
+        self._context = value
+
+    @property
+    def session(self) -> requests.Session | None:
         """
-        getter: return the requests.Session instance.
-        setter: set and validate the requests.Session instance.
+        getter: return context.session, the requests.Session instance with authentication cookies set.
+        setter: set context.session.
         """
-        return self._session
+        return self.context.session
 
     @session.setter
     def session(self, value: requests.Session) -> None:
-        if not isinstance(value, requests.Session):
-            print("Invalid session: not a requests.Session instance, exiting.")
-            sys_exit(1)
-        self._session = value
+        self.context.session = value
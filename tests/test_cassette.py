@@ -0,0 +1,62 @@
+"""
+Offline regression test: replay a cassette through NdCassettePlayer.
+
+cassettes/synthetic-bootstrap.json is synthetic: it was recorded with NdCassetteRecorder from a bootstrap of
+nd_bootstrap_4.3.1.145.vnode1.yaml against an in-process stand-in for Nexus Dashboard, not a real one, so it
+pins the package's own request sequence and parsing, not real response shapes.  It holds login, cluster GET,
+firmware version (4.3.1.145, so NTP validation), NTP validation, POST, then /clusterstatus/bootstrap
+(404 first) and /clusterstatus/install polling until Completed.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from nd_bootstrap.bootstrap import NdBootstrap
+from nd_bootstrap.cassette import REDACTED, NdCassettePlayer, load_cassette
+from nd_bootstrap.clock import NdScaledClock
+from nd_bootstrap.context import NdContext
+
+REPO = Path(__file__).resolve().parent.parent
+CASSETTE = Path(__file__).resolve().parent / "cassettes" / "synthetic-bootstrap.json"
+
+
+def test_cassette_is_redacted() -> None:
+    """
+    The recorded login carries no password or token.
+    """
+    login = next(interaction for interaction in load_cassette(str(CASSETTE))["interactions"] if interaction["path"] == "/login")
+    assert json.loads(login["request"])["userPasswd"] == REDACTED
+    assert json.loads(login["body"])["jwttoken"] == REDACTED
+
+
+def test_replay_bootstrap(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """
+    A full bootstrap replays from the cassette, without network access or waiting between polls.
+    """
+    monkeypatch.setenv("ND_IP4", "192.168.7.8")
+    monkeypatch.setenv("ND_USERNAME", "admin")
+    monkeypatch.setenv("ND_PASSWORD", "replayed")
+    player = NdCassettePlayer()
+    player.cassette_file = str(CASSETTE)
+
+    nd_bootstrap = NdBootstrap()
+    nd_bootstrap.context = NdContext.from_environment()
+    nd_bootstrap.context.adapter = player
+    nd_bootstrap.context.clock = NdScaledClock()
+    nd_bootstrap.context.clock.speed = 0
+    nd_bootstrap.config_file = str(REPO / "nd_bootstrap_4.3.1.145.vnode1.yaml")
+    nd_bootstrap.validation_cache.cache_file = str(tmp_path / "validation_cache.json")
+    nd_bootstrap.revalidate = True
+    nd_bootstrap.poll = True
+    result = nd_bootstrap.commit()
+
+    assert result.action == "bootstrap"
+    assert result.firmware_version == "4.3.1.145"
+    assert result.validation is not None and result.validation.ntp_servers == ["192.168.7.6"]
+    assert result.post_status_code == 200
+    assert nd_bootstrap.config["nodes"][0]["serialNumber"] == "9A3F6C0B2E71"
+    assert result.bootstrap_poll is not None and result.bootstrap_poll.completed and result.bootstrap_poll.polls == 4
+    assert result.install_poll is not None and result.install_poll.completed and result.install_poll.polls == 3
+    assert player.remaining == 0
@@ -0,0 +1,50 @@
+"""
+Tests for NdClusterInventory node matching.
+"""
+
+import pytest
+
+from nd_bootstrap.exceptions import NdValidationError
+from nd_bootstrap.inventory import NdClusterInventory
+
+
+@pytest.fixture(name="inventory")
+def fixture_inventory() -> NdClusterInventory:
+    """
+    Return an inventory of two nodes as reported by Nexus Dashboard.
+    """
+    inventory = NdClusterInventory()
+    inventory.nodes = [
+        {"hostName": "nd1", "serialNumber": "S1", "managementNetwork": {"ipSubnet": "10.0.0.1/24"}, "dataNetwork": {"ipSubnet": "10.1.0.1/24"}},
+        {"hostName": "nd2", "serialNumber": "S2", "managementNetwork": {"ipSubnet": "10.0.0.2/24"}},
+    ]
+    return inventory
+
+
+def test_fallback_logs_matched_key(inventory: NdClusterInventory, capsys: pytest.CaptureFixture) -> None:
+    """
+    A node without a matching management IP address is matched by hostname, and the key is logged.
+    """
+    config_node = {"hostName": "ND2", "managementNetwork": {"ipSubnet": "10.0.0.9/24"}}
+    inventory.enrich(config_node)
+    assert config_node["serialNumber"] == "S2"
+    assert "by hostname" in capsys.readouterr().out
+
+
+def test_duplicate_match_rejected(inventory: NdClusterInventory) -> None:
+    """
+    Two configured nodes that match the same reported node are rejected.
+    """
+    inventory.enrich({"hostName": "a", "managementNetwork": {"ipSubnet": "10.0.0.1/24"}})
+    with pytest.raises(NdValidationError, match="both match"):
+        inventory.enrich({"hostName": "b", "managementNetwork": {"ipSubnet": "10.0.0.7/24"}, "dataNetwork": {"ipSubnet": "10.1.0.1/24"}})
+
+
+def test_same_node_enriched_twice(inventory: NdClusterInventory) -> None:
+    """
+    Enriching the same configured node again is not a duplicate.
+    """
+    config_node = {"hostName": "a", "managementNetwork": {"ipSubnet": "10.0.0.1/24"}}
+    inventory.enrich(config_node)
+    inventory.enrich(config_node)
+    assert config_node["serialNumber"] == "S1"
@@ -0,0 +1,191 @@
+"""
+Tests for NdJobQueue and NdJobRunner with several runner processes sharing one queue database.
+
+Each runner process replays a copy of the test cassette for every job, so no Nexus Dashboard is needed.
+"""
+
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from nd_bootstrap.cassette import load_cassette
+from nd_bootstrap.config import NdBootstrapConfig
+from nd_bootstrap.job_queue import NdJobQueue
+
+REPO = Path(__file__).resolve().parent.parent
+CASSETTE = Path(__file__).resolve().parent / "cassettes" / "synthetic-bootstrap.json"
+
+# A runner process: python -c RUNNER DATABASE CASSETTE CACHE_FILE WORKERS.  Runs jobs until the queue is idle.
+RUNNER = """
+import sys
+from nd_bootstrap.cassette import NdCassettePlayer
+from nd_bootstrap.clock import NdScaledClock
+from nd_bootstrap.job_queue import NdJobQueue, NdJobRunner
+
+database, cassette_file, cache_file, workers = sys.argv[1:]
+
+
+def configure(nd_bootstrap):
+    player = NdCassettePlayer()
+    player.cassette_file = cassette_file
+    nd_bootstrap.context.adapter = player
+    nd_bootstrap.context.clock = NdScaledClock()
+    nd_bootstrap.context.clock.speed = 0
+    nd_bootstrap.validation_cache.cache_file = cache_file
+    nd_bootstrap.revalidate = True
+    nd_bootstrap.poll = True
+
+
+runner = NdJobRunner()
+runner.queue = NdJobQueue()
+runner.queue.database = database
+runner.workers = int(workers)
+runner.exit_when_idle = True
+runner.configure = configure
+runner.commit()
+"""
+
+
+def write_cassette(tmp_path: Path, edit: Callable[[list[dict]], list[dict]] | None = None) -> Path:
+    """
+    Write the test cassette, optionally edited, to tmp_path and return its path.
+    """
+    cassette = load_cassette(str(CASSETTE))
+    if edit is not None:
+        cassette["interactions"] = edit(cassette["interactions"])
+    cassette_file = tmp_path / "cassette.json"
+    cassette_file.write_text(json.dumps(cassette), encoding="utf-8")
+    return cassette_file
+
+
+def make_queue(tmp_path: Path, jobs: int) -> NdJobQueue:
+    """
+    Return a queue in tmp_path with jobs jobs for nd_bootstrap_4.3.1.145.vnode1.yaml.
+    """
+    nd_bootstrap_config = NdBootstrapConfig()
+    nd_bootstrap_config.config_file = str(REPO / "nd_bootstrap_4.3.1.145.vnode1.yaml")
+    nd_bootstrap_config.commit()
+    queue = NdJobQueue()
+    queue.database = str(tmp_path / "jobs.db")
+    for _ in range(jobs):
+        queue.submit(nd_bootstrap_config)
+    return queue
+
+
+def run_runners(queue: NdJobQueue, cassette_file: Path, tmp_path: Path, processes: int, workers: int = 2) -> list[str]:
+    """
+    Run processes runner processes of workers workers each against queue at once, wait for them to exit, and return their output.
+    """
+    env = {**os.environ, "ND_IP4": "192.168.7.8", "ND_USERNAME": "admin", "ND_PASSWORD": "replayed", "PYTHONPATH": str(REPO)}
+    runners = [
+        subprocess.Popen(  # pylint: disable=consider-using-with
+            [sys.executable, "-c", RUNNER, queue.database, str(cassette_file), str(tmp_path / f"validation_cache-{index}.json"), str(workers)],
+            cwd=REPO,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+        )
+        for index in range(processes)
+    ]
+    outputs = [runner.communicate(timeout=120)[0] for runner in runners]
+    assert [runner.returncode for runner in runners] == [0] * processes, outputs
+    return outputs
+
+
+def job_rows(queue: NdJobQueue) -> list[sqlite3.Row]:
+    """
+    Return every row of the jobs table, including the result.
+    """
+    connection = sqlite3.connect(queue.database)
+    connection.row_factory = sqlite3.Row
+    try:
+        return connection.execute("SELECT * FROM jobs ORDER BY id").fetchall()
+    finally:
+        connection.close()
+
+
+def test_runners_claim_each_job_once(tmp_path: Path) -> None:
+    """
+    Three runner processes share six jobs: each job is claimed once, and done.
+    """
+    queue = make_queue(tmp_path, jobs=6)
+    run_runners(queue, write_cassette(tmp_path), tmp_path, processes=3)
+
+    rows = job_rows(queue)
+    assert [(row["state"], row["attempts"], row["checkpoint"]) for row in rows] == [("done", 1, "completed")] * 6
+    assert all(json.loads(row["result"])["action"] == "bootstrap" for row in rows)
+
+
+def test_expired_lease_resumes_from_checkpoint(tmp_path: Path) -> None:
+    """
+    A job whose runner stopped heartbeating after the POST is resumed by another runner in reconcile mode,
+    which polls the bootstrap in progress instead of validating and POSTing again.
+    """
+    queue = make_queue(tmp_path, jobs=1)
+    job = queue.claim("crashed-runner", lease=0.2)
+    assert job is not None
+    assert queue.checkpoint(job.id, "crashed-runner", "poll_bootstrap", lease=0.2)
+    time.sleep(0.3)
+
+    def in_progress(interactions: list[dict]) -> list[dict]:
+        # The bootstrap was POSTed before the crash, so /clusterstatus/bootstrap no longer answers 404.
+        return [interaction for interaction in interactions if interaction["path"] != "/clusterstatus/bootstrap" or interaction["status"] != 404]
+
+    run_runners(queue, write_cassette(tmp_path, in_progress), tmp_path, processes=2)
+
+    (row,) = job_rows(queue)
+    assert (row["state"], row["attempts"]) == ("done", 2)
+    assert row["owner"] != "crashed-runner"
+    result = json.loads(row["result"])
+    assert (result["action"], result["post_status_code"]) == ("poll", 0)
+    assert result["install_poll"]["completed"]
+
+
+def garbled(interactions: list[dict]) -> list[dict]:
+    """
+    The firmware version response is not JSON, so NdVersion raises requests.JSONDecodeError.
+    """
+    for interaction in interactions:
+        if interaction["path"] == "/v2/bootstrap/syscfg":
+            interaction["body"] = "<html>"
+    return interactions
+
+
+def rejected(interactions: list[dict]) -> list[dict]:
+    """
+    Nexus Dashboard answers the bootstrap POST with 400.
+    """
+    for interaction in interactions:
+        if interaction["method"] == "POST" and interaction["path"] == "/v2/bootstrap/cluster":
+            interaction.update(status=400, body='{"message":"Duplicate IP address"}')
+    return interactions
+
+
+def test_unexpected_error_does_not_stop_worker(tmp_path: Path) -> None:
+    """
+    An exception other than NdBootstrapError fails its job, and the only worker goes on to the next job.
+    """
+    queue = make_queue(tmp_path, jobs=3)
+    run_runners(queue, write_cassette(tmp_path, garbled), tmp_path, processes=1, workers=1)
+
+    rows = job_rows(queue)
+    assert [row["state"] for row in rows] == ["failed"] * 3
+    assert all(row["error"].startswith("requests.exceptions.JSONDecodeError: ") for row in rows)
+
+
+def test_rejected_post_fails_job(tmp_path: Path) -> None:
+    """
+    A job whose POST Nexus Dashboard rejects is failed, not done.
+    """
+    queue = make_queue(tmp_path, jobs=1)
+    run_runners(queue, write_cassette(tmp_path, rejected), tmp_path, processes=1)
+
+    (row,) = job_rows(queue)
+    assert row["state"] == "failed"
+    assert "Status code: 400" in row["error"]
@@ -0,0 +1,103 @@
+"""
+Tests for NdSpoolRunner.run_job: which outcomes move a claimed file to done, and which to failed.
+"""
+
+import json
+import shutil
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from nd_bootstrap.bootstrap import NdBootstrap
+from nd_bootstrap.cassette import NdCassettePlayer, load_cassette
+from nd_bootstrap.clock import NdScaledClock
+from nd_bootstrap.config import NdBootstrapConfig
+from nd_bootstrap.spool import NdSpoolRunner
+
+REPO = Path(__file__).resolve().parent.parent
+CASSETTE = Path(__file__).resolve().parent / "cassettes" / "synthetic-bootstrap.json"
+
+
+def rejected(interactions: list[dict]) -> list[dict]:
+    """
+    Nexus Dashboard answers the bootstrap POST with 400.
+    """
+    for interaction in interactions:
+        if interaction["method"] == "POST" and interaction["path"] == "/v2/bootstrap/cluster":
+            interaction.update(status=400, body='{"message":"Duplicate IP address"}')
+    return interactions
+
+
+def incomplete(interactions: list[dict]) -> list[dict]:
+    """
+    The install never gets past InProgress.
+    """
+    return [interaction for interaction in interactions if interaction["path"] != "/clusterstatus/install" or '"InProgress"' in interaction["body"]]
+
+
+def garbled(interactions: list[dict]) -> list[dict]:
+    """
+    The firmware version response is not JSON, so NdVersion raises requests.JSONDecodeError.
+    """
+    for interaction in interactions:
+        if interaction["path"] == "/v2/bootstrap/syscfg":
+            interaction["body"] = "<html>"
+    return interactions
+
+
+def unchanged(interactions: list[dict]) -> list[dict]:
+    """
+    The recorded session.
+    """
+    return interactions
+
+
+@pytest.mark.parametrize(
+    ("edit", "outcome", "error_type"),
+    [
+        (unchanged, "done", None),
+        (rejected, "failed", "NdApiError"),
+        (incomplete, "failed", None),
+        (garbled, "failed", "requests.exceptions.JSONDecodeError"),
+    ],
+)
+def test_run_job(edit: Callable[[list[dict]], list[dict]], outcome: str, error_type: str | None, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """
+    Only a bootstrap whose POST was accepted and whose polling completed is done.
+    """
+    monkeypatch.setenv("ND_IP4", "192.168.7.8")
+    monkeypatch.setenv("ND_USERNAME", "admin")
+    monkeypatch.setenv("ND_PASSWORD", "replayed")
+    cassette = load_cassette(str(CASSETTE))
+    cassette["interactions"] = edit(cassette["interactions"])
+    cassette_file = tmp_path / "cassette.json"
+    cassette_file.write_text(json.dumps(cassette), encoding="utf-8")
+
+    def configure(nd_bootstrap: NdBootstrap) -> None:
+        player = NdCassettePlayer()
+        player.cassette_file = str(cassette_file)
+        nd_bootstrap.context.adapter = player
+        nd_bootstrap.context.clock = NdScaledClock()
+        nd_bootstrap.context.clock.speed = 0
+        nd_bootstrap.validation_cache.cache_file = str(tmp_path / "validation_cache.json")
+        nd_bootstrap.revalidate = True
+        nd_bootstrap.poll = True
+        nd_bootstrap.retries = 10
+
+    runner = NdSpoolRunner()
+    runner.spool_dir = str(tmp_path / "spool")
+    runner.configure = configure
+    for folder in ("claimed", "done", "failed"):
+        Path(runner.folder(folder)).mkdir(parents=True)
+    claimed = shutil.copy(REPO / "nd_bootstrap_4.3.1.145.vnode1.yaml", runner.folder("claimed"))
+    nd_bootstrap_config = NdBootstrapConfig()
+    nd_bootstrap_config.config_file = claimed
+    nd_bootstrap_config.commit()
+
+    runner.run_job(claimed, nd_bootstrap_config)
+
+    assert not list(Path(runner.folder("claimed")).iterdir())
+    summary = json.loads((Path(runner.folder(outcome)) / "nd_bootstrap_4.3.1.145.vnode1.json").read_text(encoding="utf-8"))
+    assert ("error" in summary) == (outcome == "failed")
+    assert summary.get("error_type") == error_type
@@ -0,0 +1,80 @@
+"""
+Startup tests for nd_bootstrap.py: --help and --inventory linting must not import requests/urllib3,
+and must start within a loose bound of a bare interpreter.
+"""
+
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+REPO = Path(__file__).resolve().parent.parent
+
+# Runs nd_bootstrap.py as __main__ with the given arguments, then prints the HTTP modules that were imported.
+PROBE = """
+import runpy, sys
+sys.argv = ["nd_bootstrap.py", *sys.argv[1:]]
+try:
+    runpy.run_path("nd_bootstrap.py", run_name="__main__")
+except SystemExit:
+    pass
+print("LOADED:" + ",".join(sorted(name for name in ("requests", "urllib3") if name in sys.modules)))
+"""
+
+
+def loaded_modules(*args: str) -> list[str]:
+    """
+    Run nd_bootstrap.py with args in a new interpreter, and return the HTTP modules it imported.
+    """
+    completed = subprocess.run([sys.executable, "-c", PROBE, *args], cwd=REPO, capture_output=True, text=True, timeout=60, check=True)
+    line = completed.stdout.strip().splitlines()[-1]
+    assert line.startswith("LOADED:"), completed.stdout + completed.stderr
+    return [name for name in line.removeprefix("LOADED:").split(",") if name]
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ("--help",),
+        ("nd_bootstrap_template.yaml", "--inventory", "nd_bootstrap_inventory.csv"),
+    ],
+)
+def test_no_http_imports(args: tuple[str, ...]) -> None:
+    """
+    --help and --inventory (without --cluster) exit before any request is sent, so requests is never imported.
+    """
+    assert not loaded_modules(*args)
+
+
+def best_of(runs: int, *args: str) -> float:
+    """
+    Return the shortest wall time, in seconds, of runs runs of the interpreter with args.
+    """
+    best = float("inf")
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, *args], cwd=REPO, capture_output=True, timeout=60, check=False)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+@pytest.mark.parametrize(
+    ("args", "bound"),
+    [
+        (("nd_bootstrap.py", "--help"), 0.1),
+        (("nd_bootstrap.py", "nd_bootstrap_template.yaml", "--inventory", "nd_bootstrap_inventory.csv"), 0.2),
+    ],
+)
+def test_startup_time(args: tuple[str, ...], bound: float) -> None:
+    """
+    Startup costs tens of milliseconds more than `python -c pass`.
+
+    The bounds are about three times the cost measured on a development machine (33 ms for --help, 97 ms to
+    lint the inventory, which imports yaml), and the best of three runs is used, so that a loaded CI host does
+    not fail the test.  Importing requests alone costs about 140 ms, which the --help bound catches; the looser
+    inventory bound catches a slow path, and test_no_http_imports catches the imports themselves.
+    """
+    baseline = best_of(3, "-c", "pass")
+    assert best_of(3, *args) - baseline < bound
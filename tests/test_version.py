@@ -0,0 +1,19 @@
+"""
+nd_bootstrap.__version__ must match the version in pyproject.toml.
+"""
+
+import tomllib
+from pathlib import Path
+
+import nd_bootstrap
+
+REPO = Path(__file__).resolve().parent.parent
+
+
+def test_version_matches_pyproject() -> None:
+    """
+    __version__ is a literal (importlib.metadata would cost startup time, and fails when nd_bootstrap.py runs
+    from a checkout that is not installed), so this keeps it in step with [project] version.
+    """
+    with open(REPO / "pyproject.toml", "rb") as pyproject_file:
+        assert nd_bootstrap.__version__ == tomllib.load(pyproject_file)["project"]["version"]